@@ -0,0 +1,60 @@
+; ============================================================================
+; BIBLIOTECA DISK - Disco de bloques con DMA (puertos 0x400-0x406)
+; ============================================================================
+; El disco (BlockDevice) se conecta con `python src/runner.py prog --disk ARCHIVO`.
+;
+; Puertos:
+;   0x400 SECTOR   sector actual
+;   0x401 ADDR     dirección de RAM para DMA
+;   0x402 COUNT    sectores por orden
+;   0x403 CMD      1 = leer (disco -> RAM), 2 = escribir (RAM -> disco),
+;                  3 = vaciar buffers; al leerlo da el estado (0 = OK, 1 = error)
+;   0x404 DATA     un byte por LOADIO/SVIO (E/S programada, lenta)
+;   0x405 SECTORS  tamaño del disco en sectores (512 bytes)
+;   0x406 BYTES    tamaño del disco en bytes
+;
+; Cada orden copia COUNT sectores completos de una vez y deja SECTOR apuntando
+; al siguiente, así que para recorrer el disco basta con repetir DISK_NEXT.
+; ============================================================================
+
+; DISK_READ: copia sectores del disco a la RAM
+; Entrada: R1 = primer sector, R2 = dirección destino, R3 = nº de sectores
+; Salida:  R1 = estado (0 = OK)
+DISK_READ:
+    SVIO R01, 0x400
+    SVIO R02, 0x401
+    SVIO R03, 0x402
+    MOVV8 R01, 1
+    SVIO R01, 0x403
+    LOADIO R01, 0x403
+    RET
+
+; DISK_WRITE: copia sectores de la RAM al disco
+; Entrada: R1 = primer sector, R2 = dirección origen, R3 = nº de sectores
+; Salida:  R1 = estado (0 = OK)
+DISK_WRITE:
+    SVIO R01, 0x400
+    SVIO R02, 0x401
+    SVIO R03, 0x402
+    MOVV8 R01, 2
+    SVIO R01, 0x403
+    LOADIO R01, 0x403
+    RET
+
+; DISK_NEXT: repite la última orden sobre los sectores siguientes
+; Entrada: R1 = orden (1 = leer, 2 = escribir)
+; Salida:  R1 = estado (0 = OK)
+DISK_NEXT:
+    SVIO R01, 0x403
+    LOADIO R01, 0x403
+    RET
+
+; DISK_SECTORS: R1 = tamaño del disco en sectores
+DISK_SECTORS:
+    LOADIO R01, 0x405
+    RET
+
+; DISK_BYTES: R1 = tamaño del disco en bytes
+DISK_BYTES:
+    LOADIO R01, 0x406
+    RET
@@ -0,0 +1,118 @@
+"""
+Benchmark del motor por lotes (BatchCPU) frente a N llamadas a CPU.run.
+
+Uso:
+    python scripts/bench_batch.py                  # 1000 copias, entradas 27..76
+    python scripts/bench_batch.py --n 200 --distinct 1   # todas con la misma entrada
+    python scripts/bench_batch.py --src /tmp/otro/src
+
+Cada copia cuenta los pasos de Collatz de su entrada (con CALL/RET, PUSH/POP,
+MUL y DIV). Con entradas distintas las copias se separan por PC y el lote
+ejecuta varios grupos por ronda; con --distinct 1 todas van juntas. Se comprueba
+que registros, RAM y ciclos coinciden con la ejecución secuencial. Necesita numpy.
+"""
+import argparse
+import contextlib
+import io
+import logging
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+KERNEL = """
+    LOADV R2, 0
+BUCLE:
+    CMPV R1, 1
+    JEQ FIN
+    PUSH8 R1
+    CALL PASO
+    POP8 R3
+    INC R2
+    JMP BUCLE
+PASO:
+    MOV8 R4, R1
+    ANDV R4, 1
+    JEQ PAR
+    MOVV8 R5, 3
+    MUL R1, R5
+    INC R1
+    RET
+PAR:
+    MOVV8 R7, 2
+    DIV R1, R7
+    RET
+FIN:
+    MOVV8 R6, 0x8000
+    STORER8 R2, R6
+    PARAR
+"""
+
+
+def make_cpus(programa, inputs, mem_size):
+    from machine.Memory.Memory import Memory
+    from machine.CPU.CPU import CPU
+    from machine.IO.IOsystem import IOSystem
+    from compiler.Loader import Loader
+
+    cpus = []
+    for value in inputs:
+        cpu = CPU(Memory(mem_size, auto_load=False, auto_save_at_exit=False), IOSystem())
+        with contextlib.redirect_stdout(io.StringIO()):
+            Loader(cpu.memory).load_in_memory(programa.codigo, 0)
+        cpu.set_pc(0)
+        cpu.set_sp(mem_size // 2)
+        cpu.regs[1] = value
+        cpus.append(cpu)
+    return cpus
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Instrucciones/segundo de BatchCPU frente a CPU.run")
+    parser.add_argument('--n', type=int, default=1000, help="copias del programa")
+    parser.add_argument('--distinct', type=int, default=50, help="entradas distintas (27, 28, ...)")
+    parser.add_argument('--mem-size', type=int, default=2**16)
+    parser.add_argument('--src', default=os.path.join(ROOT, 'src'),
+                        help="directorio src/ a medir (por defecto el de este checkout)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+    sys.path.insert(0, os.path.abspath(args.src))
+    from runner import build_program
+    from machine.CPU.Batch import BatchCPU
+
+    with tempfile.NamedTemporaryFile('w', suffix='.asm', delete=False, encoding='utf-8') as f:
+        f.write(KERNEL)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            programa = build_program(f.name, [])
+    finally:
+        os.unlink(f.name)
+    inputs = [27 + i % max(args.distinct, 1) for i in range(args.n)]
+
+    sequential = make_cpus(programa, inputs, args.mem_size)
+    t0 = time.perf_counter()
+    seq_cycles = [cpu.run(max_cycles=10**6) for cpu in sequential]
+    seq_secs = time.perf_counter() - t0
+
+    batched = make_cpus(programa, inputs, args.mem_size)
+    t0 = time.perf_counter()
+    batch = BatchCPU(batched)
+    cycles = batch.run(max_cycles=10**6)
+    batch_secs = time.perf_counter() - t0
+
+    ok = cycles == seq_cycles and all(
+        a.regs == b.regs and a.memory.read_u64(0x8000) == b.memory.read_u64(0x8000)
+        for a, b in zip(batched, sequential))
+    total = sum(seq_cycles)
+    print(f"src: {os.path.abspath(args.src)}  copias: {args.n}  entradas distintas: {args.distinct}")
+    print(f"{'Motor':<10} {'Instr':>10} {'Tiempo(s)':>10} {'Instr/s':>12}")
+    print(f"{'CPU.run':<10} {total:>10} {seq_secs:>10.3f} {total / seq_secs:>12,.0f}")
+    print(f"{'BatchCPU':<10} {total:>10} {batch_secs:>10.3f} {total / batch_secs:>12,.0f}"
+          f"{'' if ok else '  ¡resultado distinto!'}")
+
+
+if __name__ == '__main__':
+    main()
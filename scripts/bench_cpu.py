@@ -0,0 +1,143 @@
+"""
+Microbenchmark del CPU: instrucciones por segundo sobre los programas de Algoritmos/.
+
+Uso:
+    python scripts/bench_cpu.py                 # programas por defecto
+    python scripts/bench_cpu.py prog.asm x.txt  # programas concretos
+    python scripts/bench_cpu.py --src /ruta/a/otro/checkout/src
+    python scripts/bench_cpu.py --engine block  # traductor de bloques básicos
+    python scripts/bench_cpu.py --engine trace  # bloques + trazas de bucles calientes
+
+Los .asm se ensamblan directamente; los .txt pasan por el pipeline completo
+(preprocesador -> parser -> semántico -> generador -> ensamblador).
+Con --src se puede medir otro checkout (por ejemplo un `git worktree` del
+commit anterior) y comparar el "antes" y el "después" con el mismo script.
+"""
+import argparse
+import contextlib
+import io
+import logging
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_PROGRAMS = [
+    'Algoritmos/Euclides/Tarea9/euclides_tarea9_gui.asm',
+    'Algoritmos/Matrix/matrices_gui.asm',
+    'Algoritmos/Modulo/modulo_gui.asm',
+    'Algoritmos/Euclides/Peña/euclides_pena_gui.asm',
+    'Algoritmos/Ejemplos_alto_nivel/bubble_sort.txt',
+    'Algoritmos/Ejemplos_alto_nivel/euclides_resta.txt',
+    'Algoritmos/Ejemplos_alto_nivel/multiplicacion_matrices_3d.txt',
+    'Algoritmos/Ejemplos_alto_nivel/demo_tipos_basicos.txt',
+]
+
+
+def build_relocatable(path):
+    """Devuelve el código relocalizable (texto) de un .asm o de un programa de alto nivel."""
+    from compiler.ensamblador import Ensamblador
+
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    # El compilador y el ensamblador imprimen trazas; no interesan aquí
+    with contextlib.redirect_stdout(io.StringIO()):
+        if not path.endswith('.asm'):
+            from compiler.Preprocessor import preprocess
+            from compiler.syntax_analizer import parse
+            from compiler.semantic_analyzer import SemanticAnalyzer
+            from compiler.code_generator import generate_code
+
+            ast = parse(preprocess(text, base_path=ROOT))
+            analyzer = SemanticAnalyzer()
+            analyzer.analyze(ast)
+            text = generate_code(ast, analyzer.symbol_table)
+        return Ensamblador().assemble(text).codigo
+
+
+def new_machine(codigo, mem_size):
+    from machine.Memory.Memory import Memory
+    from machine.CPU.CPU import CPU
+    from machine.IO.IOsystem import IOSystem
+    from machine.IO.Devices import Screen, Keyboard
+    from compiler.Loader import Loader
+
+    mem = Memory(mem_size, auto_load=False, auto_save_at_exit=False)
+    io_system = IOSystem()
+    io_system.register(0x100, Screen())
+    io_system.register(0x200, Keyboard())
+    cpu = CPU(mem, io_system)
+    Loader(mem).load_in_memory(codigo, 0)
+    cpu.set_pc(0)
+    cpu.set_sp(mem.size // 2)
+    return cpu
+
+
+def count_instructions(codigo, mem_size, max_cycles):
+    cpu = new_machine(codigo, mem_size)
+    n = 0
+    while cpu.running and n < max_cycles:
+        cpu.tick()
+        n += 1
+    return n
+
+
+def bench_program(codigo, per_run, mem_size, min_time, run_kwargs):
+    """Ejecuta el programa con CPU.run hasta acumular min_time segundos; devuelve (instr, segundos)."""
+    total_instr = 0
+    total_time = 0.0
+    while total_time < min_time:
+        cpu = new_machine(codigo, mem_size)
+        t0 = time.perf_counter()
+        cpu.run(max_cycles=per_run + 1, **run_kwargs)
+        total_time += time.perf_counter() - t0
+        total_instr += per_run
+    return total_instr, total_time
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Instrucciones/segundo del CPU Atlas")
+    parser.add_argument('programs', nargs='*', help=".asm o programas de alto nivel (.txt)")
+    parser.add_argument('--src', default=os.path.join(ROOT, 'src'),
+                        help="directorio src/ a medir (por defecto el de este checkout)")
+    parser.add_argument('--min-time', type=float, default=1.0,
+                        help="segundos mínimos de ejecución por programa")
+    parser.add_argument('--mem-size', type=int, default=2**17)
+    parser.add_argument('--max-cycles', type=int, default=5_000_000)
+    parser.add_argument('--engine', default=None,
+                        help="motor de CPU.run (interp, block, trace); por defecto el de CPU.run")
+    args = parser.parse_args(argv)
+
+    # Los avisos de dispositivos inexistentes (SVIO a puertos sin registrar)
+    # distorsionan la medición
+    logging.basicConfig(level=logging.ERROR)
+
+    sys.path.insert(0, os.path.abspath(args.src))
+    programs = args.programs or [os.path.join(ROOT, p) for p in DEFAULT_PROGRAMS]
+    run_kwargs = {'engine': args.engine} if args.engine else {}
+
+    print(f"src: {os.path.abspath(args.src)}  engine: {args.engine or 'default'}")
+    print(f"{'Programa':<36} {'Instr/run':>10} {'Instr':>10} {'Tiempo(s)':>10} {'Instr/s':>12}")
+    grand_instr = 0
+    grand_time = 0.0
+    for path in programs:
+        name = os.path.basename(path)
+        try:
+            codigo = build_relocatable(path)
+            per_run = count_instructions(codigo, args.mem_size, args.max_cycles)
+            instr, secs = bench_program(codigo, per_run, args.mem_size, args.min_time, run_kwargs)
+        except Exception as e:
+            print(f"{name:<36} error: {type(e).__name__}: {e}")
+            continue
+        grand_instr += instr
+        grand_time += secs
+        print(f"{name:<36} {per_run:>10} {instr:>10} {secs:>10.3f} {instr / secs:>12,.0f}")
+
+    if grand_time:
+        print(f"{'TOTAL':<36} {'':>10} {grand_instr:>10} {grand_time:>10.3f} {grand_instr / grand_time:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
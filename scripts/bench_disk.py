@@ -0,0 +1,159 @@
+"""
+Benchmark del disco de bloques (BlockDevice): DMA frente a E/S programada.
+
+Uso:
+    python scripts/bench_disk.py                 # archivo de 8 MiB, DMA de 64 sectores
+    python scripts/bench_disk.py --mb 32 --chunk 128
+    python scripts/bench_disk.py --pio-kb 512    # tamaño del recorrido byte a byte
+    python scripts/bench_disk.py --engine interp
+
+Se crea un archivo temporal con datos aleatorios y un programa invitado,
+enlazado con lib/disk.asm, lo recorre entero:
+    dma   DISK_READ + DISK_NEXT: `chunk` sectores por orden hacia un buffer en RAM
+    copia igual, pero cada trozo se vuelve a escribir en la segunda mitad del disco
+    pio   LOADIO del puerto DATA y STORER1, byte a byte (solo los primeros --pio-kb)
+Se comprueba que la RAM (o la copia en disco) coincide con el archivo.
+"""
+import argparse
+import contextlib
+import io
+import logging
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUFFER = 0x10000
+STACK = 0x1000
+
+DMA = """
+    MOVV8 R01, 0
+    MOVV8 R02, {buffer}
+    MOVV8 R03, {chunk}
+    CALL DISK_READ          ; fija ADDR y COUNT; las siguientes órdenes solo repiten
+    CALL DISK_SECTORS
+    MOV8 R09, R01
+    MOVV8 R08, {chunk}
+BUCLE:
+    CMP R08, R09
+    JGE FIN
+    MOVV8 R01, 1
+    CALL DISK_NEXT
+    ADDV8 R08, {chunk}
+    JMP BUCLE
+FIN:
+    PARAR
+"""
+
+COPIA = """
+    CALL DISK_SECTORS
+    MOV8 R09, R01
+    MOVV8 R08, 0
+BUCLE:
+    CMP R08, R09
+    JGE FIN
+    MOV8 R01, R08
+    MOVV8 R02, {buffer}
+    MOVV8 R03, {chunk}
+    CALL DISK_READ
+    MOV8 R01, R08
+    ADD8 R01, R09
+    CALL DISK_WRITE
+    ADDV8 R08, {chunk}
+    JMP BUCLE
+FIN:
+    PARAR
+"""
+
+PIO = """
+    MOVV8 R01, 0
+    SVIO R01, 0x400         ; SECTOR = 0, DATA desde el principio
+    MOVV8 R02, {buffer}
+    MOVV8 R08, 0
+    MOVV8 R09, {nbytes}
+BUCLE:
+    CMP R08, R09
+    JGE FIN
+    LOADIO R01, 0x404
+    STORER1 R01, R02
+    ADDV8 R02, 1
+    ADDV8 R08, 1
+    JMP BUCLE
+FIN:
+    PARAR
+"""
+
+
+def run_guest(source, disk_path, engine, mem_size):
+    """Enlaza source con lib/disk.asm y lo ejecuta con el disco sobre disk_path."""
+    from runner import build_program, new_machine, DISK_PORT
+    from compiler.Loader import Loader
+
+    with tempfile.NamedTemporaryFile('w', suffix='.asm', delete=False, encoding='utf-8') as f:
+        f.write(source)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            programa = build_program(f.name, [os.path.join(ROOT, 'lib', 'disk.asm')])
+    finally:
+        os.unlink(f.name)
+    cpu, _, _ = new_machine(mem_size, disk_file=disk_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        Loader(cpu.memory).load_in_memory(programa.codigo, 0)
+    cpu.set_pc(0)
+    cpu.set_sp(mem_size - STACK)  # la pila crece hacia arriba, por encima del buffer DMA
+    t0 = time.perf_counter()
+    cycles = cpu.run(engine=engine)
+    secs = time.perf_counter() - t0
+    cpu.io.get_device(DISK_PORT).close()
+    return cpu, cycles, secs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="DMA frente a E/S programada del disco de bloques")
+    parser.add_argument('--mb', type=float, default=8, help="tamaño del archivo en MiB")
+    parser.add_argument('--chunk', type=int, default=64, help="sectores por orden DMA")
+    parser.add_argument('--pio-kb', type=int, default=256, help="KiB leídos byte a byte")
+    parser.add_argument('--engine', default='trace')
+    parser.add_argument('--src', default=os.path.join(ROOT, 'src'),
+                        help="directorio src/ a medir (por defecto el de este checkout)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    sector = 512
+    chunk_bytes = args.chunk * sector
+    nbytes = int(args.mb * 2**20) // chunk_bytes * chunk_bytes
+    data = os.urandom(nbytes)
+    pio_bytes = min(args.pio_kb * 1024, nbytes)
+    mem_size = max(2**17, BUFFER + max(chunk_bytes, pio_bytes) + STACK)
+
+    print(f"src: {os.path.abspath(args.src)}  engine: {args.engine}  "
+          f"archivo: {nbytes / 2**20:.1f} MiB  orden DMA: {args.chunk} sectores")
+    print(f"{'Modo':<8} {'Bytes':>12} {'Instr':>10} {'Tiempo(s)':>10} {'MiB/s':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'disco.img')
+        for mode in ('dma', 'copia', 'pio'):
+            with open(path, 'wb') as f:
+                f.write(data)
+            if mode == 'pio':
+                source = PIO.format(buffer=BUFFER, nbytes=pio_bytes)
+                moved = pio_bytes
+            else:
+                source = (DMA if mode == 'dma' else COPIA).format(buffer=BUFFER, chunk=args.chunk)
+                moved = nbytes
+            cpu, cycles, secs = run_guest(source, path, args.engine, mem_size)
+            if mode == 'copia':
+                with open(path, 'rb') as f:
+                    ok = f.read() == data + data
+            else:
+                last = (moved - 1) // chunk_bytes * chunk_bytes if mode == 'dma' else 0
+                size = chunk_bytes if mode == 'dma' else pio_bytes
+                ok = cpu.memory.get_bytes(BUFFER, size) == data[last:last + size]
+            print(f"{mode:<8} {moved:>12} {cycles:>10} {secs:>10.3f} {moved / 2**20 / secs:>10.1f}"
+                  f"{'' if ok else '  ¡datos distintos!'}")
+
+
+if __name__ == '__main__':
+    main()
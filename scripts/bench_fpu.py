@@ -0,0 +1,114 @@
+"""
+Benchmark de la FPU: bucle de coma flotante (CVTI2F, FSQRT, FMUL, FADD, FDIV, FSIN).
+
+Uso:
+    python scripts/bench_fpu.py                    # 200000 iteraciones, float64 y float32
+    python scripts/bench_fpu.py --n 50000 --engine interp
+    python scripts/bench_fpu.py --src /tmp/otro/src   # medir otro checkout (antes/después)
+
+Cada iteración acumula sin(sqrt(i) / (3 * sqrt(i) + 3)) y se compara el
+resultado final con el mismo cálculo hecho en Python. Las instrucciones FPU no
+las traduce el motor de bloques, así que el tiempo lo marcan sus manejadores.
+"""
+import argparse
+import contextlib
+import io
+import logging
+import math
+import os
+import struct
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+KERNEL = """
+    MOVV8 R08, 0
+    MOVV8 R09, {n}
+    MOVV8 R05, 0
+    CVTI2F{size} R05, R05      ; acumulador = 0.0
+    MOVV8 R06, 3
+    CVTI2F{size} R06, R06      ; R06 = 3.0
+BUCLE:
+    CMP R08, R09
+    JGE FIN
+    CVTI2F{size} R01, R08
+    FSQRT{size} R01
+    MOV8 R02, R01
+    FMUL{size} R02, R06
+    FADD{size} R02, R06
+    FDIV{size} R01, R02
+    FSIN{size} R01
+    FADD{size} R05, R01
+    ADDV8 R08, 1
+    JMP BUCLE
+FIN:
+    PARAR
+"""
+
+
+def expected(n, size):
+    """El mismo bucle en Python (redondeando a float32 en cada paso si size == 4)."""
+    if size == 8:
+        r = lambda x: x
+    else:
+        f32 = struct.Struct('<f')
+        r = lambda x: f32.unpack(f32.pack(x))[0]
+    acc = 0.0
+    for i in range(n):
+        s = r(math.sqrt(r(float(i))))
+        acc = r(acc + r(math.sin(r(s / r(r(s * 3.0) + 3.0)))))
+    return acc
+
+
+def run_guest(source, engine, mem_size):
+    from runner import build_program
+    from machine.Memory.Memory import Memory
+    from machine.CPU.CPU import CPU
+    from machine.IO.IOsystem import IOSystem
+    from compiler.Loader import Loader
+
+    with tempfile.NamedTemporaryFile('w', suffix='.asm', delete=False, encoding='utf-8') as f:
+        f.write(source)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            programa = build_program(f.name, [])
+    finally:
+        os.unlink(f.name)
+    cpu = CPU(Memory(mem_size, auto_load=False, auto_save_at_exit=False), IOSystem())
+    with contextlib.redirect_stdout(io.StringIO()):
+        Loader(cpu.memory).load_in_memory(programa.codigo, 0)
+    cpu.set_pc(0)
+    cpu.set_sp(mem_size // 2)
+    t0 = time.perf_counter()
+    cycles = cpu.run(max_cycles=10**9, engine=engine)
+    return cpu, cycles, time.perf_counter() - t0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Instrucciones/segundo de un bucle de coma flotante")
+    parser.add_argument('--n', type=int, default=200_000, help="iteraciones del bucle")
+    parser.add_argument('--engine', default='trace')
+    parser.add_argument('--mem-size', type=int, default=2**16)
+    parser.add_argument('--src', default=os.path.join(ROOT, 'src'),
+                        help="directorio src/ a medir (por defecto el de este checkout)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    print(f"src: {os.path.abspath(args.src)}  engine: {args.engine}  iteraciones: {args.n}")
+    print(f"{'Tipo':<8} {'Instr':>10} {'Tiempo(s)':>10} {'Instr/s':>12} {'Resultado':>22}")
+    for size, name in ((8, 'float64'), (4, 'float32')):
+        cpu, cycles, secs = run_guest(KERNEL.format(n=args.n, size=size), args.engine, args.mem_size)
+        fmt = '<d' if size == 8 else '<f'
+        bits = cpu.regs[5] & ((1 << (size * 8)) - 1)
+        result = struct.unpack(fmt, bits.to_bytes(size, 'little'))[0]
+        ok = result == expected(args.n, size)
+        print(f"{name:<8} {cycles:>10} {secs:>10.3f} {cycles / secs:>12,.0f} {result:>22.12g}"
+              f"{'' if ok else '  ¡resultado distinto!'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Microbenchmark de la tabla de símbolos de Memory: register_symbol y find_symbol_at.
+
+Uso:
+    python scripts/bench_symbols.py                  # 1000, 5000 y 20000 símbolos
+    python scripts/bench_symbols.py -n 10000 -n 50000
+    python scripts/bench_symbols.py --src /ruta/a/otro/checkout/src
+
+Registra variables globales (absolutas, como .DATA del cargador) y locales
+relativas a BP (meta['local_rel']), y luego resuelve direcciones como lo hace
+la traza de STORE: mitad dentro de globales, mitad en la pila con un BP dado.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def bench(n, lookups, seed=0):
+    from machine.Memory.Memory import Memory
+
+    rnd = random.Random(seed)
+    mem = Memory(2**20, auto_load=False, auto_save_at_exit=False)
+    n_abs = n * 3 // 4
+    globals_ = [(0x10000 + 16 * i, rnd.choice((1, 2, 4, 8))) for i in range(n_abs)]
+    rnd.shuffle(globals_)
+    locals_ = [(-8 * (i + 1), 8) for i in range(n - n_abs)]
+
+    t0 = time.perf_counter()
+    for i, (addr, size) in enumerate(globals_):
+        mem.register_symbol(f"g{i}", addr, size, meta={'init_bytes': '00' * size})
+    for i, (rel, size) in enumerate(locals_):
+        mem.register_symbol(f"l{i}", None, size, meta={'local_rel': rel, 'func': f"f{i % 50}"})
+    t_register = time.perf_counter() - t0
+
+    bp = 0x1C010
+    queries = []
+    for _ in range(lookups):
+        if rnd.random() < 0.5:
+            addr, size = rnd.choice(globals_)
+            queries.append(addr + rnd.randrange(size))
+        else:
+            rel, _ = rnd.choice(locals_) if locals_ else (0, 0)
+            queries.append(bp + rel)
+
+    t0 = time.perf_counter()
+    hits = 0
+    for addr in queries:
+        if mem.find_symbol_at(addr, bp=bp) is not None:
+            hits += 1
+    t_find = time.perf_counter() - t0
+    return t_register, t_find, hits
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="register_symbol / find_symbol_at de Memory")
+    parser.add_argument('-n', '--symbols', type=int, action='append',
+                        help="número de símbolos (repetible); por defecto 1000, 5000 y 20000")
+    parser.add_argument('--lookups', type=int, default=20_000)
+    parser.add_argument('--src', default=os.path.join(ROOT, 'src'),
+                        help="directorio src/ a medir (por defecto el de este checkout)")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.path.abspath(args.src))
+    print(f"src: {os.path.abspath(args.src)}")
+    print(f"{'Símbolos':>9} {'Registro(s)':>12} {'us/registro':>12} {'Búsquedas':>10} {'Tiempo(s)':>10} {'us/búsqueda':>12}")
+    for n in args.symbols or [1000, 5000, 20000]:
+        t_reg, t_find, hits = bench(n, args.lookups)
+        print(f"{n:>9} {t_reg:>12.3f} {1e6 * t_reg / n:>12.2f} {args.lookups:>10} {t_find:>10.3f}"
+              f" {1e6 * t_find / args.lookups:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -36,13 +36,15 @@ class SimuladorGUI:
         # Wire device callback so Screen.show forwards characters to GUI output
         try:
             # append raw without a leading newline
-            def _on_machine_show(ch: str):
+            def _on_machine_show(chunk: str):
                 try:
-                    self.texto_salida.insert('end', ch)
+                    self.texto_salida.insert('end', chunk)
                     self.texto_salida.see('end')
                 except Exception:
                     pass
             self.machine_out.on_show = _on_machine_show
+            # Mostrar lo pendiente (p. ej. un prompt) antes de esperar entrada
+            self.machine_in.on_empty = self.machine_out.flush
         except Exception:
             # If anything fails here, continue without GUI forwarding
             pass
@@ -869,7 +871,12 @@ class SimuladorGUI:
         # Reiniciar componentes - preservar memoria e I/O
         memory = self.cpu.memory
         io_system = self.cpu.io
+        tracer = getattr(self.cpu, 'store_tracer', None)
         self.cpu = CPU(memory, io_system)
+        # El CPU nuevo no trae el StoreTracer de main.py: sin él la tabla STORE queda vacía
+        if tracer is not None:
+            tracer.clear()
+            self.cpu.set_store_tracer(tracer)
         
         # Reiniciar PC a 0 y estado de ejecución
         self.cpu.pc = 0
@@ -877,7 +884,7 @@ class SimuladorGUI:
         
         # Limpiar buffers de I/O
         self.machine_out.buffer = ""
-        self.machine_in.buffer = []
+        self.machine_in.clear()
         
         ##self.disco = Disco()  # También reiniciar el disco
         self.programa_actual = []  # Limpiar programa actual
@@ -1040,8 +1047,15 @@ class SimuladorGUI:
         # Actualizar visor de RAM
         self.refrescar_visor_ram()
 
-        # Actualizar Salida maquina
-        self.set_salida(self.machine_out.buffer)
+        # Actualizar Salida maquina (solo si cambió desde la última vez)
+        self.machine_out.flush()
+        if self.machine_out.version != getattr(self, '_salida_version', None):
+            self._salida_version = self.machine_out.version
+            self.set_salida(self.machine_out.buffer)
+
+        # Volcar al log las escrituras a variables registradas desde la última actualización
+        if getattr(self.cpu, 'store_tracer', None) is not None:
+            self.cpu.store_tracer.flush(self.cpu.memory)
 
     def mainloop(self):
         self.root.mainloop()
@@ -1141,6 +1155,11 @@ class SimuladorGUI:
             iid = f"{addr}"
             self.ram_tree.insert("", "end", iid=iid, values=vals)
 
+        # Desde aquí solo se repintan las páginas que se escriban (Memory.fetch_dirty)
+        self._ram_view_mem = self.cpu.memory
+        if hasattr(self.cpu.memory, 'dirty_token'):
+            self._ram_view_token = self.cpu.memory.dirty_token()
+
     def refrescar_visor_ram(self):
         # Actualizar valores por fila para minimizar parpadeos
         mem_len = len(self.cpu.memory)
@@ -1148,12 +1167,18 @@ class SimuladorGUI:
         expected_rows = (mem_len + 7) // 8
         current_rows = len(self.ram_tree.get_children(""))
 
-        if current_rows != expected_rows:
-            # Si cambia la cantidad, repoblar
+        if current_rows != expected_rows or getattr(self, '_ram_view_mem', None) is not self.cpu.memory:
+            # Si cambia la cantidad (u otra RAM), repoblar
             self._poblar_visor_ram_inicial()
             return
 
-        for addr in range(0, mem_len, 8):
+        if hasattr(self.cpu.memory, 'fetch_dirty'):
+            ranges, self._ram_view_token = self.cpu.memory.fetch_dirty(self._ram_view_token)
+            rows = (addr for start, end in ranges for addr in range(start, end, 8))
+        else:
+            rows = range(0, mem_len, 8)
+
+        for addr in rows:
             chunk = getb(addr, min(8, mem_len - addr))
             if len(chunk) < 8:
                 chunk = bytes(chunk) + bytes(8 - len(chunk))
@@ -1247,8 +1272,8 @@ class SimuladorGUI:
         try:
             self.cpu.memory.clear()
             # Persistir inmediatamente si existe archivo configurado
-            if hasattr(self.cpu.memory, 'save_to_txt') and hasattr(self.cpu.memory, 'memory_file'):
-                self.cpu.memory.save_to_txt(self.cpu.memory.memory_file)
+            if hasattr(self.cpu.memory, 'persist'):
+                self.cpu.memory.persist()
             
             # Refrescar el visor de RAM si está abierto - ejecutar el código del botón refrescar
             if hasattr(self, 'ram_tree'):
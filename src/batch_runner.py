@@ -0,0 +1,328 @@
+"""
+Ejecución por lotes de muchos programas independientes en paralelo.
+
+Uso:
+    python src/batch_runner.py Algoritmos/Ejemplos_alto_nivel            # todos los .txt/.asm del directorio
+    python src/batch_runner.py a.asm b.txt --link lib/stdio.asm --input "hola" --json informe.json
+    python src/batch_runner.py --jobs trabajos.json --workers 4 --run-timeout 5 --max-cycles 1000000
+
+Cada trabajo recorre el mismo camino que runner.py (preprocesar → compilar →
+ensamblar → enlazar → cargar → ejecutar) en un proceso de un
+ProcessPoolExecutor, con su límite de ciclos y de tiempo, y devuelve la salida
+de la pantalla capturada en vez de escribirla en stdout. Los resultados se
+juntan en un informe JSON (--json, "-" para stdout) en el orden de los trabajos.
+
+--jobs lee una lista JSON de trabajos; cada uno es un objeto con "program" y,
+opcionalmente, las claves de JOB_DEFAULTS (link, input, max_cycles, run_timeout,
+engine...). Lo que no indique un trabajo lo ponen las opciones de la línea de
+órdenes.
+
+run_timeout limita solo la ejecución de la CPU y se comprueba entre tramos de
+RUN_SLICE ciclos, así que un trabajo puede pasarse un poco. No es un límite del
+trabajo entero: la compilación, la carga y un dispositivo que se quede esperando
+dentro de un tramo no se interrumpen, ni en este proceso ni en el pool. Los procesos
+se preparan una vez (initializer): importan el compilador con las tablas LALR
+ya generadas (el proceso principal las genera antes de arrancar el pool, así
+los trabajadores no reescriben parsetab.py a la vez) y reutilizan los lexers
+de PLY ya construidos; entre trabajos solo se olvidan los #define.
+
+Estado de cada trabajo (y código de salida, como runner.py):
+    ok (0), build_error (1, también si no se puede cargar), max_cycles (2),
+    timeout (2), runtime_error (3), worker_error (3, el proceso murió)
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from runner import BuildError, build_program, new_machine, feed_keyboard
+from machine.CPU.CPU import CPU
+from compiler.Loader import Loader
+
+logger = logging.getLogger("machine.batch")
+
+# Ciclos entre dos comprobaciones del tiempo límite
+RUN_SLICE = 200_000
+
+JOB_DEFAULTS = {
+    "name": None,          # por defecto la ruta del programa
+    "link": [],
+    "input": None,         # texto para el teclado (una línea por '\n'); sin él, teclado vacío
+    "base_path": ".",
+    "start": 0,
+    "mem_size": 2**17,
+    "max_cycles": 10_000_000,
+    "run_timeout": None,   # segundos de ejecución de la CPU (no de la compilación); None = sin límite
+    "engine": "trace",
+    "interrupts": False,
+    "protect": False,
+}
+
+EXIT_CODES = {"ok": 0, "build_error": 1, "max_cycles": 2, "timeout": 2,
+              "runtime_error": 3, "worker_error": 3}
+
+SOURCE_EXTENSIONS = (".txt", ".asm", ".relo")
+
+
+def make_job(program, **options):
+    """Trabajo completo (dict serializable) con los valores por defecto de JOB_DEFAULTS."""
+    unknown = set(options) - set(JOB_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Opciones de trabajo desconocidas: {sorted(unknown)}")
+    job = dict(JOB_DEFAULTS, **options)
+    job["program"] = program
+    job["link"] = list(job["link"])
+    if job["name"] is None:
+        job["name"] = program
+    if job["engine"] not in CPU.ENGINES:
+        raise ValueError(f"Unknown engine: {job['engine']!r}")
+    return job
+
+
+class _LogCapture(logging.Handler):
+    """Guarda los avisos de un trabajo (compilador, E/S...) para el informe."""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(f"{record.levelname}:{record.name}: {record.getMessage()}")
+
+
+def load_compiler():
+    """Importa el compilador: construye el parser (tablas LALR de parsetab.py,
+    o las genera si la gramática cambió) y los lexers de PLY una sola vez."""
+    from compiler import syntax_analizer, semantic_analyzer, code_generator  # noqa: F401
+    from compiler import Preprocessor, ensamblador  # noqa: F401
+
+
+def warm_up():
+    """Initializer de los procesos del pool. Los avisos (logging y warnings de
+    Python) solo van al informe de cada trabajo, no a la consola."""
+    load_compiler()
+    logging.captureWarnings(True)
+    logging.getLogger().handlers[:] = [logging.NullHandler()]
+
+
+def _execute(cpu, job):
+    """Ejecuta por tramos para poder mirar el reloj; devuelve (ciclos, estado)."""
+    max_cycles, timeout = job["max_cycles"], job["run_timeout"]
+    t0 = time.perf_counter()
+    cycles = 0
+    while True:
+        budget = max_cycles - cycles
+        if timeout is not None:
+            budget = min(budget, RUN_SLICE)
+        try:
+            return cycles + cpu.run(max_cycles=budget, engine=job["engine"]), "ok"
+        except RuntimeError as e:
+            if str(e) != "Max cycles reached":
+                raise
+        cycles += budget
+        if not cpu.running:
+            return cycles, "ok"        # PARAR justo en la última instrucción del tramo
+        if cycles >= max_cycles:
+            return cycles, "max_cycles"
+        if time.perf_counter() - t0 >= timeout:
+            return cycles, "timeout"
+
+
+def run_job(job):
+    """Compila, carga y ejecuta un trabajo. Los errores de construcción, carga
+    y ejecución van al resultado; solo un trabajo mal formado (make_job) lanza."""
+    from compiler import Preprocessor
+    job = make_job(job["program"], **{k: v for k, v in job.items() if k != "program"})
+    result = {"name": job["name"], "program": job["program"], "status": None, "exit_code": None,
+              "cycles": 0, "build_seconds": 0.0, "run_seconds": 0.0, "output": "",
+              "error": None, "pc": None, "log": []}
+    capture = _LogCapture()
+    root = logging.getLogger()
+    root.addHandler(capture)
+    Preprocessor.reset()
+    screen = None
+    try:
+        t0 = time.perf_counter()
+        try:
+            programa = build_program(job["program"], job["link"], job["base_path"])
+        except BuildError as e:
+            result.update(status="build_error", error=str(e))
+            return result
+        except Exception as e:
+            result.update(status="build_error", error=f"{type(e).__name__}: {e}")
+            return result
+        finally:
+            result["build_seconds"] = time.perf_counter() - t0
+
+        # Preparar la máquina y cargar también es parte de la construcción:
+        # p.ej. un programa que no cabe en mem_size o un start fuera de la RAM
+        try:
+            cpu, screen, keyboard = new_machine(job["mem_size"], interrupts=job["interrupts"])
+            Loader(cpu.memory).load_in_memory(programa.codigo, job["start"])
+            cpu.set_pc(job["start"])
+            cpu.set_sp(cpu.memory.size // 2)
+            if job["protect"]:
+                cpu.memory.enable_protection()
+            if job["input"] is not None:
+                feed_keyboard(keyboard, job["input"].split("\n"))
+            keyboard.close()
+        except Exception as e:
+            result.update(status="build_error", error=f"carga: {type(e).__name__}: {e}")
+            return result
+
+        t0 = time.perf_counter()
+        try:
+            result["cycles"], result["status"] = _execute(cpu, job)
+        except Exception as e:
+            result.update(status="runtime_error", error=f"{type(e).__name__}: {e}")
+        finally:
+            result["run_seconds"] = time.perf_counter() - t0
+        result["pc"] = cpu.pc
+    finally:
+        if screen is not None:
+            screen.flush()
+            result["output"] = screen.buffer
+        root.removeHandler(capture)
+        result["log"] = capture.lines
+        if result["status"] is not None:
+            result["exit_code"] = EXIT_CODES[result["status"]]
+    return result
+
+
+def run_batch(jobs, workers=None, on_result=None):
+    """Ejecuta los trabajos (dicts de make_job o con al menos "program") y
+    devuelve el informe {"jobs": [...], "summary": {...}}.
+
+    workers=1 ejecuta todo en este proceso; si no, un ProcessPoolExecutor con
+    `workers` procesos (None = os.cpu_count()). on_result(result) se llama al
+    terminar cada trabajo, en el orden en que terminan."""
+    jobs = [make_job(job["program"], **{k: v for k, v in job.items() if k != "program"})
+            for job in jobs]
+    t0 = time.perf_counter()
+    # Las tablas del parser se generan (si hace falta) aquí, antes de que los
+    # trabajadores las lean
+    load_compiler()
+    results = [None] * len(jobs)
+    if workers == 1 or len(jobs) <= 1:
+        for i, job in enumerate(jobs):
+            results[i] = run_job(job)
+            if on_result is not None:
+                on_result(results[i])
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=warm_up) as pool:
+            futures = {pool.submit(run_job, job): i for i, job in enumerate(jobs)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    job = jobs[i]
+                    results[i] = {"name": job["name"], "program": job["program"],
+                                  "status": "worker_error", "exit_code": EXIT_CODES["worker_error"],
+                                  "cycles": 0, "build_seconds": 0.0, "run_seconds": 0.0,
+                                  "output": "", "error": f"{type(e).__name__}: {e}",
+                                  "pc": None, "log": []}
+                if on_result is not None:
+                    on_result(results[i])
+    return {"jobs": results, "summary": summarize(results, time.perf_counter() - t0, workers)}
+
+
+def summarize(results, wall_seconds, workers=None):
+    statuses = {}
+    for r in results:
+        statuses[r["status"]] = statuses.get(r["status"], 0) + 1
+    return {
+        "total": len(results),
+        "statuses": statuses,
+        "failed": sum(1 for r in results if r["status"] != "ok"),
+        "cycles": sum(r["cycles"] for r in results),
+        "build_seconds": sum(r["build_seconds"] for r in results),
+        "run_seconds": sum(r["run_seconds"] for r in results),
+        "wall_seconds": wall_seconds,
+        "workers": workers or os.cpu_count(),
+    }
+
+
+def collect_programs(paths):
+    """Expande directorios (recursivamente) a sus .txt/.asm/.relo, en orden."""
+    programs = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                programs += [os.path.join(dirpath, f) for f in sorted(filenames)
+                             if f.endswith(SOURCE_EXTENSIONS)]
+        else:
+            programs.append(path)
+    return programs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ejecuta muchos programas Atlas en paralelo")
+    parser.add_argument("programs", nargs="*", metavar="PROGRAMA",
+                        help="programas (.txt, .asm, .relo) o directorios que los contienen")
+    parser.add_argument("--jobs", default=None, metavar="ARCHIVO",
+                        help="lista JSON de trabajos ({\"program\": ..., \"input\": ..., ...})")
+    parser.add_argument("--link", action="append", default=[], metavar="ARCHIVO",
+                        help="relocalizable a enlazar tras cada programa; repetible")
+    parser.add_argument("--base-path", default=".")
+    parser.add_argument("--input", default=None, help="texto para el teclado de cada programa")
+    parser.add_argument("--mem-size", type=lambda s: int(s, 0), default=JOB_DEFAULTS["mem_size"])
+    parser.add_argument("--max-cycles", type=int, default=JOB_DEFAULTS["max_cycles"])
+    parser.add_argument("--run-timeout", type=float, default=None, metavar="SEGUNDOS",
+                        help="segundos de ejecución de la CPU por trabajo; no limita la compilación "
+                             "ni la carga, y se comprueba cada %d ciclos" % RUN_SLICE)
+    parser.add_argument("--engine", default=JOB_DEFAULTS["engine"], choices=CPU.ENGINES)
+    parser.add_argument("--interrupts", action="store_true")
+    parser.add_argument("--protect", action="store_true")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="procesos del pool (por defecto uno por CPU; 1 = sin pool)")
+    parser.add_argument("--json", default=None, metavar="ARCHIVO",
+                        help="guarda el informe JSON (\"-\" para stdout)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="sin una línea por trabajo")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+    defaults = {"link": args.link, "base_path": args.base_path, "input": args.input,
+                "mem_size": args.mem_size, "max_cycles": args.max_cycles, "run_timeout": args.run_timeout,
+                "engine": args.engine, "interrupts": args.interrupts, "protect": args.protect}
+    specs = [{"program": p} for p in collect_programs(args.programs)]
+    if args.jobs:
+        with open(args.jobs, "r", encoding="utf-8") as f:
+            specs += json.load(f)
+    if not specs:
+        parser.error("no hay programas que ejecutar")
+    try:
+        jobs = [make_job(spec["program"], **dict(defaults, **{k: v for k, v in spec.items() if k != "program"}))
+                for spec in specs]
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"error: trabajo no válido: {e}", file=sys.stderr)
+        return 1
+
+    report_out = sys.stderr if args.json == "-" else sys.stdout
+
+    def show(result):
+        if not args.quiet:
+            print(f"{result['status']:<14} {result['cycles']:>12} "
+                  f"{result['build_seconds'] + result['run_seconds']:>8.3f}s  {result['name']}",
+                  file=report_out, flush=True)
+
+    report = run_batch(jobs, workers=args.workers, on_result=show)
+    summary = report["summary"]
+    counts = ", ".join(f"{status}: {n}" for status, n in sorted(summary["statuses"].items()))
+    print(f"{summary['total']} trabajos en {summary['wall_seconds']:.2f} s "
+          f"({summary['workers']} procesos) - {counts}", file=report_out)
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-from machine.Memory.Memory import Memory
+from machine.Memory.Memory import Memory, PROT_RX, PROT_RW
 import logging
 import struct
 
@@ -156,6 +156,10 @@ class Loader :
             absoluto += f"{ins:016X}\n"
             address += 8
 
+        # Región de código: lectura/ejecución, sin escritura (ver Memory.enable_protection)
+        if address > start_address and hasattr(self.memory, 'set_region'):
+            self.memory.set_region(f"codigo@{start_address:#x}", start_address, address, PROT_RX)
+
         # Apply .DATA entries (deterministic initialization at load-time)
         if self.init_data_on_load and data_entries:
             for entry in data_entries:
@@ -198,6 +202,8 @@ class Loader :
                     data = bytes.fromhex(entry.get('bytes_hex',''))
                     # write raw bytes to memory at addr
                     self.memory.load_bytes(addr, data)
+                    if data and hasattr(self.memory, 'set_region'):
+                        self.memory.set_region(f".DATA {entry.get('name') or f'{addr:#x}'}", addr, addr + len(data), PROT_RW)
                     # produce an interpreted initializer representation for the loader
                     init_repr = None
                     try:
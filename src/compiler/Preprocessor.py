@@ -72,14 +72,22 @@ lexer = lex.lex()
 macros = {}
 conditional_stack = []
 
+def reset():
+    """Olvida los #define y los #ifdef abiertos: el estado es global y, sin
+    esto, pasa de un programa al siguiente dentro del mismo proceso."""
+    macros.clear()
+    conditional_stack.clear()
+
 def preprocess(code: str, base_path="."):
-    ### Create a new lexer to preprocess so its posible to preprocess included files with no conflict
-    lexer = lex.lex()
-    lexer.input(code)
+    ### Clone the module lexer so its posible to preprocess included files with no conflict
+    ### (clone() reuses the already-built rules instead of building a new lexer)
+    file_lexer = lexer.clone()
+    file_lexer.lineno = 1
+    file_lexer.input(code)
     result = []
     current_line = []
 
-    for tok in lexer:
+    for tok in file_lexer:
         
         if tok.type == 'NEWLINE':
             process_line(current_line, result, base_path)
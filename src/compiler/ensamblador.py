@@ -73,6 +73,10 @@ def t_error(t):
     print(f"Carácter ilegal '{t.value[0]}' en línea {t.lexer.lineno}")
     t.lexer.skip(1)
 
+# Construir el lexer (validar reglas, compilar la expresión maestra) es lo caro:
+# se hace una vez al importar y cada Ensamblador usa un clon
+_lexer = lex.lex()
+
 
 # =============================================
 # Para castear flotantes
@@ -175,7 +179,7 @@ class Ensamblador:
     """Ensamblador completo con PLY y generación de bytecode"""
     
     def __init__(self):
-        self.lexer = lex.lex()
+        self.lexer = _lexer.clone()
         # Tabla de símbolos (etiquetas y direcciones)
         self.labels = {}
         self.extern_labels = {}
@@ -189,6 +189,13 @@ INSTRUCTION_SET = {
     'PUSH8':{'opcode': 0x0823, 'format': 'R',  'requiresAddress': False},
     'PUSH':{'opcode': 0x0823, 'format': 'R',  'requiresAddress': False},
 
+    # Interrupciones
+    'EI':    {'opcode': 0x0900, 'format': 'OP', 'requiresAddress': False},  # habilitar
+    'DI':    {'opcode': 0x0901, 'format': 'OP', 'requiresAddress': False},  # deshabilitar
+    'RTI':   {'opcode': 0x0902, 'format': 'OP', 'requiresAddress': False},  # retorno de interrupción
+    'WAIT':  {'opcode': 0x0903, 'format': 'OP', 'requiresAddress': False},  # dormir hasta una interrupción
+    'SETIV': {'opcode': 0x0904, 'format': 'RI', 'requiresAddress': True},   # vector[Rd] = etiqueta
+
 }
 
 
@@ -364,4 +371,11 @@ IS_INV = {
     0x0821: {'mnemonic': 'PUSH2','format': 'R'},
     0x0822: {'mnemonic': 'PUSH4','format': 'R'},
     0x0823: {'mnemonic': 'PUSH8','format': 'R'},
+
+    # Interrupciones
+    0x0900: {'mnemonic': 'EI',    'format': 'OP'},
+    0x0901: {'mnemonic': 'DI',    'format': 'OP'},
+    0x0902: {'mnemonic': 'RTI',   'format': 'OP'},
+    0x0903: {'mnemonic': 'WAIT',  'format': 'OP'},
+    0x0904: {'mnemonic': 'SETIV', 'format': 'RI'},
 }
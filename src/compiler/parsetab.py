@@ -6,7 +6,7 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'rightASIGNARPLUSEQMINUSEQMULTEQDIVEQMODEQleftORLOGleftANDLOGleftORleftXORleftANDleftIGUALDISTINTOleftMENORMENORIGUALMAYORMAYORIGUALleftMASMENOSleftMULTDIVMODrightUNARYleftPUNTOFLECHACORCHIZQPARIZQPLUSPLUSMINUSMINUSAND ANDLOG ASIGNAR BOOLEANO CADENA CARACTER COMA CONSTANTE CONTINUAR CON_SIGNO CORCHDER CORCHIZQ DISTINTO DIV DIVEQ DOBLE ELIMINAR ENTERO ENTERO2 ENTERO4 ENTERO8 ESTRUCTURA EXTERNO FALSO FLECHA FLOT FLOTANTE FUNCION ID IGUAL IMPRIMIR LLAVEDER LLAVEIZQ MAS MAYOR MAYORIGUAL MENOR MENORIGUAL MENOS MIENTRAS MINUSEQ MINUSMINUS MOD MODEQ MULT MULTEQ NOT NUEVO OR ORLOG PARA PARDER PARIZQ PLUSEQ PLUSPLUS PUNTO PUNTOCOMA RETORNAR ROMPER SI SIN_SIGNO SI_NO SI_NO_SI TIPO_CADENA TIPO_CARACTER VACIO VERDADERO XORprogram : declaration_listdeclaration_list : declaration_list declaration\n| declarationdeclaration : function_decl\n| struct_decl\n| var_decl_stmtfunction_decl : FUNCION type ID PARIZQ param_list PARDER block\n| FUNCION type ID PARIZQ PARDER blockfunction_decl : EXTERNO FUNCION type ID PARIZQ param_list PARDER PUNTOCOMA\n| EXTERNO FUNCION type ID PARIZQ PARDER PUNTOCOMAparam_list : param_list COMA param\n| paramparam : type ID\n| type_base array_dims IDstruct_decl : ESTRUCTURA ID LLAVEIZQ member_list LLAVEDER PUNTOCOMAmember_list : member_list member\n| membermember : type ID PUNTOCOMA\n| type_base array_dims ID PUNTOCOMAvar_decl_stmt : var_decl PUNTOCOMAvar_decl : type ID\n| type ID ASIGNAR expression\n| type_base array_dims ID\n| type_base array_dims ID ASIGNAR expressionvar_decl : CONSTANTE type ID ASIGNAR expressionarray_dims : CORCHIZQ ENTERO CORCHDER\n| array_dims CORCHIZQ ENTERO CORCHDERtype : type_base\n| type MULT\n| ID\n| ID MULTtype_base : VACIO\n| ENTERO2\n| ENTERO4\n| ENTERO8\n| TIPO_CARACTER\n| TIPO_CADENA\n| FLOTANTE\n| DOBLE\n| BOOLEANO\n| CON_SIGNO\n| SIN_SIGNOstatement : var_decl_stmt\n| expr_stmt\n| if_stmt\n| while_stmt\n| for_stmt\n| return_stmt\n| break_stmt\n| continue_stmt\n| print_stmt\n| blockblock : LLAVEIZQ statement_list LLAVEDER\n| LLAVEIZQ LLAVEDERstatement_list : statement_list statement\n| statementexpr_stmt : expression PUNTOCOMA\n| PUNTOCOMAif_stmt : SI PARIZQ expression PARDER statement\n| SI PARIZQ expression PARDER statement elif_list\n| SI PARIZQ expression PARDER statement elif_list SI_NO statement\n| SI PARIZQ expression PARDER statement SI_NO statementelif_list : elif_clause\n| elif_list elif_clauseelif_clause : SI_NO_SI PARIZQ expression PARDER statementwhile_stmt : MIENTRAS PARIZQ expression PARDER statementfor_stmt : PARA PARIZQ for_init_opt PUNTOCOMA expr_opt PUNTOCOMA expr_opt PARDER statementfor_init_opt : var_decl\n| expression\n| emptyexpr_opt : expression\n| emptyreturn_stmt : RETORNAR expression PUNTOCOMA\n| RETORNAR PUNTOCOMAbreak_stmt : ROMPER PUNTOCOMAcontinue_stmt : CONTINUAR PUNTOCOMAprint_stmt : IMPRIMIR PARIZQ argument_list PARDER PUNTOCOMA\n| IMPRIMIR PARIZQ PARDER PUNTOCOMAexpression : assignmentassignment : logical ASIGNAR assignment\n| logical PLUSEQ assignment\n| logical MINUSEQ assignment\n| logical MULTEQ assignment\n| logical DIVEQ assignment\n| logical MODEQ assignment\n| logicallogical : logical ORLOG logical_and\n| logical_andlogical_and : logical_and ANDLOG bitwise_or\n| bitwise_orbitwise_or : bitwise_or OR bitwise_xor\n| bitwise_xorbitwise_xor : bitwise_xor XOR bitwise_and\n| bitwise_andbitwise_and : bitwise_and AND equality\n| equalityequality : equality IGUAL relational\n| equality DISTINTO relational\n| relationalrelational : relational MENOR additive\n| relational MENORIGUAL additive\n| relational MAYOR additive\n| relational MAYORIGUAL additive\n| additiveadditive : additive MAS multiplicative\n| additive MENOS multiplicative\n| multiplicativemultiplicative : multiplicative MULT unary\n| multiplicative DIV unary\n| multiplicative MOD unary\n| unaryunary : NOT unary\n| MENOS unary %prec UNARY\n| PLUSPLUS unary\n| MINUSMINUS unary\n| MULT unary %prec UNARY\n| AND unary %prec UNARY\n| postfixpostfix : postfix PLUSPLUS\n| postfix MINUSMINUS\n| postfix PUNTO ID\n| postfix FLECHA ID\n| postfix CORCHIZQ expression CORCHDER\n| postfix PARIZQ argument_list PARDER\n| postfix PARIZQ PARDER\n| primaryargument_list : argument_list COMA expression\n| expressionprimary : ID\n| ENTERO\n| FLOT\n| CARACTER\n| CADENA\n| VERDADERO\n| FALSO\n| PARIZQ expression PARDER\n| new_expr\n| delete_exprnew_expr : NUEVO typedelete_expr : ELIMINAR unaryempty :'
+_lr_signature = 'rightASIGNARPLUSEQMINUSEQMULTEQDIVEQMODEQleftORLOGleftANDLOGleftORleftXORleftANDleftIGUALDISTINTOleftMENORMENORIGUALMAYORMAYORIGUALleftMASMENOSleftMULTDIVMODrightUNARYleftPUNTOFLECHACORCHIZQPARIZQPLUSPLUSMINUSMINUSAND ANDLOG ASIGNAR BOOLEANO CADENA CARACTER COMA CONSTANTE CONTINUAR CON_SIGNO CORCHDER CORCHIZQ DISTINTO DIV DIVEQ DOBLE ELIMINAR ENTERO ENTERO2 ENTERO4 ENTERO8 ESTRUCTURA EXTERNO FALSO FLECHA FLOT FLOTANTE FUNCION ID IGUAL IMPRIMIR LLAVEDER LLAVEIZQ MAS MAYOR MAYORIGUAL MENOR MENORIGUAL MENOS MIENTRAS MINUSEQ MINUSMINUS MOD MODEQ MULT MULTEQ NOT NUEVO OR ORLOG PARA PARDER PARIZQ PLUSEQ PLUSPLUS PUNTO PUNTOCOMA RETORNAR ROMPER SI SIN_SIGNO SI_NO SI_NO_SI TIPO_CADENA TIPO_CARACTER VACIO VERDADERO XORprogram : declaration_listdeclaration_list : declaration_list declaration\n                        | declarationdeclaration : function_decl\n                   | struct_decl\n                   | var_decl_stmtfunction_decl : FUNCION type ID PARIZQ param_list PARDER block\n                     | FUNCION type ID PARIZQ PARDER blockfunction_decl : EXTERNO FUNCION type ID PARIZQ param_list PARDER PUNTOCOMA\n                     | EXTERNO FUNCION type ID PARIZQ PARDER PUNTOCOMAparam_list : param_list COMA param\n                  | paramparam : type ID\n             | type_base array_dims IDstruct_decl : ESTRUCTURA ID LLAVEIZQ member_list LLAVEDER PUNTOCOMAmember_list : member_list member\n                   | membermember : type ID PUNTOCOMA\n              | type_base array_dims ID PUNTOCOMAvar_decl_stmt : var_decl PUNTOCOMAvar_decl : type ID\n                | type ID ASIGNAR expression\n                | type_base array_dims ID\n                | type_base array_dims ID ASIGNAR expressionvar_decl : CONSTANTE type ID ASIGNAR expressionarray_dims : CORCHIZQ ENTERO CORCHDER\n                  | array_dims CORCHIZQ ENTERO CORCHDERtype : type_base\n            | type MULT\n            | ID\n            | ID MULTtype_base : VACIO\n                 | ENTERO2\n                 | ENTERO4\n                 | ENTERO8\n                 | TIPO_CARACTER\n                 | TIPO_CADENA\n                 | FLOTANTE\n                 | DOBLE\n                 | BOOLEANO\n                 | CON_SIGNO\n                 | SIN_SIGNOstatement : var_decl_stmt\n                 | expr_stmt\n                 | if_stmt\n                 | while_stmt\n                 | for_stmt\n                 | return_stmt\n                 | break_stmt\n                 | continue_stmt\n                 | print_stmt\n                 | blockblock : LLAVEIZQ statement_list LLAVEDER\n             | LLAVEIZQ LLAVEDERstatement_list : statement_list statement\n                      | statementexpr_stmt : expression PUNTOCOMA\n                 | PUNTOCOMAif_stmt : SI PARIZQ expression PARDER statement\n               | SI PARIZQ expression PARDER statement elif_list\n               | SI PARIZQ expression PARDER statement elif_list SI_NO statement\n               | SI PARIZQ expression PARDER statement SI_NO statementelif_list : elif_clause\n                 | elif_list elif_clauseelif_clause : SI_NO_SI PARIZQ expression PARDER statementwhile_stmt : MIENTRAS PARIZQ expression PARDER statementfor_stmt : PARA PARIZQ for_init_opt PUNTOCOMA expr_opt PUNTOCOMA expr_opt PARDER statementfor_init_opt : var_decl\n                    | expression\n                    | emptyexpr_opt : expression\n                | emptyreturn_stmt : RETORNAR expression PUNTOCOMA\n                   | RETORNAR PUNTOCOMAbreak_stmt : ROMPER PUNTOCOMAcontinue_stmt : CONTINUAR PUNTOCOMAprint_stmt : IMPRIMIR PARIZQ argument_list PARDER PUNTOCOMA\n                  | IMPRIMIR PARIZQ PARDER PUNTOCOMAexpression : assignmentassignment : logical ASIGNAR assignment\n                  | logical PLUSEQ assignment\n                  | logical MINUSEQ assignment\n                  | logical MULTEQ assignment\n                  | logical DIVEQ assignment\n                  | logical MODEQ assignment\n                  | logicallogical : logical ORLOG logical_and\n               | logical_andlogical_and : logical_and ANDLOG bitwise_or\n                   | bitwise_orbitwise_or : bitwise_or OR bitwise_xor\n                  | bitwise_xorbitwise_xor : bitwise_xor XOR bitwise_and\n                   | bitwise_andbitwise_and : bitwise_and AND equality\n                   | equalityequality : equality IGUAL relational\n                | equality DISTINTO relational\n                | relationalrelational : relational MENOR additive\n                  | relational MENORIGUAL additive\n                  | relational MAYOR additive\n                  | relational MAYORIGUAL additive\n                  | additiveadditive : additive MAS multiplicative\n                | additive MENOS multiplicative\n                | multiplicativemultiplicative : multiplicative MULT unary\n                      | multiplicative DIV unary\n                      | multiplicative MOD unary\n                      | unaryunary : NOT unary\n             | MENOS unary %prec UNARY\n             | PLUSPLUS unary\n             | MINUSMINUS unary\n             | MULT unary %prec UNARY\n             | AND unary %prec UNARY\n             | postfixpostfix : postfix PLUSPLUS\n               | postfix MINUSMINUS\n               | postfix PUNTO ID\n               | postfix FLECHA ID\n               | postfix CORCHIZQ expression CORCHDER\n               | postfix PARIZQ argument_list PARDER\n               | postfix PARIZQ PARDER\n               | primaryargument_list : argument_list COMA expression\n                     | expressionprimary : ID\n               | ENTERO\n               | FLOT\n               | CARACTER\n               | CADENA\n               | VERDADERO\n               | FALSO\n               | PARIZQ expression PARDER\n               | new_expr\n               | delete_exprnew_expr : NUEVO typedelete_expr : ELIMINAR unaryempty :'
     
 _lr_action_items = {'FUNCION':([0,2,3,4,5,6,10,26,34,141,175,178,181,208,210,222,],[7,7,-3,-4,-5,-6,32,-2,-20,-8,-15,-7,-54,-10,-53,-9,]),'EXTERNO':([0,2,3,4,5,6,26,34,141,175,178,181,208,210,222,],[10,10,-3,-4,-5,-6,-2,-20,-8,-15,-7,-54,-10,-53,-9,]),'ESTRUCTURA':([0,2,3,4,5,6,26,34,141,175,178,181,208,210,222,],[11,11,-3,-4,-5,-6,-2,-20,-8,-15,-7,-54,-10,-53,-9,]),'CONSTANTE':([0,2,3,4,5,6,26,34,141,142,175,178,180,181,182,183,184,185,186,187,188,189,190,191,192,193,208,210,211,212,215,217,218,219,222,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[14,14,-3,-4,-5,-6,-2,-20,-8,14,-15,-7,14,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-10,-53,-55,-57,14,-74,-75,-76,-9,-73,14,14,-78,-59,-66,-77,-60,14,-63,14,-64,-62,-61,14,14,-67,-65,]),'ID':([0,2,3,4,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,30,31,32,34,35,37,39,40,41,46,55,60,61,63,64,65,67,77,78,80,81,82,83,84,86,87,88,92,93,94,95,96,97,98,99,100,101,102,103,105,106,107,108,109,110,111,112,113,114,115,123,124,125,126,130,132,134,136,140,141,142,143,175,176,178,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,202,206,208,209,210,211,212,213,214,215,217,218,219,220,222,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[9,9,-3,-4,-5,-6,9,29,-30,33,-28,9,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-2,38,-28,-29,-31,9,-20,42,45,47,79,9,9,47,47,47,47,47,47,47,9,47,9,-17,133,-28,47,-26,47,138,-28,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,166,167,47,47,9,-16,177,-27,9,-8,202,203,-15,-18,-7,202,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,47,-30,47,-10,-19,-53,-55,-57,47,47,202,-74,-75,-76,47,-9,-73,202,202,47,-78,-59,-66,-77,-60,202,-63,47,202,-64,-62,47,-61,202,202,-67,-65,]),'VACIO':([0,2,3,4,5,6,7,14,26,32,34,41,46,77,80,81,130,132,140,141,142,175,176,178,180,181,182,183,184,185,186,187,188,189,190,191,192,193,208,209,210,211,212,215,217,218,219,222,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[15,15,-3,-4,-5,-6,15,15,-2,15,-20,15,15,15,15,-17,15,-16,15,-8,15,-15,-18,-7,15,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-10,-19,-53,-55,-57,15,-74,-75,-76,-9,-73,15,15,-78,-59,-66,-77,-60,15,-63,15,-64,-62,-61,15,15,-67,-65,]),'ENTERO2':([0,2,3,4,5,6,7,14,26,32,34,41,46,77,80,81,130,132,140,141,142,175,176,178,180,181,182,183,184,185,186,187,188,189,190,191,192,193,208,209,210,211,212,215,217,218,219,222,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[16,16,-3,-4,-5,-6,16,16,-2,16,-20,16,16,16,16,-17,16,-16,16,-8,16,-15,-18,-7,16,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-10,-19,-53,-55,-57,16,-74,-75,-76,-9,-73,16,16,-78,-59,-66,-77,-60,16,-63,16,-64,-62,-61,16,16,-67,-65,]),'ENTERO4':([0,2,3,4,5,6,7,14,26,32,34,41,46,77,80,81,130,132,140,141,142,175,176,178,180,181,182,183,184,185,186,187,188,189,190,191,192,193,208,209,210,211,212,215,217,218,219,222,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[17,17,-3,-4,-5,-6,17,17,-2,17,-20,17,17,17,17,-17,17,-16,17,-8,17,-15,-18,-7,17,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-10,-19,-53,-55,-57,17,-74,-75,-76,-9,-73,17,17,-78,-59,-66,-77,-60,17,-63,17,-64,-62,-61,17,17,-67,-65,]),'ENTERO8':([0,2,3,4,5,6,7,14,26,32,34,41,46,77,80,81,130,132,140,141,142,175,176,178,180,181,182,183,184,185,186,187,188,189,190,191,192,193,208,209,210,211,212,215,217,218,219,222,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[18,18,-3,-4,-5,-6,18,18,-2,18,-20,18,18,18,18,-17,18,-16,18,-8,18,-15,-18,-7,18,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-10,-19,-53,-55,-57,18,-74,-75,-76,-9,-73,18,18,-78,-59,-66,-77,-60,18,-63,18,-64,-62,-61,18,18,-67,-65,]),'TIPO_CARACTER':([0,2,3,4,5,6,7,14,26,32,34,41,46,77,80,81,130,132,140,141,142,175,176,178,180,181,182,183,184,185,186,187,188,189,190,191,192,193,208,209,210,211,212,215,217,218,219,222,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[19,19,-3,-4,-5,-6,19,19,-2,19,-20,19,19,19,19,-17,19,-16,19,-8,19,-15,-18,-7,19,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-10,-19,-53,-55,-57,19,-74,-75,-76,-9,-73,19,19,-78,-59,-66,-77,-60,19,-63,19,-64,-62,-61,19,19,-67,-65,]),'TIPO_CADENA':([0,2,3,4,5,6,7,14,26,32,34,41,46,77,80,81,130,132,140,141,142,175,176,178,180,181,182,183,184,185,186,187,188,189,190,191,192,193,208,209,210,211,212,215,217,218,219,222,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[20,20,-3,-4,-5,-6,20,20,-2,20,-20,20,20,20,20,-17,20,-16,20,-8,20,-15,-18,-7,20,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-10,-19,-53,-55,-57,20,-74,-75,-76,-9,-73,20,20,-78,-59,-66,-77,-60,20,-63,20,-64,-62,-61,20,20,-67,-65,]),'FLOTANTE':([0,2,3,4,5,6,7,14,26,32,34,41,46,77,80,81,130,132,140,141,142,175,176,178,180,181,182,183,184,185,186,187,188,189,190,191,192,193,208,209,210,211,212,215,217,218,219,222,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[21,21,-3,-4,-5,-6,21,21,-2,21,-20,21,21,21,21,-17,21,-16,21,-8,21,-15,-18,-7,21,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-10,-19,-53,-55,-57,21,-74,-75,-76,-9,-73,21,21,-78,-59,-66,-77,-60,21,-63,21,-64,-62,-61,21,21,-67,-65,]),'DOBLE':([0,2,3,4,5,6,7,14,26,32,34,41,46,77,80,81,130,132,140,141,142,175,176,178,180,181,182,183,184,185,186,187,188,189,190,191,192,193,208,209,210,211,212,215,217,218,219,222,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[22,22,-3,-4,-5,-6,22,22,-2,22,-20,22,22,22,22,-17,22,-16,22,-8,22,-15,-18,-7,22,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-10,-19,-53,-55,-57,22,-74,-75,-76,-9,-73,22,22,-78,-59,-66,-77,-60,22,-63,22,-64,-62,-61,22,22,-67,-65,]),'BOOLEANO':([0,2,3,4,5,6,7,14,26,32,34,41,46,77,80,81,130,132,140,141,142,175,176,178,180,181,182,183,184,185,186,187,188,189,190,191,192,193,208,209,210,211,212,215,217,218,219,222,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[23,23,-3,-4,-5,-6,23,23,-2,23,-20,23,23,23,23,-17,23,-16,23,-8,23,-15,-18,-7,23,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-10,-19,-53,-55,-57,23,-74,-75,-76,-9,-73,23,23,-78,-59,-66,-77,-60,23,-63,23,-64,-62,-61,23,23,-67,-65,]),'CON_SIGNO':([0,2,3,4,5,6,7,14,26,32,34,41,46,77,80,81,130,132,140,141,142,175,176,178,180,181,182,183,184,185,186,187,188,189,190,191,192,193,208,209,210,211,212,215,217,218,219,222,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[24,24,-3,-4,-5,-6,24,24,-2,24,-20,24,24,24,24,-17,24,-16,24,-8,24,-15,-18,-7,24,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-10,-19,-53,-55,-57,24,-74,-75,-76,-9,-73,24,24,-78,-59,-66,-77,-60,24,-63,24,-64,-62,-61,24,24,-67,-65,]),'SIN_SIGNO':([0,2,3,4,5,6,7,14,26,32,34,41,46,77,80,81,130,132,140,141,142,175,176,178,180,181,182,183,184,185,186,187,188,189,190,191,192,193,208,209,210,211,212,215,217,218,219,222,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[25,25,-3,-4,-5,-6,25,25,-2,25,-20,25,25,25,25,-17,25,-16,25,-8,25,-15,-18,-7,25,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-10,-19,-53,-55,-57,25,-74,-75,-76,-9,-73,25,25,-78,-59,-66,-77,-60,25,-63,25,-64,-62,-61,25,25,-67,-65,]),'$end':([1,2,3,4,5,6,26,34,141,175,178,181,208,210,222,],[0,-1,-3,-4,-5,-6,-2,-20,-8,-15,-7,-54,-10,-53,-9,]),'MULT':([8,9,13,15,16,17,18,19,20,21,22,23,24,25,27,28,30,31,34,37,39,40,47,55,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,82,83,84,87,88,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,128,129,142,161,162,163,164,165,166,167,170,172,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,202,204,205,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[30,31,-28,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,30,-28,-29,-31,-20,30,61,30,-129,61,113,61,61,-111,61,61,61,-118,61,-126,-130,-131,-132,-133,-134,-135,-137,-138,61,30,-28,61,61,30,-28,61,61,61,61,61,61,61,61,61,61,61,-117,61,61,61,61,61,61,61,61,61,61,61,-113,-116,-112,-114,-115,-119,-120,61,61,30,-140,61,113,113,-108,-109,-110,-121,-122,-125,-136,61,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,61,31,-123,-124,61,-53,-55,-57,61,61,61,-74,-75,-76,61,-73,61,61,61,-78,-59,-66,-77,-60,61,-63,61,61,-64,-62,61,-61,61,61,-67,-65,]),'PLUSPLUS':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,34,39,47,55,60,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,84,87,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,128,129,142,166,167,170,172,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,202,204,205,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-20,64,-129,64,64,64,64,64,64,121,64,-126,-130,-131,-132,-133,-134,-135,-137,-138,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-117,64,64,64,64,64,64,64,64,64,64,64,-113,-116,-112,-114,-115,-119,-120,64,64,-139,-140,64,-121,-122,-125,-136,64,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,64,-129,-123,-124,64,-53,-55,-57,64,64,64,-74,-75,-76,64,-73,64,64,64,-78,-59,-66,-77,-60,64,-63,64,64,-64,-62,64,-61,64,64,-67,-65,]),'MINUSMINUS':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,34,39,47,55,60,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,84,87,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,128,129,142,166,167,170,172,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,202,204,205,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-20,65,-129,65,65,65,65,65,65,122,65,-126,-130,-131,-132,-133,-134,-135,-137,-138,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-117,65,65,65,65,65,65,65,65,65,65,65,-113,-116,-112,-114,-115,-119,-120,65,65,-139,-140,65,-121,-122,-125,-136,65,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,65,-129,-123,-124,65,-53,-55,-57,65,65,65,-74,-75,-76,65,-73,65,65,65,-78,-59,-66,-77,-60,65,-63,65,65,-64,-62,65,-61,65,65,-67,-65,]),'PUNTO':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,123,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,-121,-122,-125,-136,-129,-123,-124,]),'FLECHA':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,124,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,-121,-122,-125,-136,-129,-123,-124,]),'CORCHIZQ':([9,13,15,16,17,18,19,20,21,22,23,24,25,28,30,31,35,47,66,68,69,70,71,72,73,74,75,76,83,86,92,104,116,117,118,119,120,121,122,128,129,134,136,143,166,167,170,172,202,204,205,],[-30,36,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,43,-129,125,-126,-130,-131,-132,-133,-134,-135,-137,-138,36,-26,36,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,43,-27,43,-121,-122,-125,-136,-129,-123,-124,]),'PARIZQ':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,34,38,39,47,55,60,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,84,87,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,128,129,142,166,167,170,172,180,181,182,183,184,185,186,187,188,189,190,191,192,193,195,196,197,198,201,202,204,205,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,246,247,248,249,250,251,253,255,256,257,258,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-20,46,67,-129,67,67,67,67,67,67,126,67,-126,-130,-131,-132,-133,-134,-135,-137,-138,67,130,67,67,67,67,67,67,67,67,67,67,67,67,67,-117,67,67,67,67,67,67,67,67,67,67,67,-113,-116,-112,-114,-115,-119,-120,67,67,-139,-140,67,-121,-122,-125,-136,67,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,213,214,215,67,220,-129,-123,-124,67,-53,-55,-57,67,67,67,-74,-75,-76,67,-73,67,67,67,-78,-59,-66,-77,-60,67,-63,251,67,67,-64,-62,67,-61,67,67,-67,-65,]),'DIV':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,114,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,114,114,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'MOD':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,115,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,115,115,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'MAS':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,111,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,111,111,111,111,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'MENOS':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,34,39,47,55,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,84,87,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,128,129,142,157,158,159,160,161,162,163,164,165,166,167,170,172,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,202,204,205,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-20,60,-129,60,112,-107,60,60,-111,60,60,60,-118,60,-126,-130,-131,-132,-133,-134,-135,-137,-138,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-117,60,60,60,60,60,60,60,60,60,60,60,-113,-116,-112,-114,-115,-119,-120,60,60,-139,-140,60,112,112,112,112,-105,-106,-108,-109,-110,-121,-122,-125,-136,60,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,60,-129,-123,-124,60,-53,-55,-57,60,60,60,-74,-75,-76,60,-73,60,60,60,-78,-59,-66,-77,-60,60,-63,60,60,-64,-62,60,-61,60,60,-67,-65,]),'MENOR':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,107,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,107,107,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'MENORIGUAL':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,108,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,108,108,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'MAYOR':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,109,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,109,109,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'MAYORIGUAL':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,110,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,110,110,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'IGUAL':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,105,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,105,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'DISTINTO':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,106,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,106,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'AND':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,34,39,47,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,84,87,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,128,129,142,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,202,204,205,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-20,55,-129,103,55,-96,-99,-104,-107,55,55,-111,55,55,55,-118,55,-126,-130,-131,-132,-133,-134,-135,-137,-138,55,55,55,55,55,55,55,55,55,55,55,55,55,55,-117,55,55,55,55,55,55,55,55,55,55,55,-113,-116,-112,-114,-115,-119,-120,55,55,-139,-140,55,103,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,55,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,55,-129,-123,-124,55,-53,-55,-57,55,55,55,-74,-75,-76,55,-73,55,55,55,-78,-59,-66,-77,-60,55,-63,55,55,-64,-62,55,-61,55,55,-67,-65,]),'XOR':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,53,54,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,102,-94,-96,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,102,-93,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'OR':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,52,53,54,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,101,-92,-94,-96,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,101,-91,-93,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'ANDLOG':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,51,52,53,54,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,100,-90,-92,-94,-96,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,100,-89,-91,-93,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'ASIGNAR':([9,15,16,17,18,19,20,21,22,23,24,25,28,29,30,31,42,45,47,50,51,52,53,54,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,39,-29,-31,84,87,-129,93,-88,-90,-92,-94,-96,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,-87,-89,-91,-93,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'PLUSEQ':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,50,51,52,53,54,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,94,-88,-90,-92,-94,-96,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,-87,-89,-91,-93,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'MINUSEQ':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,50,51,52,53,54,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,95,-88,-90,-92,-94,-96,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,-87,-89,-91,-93,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'MULTEQ':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,50,51,52,53,54,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,96,-88,-90,-92,-94,-96,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,-87,-89,-91,-93,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'DIVEQ':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,50,51,52,53,54,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,97,-88,-90,-92,-94,-96,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,-87,-89,-91,-93,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'MODEQ':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,50,51,52,53,54,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,98,-88,-90,-92,-94,-96,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,-87,-89,-91,-93,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'ORLOG':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,50,51,52,53,54,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,202,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,99,-88,-90,-92,-94,-96,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,-87,-89,-91,-93,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,-129,-123,-124,]),'PUNTOCOMA':([9,12,15,16,17,18,19,20,21,22,23,24,25,28,29,30,31,34,42,47,48,49,50,51,52,53,54,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,104,116,117,118,119,120,121,122,128,129,131,133,135,137,142,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,172,174,177,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,198,199,200,202,204,205,207,210,211,212,215,216,217,218,219,225,226,227,228,229,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,248,249,250,253,255,256,257,258,],[-30,34,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-21,-29,-31,-20,-23,-129,-22,-79,-86,-88,-90,-92,-94,-96,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,175,176,-24,-25,193,-80,-81,-82,-83,-84,-85,-87,-89,-91,-93,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,-125,-136,208,209,193,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,212,217,218,219,-129,-123,-124,222,-53,-55,-57,-141,229,-74,-75,-76,234,-68,-69,-70,-73,236,193,193,-141,242,-78,-59,-66,247,-71,-72,-77,-60,193,-63,193,-64,-62,-61,193,193,-67,-65,]),'PARDER':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,46,47,49,50,51,52,53,54,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,89,91,104,116,117,118,119,120,121,122,126,127,128,129,130,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,179,203,204,205,220,221,223,224,230,240,241,247,252,254,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,90,-129,-79,-86,-88,-90,-92,-94,-96,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,139,-12,-117,-113,-116,-112,-114,-115,-119,-120,170,172,-139,-140,174,-13,-80,-81,-82,-83,-84,-85,-87,-89,-91,-93,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,205,-125,-128,-136,207,-11,-14,-123,-124,231,-127,232,233,235,-71,-72,-141,255,256,]),'CORCHDER':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,44,47,49,50,51,52,53,54,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,85,104,116,117,118,119,120,121,122,128,129,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,170,172,204,205,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,86,-129,-79,-86,-88,-90,-92,-94,-96,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,136,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,-80,-81,-82,-83,-84,-85,-87,-89,-91,-93,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,204,-125,-136,-123,-124,]),'COMA':([9,15,16,17,18,19,20,21,22,23,24,25,28,30,31,47,49,50,51,52,53,54,56,57,58,59,62,66,68,69,70,71,72,73,74,75,76,89,91,104,116,117,118,119,120,121,122,128,129,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,179,203,204,205,221,230,],[-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-28,-29,-31,-129,-79,-86,-88,-90,-92,-94,-96,-99,-104,-107,-111,-118,-126,-130,-131,-132,-133,-134,-135,-137,-138,140,-12,-117,-113,-116,-112,-114,-115,-119,-120,-139,-140,-13,-80,-81,-82,-83,-84,-85,-87,-89,-91,-93,-95,-97,-98,-100,-101,-102,-103,-105,-106,-108,-109,-110,-121,-122,206,-125,-128,-136,140,-11,-14,-123,-124,-127,206,]),'LLAVEIZQ':([33,34,90,139,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,210,211,212,217,218,219,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[41,-20,142,142,142,142,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-53,-55,-57,-74,-75,-76,-73,142,142,-78,-59,-66,-77,-60,142,-63,142,-64,-62,-61,142,142,-67,-65,]),'LLAVEDER':([34,80,81,132,142,176,180,181,182,183,184,185,186,187,188,189,190,191,192,193,209,210,211,212,217,218,219,229,236,237,238,242,243,245,249,250,253,257,258,],[-20,131,-17,-16,181,-18,210,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-19,-53,-55,-57,-74,-75,-76,-73,-78,-59,-66,-77,-60,-63,-64,-62,-61,-67,-65,]),'SI':([34,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,210,211,212,217,218,219,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[-20,195,195,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-53,-55,-57,-74,-75,-76,-73,195,195,-78,-59,-66,-77,-60,195,-63,195,-64,-62,-61,195,195,-67,-65,]),'MIENTRAS':([34,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,210,211,212,217,218,219,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[-20,196,196,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-53,-55,-57,-74,-75,-76,-73,196,196,-78,-59,-66,-77,-60,196,-63,196,-64,-62,-61,196,196,-67,-65,]),'PARA':([34,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,210,211,212,217,218,219,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[-20,197,197,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-53,-55,-57,-74,-75,-76,-73,197,197,-78,-59,-66,-77,-60,197,-63,197,-64,-62,-61,197,197,-67,-65,]),'RETORNAR':([34,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,210,211,212,217,218,219,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[-20,198,198,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-53,-55,-57,-74,-75,-76,-73,198,198,-78,-59,-66,-77,-60,198,-63,198,-64,-62,-61,198,198,-67,-65,]),'ROMPER':([34,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,210,211,212,217,218,219,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[-20,199,199,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-53,-55,-57,-74,-75,-76,-73,199,199,-78,-59,-66,-77,-60,199,-63,199,-64,-62,-61,199,199,-67,-65,]),'CONTINUAR':([34,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,210,211,212,217,218,219,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[-20,200,200,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-53,-55,-57,-74,-75,-76,-73,200,200,-78,-59,-66,-77,-60,200,-63,200,-64,-62,-61,200,200,-67,-65,]),'IMPRIMIR':([34,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,210,211,212,217,218,219,229,232,233,236,237,238,242,243,244,245,248,249,250,253,255,256,257,258,],[-20,201,201,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-53,-55,-57,-74,-75,-76,-73,201,201,-78,-59,-66,-77,-60,201,-63,201,-64,-62,-61,201,201,-67,-65,]),'NOT':([34,39,55,60,61,63,64,65,67,78,84,87,93,94,95,96,97,98,99,100,101,102,103,105,106,107,108,109,110,111,112,113,114,115,125,126,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[-20,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,63,63,-53,-55,-57,63,63,63,-74,-75,-76,63,-73,63,63,63,-78,-59,-66,-77,-60,63,-63,63,63,-64,-62,63,-61,63,63,-67,-65,]),'ENTERO':([34,36,39,43,55,60,61,63,64,65,67,78,84,87,93,94,95,96,97,98,99,100,101,102,103,105,106,107,108,109,110,111,112,113,114,115,125,126,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[-20,44,69,85,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,69,69,-53,-55,-57,69,69,69,-74,-75,-76,69,-73,69,69,69,-78,-59,-66,-77,-60,69,-63,69,69,-64,-62,69,-61,69,69,-67,-65,]),'FLOT':([34,39,55,60,61,63,64,65,67,78,84,87,93,94,95,96,97,98,99,100,101,102,103,105,106,107,108,109,110,111,112,113,114,115,125,126,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[-20,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,70,70,-53,-55,-57,70,70,70,-74,-75,-76,70,-73,70,70,70,-78,-59,-66,-77,-60,70,-63,70,70,-64,-62,70,-61,70,70,-67,-65,]),'CARACTER':([34,39,55,60,61,63,64,65,67,78,84,87,93,94,95,96,97,98,99,100,101,102,103,105,106,107,108,109,110,111,112,113,114,115,125,126,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[-20,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,71,71,-53,-55,-57,71,71,71,-74,-75,-76,71,-73,71,71,71,-78,-59,-66,-77,-60,71,-63,71,71,-64,-62,71,-61,71,71,-67,-65,]),'CADENA':([34,39,55,60,61,63,64,65,67,78,84,87,93,94,95,96,97,98,99,100,101,102,103,105,106,107,108,109,110,111,112,113,114,115,125,126,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[-20,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,72,72,-53,-55,-57,72,72,72,-74,-75,-76,72,-73,72,72,72,-78,-59,-66,-77,-60,72,-63,72,72,-64,-62,72,-61,72,72,-67,-65,]),'VERDADERO':([34,39,55,60,61,63,64,65,67,78,84,87,93,94,95,96,97,98,99,100,101,102,103,105,106,107,108,109,110,111,112,113,114,115,125,126,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[-20,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,73,73,-53,-55,-57,73,73,73,-74,-75,-76,73,-73,73,73,73,-78,-59,-66,-77,-60,73,-63,73,73,-64,-62,73,-61,73,73,-67,-65,]),'FALSO':([34,39,55,60,61,63,64,65,67,78,84,87,93,94,95,96,97,98,99,100,101,102,103,105,106,107,108,109,110,111,112,113,114,115,125,126,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[-20,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,74,74,-53,-55,-57,74,74,74,-74,-75,-76,74,-73,74,74,74,-78,-59,-66,-77,-60,74,-63,74,74,-64,-62,74,-61,74,74,-67,-65,]),'NUEVO':([34,39,55,60,61,63,64,65,67,78,84,87,93,94,95,96,97,98,99,100,101,102,103,105,106,107,108,109,110,111,112,113,114,115,125,126,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[-20,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,77,77,-53,-55,-57,77,77,77,-74,-75,-76,77,-73,77,77,77,-78,-59,-66,-77,-60,77,-63,77,77,-64,-62,77,-61,77,77,-67,-65,]),'ELIMINAR':([34,39,55,60,61,63,64,65,67,78,84,87,93,94,95,96,97,98,99,100,101,102,103,105,106,107,108,109,110,111,112,113,114,115,125,126,142,180,181,182,183,184,185,186,187,188,189,190,191,192,193,198,206,210,211,212,213,214,215,217,218,219,220,229,232,233,234,236,237,238,242,243,244,245,247,248,249,250,251,253,255,256,257,258,],[-20,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-54,-56,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,78,78,-53,-55,-57,78,78,78,-74,-75,-76,78,-73,78,78,78,-78,-59,-66,-77,-60,78,-63,78,78,-64,-62,78,-61,78,78,-67,-65,]),'SI_NO':([34,181,183,184,185,186,187,188,189,190,191,192,193,210,212,217,218,219,229,236,237,238,242,243,245,249,250,253,257,258,],[-20,-54,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-53,-57,-74,-75,-76,-73,-78,244,-66,-77,248,-63,-64,-62,-61,-67,-65,]),'SI_NO_SI':([34,181,183,184,185,186,187,188,189,190,191,192,193,210,212,217,218,219,229,236,237,238,242,243,245,249,250,253,257,258,],[-20,-54,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-58,-53,-57,-74,-75,-76,-73,-78,246,-66,-77,246,-63,-64,-62,-61,-67,-65,]),}
 
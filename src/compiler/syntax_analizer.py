@@ -617,6 +617,8 @@ def parse(code, debug=False):
     """
     from compiler.Lex_analizer import lexer
     
+    # El lexer es del módulo: sin esto las líneas siguen contando desde el programa anterior
+    lexer.lineno = 1
     result = parser.parse(code, lexer=lexer, debug=debug)
     return result
 
@@ -0,0 +1,696 @@
+"""
+Ejecución por lotes: N copias de un mismo programa en lockstep (NumPy).
+
+Para corregir prácticas o barrer parámetros se ejecuta el mismo programa con
+muchas entradas distintas. BatchCPU recibe N CPU ya preparados (programa
+cargado, registros, memoria y E/S de cada caso) y los avanza a la vez, una
+instrucción por copia y ronda:
+
+- los registros viven en un array (N, 16) uint64, las banderas en (N, 4)
+  (Z, N, C, V) y las memorias en (N, size) uint8;
+- en cada ronda las copias vivas se agrupan por PC y cada grupo ejecuta su
+  instrucción con operaciones vectoriales (ALU, CMP, saltos, MOV, LOAD/STORE,
+  PUSH/POP, CALL/RET...). Si un salto divide las copias, cada PC forma su
+  propio grupo en la ronda siguiente;
+- la decodificación usa las tablas de CPU.formats y se guarda por PC. Si las
+  copias tienen bytes distintos en ese PC (código automodificable, programas
+  distintos) las que no coinciden con la decodificada van por la vía escalar.
+
+Lo que no tiene versión vectorial (E/S, FPU, MUL8/DIV8/MOD8, EI/DI/WAIT...),
+los accesos fuera de rango y las copias con protección de memoria, profiler o
+traza de STORE se ejecutan con el tick() del propio CPU de esa copia, así que
+el resultado (registros, banderas, PC, RAM, ciclos y excepción) es el mismo
+que N llamadas sucesivas a CPU.run con el intérprete.
+
+Uso:
+    batch = BatchCPU(cpus)
+    cycles = batch.run(max_cycles=100_000)
+    for cpu, n, err in zip(cpus, cycles, batch.errors): ...
+
+numpy es una dependencia opcional: solo se importa al crear un BatchCPU.
+"""
+from functools import partial
+
+from machine.Memory.Memory import PAGE_SHIFT, PAGE_SIZE
+from machine.CPU.CPU import STORE_OPS, RR, RI, R, OP
+from machine.CPU.Units import ALU_FLAG_FUNCS, alu_source
+from machine.CPU.Translator import ALU_OPS, CMP_OPS, FLAG_OPS, NOP_OPS
+
+MASK64 = (1 << 64) - 1
+FLAG_NAMES = ("Z", "N", "C", "V")
+Z, N, C, V = range(4)
+
+_DTYPES = {1: 'u1', 2: '<u2', 4: '<u4', 8: '<u8'}
+_ALU_NAMESPACE = {f.__name__: f for f in ALU_FLAG_FUNCS.values()}
+
+
+def _mask(size):
+    return (1 << (8 * size)) - 1
+
+
+def _alu_scalar(op, signed, asize):
+    """f(a, b) -> (res, registro de banderas): el mismo código que los
+    handlers generados de CPU, para los casos que no se vectorizan."""
+    lines = ["def f(a, b):"]
+    lines += ["    " + line for line in alu_source(op, signed, asize, "rec")]
+    lines.append("    return res, rec")
+    namespace = dict(_ALU_NAMESPACE)
+    exec(compile("\n".join(lines), f"<batch alu {op}{asize}>", "exec"), namespace)
+    return namespace["f"]
+
+
+class BatchCPU:
+    """N CPU que ejecutan el mismo programa en lockstep.
+
+    Todas las memorias deben tener el mismo tamaño y estar en RAM (Memory, no
+    MappedMemory). Las interrupciones no se entregan por lotes: las copias con
+    controlador (io.irq) se rechazan.
+    """
+
+    def __init__(self, cpus):
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("BatchCPU necesita numpy (pip install numpy)") from e
+        self.np = np
+        self.cpus = list(cpus)
+        if not self.cpus:
+            raise ValueError("BatchCPU necesita al menos un CPU")
+        self.size = len(self.cpus[0].memory)
+        for cpu in self.cpus:
+            if len(cpu.memory) != self.size:
+                raise ValueError("Todas las memorias del lote deben tener el mismo tamaño")
+            if not isinstance(cpu.memory.mem, bytearray):
+                raise ValueError("BatchCPU solo admite memorias en RAM (bytearray)")
+            if getattr(cpu.io, 'irq', None) is not None:
+                raise ValueError("BatchCPU no entrega interrupciones: ejecute esa copia con CPU.run")
+        self.n = len(self.cpus)
+        self.formats = self.cpus[0].formats
+        self.errors = [None] * self.n
+        self.cycles = np.zeros(self.n, dtype=np.int64)
+
+        self.regs = np.zeros((self.n, 16), dtype=np.uint64)
+        self.flags = np.zeros((self.n, 4), dtype=np.uint8)
+        self.pc = np.zeros(self.n, dtype=np.uint64)
+        self.mem = None
+
+        # Instrucciones decodificadas: pc -> (vec, rd, rs, imm, next_pc, ref)
+        # ref son los bytes de la instrucción si no todas las copias los comparten
+        self._decoded = {}
+        self._decoded_pages = {}
+        npages = (self.size >> PAGE_SHIFT) + 1
+        self._code = np.zeros(npages, dtype=bool)
+        self._dirty = np.zeros(npages, dtype=bool)
+        self._offsets = {n: np.arange(n, dtype=np.intp) for n in _DTYPES}
+        self._alu_fns = {}
+        self._vector = self._vector_ops()
+        for cpu in self.cpus:
+            cpu.memory.add_write_listener(self._on_code_write)
+
+    # ---------- Tabla de operaciones vectoriales ----------
+    def _vector_ops(self):
+        ops = {0x0000: self._v_parar, 0x0015: self._v_mod64,
+               0x0030: self._v_inc, 0x0031: self._v_dec, 0x0064: self._v_clr,
+               0x0040: self._v_not, 0x0061: self._v_loadv,
+               0x0060: partial(self._v_load, 8, True), 0x0062: partial(self._v_loadr, 1, True),
+               0x0099: self._v_call, 0x0800: self._v_ret}
+        ops.update((op, self._v_nop) for op in NOP_OPS)
+        ops.update((op, partial(self._v_alu, spec)) for op, spec in ALU_OPS.items())
+        ops.update((op, partial(self._v_cmp, *spec)) for op, spec in CMP_OPS.items())
+        ops.update((op, partial(self._v_flag, FLAG_NAMES.index(flag), value))
+                   for op, (flag, value) in FLAG_OPS.items())
+        for op, fn, use_imm in ((0x0041, 'bitwise_and', False), (0x0042, 'bitwise_and', True),
+                                (0x0043, 'bitwise_or', False), (0x0044, 'bitwise_or', True),
+                                (0x0045, 'bitwise_xor', False), (0x0046, 'bitwise_xor', True)):
+            ops[op] = partial(self._v_logic, getattr(self.np, fn), use_imm)
+        for op, kind in ((0x0050, 'left'), (0x0051, 'arith'), (0x0052, 'left'), (0x0053, 'right')):
+            ops[op] = partial(self._v_shift, kind)
+        conds = {0x0090: None,
+                 0x0091: lambda f: f[:, Z] == 1, 0x0092: lambda f: f[:, Z] == 0,
+                 0x0093: lambda f: f[:, N] == 1, 0x0094: lambda f: f[:, N] == 0,
+                 0x0095: lambda f: f[:, C] == 1, 0x0096: lambda f: f[:, C] == 0,
+                 0x0097: lambda f: (f[:, V] ^ f[:, N]) == 1, 0x0098: lambda f: (f[:, V] ^ f[:, N]) == 0}
+        ops.update((op, partial(self._v_jump, cond)) for op, cond in conds.items())
+        for i, size in enumerate((1, 2, 4, 8)):
+            ops[0x0400 + i] = partial(self._v_mov, size)
+            ops[0x0410 + i] = partial(self._v_movv, size)
+            ops[0x0500 + i] = partial(self._v_load, size, False)
+            ops[0x0510 + i] = partial(self._v_loadr, size, False)
+            ops[0x0810 + i] = partial(self._v_pop, size)
+            ops[0x0820 + i] = partial(self._v_push, size)
+        for op, (size, length) in STORE_OPS.items():
+            ops[op] = partial(self._v_store if length == 16 else self._v_storer, size)
+        return ops
+
+    # ---------- Ejecución ----------
+    def run(self, max_cycles=10_000_000_000):
+        """Ejecuta todas las copias hasta PARAR, error o max_cycles instrucciones.
+
+        Devuelve una lista con las instrucciones ejecutadas por cada copia; en
+        self.errors queda la excepción de cada una (o None), la misma que habría
+        lanzado CPU.run (RuntimeError("Max cycles reached") incluida)."""
+        self._attach()
+        try:
+            rounds, pending = self._loop(max_cycles)
+        finally:
+            self._detach()
+        for lane in pending:
+            self.cycles[lane] = rounds
+        for lane in range(self.n):
+            if self.errors[lane] is None and self.cycles[lane] >= max_cycles:
+                self.errors[lane] = RuntimeError("Max cycles reached")
+        return self.cycles.tolist()
+
+    def _loop(self, max_cycles):
+        np = self.np
+        rounds = 0
+        shared, owned = self._active()
+        while (shared.size or owned.size) and rounds < max_cycles:
+            self._round = rounds
+            if shared.size:
+                pcs = self.pc[shared]
+                first = pcs[0]
+                if (pcs == first).all():
+                    self._step(int(first), shared)
+                else:
+                    order = np.argsort(pcs, kind='stable')
+                    sorted_pcs = pcs[order]
+                    cuts = np.flatnonzero(sorted_pcs[1:] != sorted_pcs[:-1]) + 1
+                    starts = np.concatenate(([0], cuts)).tolist()
+                    for pc, group in zip(sorted_pcs[starts].tolist(), np.split(shared[order], cuts)):
+                        self._step(pc, group)
+            for lane in owned.tolist():
+                self._tick_owned(lane)
+            rounds += 1
+            if self._changed:
+                shared, owned = self._active()
+        return rounds, np.concatenate((shared, owned)).tolist()
+
+    def _active(self):
+        self._changed = False
+        alive = self._alive
+        return (self.np.flatnonzero(alive & ~self._owned),
+                self.np.flatnonzero(alive & self._owned))
+
+    def _stop(self, lanes, cycles, error=None):
+        self._alive[lanes] = False
+        self.cycles[lanes] = cycles
+        if error is not None:
+            self.errors[lanes] = error
+        self._changed = True
+
+    def _step(self, pc, lanes):
+        entry = self._decoded.get(pc)
+        if entry is None:
+            entry = self._decode(pc, lanes)
+        vec, rd, rs, imm, next_pc, ref = entry
+        if ref is not None:
+            same = (self.mem[lanes, pc:next_pc] == ref).all(axis=1)
+            if not same.all():
+                self._scalar(lanes[~same], pc)
+                lanes = lanes[same]
+                if not lanes.size:
+                    return
+        if vec is None:
+            self._scalar(lanes, pc)
+            return
+        self.pc[lanes] = next_pc
+        vec(lanes, rd, rs, imm, pc, next_pc)
+
+    def _decode(self, pc, lanes):
+        """Decodifica con los bytes de la primera copia del grupo (como CPU.decode)."""
+        size = self.size
+        if pc + 8 > size:
+            return (None, None, None, None, pc, None)   # tick() da el IndexError
+        lane = int(lanes[0])
+        word = int.from_bytes(self.mem[lane, pc:pc + 8].tobytes(), 'little')
+        opcode = (word >> 48) & 0xFFFF
+        fmt = self.formats.get(opcode)
+        rd = rs = imm = None
+        next_pc = pc + 8
+        vec = self._vector.get(opcode)
+        if fmt == RR:
+            rd, rs = (word >> 4) & 0xF, word & 0xF
+        elif fmt == RI:
+            if pc + 16 > size:
+                return (None, None, None, None, pc, None)
+            rd = (word >> 44) & 0xF
+            imm = int.from_bytes(self.mem[lane, pc + 8:pc + 16].tobytes(), 'little')
+            next_pc = pc + 16
+        elif fmt == R:
+            rd = (word >> 44) & 0xF
+        elif fmt != OP:
+            vec = None
+        rows = self.mem[self._shared_rows, pc:next_pc]
+        code = self.mem[lane, pc:next_pc]
+        ref = None if (rows == code).all() else code.copy()
+        entry = (vec, rd, rs, imm, next_pc, ref)
+        self._decoded[pc] = entry
+        for page in range(pc >> PAGE_SHIFT, ((next_pc - 1) >> PAGE_SHIFT) + 1):
+            self._decoded_pages.setdefault(page, []).append(pc)
+            if not self._code[page]:
+                self._code[page] = True
+                for cpu in self.cpus:
+                    cpu.memory.watch_code(page << PAGE_SHIFT, 1)
+        return entry
+
+    def _on_code_write(self, addr, nbytes):
+        """Listener de Memory: una escritura sobre código invalida lo decodificado."""
+        for page in range(addr >> PAGE_SHIFT, ((addr + nbytes - 1) >> PAGE_SHIFT) + 1):
+            for pc in self._decoded_pages.pop(page, ()):
+                self._decoded.pop(pc, None)
+
+    # ---------- Vía escalar (tick del CPU de cada copia) ----------
+    def _scalar(self, lanes, pc):
+        R, F = self.regs, self.flags
+        for lane in lanes.tolist():
+            cpu = self.cpus[lane]
+            cpu.regs[:] = R[lane].tolist()
+            cpu.flags = dict(zip(FLAG_NAMES, F[lane].tolist()))
+            cpu.pc = pc
+            try:
+                cpu.tick()
+            except Exception as e:
+                self._stop(lane, self._round, e)
+            regs = cpu.regs
+            if not (0 <= cpu.pc <= MASK64 and all(0 <= v <= MASK64 for v in regs)):
+                # Valores fuera de 64 bits: la copia sigue solo con su CPU
+                self._owned[lane] = True
+                self._changed = True
+            else:
+                R[lane] = regs
+                flags = cpu.flags
+                F[lane] = [flags[name] for name in FLAG_NAMES]
+                self.pc[lane] = cpu.pc
+            if self._alive[lane] and not cpu.running:
+                self._stop(lane, self._round + 1)
+
+    def _tick_owned(self, lane):
+        cpu = self.cpus[lane]
+        try:
+            cpu.tick()
+        except Exception as e:
+            self._stop(lane, self._round, e)
+            return
+        if not cpu.running:
+            self._stop(lane, self._round + 1)
+
+    # ---------- Entrada y salida del lote ----------
+    def _attach(self):
+        np = self.np
+        n, size = self.n, self.size
+        self.errors = [None] * n
+        self.cycles = np.zeros(n, dtype=np.int64)
+        self._alive = np.ones(n, dtype=bool)
+        self._owned = np.zeros(n, dtype=bool)
+        self._halted = np.zeros(n, dtype=bool)
+        self._dirty[:] = False
+        self._round = 0
+        self.mem = np.empty((n, size), dtype=np.uint8)
+        self._saved_mem = []
+        for i, cpu in enumerate(self.cpus):
+            memory = cpu.memory
+            cpu.running = 1
+            regs = cpu.regs
+            self.mem[i] = np.frombuffer(memory.mem, dtype=np.uint8)
+            if (memory.protection or cpu.profiler is not None or cpu.store_tracer is not None
+                    or not 0 <= cpu.pc <= MASK64
+                    or not all(isinstance(v, int) and 0 <= v <= MASK64 for v in regs)):
+                # Copia solo escalar: sigue con su propia memoria (los accesos
+                # comprobados de Memory guardan la referencia al bytearray)
+                self._owned[i] = True
+                self._saved_mem.append(None)
+                continue
+            self.regs[i] = regs
+            flags = cpu.flags
+            self.flags[i] = [flags[name] for name in FLAG_NAMES]
+            self.pc[i] = cpu.pc
+            self._saved_mem.append(memory.mem)
+            memory.mem = memoryview(self.mem[i])
+            for page in memory._watched_pages:
+                if page < len(self._code):
+                    self._code[page] = True
+        self._shared_rows = np.flatnonzero(~self._owned)
+        self._decoded.clear()
+        self._decoded_pages.clear()
+
+    def _detach(self):
+        page_starts = [page << PAGE_SHIFT for page in self.np.flatnonzero(self._dirty).tolist()]
+        for i, cpu in enumerate(self.cpus):
+            saved = self._saved_mem[i]
+            if saved is None:
+                continue
+            memory = cpu.memory
+            memoryview(saved)[:] = self.mem[i]
+            memory.mem = saved
+            for start in page_starts:
+                memory._mark_dirty(start, min(PAGE_SIZE, self.size - start))
+            if not self._owned[i]:
+                cpu.regs[:] = self.regs[i].tolist()
+                cpu.flags = dict(zip(FLAG_NAMES, self.flags[i].tolist()))
+                cpu.pc = int(self.pc[i])
+                if self._halted[i]:
+                    cpu.running = False
+        self._saved_mem = []
+
+    # ---------- Memoria ----------
+    def _read(self, lanes, addr, n):
+        np = self.np
+        if isinstance(addr, int):
+            raw = self.mem[lanes, addr:addr + n]
+        else:
+            raw = self.mem[lanes[:, None], addr.astype(np.intp)[:, None] + self._offsets[n]]
+        return np.ascontiguousarray(raw).view(_DTYPES[n])[:, 0].astype(np.uint64)
+
+    def _write(self, lanes, addr, n, values):
+        np = self.np
+        raw = values.astype('<u8').view(np.uint8).reshape(-1, 8)[:, :n]
+        if isinstance(addr, int):
+            self.mem[lanes, addr:addr + n] = raw
+            first, last = addr >> PAGE_SHIFT, (addr + n - 1) >> PAGE_SHIFT
+            self._dirty[first:last + 1] = True
+            if self._code[first] or self._code[last]:
+                self._code_written(lanes, [addr] * len(lanes), n)
+            return
+        self.mem[lanes[:, None], addr.astype(np.intp)[:, None] + self._offsets[n]] = raw
+        first, last = addr >> PAGE_SHIFT, (addr + (n - 1)) >> PAGE_SHIFT
+        self._dirty[first] = True
+        self._dirty[last] = True
+        hit = self._code[first] | self._code[last]
+        if hit.any():
+            self._code_written(lanes[hit], addr[hit].tolist(), n)
+
+    def _code_written(self, lanes, addrs, n):
+        # Mismo aviso que Memory.write_uN: cachés del CPU de la copia y del lote
+        for lane, addr in zip(lanes.tolist(), addrs):
+            self.cpus[lane].memory._after_write(addr, n)
+            self._on_code_write(addr, n)
+
+    def _in_range(self, lanes, addr, n, pc):
+        """Copias cuyo acceso [addr, addr+n) cabe en memoria; el resto va por
+        tick(), que lanza el mismo IndexError que la ejecución normal."""
+        limit = self.size - n
+        ok = addr <= limit if limit >= 0 else self.np.zeros(len(lanes), dtype=bool)
+        if ok.all():
+            return lanes, addr, None
+        self._scalar(lanes[~ok], pc)
+        return lanes[ok], addr[ok], ok
+
+    # ---------- Operaciones vectoriales ----------
+    # Cada una recibe (lanes, rd, rs, imm, pc, next_pc) con self.pc[lanes] ya en next_pc.
+    def _zn(self, lanes, r):
+        self.flags[lanes, Z] = r == 0
+        self.flags[lanes, N] = r >> 63
+
+    def _v_nop(self, lanes, rd, rs, imm, pc, next_pc):
+        pass
+
+    def _v_parar(self, lanes, rd, rs, imm, pc, next_pc):
+        self._halted[lanes] = True
+        self._stop(lanes, self._round + 1)
+
+    def _v_alu(self, spec, lanes, rd, rs, imm, pc, next_pc):
+        np = self.np
+        op, signed, rsize, imm_mask, asize, wsize = spec
+        R, F = self.regs, self.flags
+        a = R[lanes, rd] & _mask(rsize)
+        if imm_mask is None:
+            b = R[lanes, rs] & _mask(rsize)
+        else:
+            b = np.full(len(lanes), imm & imm_mask if imm_mask else imm, dtype=np.uint64)
+        if op in ('div', 'mod'):
+            zero = b == 0
+            if zero.any():
+                # Igual que el handler: V = 1 y el registro a 0
+                F[lanes[zero], V] = 1
+                R[lanes[zero], rd] = 0
+                keep = ~zero
+                lanes, a, b = lanes[keep], a[keep], b[keep]
+                if not lanes.size:
+                    return
+        if asize < 8:
+            # ADDV8 lee 8 bytes y opera en 4: vale mientras a quepa holgado en int64
+            if (signed or op == 'mul') and (rsize == asize or not (a >> 62).any()):
+                self._alu_small(op, signed, asize, lanes, rd, a, b)
+            else:
+                self._alu_lanes(spec, lanes, rd, a, b)
+        elif signed or op == 'mul':
+            self._alu_wide(spec, lanes, rd, a, b)
+        else:
+            self._alu_lanes(spec, lanes, rd, a, b)
+
+    def _alu_small(self, op, signed, size, lanes, rd, a, b):
+        """Tamaños 1, 2 y 4: el resultado exacto cabe en int64 (o uint64 en MUL sin signo)."""
+        np = self.np
+        bits = size * 8
+        sign, mask = 1 << (bits - 1), _mask(size)
+        if op == 'mul' and not signed:
+            res = a * b
+            c = v = res > mask
+        else:
+            ai, bi = a.astype(np.int64), b.astype(np.int64)
+            ai -= (ai & sign) << 1
+            bi -= (bi & sign) << 1
+            if op == 'add':
+                res = ai + bi
+                c = (res < 0) | (res > mask)
+                v = ((ai ^ res) & (bi ^ res) & sign) != 0
+            elif op == 'sub':
+                res = ai - bi
+                c = ai < bi
+                v = ((ai ^ bi) & (ai ^ res) & sign) != 0
+            else:
+                if op == 'mul':
+                    res = ai * bi
+                elif op == 'div':
+                    # int(a / b) en Python: división en coma flotante truncada (exacta con |a| < 2**53)
+                    res = np.trunc(ai / bi).astype(np.int64)
+                else:
+                    res = np.mod(ai, bi)
+                v = (res < -sign) | (res >= sign)
+                c = v if op == 'mul' else False
+        res = (res & mask).astype(np.uint64)
+        F = self.flags
+        F[lanes, Z] = res == 0
+        F[lanes, N] = res >> (bits - 1)
+        F[lanes, C] = c
+        F[lanes, V] = v
+        self.regs[lanes, rd] = res
+
+    def _alu_wide(self, spec, lanes, rd, a, b):
+        """64 bits con signo (y MUL sin signo). ADD/SUB: aritmética modular y
+        banderas por bits. MUL/DIV/MOD solo donde int64/float64 dan el resultado
+        exacto (sin desbordamiento, así que C = V = 0); el resto copia a copia."""
+        np = self.np
+        op = spec[0]
+        F = self.flags
+        if op == 'add':
+            r = a + b
+            v = ((a ^ r) & (b ^ r)) >> 63
+            F[lanes, C] = (r >> 63) ^ v
+            F[lanes, V] = v
+        elif op == 'sub':
+            r = a - b
+            F[lanes, C] = a.view(np.int64) < b.view(np.int64)
+            F[lanes, V] = ((a ^ b) & (a ^ r)) >> 63
+        else:
+            ai, bi = a.view(np.int64), b.view(np.int64)
+            if op == 'mul' and not spec[1]:
+                ok = (a < 1 << 32) & (b < 1 << 32)
+            elif op == 'mul':
+                ok = (ai > -(1 << 31)) & (ai < 1 << 31) & (bi > -(1 << 31)) & (bi < 1 << 31)
+            elif op == 'div':
+                ok = (ai > -(1 << 53)) & (ai < 1 << 53) & (bi > -(1 << 53)) & (bi < 1 << 53)
+            else:
+                ok = (ai != -(1 << 63)) | (bi != -1)
+            if not ok.all():
+                rest = ~ok
+                self._alu_lanes(spec, lanes[rest], rd, a[rest], b[rest])
+                lanes, a, ai, bi = lanes[ok], a[ok], ai[ok], bi[ok]
+                b = b[ok]
+            if op == 'mul':
+                r = a * b if not spec[1] else (ai * bi).view(np.uint64)
+            elif op == 'div':
+                r = np.trunc(ai / bi).astype(np.int64).view(np.uint64)
+            else:
+                r = np.mod(ai, bi).view(np.uint64)
+            F[lanes, C] = 0
+            F[lanes, V] = 0
+        self._zn(lanes, r)
+        self.regs[lanes, rd] = r
+
+    def _alu_lanes(self, spec, lanes, rd, a, b):
+        """MUL8/DIV8/MOD8, ADDV8 (4 bytes sobre un registro de 8)...: enteros de
+        Python copia a copia, con el mismo código que el handler de CPU."""
+        np = self.np
+        op, signed, rsize, imm_mask, asize, wsize = spec
+        fn = self._alu_fns.get(spec)
+        if fn is None:
+            fn = self._alu_fns[spec] = _alu_scalar(op, signed, asize)
+        wmask = _mask(asize) & _mask(wsize)
+        out, flags = [], []
+        for x, y in zip(a.tolist(), b.tolist()):
+            res, rec = fn(x, y)
+            out.append(res & wmask)
+            flags.append(rec[0](*rec[1:]))
+        self.regs[lanes, rd] = np.array(out, dtype=np.uint64)
+        self.flags[lanes] = np.array(flags, dtype=np.uint8)
+
+    def _v_mod64(self, lanes, rd, rs, imm, pc, next_pc):
+        R = self.regs
+        b = R[lanes, rs]
+        zero = b == 0
+        if zero.any():
+            self._scalar(lanes[zero], pc)   # ZeroDivisionError
+            lanes, b = lanes[~zero], b[~zero]
+        R[lanes, rd] = R[lanes, rd] % b
+
+    def _v_inc(self, lanes, rd, rs, imm, pc, next_pc):
+        a = self.regs[lanes, rd]
+        r = a + 1
+        self._zn(lanes, r)
+        self.flags[lanes, C] = a == MASK64
+        self.flags[lanes, V] = a == MASK64 >> 1
+        self.regs[lanes, rd] = r
+
+    def _v_dec(self, lanes, rd, rs, imm, pc, next_pc):
+        a = self.regs[lanes, rd]
+        r = a - 1
+        self._zn(lanes, r)
+        self.flags[lanes, C] = a == 0
+        self.flags[lanes, V] = a == 1 << 63
+        self.regs[lanes, rd] = r
+
+    def _v_clr(self, lanes, rd, rs, imm, pc, next_pc):
+        self.regs[lanes, rd] = 0
+        self.flags[lanes] = (1, 0, 0, 0)
+
+    def _v_not(self, lanes, rd, rs, imm, pc, next_pc):
+        r = ~self.regs[lanes, rd]
+        self.regs[lanes, rd] = r
+        self._zn(lanes, r)
+
+    def _v_logic(self, fn, use_imm, lanes, rd, rs, imm, pc, next_pc):
+        b = self.np.uint64(imm & MASK64) if use_imm else self.regs[lanes, rs]
+        r = fn(self.regs[lanes, rd], b)
+        self.regs[lanes, rd] = r
+        self._zn(lanes, r)
+
+    def _v_shift(self, kind, lanes, rd, rs, imm, pc, next_pc):
+        np = self.np
+        a = self.regs[lanes, rd]
+        amt = a & 0x3F
+        if kind == 'left':
+            r = a << amt
+        elif kind == 'right':
+            r = a >> amt
+        else:
+            r = (a.view(np.int64) >> amt.astype(np.int64)).view(np.uint64)
+        self.regs[lanes, rd] = r
+        self._zn(lanes, r)
+
+    def _v_loadv(self, lanes, rd, rs, imm, pc, next_pc):
+        value = imm & MASK64
+        self.regs[lanes, rd] = value
+        self.flags[lanes, Z] = value == 0
+        self.flags[lanes, N] = value >> 63
+
+    def _v_load(self, size, zn, lanes, rd, rs, imm, pc, next_pc):
+        if imm + size > self.size:
+            self._scalar(lanes, pc)
+            return
+        value = self._read(lanes, imm, size)
+        self.regs[lanes, rd] = value
+        if zn:
+            self._zn(lanes, value)
+
+    def _v_loadr(self, size, zn, lanes, rd, rs, imm, pc, next_pc):
+        lanes, addr, _ = self._in_range(lanes, self.regs[lanes, rs], size, pc)
+        if lanes.size:
+            value = self._read(lanes, addr, size)
+            self.regs[lanes, rd] = value
+            if zn:
+                self._zn(lanes, value)
+
+    def _v_store(self, size, lanes, rd, rs, imm, pc, next_pc):
+        if imm + size > self.size:
+            self._scalar(lanes, pc)
+            return
+        self._write(lanes, imm, size, self.regs[lanes, rd] & _mask(size))
+
+    def _v_storer(self, size, lanes, rd, rs, imm, pc, next_pc):
+        R = self.regs
+        lanes, addr, _ = self._in_range(lanes, R[lanes, rs], size, pc)
+        if lanes.size:
+            self._write(lanes, addr, size, R[lanes, rd] & _mask(size))
+
+    def _v_cmp(self, size, imm_mask, lanes, rd, rs, imm, pc, next_pc):
+        np = self.np
+        m = _mask(size)
+        a = self.regs[lanes, rd] & m
+        if imm_mask is None:
+            b = self.regs[lanes, rs] & m
+        else:
+            b = np.uint64(imm & imm_mask if imm_mask else imm)
+        r = a - b
+        F = self.flags
+        self._zn(lanes, r)
+        F[lanes, C] = a >= b
+        F[lanes, V] = ((a ^ b) & (a ^ r)) >> 63
+
+    def _v_flag(self, index, value, lanes, rd, rs, imm, pc, next_pc):
+        self.flags[lanes, index] = value
+
+    def _v_jump(self, cond, lanes, rd, rs, imm, pc, next_pc):
+        if cond is None:
+            self.pc[lanes] = imm
+        else:
+            taken = cond(self.flags[lanes])
+            self.pc[lanes[taken]] = imm
+
+    def _v_mov(self, size, lanes, rd, rs, imm, pc, next_pc):
+        self.regs[lanes, rd] = self.regs[lanes, rs] & _mask(size)
+
+    def _v_movv(self, size, lanes, rd, rs, imm, pc, next_pc):
+        self.regs[lanes, rd] = imm & _mask(size)
+
+    def _v_call(self, lanes, rd, rs, imm, pc, next_pc):
+        R = self.regs
+        lanes, sp, _ = self._in_range(lanes, R[lanes, 15], 8, pc)
+        if lanes.size:
+            self._write(lanes, sp, 8, self.np.full(len(lanes), next_pc, dtype=self.np.uint64))
+            R[lanes, 15] = sp + 8
+            self.pc[lanes] = imm & MASK64
+
+    def _pop_lanes(self, lanes, size, pc):
+        """Copias con al menos size bytes en la pila y sp dentro de memoria."""
+        sp = self.regs[lanes, 15]
+        ok = (sp >= size) & (sp <= self.size)
+        if not ok.all():
+            self._scalar(lanes[~ok], pc)
+            lanes, sp = lanes[ok], sp[ok]
+        return lanes, sp - size
+
+    def _v_ret(self, lanes, rd, rs, imm, pc, next_pc):
+        lanes, sp = self._pop_lanes(lanes, 8, pc)
+        if lanes.size:
+            self.pc[lanes] = self._read(lanes, sp, 8)
+            self.regs[lanes, 15] = sp
+
+    def _v_pop(self, size, lanes, rd, rs, imm, pc, next_pc):
+        lanes, sp = self._pop_lanes(lanes, size, pc)
+        if lanes.size:
+            value = self._read(lanes, sp, size)
+            self.regs[lanes, 15] = sp
+            self.regs[lanes, rd] = value
+            self._zn(lanes, value)
+
+    def _v_push(self, size, lanes, rd, rs, imm, pc, next_pc):
+        R = self.regs
+        value = R[lanes, rd] & _mask(size)
+        lanes, sp, ok = self._in_range(lanes, R[lanes, 15], size, pc)
+        if lanes.size:
+            if ok is not None:
+                value = value[ok]
+            self._write(lanes, sp, size, value)
+            R[lanes, 15] = sp + size
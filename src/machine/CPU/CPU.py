@@ -1,13 +1,25 @@
 from ast import List
 from typing import Optional, Dict
-from machine.Memory.Memory import Memory
+from machine.Memory.Memory import Memory, MemoryFault, PAGE_SHIFT
 from machine.IO.IOsystem import IOSystem
-from machine.CPU.Register import Register
-from machine.CPU.Units import ALU, FPU
+from machine.CPU.Register import Register, RegisterFile, MASK8, MASK16, MASK32
+from machine.CPU.Units import ALU, FPU, FLOAT_CODECS, ALU_FLAG_FUNCS, alu_source, flags_cmp, flags_inc, flags_dec
+from machine.CPU.Units import f32_from_bits, f32_to_bits, f64_from_bits, f64_to_bits
+from machine.CPU.Translator import BlockTranslator, BlockExit, ALU_OPS, HOT_LOOP_THRESHOLD, MAX_TRACE_BLOCKS
+from machine.IO.Interrupts import IRQ_CHECK_CYCLES
 from compiler.instructions import IS_INV
 import logging
+import math
+import operator
 import struct
 
+# STORE*: opcode -> (bytes escritos, longitud de la instrucción)
+STORE_OPS = {
+    0x0063: (8, 16),
+    0x0600: (1, 16), 0x0601: (2, 16), 0x0602: (4, 16), 0x0603: (8, 16),
+    0x0610: (1, 8), 0x0611: (2, 8), 0x0612: (4, 8), 0x0613: (8, 8),
+}
+
 logger = logging.getLogger("machine.cpu")
 
 MASK64 = (1 << 64) - 1
@@ -27,6 +39,111 @@ def to_int64(x: int) -> int:
         return x - (1 << 64)
     return x
 
+# -------- Manejadores aritméticos por tamaño --------
+# ADD1, MULS4, SUBV8... tienen el tamaño fijo en el opcode: su handler se genera
+# al importar a partir de ALU_OPS (la misma tabla que usa el traductor, con sus
+# rarezas) y de alu_source, con máscaras y bit de signo como constantes en vez
+# de pasar por ALU._mask/_to_signed en cada instrucción. Dejan en
+# _pending_flags el mismo registro que ALU.last.
+_ALU_NAMESPACE = {f.__name__: f for f in ALU_FLAG_FUNCS.values()}
+
+
+def _alu_handler(opcode):
+    op, signed, rsize, imm_mask, asize, wsize = ALU_OPS[opcode]
+    mnemonic = IS_INV[opcode]['mnemonic']
+    rmask = (1 << (8 * rsize)) - 1
+    if imm_mask is None:
+        b = f"regs[rs] & {rmask}"
+    else:
+        b = f"imm & {imm_mask}" if imm_mask else "imm"
+    lines = [f"def _op_{mnemonic.lower()}(self, rd, rs, imm):",
+             f'    """{mnemonic}"""',
+             "    regs = self.regs",
+             f"    a = regs[rd] & {rmask}",
+             f"    b = {b}"]
+    if op in ('div', 'mod'):
+        # ZeroDivisionError en la ALU: solo se activa V y el registro queda a 0
+        lines += ["    if b == 0:",
+                  '        self.flags["V"] = 1',
+                  "        regs[rd] = 0",
+                  "        return"]
+    lines += ["    " + line for line in alu_source(op, signed, asize, "self._pending_flags")]
+    lines.append(f"    regs[rd] = res & {((1 << (8 * asize)) - 1) & ((1 << (8 * wsize)) - 1)}")
+    namespace = dict(_ALU_NAMESPACE)
+    exec(compile("\n".join(lines), f"<alu {mnemonic}>", "exec"), namespace)
+    return namespace[f"_op_{mnemonic.lower()}"]
+
+
+# -------- Manejadores FPU fusionados --------
+# Con operandos finitos la FPU no tiene nada que avisar: la operación se hace
+# aquí mismo y las banderas se escriben directamente (las mismas que daría
+# FPU._update_flags). NaN/inf, división por cero y raíz de un negativo siguen
+# pasando por FPU, que es quien emite los RuntimeWarning.
+_FPU_BINOPS = {'add': operator.add, 'sub': operator.sub, 'mul': operator.mul, 'div': operator.truediv}
+_FPU_UNOPS = {'sqrt': math.sqrt, 'sin': math.sin, 'cos': math.cos}
+
+
+def _fpu_binop(name, size):
+    op = _FPU_BINOPS[name]
+    to_float, to_bits = FLOAT_CODECS[size]
+    mask = MASK32 if size == 4 else MASK64
+    sign_shift = size * 8 - 1
+    is_div = name == 'div'
+
+    def handler(self, rd, rs, imm):
+        regs = self.regs
+        a, b = regs[rd] & mask, regs[rs] & mask
+        fa, fb = to_float(a), to_float(b)
+        # x - x == 0.0 solo si x es finito (inf - inf y nan - nan dan nan)
+        if fa - fa == 0.0 and fb - fb == 0.0 and (fb != 0.0 or not is_div):
+            r = op(fa, fb)
+            bits = to_bits(r)
+            self._pending_flags = None
+            flags = self._flags
+            flags["C"] = 0
+            flags["V"] = 0 if r - r == 0.0 else 1
+            flags["Z"] = 1 if r == 0.0 else 0
+            flags["N"] = bits >> sign_shift
+        else:
+            bits = getattr(self.fpu, name)(a, b, size)
+            self.sync_flags_from_fpu()
+        regs[rd] = bits & mask
+
+    handler.__name__ = f"_op_f{name}{size}"
+    handler.__doc__ = f"F{name.upper()}{size}"
+    return handler
+
+
+def _fpu_unop(name, size):
+    op = _FPU_UNOPS[name]
+    to_float, to_bits = FLOAT_CODECS[size]
+    mask = MASK32 if size == 4 else MASK64
+    sign_shift = size * 8 - 1
+    is_sqrt = name == 'sqrt'
+
+    def handler(self, rd, rs, imm):
+        regs = self.regs
+        a = regs[rd] & mask
+        fa = to_float(a)
+        if fa - fa == 0.0 and (fa >= 0.0 or not is_sqrt):
+            r = op(fa)
+            bits = to_bits(r)
+            self._pending_flags = None
+            flags = self._flags
+            flags["C"] = 0
+            flags["V"] = 0
+            flags["Z"] = 1 if r == 0.0 else 0
+            flags["N"] = bits >> sign_shift
+        else:
+            bits = getattr(self.fpu, name)(a, size)
+            self.sync_flags_from_fpu()
+        regs[rd] = bits & mask
+
+    handler.__name__ = f"_op_f{name}{size}"
+    handler.__doc__ = f"F{name.upper()}{size}"
+    return handler
+
+
 class Instruction:
     def __init__(self, opcode: int, fmt: str,
                  rd: Optional[int] = None,
@@ -42,23 +159,47 @@ class Instruction:
         return (f"<Instr op={self.opcode:#06x} fmt={self.fmt} "
                 f"rd={self.rd} rs={self.rs} imm={self.imm}>")
 
+class MachineSnapshot:
+    """Estado completo capturado por CPU.snapshot(): registros, banderas, PC,
+    estado de interrupciones (EI/DI, WAIT), RAM (MemorySnapshot) y dispositivos de E/S."""
+    __slots__ = ("regs", "flags", "pc", "ir", "running", "interrupts_enabled", "waiting",
+                 "memory", "io")
+
+    def __init__(self, regs, flags, pc, ir, running, memory, io,
+                 interrupts_enabled=False, waiting=False):
+        self.regs = regs
+        self.flags = flags
+        self.pc = pc
+        self.ir = ir
+        self.running = running
+        self.interrupts_enabled = interrupts_enabled
+        self.waiting = waiting
+        self.memory = memory
+        self.io = io
+
 class CPU:
     def __init__(self, memory:Memory, io_sytem : IOSystem):
-        self.registers: List[Register] = [Register(f"R{i}") for i in range(16)]
-        self.flags: Dict[str, int] = {"Z": 0, "N": 0, "C": 0, "V": 0}
+        # Banco de registros plano: los handlers usan self.regs (lista de enteros);
+        # self.registers[i] es una vista con .value/read/write (GUI, tests)
+        self.registers = RegisterFile(16)
+        self.regs: list = self.registers.values
+        # Banderas perezosas: ALU/CMP/INC/DEC solo dejan en _pending_flags
+        # (función, a, b, resultado, tamaño); la propiedad flags las evalúa
+        # antes de devolver el dict (saltos, instrucciones de flags, GUI, tests)
+        self._flags: Dict[str, int] = {"Z": 0, "N": 0, "C": 0, "V": 0}
+        self._pending_flags: Optional[tuple] = None
         self.memory = memory
         self.pc = 0
         self.ir = 0
         self.sp:Register = self.registers[15]
         self.running = True
         self.io = io_sytem
+        # Interrupciones (ver machine/IO/Interrupts.py): EI/DI y WAIT pendiente
+        self.interrupts_enabled = False
+        self.waiting = False
         self.alu = ALU()
         self.fpu = FPU()
 
-        # printing control for store logs: print header only once
-        self._store_header_printed = False
-        # small helper: keep minimal runtime symbol logging for stores
-        # CPU will consult memory.find_symbol_at(addr) if available
 
         # mapa de opcode -> formato
         self.formats = {
@@ -134,28 +275,137 @@ class CPU:
             # Size-specific CMP instructions
             0x0830: RR, 0x0831: RR, 0x0832: RR, 0x0833: RR,  # CMP1, CMP2, CMP4, CMP8
             0x0840: RI, 0x0841: RI, 0x0842: RI, 0x0843: RI,  # CMPV1, CMPV2, CMPV4, CMPV8
+
+            # Interrupciones
+            0x0900: OP, 0x0901: OP, 0x0902: OP, 0x0903: OP,  # EI, DI, RTI, WAIT
+            0x0904: RI,  # SETIV
+        }
+
+        # mapa de opcode -> handler. Se construye una sola vez para que
+        # execute() resuelva cada instrucción con una búsqueda en vez de
+        # recorrer una cadena de comparaciones.
+        self._handlers = {
+            # Control
+            0x0000: self._op_parar, 0x0001: self._op_nop,
+            # Aritmética RR / RI (8 bytes)
+            0x0010: self._op_add, 0x0011: self._op_sub, 0x0012: self._op_muls,
+            0x0013: self._op_mul, 0x0014: self._op_div, 0x0015: self._op_mod,
+            0x0020: self._op_addv, 0x0021: self._op_subv,
+            # Inc / Dec / Clr
+            0x0030: self._op_inc, 0x0031: self._op_dec, 0x0064: self._op_clr,
+            # Lógicas
+            0x0040: self._op_not, 0x0041: self._op_and, 0x0042: self._op_andv,
+            0x0043: self._op_or, 0x0044: self._op_orv, 0x0045: self._op_xor,
+            0x0046: self._op_xorv,
+            # Shifts
+            0x0050: self._op_shi, 0x0051: self._op_shd, 0x0052: self._op_ushi,
+            0x0053: self._op_ushd,
+            # Memoria
+            0x0060: self._op_load, 0x0061: self._op_loadv, 0x0062: self._op_loadr,
+            0x0063: self._op_storev,
+            # Comparación
+            0x0070: self._op_cmp, 0x0071: self._op_cmpv,
+            0x0830: self._op_cmp1, 0x0831: self._op_cmp2, 0x0832: self._op_cmp4, 0x0833: self._op_cmp8,
+            0x0840: self._op_cmpv1, 0x0841: self._op_cmpv2, 0x0842: self._op_cmpv4, 0x0843: self._op_cmpv8,
+            # Flags
+            0x0080: self._op_clrz, 0x0081: self._op_setz, 0x0082: self._op_clrn, 0x0083: self._op_setn,
+            0x0084: self._op_clrc, 0x0085: self._op_setc, 0x0086: self._op_clrv, 0x0087: self._op_setv,
+            # Jumps
+            0x0090: self._op_jmp, 0x0091: self._op_jeq, 0x0092: self._op_jne,
+            0x0093: self._op_jlt, 0x0094: self._op_jge, 0x0095: self._op_jcs,
+            0x0096: self._op_jcc, 0x0097: self._op_jmi, 0x0098: self._op_jpl,
+            # I/O
+            0x00A0: self._op_svio, 0x00A1: self._op_loadio, 0x00A2: self._op_showio,
+            # Aritmética con tamaño (1 byte)
+            0x0100: self._op_add1, 0x0101: self._op_sub1, 0x0102: self._op_mul1,
+            0x0103: self._op_muls1, 0x0104: self._op_div1, 0x0105: self._op_mod1,
+            0x0110: self._op_addv1, 0x0111: self._op_subv1,
+            # Aritmética con tamaño (2 bytes)
+            0x0200: self._op_add2, 0x0201: self._op_sub2, 0x0202: self._op_mul2,
+            0x0203: self._op_muls2, 0x0204: self._op_div2, 0x0205: self._op_mod2,
+            0x0210: self._op_addv2, 0x0211: self._op_subv2,
+            # Aritmética con tamaño (4 bytes)
+            0x0300: self._op_add4, 0x0301: self._op_sub4, 0x0302: self._op_mul4,
+            0x0303: self._op_muls4, 0x0304: self._op_div4, 0x0305: self._op_mod4,
+            0x0310: self._op_addv4, 0x0311: self._op_subv4,
+            # Aritmética con tamaño (8 bytes)
+            0x0312: self._op_add8, 0x0313: self._op_sub8, 0x0314: self._op_mul8,
+            0x0315: self._op_muls8, 0x0316: self._op_div8, 0x0319: self._op_mod8,
+            0x0317: self._op_addv8, 0x0318: self._op_subv8,
+            # MOV
+            0x0400: self._op_mov1, 0x0401: self._op_mov2, 0x0402: self._op_mov4, 0x0403: self._op_mov8,
+            0x0410: self._op_movv1, 0x0411: self._op_movv2, 0x0412: self._op_movv4, 0x0413: self._op_movv8,
+            # LOAD
+            0x0500: self._op_load1, 0x0501: self._op_load2, 0x0502: self._op_load4, 0x0503: self._op_load8,
+            0x0510: self._op_loadr1, 0x0511: self._op_loadr2, 0x0512: self._op_loadr4, 0x0513: self._op_loadr8,
+            # STORE
+            0x0600: self._op_store1, 0x0601: self._op_store2, 0x0602: self._op_store4, 0x0603: self._op_store8,
+            0x0610: self._op_storer1, 0x0611: self._op_storer2, 0x0612: self._op_storer4, 0x0613: self._op_storer8,
+            # FPU
+            0x0700: self._op_fadd4, 0x0701: self._op_fsub4, 0x0702: self._op_fmul4, 0x0703: self._op_fdiv4,
+            0x0710: self._op_fadd8, 0x0711: self._op_fsub8, 0x0712: self._op_fmul8, 0x0713: self._op_fdiv8,
+            0x0720: self._op_fsqrt4, 0x0721: self._op_fsqrt8, 0x0722: self._op_fsin4, 0x0723: self._op_fcos4,
+            0x0724: self._op_fsin8, 0x0725: self._op_fcos8,
+            0x0730: self._op_cvtf2i8, 0x0731: self._op_cvti2f8, 0x0732: self._op_cvtf2i4, 0x0733: self._op_cvti2f4,
+            # Stack
+            0x0099: self._op_call, 0x0800: self._op_ret,
+            0x0810: self._op_pop1, 0x0811: self._op_pop2, 0x0812: self._op_pop4, 0x0813: self._op_pop8,
+            0x0820: self._op_push1, 0x0821: self._op_push2, 0x0822: self._op_push4, 0x0823: self._op_push8,
+            # Interrupciones
+            0x0900: self._op_ei, 0x0901: self._op_di, 0x0902: self._op_rti, 0x0903: self._op_wait,
+            0x0904: self._op_setiv,
         }
 
+        # Caché de instrucciones predecodificadas: pc -> (handler, rd, rs, imm, next_pc).
+        # Un bucle se decodifica una vez y luego solo se re-ejecuta. La memoria
+        # avisa (invalidate_code) cuando se escribe sobre código ya cacheado.
+        self._icache: Dict[int, tuple] = {}
+        self._icache_pages: Dict[int, list] = {}
+        if hasattr(memory, 'add_write_listener'):
+            memory.add_write_listener(self.invalidate_code)
+
+        # Traductor de bloques básicos (engine="block"), creado al primer uso
+        self._translator: Optional[BlockTranslator] = None
+        # Perfilador opcional (ver Profiler.py); None = sin coste en run()
+        self.profiler = None
+        # Traza de STORE opcional (ver StoreTrace.py y set_store_tracer)
+        self.store_tracer = None
+        self._store_handlers = {op: self._handlers[op] for op in STORE_OPS}
+
     # ---------------- Helpers ----------------
+    @property
+    def flags(self) -> Dict[str, int]:
+        if self._pending_flags is not None:
+            self.materialize_flags()
+        return self._flags
+
+    @flags.setter
+    def flags(self, values: Dict[str, int]):
+        self._pending_flags = None
+        self._flags.update(values)
+
+    def materialize_flags(self):
+        """Evalúa las banderas pendientes de la última operación aritmética."""
+        record = self._pending_flags
+        if record is not None:
+            self._pending_flags = None
+            flags = self._flags
+            flags["Z"], flags["N"], flags["C"], flags["V"] = record[0](*record[1:])
+
     def update_ZN(self, val: int):
-        self.flags["Z"] = int((val & MASK64) == 0)
-        self.flags["N"] = int(((val >> 63) & 1) == 1)
+        flags = self.flags
+        flags["Z"] = int((val & MASK64) == 0)
+        flags["N"] = int(((val >> 63) & 1) == 1)
         #self.update_gui()
     
     def sync_flags_from_alu(self):
-        """Sync flags from ALU to CPU flags"""
-        alu_flags = self.alu.flags.as_dict()
-        self.flags["C"] = alu_flags["C"]
-        self.flags["V"] = alu_flags["V"]  # ALU uses O for overflow, CPU uses V
-        self.flags["Z"] = alu_flags["Z"]
-        self.flags["N"] = alu_flags["N"]
+        """Sync flags from ALU to CPU flags (se evalúan al leerlas)"""
+        self._pending_flags = self.alu.last
     
     def sync_flags_from_fpu(self):
         """Sync flags from FPU to CPU flags"""
-        self.flags["C"] = self.fpu.flags["C"]
-        self.flags["V"] = self.fpu.flags["V"]  # FPU uses O for overflow, CPU uses V
-        self.flags["Z"] = self.fpu.flags["Z"]
-        self.flags["N"] = self.fpu.flags["N"]
+        self._pending_flags = None
+        self._flags.update(self.fpu.flags)
 
     @staticmethod
     def unsigned_add_carry(a: int, b: int) -> int:
@@ -177,105 +427,15 @@ class CPU:
     def fetch(self) -> None:
         if self.pc + 8 > len(self.memory):
             raise IndexError(f"PC fuera de rango: {self.pc:#x}")
+        if getattr(self.memory, 'protection', False):
+            try:
+                self.memory.check_exec(self.pc)
+            except MemoryFault as e:
+                e.pc = self.pc
+                raise
         # little-endian: byte bajo primero
-        word = int.from_bytes(self.memory.get_bytes(self.pc,8), "little")
-        self.ir = word 
+        self.ir = self.memory.read_u64(self.pc)
         self.pc += 8
-
-    def _log_store(self, addr: int, size: int, val: int):
-        """Log a memory store only if it corresponds to a named symbol registered in Memory.
-        Keeps logs minimal as requested: only when we move variables to memory.
-        """
-        try:
-            if not hasattr(self.memory, 'find_symbol_at'):
-                return
-            # pass current BP to allow resolving BP-relative symbols
-            try:
-                bp_val = self.registers[14].read(8)
-            except Exception:
-                bp_val = None
-            # debug: show BP when resolving relative symbols
-            logger.debug("CPU: resolving symbol addr=%s with BP=%s", f"{addr:#010x}", f"{bp_val:#010x}" if bp_val is not None else 'None')
-            sym = self.memory.find_symbol_at(addr, bp=bp_val)
-
-            # compute unsigned/hex representation
-            mask = (1 << (size * 8)) - 1
-            unsigned = int(val) & mask
-            try:
-                hex_str = f"0x{unsigned:0{size*2}X}"
-            except Exception:
-                hex_str = hex(unsigned)
-
-            # optional float reinterpretation for 4/8 bytes
-            float_val = None
-            if size in (4, 8):
-                try:
-                    if size == 4:
-                        float_val = struct.unpack('<f', int(val).to_bytes(4, 'little', signed=False))[0]
-                    else:
-                        float_val = struct.unpack('<d', int(val).to_bytes(8, 'little', signed=False))[0]
-                except Exception:
-                    float_val = None
-
-            # print a header once to introduce the STORE table
-            if not self._store_header_printed:
-                # Print a nicely aligned header for STORE table
-                # widen Raw column to accommodate 8-byte hex values with 'raw=' prefix
-                logger.info("STORE  %-12s %-12s %-6s %-16s %-20s %-24s %s", 'Name', 'Addr', 'Size', 'Offset', 'Value/Float', 'Raw', 'PC')
-                self._store_header_printed = True
-
-            # Common fields
-            instr_addr = max(0, self.pc - 8)
-            pc_field = f"pc=0x{instr_addr:06x}"
-
-            if sym:
-                name = sym.get('name')
-                base_addr = sym.get('addr')
-                rel = addr - base_addr
-
-                # Prepare column fields
-                name_col = name[:12]
-                addr_col = f"{addr:#010x}"
-                size_col = size
-                offset_display = f"+{rel} (0x{rel:X})" if rel != 0 else "+0"
-                if float_val is not None:
-                    val_field = f"float={float_val:.6f}"
-                else:
-                    val_field = f"value={int(val)}"
-                raw_field = f"raw={hex_str}"
-                instr_addr = max(0, self.pc - 8)
-                pc_field = f"pc={instr_addr:#010x}"
-
-                logger.info("STORE  %-12s %-12s %-6d %-16s %-20s %-24s %s", name_col, addr_col, size_col, offset_display, val_field, raw_field, pc_field)
-            else:
-                # if store is inside the stack area, also log address/size/value
-                try:
-                    if hasattr(self.memory, 'stack_base') and hasattr(self.memory, 'stack_end'):
-                        if self.memory.stack_base <= addr < self.memory.stack_end:
-                            addr_f = f"{addr:#010x}"
-                            size_f = f"{size}"
-                            offset_display = f"+0 (0x0)"
-                            if float_val is not None:
-                                val_field = f"{float_val:.6f}"
-                            else:
-                                val_field = f"{int(val)}"
-                            raw_field = hex_str
-                            name_col = 'stack'
-                            addr_col = f"{addr:#010x}"
-                            size_col = size
-                            offset_display = "+0"
-                            if float_val is not None:
-                                val_field = f"float={float_val:.6f}"
-                            else:
-                                val_field = f"value={int(val)}"
-                            raw_field = f"raw={hex_str}"
-                            instr_addr = max(0, self.pc - 8)
-                            pc_field = f"pc={instr_addr:#010x}"
-                            logger.info("STORE  %-12s %-12s %-6d %-16s %-20s %-24s %s", name_col, addr_col, size_col, offset_display, val_field, raw_field, pc_field)
-                except Exception:
-                    pass
-        except Exception:
-            logger.exception("error logging store @0x%08X", addr)
         
 
     def decode(self) -> Instruction:
@@ -308,896 +468,970 @@ class CPU:
             raise ValueError(f"ERROR en CPU.decode: Formato desconocido para opcode {hex(opcode)}, dir {self.pc-8}, ins = {self.ir:X}")
 
     def execute(self, ins: Instruction):
-        op = ins.opcode
-
-        # -------- Control --------
-        if op == 0x0000:  # PARAR
-            self.running = False
-            return
-        if op == 0x0001:  # NOP
-            return
-
-        # -------- Aritmética RR --------
-        if op == 0x0010:  # ADD (8 bytes)
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = self.alu.add(a, b, 8, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 8)
-            return
-
-        if op == 0x0011:  # SUB (8 bytes)
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = self.alu.sub(a, b, 8, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 8)
-            return
-
-        if op == 0x0012:  # MULS (signed, 8 bytes)
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = self.alu.mul(a, b, 8, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 8)
-            return
-
-        if op == 0x0013:  # MUL (unsigned, 8 bytes)
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = self.alu.mul(a, b, 8, signed=False)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 8)
-            return
-
-        if op == 0x0014:  # DIV (8 bytes)
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            try:
-                r = self.alu.div(a, b, 8, signed=True)
-                self.sync_flags_from_alu()
-                self.registers[ins.rd].write(r, 8)
-            except ZeroDivisionError:
-                self.flags["V"] = 1
-                self.registers[ins.rd].write(0, 8)
-            return
-        
-        if op ==  0x0015: # MOD
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = a % b
-            self.registers[ins.rd].write(r, 8)
-           
-        # -------- Aritmética RI --------
-        if op == 0x0020:  # ADDV (8 bytes)
-            a, b = self.registers[ins.rd].read(8), ins.imm
-            r = self.alu.add(a, b, 8, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 8)
-            return
-
-        if op == 0x0021:  # SUBV (8 bytes)
-            a, b = self.registers[ins.rd].read(8), ins.imm
-            r = self.alu.sub(a, b, 8, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 8)
-            return
-
-        # -------- Inc / Dec / Clr --------
-        if op == 0x0030:  # INC
-            a = self.registers[ins.rd].read(8)
-            r = to_uint64(a + 1)
-            self.flags["C"] = self.unsigned_add_carry(a, 1)
-            self.flags["V"] = self.signed_overflow_add(to_int64(a), 1, to_int64(r))
-            self.update_ZN(r)
-            self.registers[ins.rd].write(r, 8)
-            return
-
-        if op == 0x0031:  # DEC
-            a = self.registers[ins.rd].read(8)
-            r = to_uint64(a - 1)
-            self.flags["C"] = self.unsigned_sub_borrow(a, 1)
-            self.flags["V"] = self.signed_overflow_sub(to_int64(a), 1, to_int64(r))
-            self.update_ZN(r)
-            self.registers[ins.rd].write(r, 8)
-            return
-
-        if op == 0x0064:  # CLR
-            self.registers[ins.rd].write(0, 8)
-            self.update_ZN(0)
-            self.flags["C"] = self.flags["V"] = 0
-            return
-
-        # -------- Lógicas --------
-        if op == 0x0040:  # NOT
-            r = to_uint64(~self.registers[ins.rd].read(8))
-            self.registers[ins.rd].write(r, 8)
-            self.update_ZN(r)
-            return
-
-        if op == 0x0041:  # AND
-            r = to_uint64(self.registers[ins.rd].read(8) & self.registers[ins.rs].read(8))
-            self.registers[ins.rd].write(r, 8)
-            self.update_ZN(r)
-            return
-
-        if op == 0x0042:  # ANDV
-            r = to_uint64(self.registers[ins.rd].read(8) & ins.imm)
-            self.registers[ins.rd].write(r, 8)
-            self.update_ZN(r)
-            return
-
-        if op == 0x0043:  # OR
-            r = to_uint64(self.registers[ins.rd].read(8) | self.registers[ins.rs].read(8))
-            self.registers[ins.rd].write(r, 8)
-            self.update_ZN(r)
-            return
-
-        if op == 0x0044:  # ORV
-            r = to_uint64(self.registers[ins.rd].read(8) | ins.imm)
-            self.registers[ins.rd].write(r, 8)
-            self.update_ZN(r)
-            return
-
-        if op == 0x0045:  # XOR
-            r = to_uint64(self.registers[ins.rd].read(8) ^ self.registers[ins.rs].read(8))
-            self.registers[ins.rd].write(r, 8)
-            self.update_ZN(r)
-            return
-
-        if op == 0x0046:  # XORV
-            r = to_uint64(self.registers[ins.rd].read(8) ^ ins.imm)
-            self.registers[ins.rd].write(r, 8)
-            self.update_ZN(r)
-            return
-
-        # -------- Shifts --------
-        if op == 0x0050:  # SHI (left)
-            amt = self.registers[ins.rd].read(8) & 0x3F
-            r = to_uint64(self.registers[ins.rd].read(8) << amt)
-            self.registers[ins.rd].write(r, 8)
-            self.update_ZN(r)
-            return
-
-        if op == 0x0051:  # SHD (signed right)
-            amt = self.registers[ins.rd].read(8) & 0x3F
-            r = to_uint64(to_int64(self.registers[ins.rd].read(8)) >> amt)
-            self.registers[ins.rd].write(r, 8)
-            self.update_ZN(r)
-            return
-
-        if op == 0x0052:  # USHI (unsigned left)
-            amt = self.registers[ins.rd].read(8) & 0x3F
-            r = to_uint64(self.registers[ins.rd].read(8) << amt)
-            self.registers[ins.rd].write(r, 8)
-            self.update_ZN(r)
-            return
-
-        if op == 0x0053:  # USHD (unsigned right)
-            amt = self.registers[ins.rd].read(8) & 0x3F
-            r = self.registers[ins.rd].read(8) >> amt
-            self.registers[ins.rd].write(r, 8)
-            self.update_ZN(r)
-            return
-
-        # -------- Memoria --------
-        if op == 0x0060:  # LOAD R, M
-            self.registers[ins.rd].write(self.memory.read(ins.imm,8), 8)
-            self.update_ZN(self.registers[ins.rd].read(8))
-            return
-
-        if op == 0x0061:  # LOADV R, v
-            self.registers[ins.rd].write(to_uint64(ins.imm), 8)
-            self.update_ZN(self.registers[ins.rd].read(8))
-            return
-
-        if op == 0x0062:  # LOADR R, R'
-            addr = self.registers[ins.rs].read(8) & MASK64
-            self.registers[ins.rd].write(self.memory[addr], 8)
-            self.update_ZN(self.registers[ins.rd].read(8))
-            return
-
-        if op == 0x0063:  # STOREV M, R
-            val = self.registers[ins.rd].read(8)
-            self.memory.write(ins.imm, val, 8)
-            self._log_store(ins.imm, 8, val)
-            return
-
-        # -------- Comparación --------
-        if op == 0x0070:  # CMP R, R'
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = to_uint64(a - b)
-            self.update_ZN(r)
-            self.flags["C"] = int(a >= b)
-            self.flags["V"] = self.signed_overflow_sub(to_int64(a), to_int64(b), to_int64(r))
-            return
-
-        if op == 0x0071:  # CMPV R, v
-            a, b = self.registers[ins.rd].read(8), ins.imm
-            r = to_uint64(a - b)
-            self.update_ZN(r)
-            self.flags["C"] = int(a >= b)
-            self.flags["V"] = self.signed_overflow_sub(to_int64(a), to_int64(b), to_int64(r))
-            return
-
-        # -------- Size-specific CMP Instructions --------
-        if op == 0x0830:  # CMP1 Rd, Rs
-            a, b = self.registers[ins.rd].read(1), self.registers[ins.rs].read(1)
-            r = to_uint64(a - b)
-            self.update_ZN(r)
-            self.flags["C"] = int(a >= b)
-            self.flags["V"] = self.signed_overflow_sub(to_int64(a), to_int64(b), to_int64(r))
-            return
-
-        if op == 0x0831:  # CMP2 Rd, Rs
-            a, b = self.registers[ins.rd].read(2), self.registers[ins.rs].read(2)
-            r = to_uint64(a - b)
-            self.update_ZN(r)
-            self.flags["C"] = int(a >= b)
-            self.flags["V"] = self.signed_overflow_sub(to_int64(a), to_int64(b), to_int64(r))
-            return
-
-        if op == 0x0832:  # CMP4 Rd, Rs
-            a, b = self.registers[ins.rd].read(4), self.registers[ins.rs].read(4)
-            r = to_uint64(a - b)
-            self.update_ZN(r)
-            self.flags["C"] = int(a >= b)
-            self.flags["V"] = self.signed_overflow_sub(to_int64(a), to_int64(b), to_int64(r))
-            return
-
-        if op == 0x0833:  # CMP8 Rd, Rs
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = to_uint64(a - b)
-            self.update_ZN(r)
-            self.flags["C"] = int(a >= b)
-            self.flags["V"] = self.signed_overflow_sub(to_int64(a), to_int64(b), to_int64(r))
-            return
-
-        if op == 0x0840:  # CMPV1 Rd, v
-            a, b = self.registers[ins.rd].read(1), ins.imm & 0xFF
-            r = to_uint64(a - b)
-            self.update_ZN(r)
-            self.flags["C"] = int(a >= b)
-            self.flags["V"] = self.signed_overflow_sub(to_int64(a), to_int64(b), to_int64(r))
-            return
-
-        if op == 0x0841:  # CMPV2 Rd, v
-            a, b = self.registers[ins.rd].read(2), ins.imm & 0xFFFF
-            r = to_uint64(a - b)
-            self.update_ZN(r)
-            self.flags["C"] = int(a >= b)
-            self.flags["V"] = self.signed_overflow_sub(to_int64(a), to_int64(b), to_int64(r))
-            return
-
-        if op == 0x0842:  # CMPV4 Rd, v
-            a, b = self.registers[ins.rd].read(4), ins.imm & 0xFFFFFFFF
-            r = to_uint64(a - b)
-            self.update_ZN(r)
-            self.flags["C"] = int(a >= b)
-            self.flags["V"] = self.signed_overflow_sub(to_int64(a), to_int64(b), to_int64(r))
-            return
-
-        if op == 0x0843:  # CMPV8 Rd, v
-            a, b = self.registers[ins.rd].read(8), ins.imm
-            r = to_uint64(a - b)
-            self.update_ZN(r)
-            self.flags["C"] = int(a >= b)
-            self.flags["V"] = self.signed_overflow_sub(to_int64(a), to_int64(b), to_int64(r))
-            return
-
-        # -------- Flags manip --------
-        if op == 0x0080: self.flags["Z"] = 0; return
-        if op == 0x0081: self.flags["Z"] = 1; return
-        if op == 0x0082: self.flags["N"] = 0; return
-        if op == 0x0083: self.flags["N"] = 1; return
-        if op == 0x0084: self.flags["C"] = 0; return
-        if op == 0x0085: self.flags["C"] = 1; return
-        if op == 0x0086: self.flags["V"] = 0; return
-        if op == 0x0087: self.flags["V"] = 1; return
-
-        # -------- Saltos --------
-        if 0x0090 <= op <= 0x0098:
-            imm = ins.imm
-            take = False
-            if op == 0x0090: take = True
-            elif op == 0x0091: take = self.flags["Z"] == 1
-            elif op == 0x0092: take = self.flags["Z"] == 0
-            elif op == 0x0093: take = self.flags["N"] == 1
-            elif op == 0x0094: take = self.flags["N"] == 0
-            elif op == 0x0095: take = self.flags["C"] == 1
-            elif op == 0x0096: take = self.flags["C"] == 0
-            elif op == 0x0097: take = (self.flags["V"] ^ self.flags["N"]) == 1
-            elif op == 0x0098: take = (self.flags["V"] ^ self.flags["N"]) == 0
-            if take: 
-                self.pc = imm
-            return
-
-         # -------- I/O --------
-        if op == 0x00A0:  # SVIO
-            value = self.registers[ins.rd].read(8)
-            self.io.write(ins.imm,value)
-            return
-        if op == 0x00A1:  # LOADIO
-            value = self.io.read(ins.imm)
-            self.registers[ins.rd].write(value, 8)
-            self.update_ZN(self.registers[ins.rd].read(8))
-            return
-        if op == 0x00A2:  # SHOWIO
-            self.io.show(ins.imm)
-            return
-    
-
-        # -------- Size-suffixed Arithmetic Instructions (1 byte) --------
-        if op == 0x0100:  # ADD1
-            a, b = self.registers[ins.rd].read(1), self.registers[ins.rs].read(1)
-            r = self.alu.add(a, b, 1, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 1)
-            return
-        if op == 0x0101:  # SUB1
-            a, b = self.registers[ins.rd].read(1), self.registers[ins.rs].read(1)
-            r = self.alu.sub(a, b, 1, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 1)
-            return
-        if op == 0x0102:  # MUL1
-            a, b = self.registers[ins.rd].read(1), self.registers[ins.rs].read(1)
-            r = self.alu.mul(a, b, 1, signed=False)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 1)
-            return
-        if op == 0x0103:  # MULS1
-            a, b = self.registers[ins.rd].read(1), self.registers[ins.rs].read(1)
-            r = self.alu.mul(a, b, 1, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 1)
-            return
-        if op == 0x0104:  # DIV1
-            a, b = self.registers[ins.rd].read(1), self.registers[ins.rs].read(1)
-            try:
-                r = self.alu.div(a, b, 1, signed=True)
-                self.sync_flags_from_alu()
-                self.registers[ins.rd].write(r, 1)
-            except ZeroDivisionError:
-                self.flags["V"] = 1
-                self.registers[ins.rd].write(0, 1)
-            return
-        if op == 0x0105:  # MOD1
-            a, b = self.registers[ins.rd].read(1), self.registers[ins.rs].read(1)
-            try:
-                r = self.alu.mod(a, b, 1, signed=True)
-                self.sync_flags_from_alu()
-                self.registers[ins.rd].write(r, 1)
-            except ZeroDivisionError:
-                self.flags["V"] = 1
-                self.registers[ins.rd].write(0, 1)
-            return
-        if op == 0x0110:  # ADDV1
-            a, b = self.registers[ins.rd].read(1), ins.imm & 0xFF
-            r = self.alu.add(a, b, 1, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 1)
-            return
-        if op == 0x0111:  # SUBV1
-            a, b = self.registers[ins.rd].read(1), ins.imm & 0xFF
-            r = self.alu.sub(a, b, 1, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 1)
-            return
-
-        # -------- Size-suffixed Arithmetic Instructions (2 bytes) --------
-        if op == 0x0200:  # ADD2
-            a, b = self.registers[ins.rd].read(2), self.registers[ins.rs].read(2)
-            r = self.alu.add(a, b, 2, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 2)
-            return
-        if op == 0x0201:  # SUB2
-            a, b = self.registers[ins.rd].read(2), self.registers[ins.rs].read(2)
-            r = self.alu.sub(a, b, 2, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 2)
-            return
-        if op == 0x0202:  # MUL2
-            a, b = self.registers[ins.rd].read(2), self.registers[ins.rs].read(2)
-            r = self.alu.mul(a, b, 2, signed=False)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 2)
-            return
-        if op == 0x0203:  # MULS2
-            a, b = self.registers[ins.rd].read(2), self.registers[ins.rs].read(2)
-            r = self.alu.mul(a, b, 2, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 2)
-            return
-        if op == 0x0204:  # DIV2
-            a, b = self.registers[ins.rd].read(2), self.registers[ins.rs].read(2)
-            try:
-                r = self.alu.div(a, b, 2, signed=True)
-                self.sync_flags_from_alu()
-                self.registers[ins.rd].write(r, 2)
-            except ZeroDivisionError:
-                self.flags["V"] = 1
-                self.registers[ins.rd].write(0, 2)
-            return
-        if op == 0x0205:  # MOD2
-            a, b = self.registers[ins.rd].read(2), self.registers[ins.rs].read(2)
-            try:
-                r = self.alu.mod(a, b, 2, signed=True)
-                self.sync_flags_from_alu()
-                self.registers[ins.rd].write(r, 2)
-            except ZeroDivisionError:
-                self.flags["V"] = 1
-                self.registers[ins.rd].write(0, 2)
-            return
-        if op == 0x0210:  # ADDV2
-            a, b = self.registers[ins.rd].read(2), ins.imm & 0xFFFF
-            r = self.alu.add(a, b, 2, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 2)
-            return
-        if op == 0x0211:  # SUBV2
-            a, b = self.registers[ins.rd].read(2), ins.imm & 0xFFFF
-            r = self.alu.sub(a, b, 2, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 2)
-            return
+        handler = self._handlers.get(ins.opcode)
+        if handler is not None:
+            handler(ins.rd, ins.rs, ins.imm)
+
+    # ---------------- Handlers por opcode ----------------
+    # Cada handler recibe (rd, rs, imm) ya decodificados; los campos que no
+    # usa el formato llegan como None.
+
+    # -------- Control --------
+    def _op_parar(self, rd, rs, imm):
+        """PARAR"""
+        self.running = False
+
+    def _op_nop(self, rd, rs, imm):
+        """NOP"""
+
+    # -------- Aritmética RR --------
+    _op_add, _op_sub = _alu_handler(0x0010), _alu_handler(0x0011)
+    _op_muls, _op_mul = _alu_handler(0x0012), _alu_handler(0x0013)
+    _op_div = _alu_handler(0x0014)
+
+    def _op_mod(self, rd, rs, imm):
+        """MOD"""
+        a, b = self.regs[rd] & MASK64, self.regs[rs] & MASK64
+        r = a % b
+        self.regs[rd] = r & MASK64
+
+    # -------- Aritmética RI --------
+    _op_addv, _op_subv = _alu_handler(0x0020), _alu_handler(0x0021)
+
+    # -------- Inc / Dec / Clr --------
+    def _op_inc(self, rd, rs, imm):
+        """INC"""
+        a = self.regs[rd] & MASK64
+        r = to_uint64(a + 1)
+        self._pending_flags = (flags_inc, a, 1, r, 8)
+        self.regs[rd] = r & MASK64
+
+    def _op_dec(self, rd, rs, imm):
+        """DEC"""
+        a = self.regs[rd] & MASK64
+        r = to_uint64(a - 1)
+        self._pending_flags = (flags_dec, a, 1, r, 8)
+        self.regs[rd] = r & MASK64
+
+    def _op_clr(self, rd, rs, imm):
+        """CLR"""
+        self.regs[rd] = 0
+        self._pending_flags = None
+        self._flags.update(Z=1, N=0, C=0, V=0)
+
+    # -------- Lógicas --------
+    def _op_not(self, rd, rs, imm):
+        """NOT"""
+        r = to_uint64(~(self.regs[rd] & MASK64))
+        self.regs[rd] = r & MASK64
+        self.update_ZN(r)
+
+    def _op_and(self, rd, rs, imm):
+        """AND"""
+        r = to_uint64((self.regs[rd] & MASK64) & (self.regs[rs] & MASK64))
+        self.regs[rd] = r & MASK64
+        self.update_ZN(r)
+
+    def _op_andv(self, rd, rs, imm):
+        """ANDV"""
+        r = to_uint64((self.regs[rd] & MASK64) & imm)
+        self.regs[rd] = r & MASK64
+        self.update_ZN(r)
+
+    def _op_or(self, rd, rs, imm):
+        """OR"""
+        r = to_uint64((self.regs[rd] & MASK64) | (self.regs[rs] & MASK64))
+        self.regs[rd] = r & MASK64
+        self.update_ZN(r)
+
+    def _op_orv(self, rd, rs, imm):
+        """ORV"""
+        r = to_uint64((self.regs[rd] & MASK64) | imm)
+        self.regs[rd] = r & MASK64
+        self.update_ZN(r)
+
+    def _op_xor(self, rd, rs, imm):
+        """XOR"""
+        r = to_uint64((self.regs[rd] & MASK64) ^ (self.regs[rs] & MASK64))
+        self.regs[rd] = r & MASK64
+        self.update_ZN(r)
+
+    def _op_xorv(self, rd, rs, imm):
+        """XORV"""
+        r = to_uint64((self.regs[rd] & MASK64) ^ imm)
+        self.regs[rd] = r & MASK64
+        self.update_ZN(r)
+
+    # -------- Shifts --------
+    def _op_shi(self, rd, rs, imm):
+        """SHI (left)"""
+        amt = self.regs[rd] & 0x3F
+        r = to_uint64((self.regs[rd] & MASK64) << amt)
+        self.regs[rd] = r & MASK64
+        self.update_ZN(r)
+
+    def _op_shd(self, rd, rs, imm):
+        """SHD (signed right)"""
+        amt = self.regs[rd] & 0x3F
+        r = to_uint64(to_int64(self.regs[rd]) >> amt)
+        self.regs[rd] = r & MASK64
+        self.update_ZN(r)
+
+    def _op_ushi(self, rd, rs, imm):
+        """USHI (unsigned left)"""
+        amt = self.regs[rd] & 0x3F
+        r = to_uint64((self.regs[rd] & MASK64) << amt)
+        self.regs[rd] = r & MASK64
+        self.update_ZN(r)
+
+    def _op_ushd(self, rd, rs, imm):
+        """USHD (unsigned right)"""
+        amt = self.regs[rd] & 0x3F
+        r = (self.regs[rd] & MASK64) >> amt
+        self.regs[rd] = r & MASK64
+        self.update_ZN(r)
+
+    # -------- Memoria --------
+    def _op_load(self, rd, rs, imm):
+        """LOAD R, M"""
+        self.regs[rd] = self.memory.read_u64(imm)
+        self.update_ZN(self.regs[rd])
+
+    def _op_loadv(self, rd, rs, imm):
+        """LOADV R, v"""
+        self.regs[rd] = to_uint64(imm)
+        self.update_ZN(self.regs[rd])
+
+    def _op_loadr(self, rd, rs, imm):
+        """LOADR R, R'"""
+        addr = self.regs[rs] & MASK64
+        self.regs[rd] = self.memory.read_u8(addr)
+        self.update_ZN(self.regs[rd])
+
+    def _op_storev(self, rd, rs, imm):
+        """STOREV M, R"""
+        val = self.regs[rd] & MASK64
+        self.memory.write_u64(imm, val)
+
+    # -------- Comparación --------
+    def _op_cmp(self, rd, rs, imm):
+        """CMP R, R'"""
+        a, b = self.regs[rd] & MASK64, self.regs[rs] & MASK64
+        r = to_uint64(a - b)
+        self._pending_flags = (flags_cmp, a, b, r, 8)
+
+    def _op_cmpv(self, rd, rs, imm):
+        """CMPV R, v"""
+        a, b = self.regs[rd] & MASK64, imm
+        r = to_uint64(a - b)
+        self._pending_flags = (flags_cmp, a, b, r, 8)
+
+    # -------- Size-specific CMP Instructions --------
+    def _op_cmp1(self, rd, rs, imm):
+        """CMP1 Rd, Rs"""
+        a, b = self.regs[rd] & MASK8, self.regs[rs] & MASK8
+        r = to_uint64(a - b)
+        self._pending_flags = (flags_cmp, a, b, r, 8)
+
+    def _op_cmp2(self, rd, rs, imm):
+        """CMP2 Rd, Rs"""
+        a, b = self.regs[rd] & MASK16, self.regs[rs] & MASK16
+        r = to_uint64(a - b)
+        self._pending_flags = (flags_cmp, a, b, r, 8)
+
+    def _op_cmp4(self, rd, rs, imm):
+        """CMP4 Rd, Rs"""
+        a, b = self.regs[rd] & MASK32, self.regs[rs] & MASK32
+        r = to_uint64(a - b)
+        self._pending_flags = (flags_cmp, a, b, r, 8)
+
+    def _op_cmp8(self, rd, rs, imm):
+        """CMP8 Rd, Rs"""
+        a, b = self.regs[rd] & MASK64, self.regs[rs] & MASK64
+        r = to_uint64(a - b)
+        self._pending_flags = (flags_cmp, a, b, r, 8)
+
+    def _op_cmpv1(self, rd, rs, imm):
+        """CMPV1 Rd, v"""
+        a, b = self.regs[rd] & MASK8, imm & 0xFF
+        r = to_uint64(a - b)
+        self._pending_flags = (flags_cmp, a, b, r, 8)
+
+    def _op_cmpv2(self, rd, rs, imm):
+        """CMPV2 Rd, v"""
+        a, b = self.regs[rd] & MASK16, imm & 0xFFFF
+        r = to_uint64(a - b)
+        self._pending_flags = (flags_cmp, a, b, r, 8)
+
+    def _op_cmpv4(self, rd, rs, imm):
+        """CMPV4 Rd, v"""
+        a, b = self.regs[rd] & MASK32, imm & 0xFFFFFFFF
+        r = to_uint64(a - b)
+        self._pending_flags = (flags_cmp, a, b, r, 8)
+
+    def _op_cmpv8(self, rd, rs, imm):
+        """CMPV8 Rd, v"""
+        a, b = self.regs[rd] & MASK64, imm
+        r = to_uint64(a - b)
+        self._pending_flags = (flags_cmp, a, b, r, 8)
+
+    # -------- Flags manip --------
+    def _op_clrz(self, rd, rs, imm):
+        """CLRZ"""
+        self.flags["Z"] = 0
+
+    def _op_setz(self, rd, rs, imm):
+        """SETZ"""
+        self.flags["Z"] = 1
+
+    def _op_clrn(self, rd, rs, imm):
+        """CLRN"""
+        self.flags["N"] = 0
+
+    def _op_setn(self, rd, rs, imm):
+        """SETN"""
+        self.flags["N"] = 1
+
+    def _op_clrc(self, rd, rs, imm):
+        """CLRC"""
+        self.flags["C"] = 0
+
+    def _op_setc(self, rd, rs, imm):
+        """SETC"""
+        self.flags["C"] = 1
+
+    def _op_clrv(self, rd, rs, imm):
+        """CLRV"""
+        self.flags["V"] = 0
+
+    def _op_setv(self, rd, rs, imm):
+        """SETV"""
+        self.flags["V"] = 1
+
+    # -------- Saltos --------
+    def _op_jmp(self, rd, rs, imm):
+        """JMP"""
+        self.pc = imm
+
+    def _op_jeq(self, rd, rs, imm):
+        """JEQ"""
+        if self.flags["Z"] == 1:
+            self.pc = imm
+
+    def _op_jne(self, rd, rs, imm):
+        """JNE"""
+        if self.flags["Z"] == 0:
+            self.pc = imm
+
+    def _op_jlt(self, rd, rs, imm):
+        """JLT"""
+        if self.flags["N"] == 1:
+            self.pc = imm
+
+    def _op_jge(self, rd, rs, imm):
+        """JGE"""
+        if self.flags["N"] == 0:
+            self.pc = imm
+
+    def _op_jcs(self, rd, rs, imm):
+        """JCS"""
+        if self.flags["C"] == 1:
+            self.pc = imm
+
+    def _op_jcc(self, rd, rs, imm):
+        """JCC"""
+        if self.flags["C"] == 0:
+            self.pc = imm
+
+    def _op_jmi(self, rd, rs, imm):
+        """JMI"""
+        if (self.flags["V"] ^ self.flags["N"]) == 1:
+            self.pc = imm
+
+    def _op_jpl(self, rd, rs, imm):
+        """JPL"""
+        if (self.flags["V"] ^ self.flags["N"]) == 0:
+            self.pc = imm
+
+    # -------- I/O --------
+    def _op_svio(self, rd, rs, imm):
+        """SVIO"""
+        value = self.regs[rd] & MASK64
+        self.io.write(imm,value)
+
+    def _op_loadio(self, rd, rs, imm):
+        """LOADIO"""
+        value = self.io.read(imm)
+        self.regs[rd] = value & MASK64
+        self.update_ZN(self.regs[rd])
+
+    def _op_showio(self, rd, rs, imm):
+        """SHOWIO"""
+        self.io.show(imm)
+
+    # -------- Size-suffixed Arithmetic Instructions (1 byte) --------
+    _op_add1, _op_sub1 = _alu_handler(0x0100), _alu_handler(0x0101)
+    _op_mul1, _op_muls1 = _alu_handler(0x0102), _alu_handler(0x0103)
+    _op_div1, _op_mod1 = _alu_handler(0x0104), _alu_handler(0x0105)
+    _op_addv1, _op_subv1 = _alu_handler(0x0110), _alu_handler(0x0111)
+
+    # -------- Size-suffixed Arithmetic Instructions (2 bytes) --------
+    _op_add2, _op_sub2 = _alu_handler(0x0200), _alu_handler(0x0201)
+    _op_mul2, _op_muls2 = _alu_handler(0x0202), _alu_handler(0x0203)
+    _op_div2, _op_mod2 = _alu_handler(0x0204), _alu_handler(0x0205)
+    _op_addv2, _op_subv2 = _alu_handler(0x0210), _alu_handler(0x0211)
+
+    # -------- Size-suffixed Arithmetic Instructions (4 bytes) --------
+    _op_add4, _op_sub4 = _alu_handler(0x0300), _alu_handler(0x0301)
+    _op_mul4, _op_muls4 = _alu_handler(0x0302), _alu_handler(0x0303)
+    _op_div4, _op_mod4 = _alu_handler(0x0304), _alu_handler(0x0305)
+    _op_addv4, _op_subv4 = _alu_handler(0x0310), _alu_handler(0x0311)
+
+    # -------- Size-suffixed Arithmetic Instructions (8 bytes) --------
+    _op_add8, _op_sub8 = _alu_handler(0x0312), _alu_handler(0x0313)
+    _op_mul8, _op_muls8 = _alu_handler(0x0314), _alu_handler(0x0315)
+    _op_div8, _op_mod8 = _alu_handler(0x0316), _alu_handler(0x0319)
+    _op_addv8, _op_subv8 = _alu_handler(0x0317), _alu_handler(0x0318)  # ADDV8 opera en 4 bytes
+
+    # -------- MOV Instructions --------
+    def _op_mov1(self, rd, rs, imm):
+        """MOV1"""
+        self.regs[rd] = self.regs[rs] & MASK8
+
+    def _op_mov2(self, rd, rs, imm):
+        """MOV2"""
+        self.regs[rd] = self.regs[rs] & MASK16
+
+    def _op_mov4(self, rd, rs, imm):
+        """MOV4"""
+        self.regs[rd] = self.regs[rs] & MASK32
+
+    def _op_mov8(self, rd, rs, imm):
+        """MOV8"""
+        self.regs[rd] = self.regs[rs] & MASK64
+
+    def _op_movv1(self, rd, rs, imm):
+        """MOVV1"""
+        self.regs[rd] = imm & MASK8
+
+    def _op_movv2(self, rd, rs, imm):
+        """MOVV2"""
+        self.regs[rd] = imm & MASK16
+
+    def _op_movv4(self, rd, rs, imm):
+        """MOVV4"""
+        self.regs[rd] = imm & MASK32
+
+    def _op_movv8(self, rd, rs, imm):
+        """MOVV8"""
+        self.regs[rd] = imm & MASK64
+
+    # -------- LOAD Instructions --------
+    def _op_load1(self, rd, rs, imm):
+        """LOAD1"""
+        self.regs[rd] = self.memory.read_u8(imm)
+
+    def _op_load2(self, rd, rs, imm):
+        """LOAD2"""
+        self.regs[rd] = self.memory.read_u16(imm)
+
+    def _op_load4(self, rd, rs, imm):
+        """LOAD4"""
+        self.regs[rd] = self.memory.read_u32(imm)
+
+    def _op_load8(self, rd, rs, imm):
+        """LOAD8"""
+        self.regs[rd] = self.memory.read_u64(imm)
+
+    def _op_loadr1(self, rd, rs, imm):
+        """LOADR1"""
+        addr = self.regs[rs] & MASK64
+        self.regs[rd] = self.memory.read_u8(addr)
+
+    def _op_loadr2(self, rd, rs, imm):
+        """LOADR2"""
+        addr = self.regs[rs] & MASK64
+        self.regs[rd] = self.memory.read_u16(addr)
+
+    def _op_loadr4(self, rd, rs, imm):
+        """LOADR4"""
+        addr = self.regs[rs] & MASK64
+        self.regs[rd] = self.memory.read_u32(addr)
+
+    def _op_loadr8(self, rd, rs, imm):
+        """LOADR8"""
+        addr = self.regs[rs] & MASK64
+        value = self.memory.read_u64(addr)
+        self.regs[rd] = value & MASK64
+
+    # -------- STORE Instructions --------
+    def _op_store1(self, rd, rs, imm):
+        """STORE1"""
+        val = self.regs[rd] & MASK8
+        self.memory.write_u8(imm, val)
+
+    def _op_store2(self, rd, rs, imm):
+        """STORE2"""
+        val = self.regs[rd] & MASK16
+        self.memory.write_u16(imm, val)
+
+    def _op_store4(self, rd, rs, imm):
+        """STORE4"""
+        val = self.regs[rd] & MASK32
+        self.memory.write_u32(imm, val)
+
+    def _op_store8(self, rd, rs, imm):
+        """STORE8"""
+        val = self.regs[rd] & MASK64
+        self.memory.write_u64(imm, val)
+
+    def _op_storer1(self, rd, rs, imm):
+        """STORER1"""
+        addr = self.regs[rs] & MASK64
+        val = self.regs[rd] & MASK8
+        self.memory.write_u8(addr, val)
+
+    def _op_storer2(self, rd, rs, imm):
+        """STORER2"""
+        addr = self.regs[rs] & MASK64
+        val = self.regs[rd] & MASK16
+        self.memory.write_u16(addr, val)
+
+    def _op_storer4(self, rd, rs, imm):
+        """STORER4"""
+        addr = self.regs[rs] & MASK64
+        val = self.regs[rd] & MASK32
+        self.memory.write_u32(addr, val)
+
+    def _op_storer8(self, rd, rs, imm):
+        """STORER8"""
+        addr = self.regs[rs] & MASK64
+        val = self.regs[rd] & MASK64
+        self.memory.write_u64(addr, val)
+
+    # -------- FPU Instructions --------
+    _op_fadd4, _op_fsub4 = _fpu_binop('add', 4), _fpu_binop('sub', 4)
+    _op_fmul4, _op_fdiv4 = _fpu_binop('mul', 4), _fpu_binop('div', 4)
+    _op_fadd8, _op_fsub8 = _fpu_binop('add', 8), _fpu_binop('sub', 8)
+    _op_fmul8, _op_fdiv8 = _fpu_binop('mul', 8), _fpu_binop('div', 8)
+    _op_fsqrt4, _op_fsqrt8 = _fpu_unop('sqrt', 4), _fpu_unop('sqrt', 8)
+    _op_fsin4, _op_fcos4 = _fpu_unop('sin', 4), _fpu_unop('cos', 4)
+    _op_fsin8, _op_fcos8 = _fpu_unop('sin', 8), _fpu_unop('cos', 8)
+
+    # -------- Conversiones FPU --------
+    def _op_cvtf2i8(self, rd, rs, imm):
+        """CVTF2I8 (float64 -> int64)"""
+        float_bits = self.regs[rs] & MASK64
+        float_val = f64_from_bits(float_bits)
+        int_val = int(float_val)  # Truncar a entero
+        # Ajustar para complemento a 2 si es necesario
+        if int_val < 0:
+            int_val = (1 << 64) + int_val
+        self.regs[rd] = int_val & MASK64
+
+    def _op_cvti2f8(self, rd, rs, imm):
+        """CVTI2F8 (int64 -> float64)"""
+        int_bits = self.regs[rs] & MASK64
+        # Convertir de complemento a 2 si es negativo
+        if int_bits & (1 << 63):
+            int_val = int_bits - (1 << 64)
+        else:
+            int_val = int_bits
+        float_val = float(int_val)
+        float_bits = f64_to_bits(float_val)
+        self.regs[rd] = float_bits & MASK64
+
+    def _op_cvtf2i4(self, rd, rs, imm):
+        """CVTF2I4 (float32 -> int32)"""
+        float_bits = self.regs[rs] & MASK32
+        float_val = f32_from_bits(float_bits)
+        int_val = int(float_val)
+        if int_val < 0:
+            int_val = (1 << 32) + int_val
+        self.regs[rd] = int_val & MASK32
+
+    def _op_cvti2f4(self, rd, rs, imm):
+        """CVTI2F4 (int32 -> float32)"""
+        int_bits = self.regs[rs] & MASK32
+        if int_bits & (1 << 31):
+            int_val = int_bits - (1 << 32)
+        else:
+            int_val = int_bits
+        float_val = float(int_val)
+        float_bits = f32_to_bits(float_val)
+        self.regs[rd] = float_bits & MASK32
+
+    # -------- Stack Instructions --------
+    def _op_call(self, rd, rs, imm):
+        """CALL (call subroutine)"""
+        # Push return address to stack (8 bytes)
+        if self.regs[15] + 8 > len(self.memory):
+            raise IndexError("Stack overflow: cannot push return address")
+        self.memory.write_u64(self.regs[15], self.pc)
+        self.regs[15] += 8
+        self.pc = imm & MASK64
+
+    def _op_ret(self, rd, rs, imm):
+        """RET (return from subroutine)"""
+        # Pop return address from stack (8 bytes)
+        if self.regs[15] < 8:
+            raise IndexError("Stack underflow: cannot pop return address")
+        return_addr = self.memory.read_u64(self.regs[15] - 8)
+        self.regs[15] -= 8
+        self.pc = return_addr & MASK64
+
+    def _op_pop1(self, rd, rs, imm):
+        """POP1"""
+        if self.regs[15] < 1:
+            raise IndexError("Stack underflow: cannot pop 1 byte")
+        value = self.memory.read_u8(self.regs[15] - 1)
+        self.regs[15] -= 1
+        self.regs[rd] = value & MASK8
+        self.update_ZN(value)
+
+    def _op_pop2(self, rd, rs, imm):
+        """POP2"""
+        if self.regs[15] < 2:
+            raise IndexError("Stack underflow: cannot pop 2 bytes")
+        value = self.memory.read_u16(self.regs[15] - 2)
+        self.regs[15] -= 2
+        self.regs[rd] = value & MASK16
+        self.update_ZN(value)
+
+    def _op_pop4(self, rd, rs, imm):
+        """POP4"""
+        if self.regs[15] < 4:
+            raise IndexError("Stack underflow: cannot pop 4 bytes")
+        value = self.memory.read_u32(self.regs[15] - 4)
+        self.regs[15] -= 4
+        self.regs[rd] = value & MASK32
+        self.update_ZN(value)
+
+    def _op_pop8(self, rd, rs, imm):
+        """POP8"""
+        if self.regs[15] < 8:
+            raise IndexError("Stack underflow: cannot pop 8 bytes")
+        value = self.memory.read_u64(self.regs[15] - 8)
+        self.regs[15] -= 8
+        self.regs[rd] = value & MASK64
+        self.update_ZN(value)
+
+    def _op_push1(self, rd, rs, imm):
+        """PUSH1"""
+        value = self.regs[rd] & MASK8
+        if self.regs[15] + 1 > len(self.memory):
+            raise IndexError("Stack overflow: cannot push 1 byte")
+        self.memory.write_u8(self.regs[15], value)
+        self.regs[15] += 1
+
+    def _op_push2(self, rd, rs, imm):
+        """PUSH2"""
+        value = self.regs[rd] & MASK16
+        if self.regs[15] + 2 > len(self.memory):
+            raise IndexError("Stack overflow: cannot push 2 bytes")
+        self.memory.write_u16(self.regs[15], value)
+        self.regs[15] += 2
+
+    def _op_push4(self, rd, rs, imm):
+        """PUSH4"""
+        value = self.regs[rd] & MASK32
+        if self.regs[15] + 4 > len(self.memory):
+            raise IndexError("Stack overflow: cannot push 4 bytes")
+        self.memory.write_u32(self.regs[15], value)
+        self.regs[15] += 4
+
+    def _op_push8(self, rd, rs, imm):
+        """PUSH8"""
+        value = self.regs[rd] & MASK64
+        if self.regs[15] + 8 > len(self.memory):
+            raise IndexError("Stack overflow: cannot push 8 bytes")
+        self.memory.write_u64(self.regs[15], value)
+        self.regs[15] += 8
+
+    # -------- Interrupciones --------
+    def _op_ei(self, rd, rs, imm):
+        """EI"""
+        self.interrupts_enabled = True
+
+    def _op_di(self, rd, rs, imm):
+        """DI"""
+        self.interrupts_enabled = False
+
+    def _op_rti(self, rd, rs, imm):
+        """RTI (return from interrupt): desapila banderas y pc y rehabilita interrupciones"""
+        if self.regs[15] < 16:
+            raise IndexError("Stack underflow: cannot pop interrupt frame")
+        packed = self.memory.read_u64(self.regs[15] - 8)
+        return_addr = self.memory.read_u64(self.regs[15] - 16)
+        self.regs[15] -= 16
+        self.flags = {"Z": packed & 1, "N": (packed >> 1) & 1, "C": (packed >> 2) & 1, "V": (packed >> 3) & 1}
+        self.pc = return_addr & MASK64
+        self.interrupts_enabled = True
+
+    def _op_wait(self, rd, rs, imm):
+        """WAIT: sin controlador de interrupciones es un NOP"""
+        if getattr(self.io, 'irq', None) is not None:
+            # run() ve running a 0, espera en el controlador y continúa
+            self.waiting = True
+            self.running = 0
+
+    def _op_setiv(self, rd, rs, imm):
+        """SETIV (vector de la línea Rd = imm)"""
+        irq = getattr(self.io, 'irq', None)
+        if irq is None:
+            raise RuntimeError("SETIV sin controlador de interrupciones")
+        irq.vectors[self.regs[rd] % irq.LINES] = imm & MASK64
+
+    def _deliver_interrupt(self, irq):
+        """Entra en el manejador de la línea pendiente de menor número, si procede."""
+        if not self.interrupts_enabled or not irq.pending & irq.mask:
+            return
+        line = irq.take()
+        if line is None:
+            return
+        vector = irq.vectors[line]
+        if vector is None:
+            logger.warning("Interrupción %d sin vector (SETIV); se descarta", line)
+            return
+        sp = self.regs[15]
+        if sp + 16 > len(self.memory):
+            raise IndexError("Stack overflow: cannot push interrupt frame")
+        f = self.flags
+        self.memory.write_u64(sp, self.pc)
+        self.memory.write_u64(sp + 8, f["Z"] | f["N"] << 1 | f["C"] << 2 | f["V"] << 3)
+        self.regs[15] = sp + 16
+        self.interrupts_enabled = False
+        self.pc = vector
+
+    # ---------------- Caché de instrucciones ----------------
+    def predecode(self, pc: int) -> tuple:
+        """Decodifica la instrucción en pc y la guarda en la caché.
+        Propaga los mismos errores que fetch()/decode()."""
+        self.pc = pc
+        self.fetch()
+        ins = self.decode()
+        next_pc = self.pc
+        handler = self._handlers.get(ins.opcode, self._op_nop)
+        entry = (handler, ins.rd, ins.rs, ins.imm, next_pc)
 
-        # -------- Size-suffixed Arithmetic Instructions (4 bytes) --------
-        if op == 0x0300:  # ADD4
-            a, b = self.registers[ins.rd].read(4), self.registers[ins.rs].read(4)
-            r = self.alu.add(a, b, 4, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 4)
-            return
-        if op == 0x0301:  # SUB4
-            a, b = self.registers[ins.rd].read(4), self.registers[ins.rs].read(4)
-            r = self.alu.sub(a, b, 4, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 4)
-            return
-        if op == 0x0302:  # MUL4
-            a, b = self.registers[ins.rd].read(4), self.registers[ins.rs].read(4)
-            r = self.alu.mul(a, b, 4, signed=False)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 4)
-            return
-        if op == 0x0303:  # MULS4
-            a, b = self.registers[ins.rd].read(4), self.registers[ins.rs].read(4)
-            r = self.alu.mul(a, b, 4, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 4)
-            return
-        if op == 0x0304:  # DIV4
-            a, b = self.registers[ins.rd].read(4), self.registers[ins.rs].read(4)
-            try:
-                r = self.alu.div(a, b, 4, signed=True)
-                self.sync_flags_from_alu()
-                self.registers[ins.rd].write(r, 4)
-            except ZeroDivisionError:
-                self.flags["V"] = 1
-                self.registers[ins.rd].write(0, 4)
-            return
-        if op == 0x0305:  # MOD4
-            a, b = self.registers[ins.rd].read(4), self.registers[ins.rs].read(4)
-            try:
-                r = self.alu.mod(a, b, 4, signed=True)
-                self.sync_flags_from_alu()
-                self.registers[ins.rd].write(r, 4)
-            except ZeroDivisionError:
-                self.flags["V"] = 1
-                self.registers[ins.rd].write(0, 4)
-            return
-        if op == 0x0310:  # ADDV4
-            a, b = self.registers[ins.rd].read(4), ins.imm & 0xFFFFFFFF
-            r = self.alu.add(a, b, 4, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 4)
-            return
-        if op == 0x0311:  # SUBV4
-            a, b = self.registers[ins.rd].read(4), ins.imm & 0xFFFFFFFF
-            r = self.alu.sub(a, b, 4, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 4)
-            return
+        self._icache[pc] = entry
+        for page in range(pc >> PAGE_SHIFT, ((next_pc - 1) >> PAGE_SHIFT) + 1):
+            self._icache_pages.setdefault(page, []).append(pc)
+        if hasattr(self.memory, 'watch_code'):
+            self.memory.watch_code(pc, next_pc - pc)
 
+        self.pc = pc
+        return entry
+
+    def set_store_tracer(self, tracer):
+        """Conecta (o con None desconecta) un StoreTracer. Los STORE pasan a
+        handlers que anotan cada escritura; el traductor deja de generar código
+        para ellos mientras la traza está activa."""
+        self.store_tracer = tracer
+        for op, handler in self._store_handlers.items():
+            self._handlers[op] = handler if tracer is None else self._traced_store(op, handler, tracer)
+        self._icache.clear()
+        self._icache_pages.clear()
+        self._translator = None
+
+    def _traced_store(self, op, handler, tracer):
+        size, length = STORE_OPS[op]
+        mask = (1 << (8 * size)) - 1
+        regs = self.regs
+        record = tracer.record
+        register_addr = length == 8  # STORERn: la dirección está en rs
+
+        def traced(rd, rs, imm):
+            addr = regs[rs] & MASK64 if register_addr else imm
+            val = regs[rd] & mask
+            handler(rd, rs, imm)
+            record(self.pc - length, addr, size, val, regs[14])
+        return traced
+
+    def invalidate_code(self, addr: int, nbytes: int):
+        """Descarta las instrucciones cacheadas en las páginas que toca [addr, addr+nbytes)."""
+        if nbytes >= len(self.memory):
+            self._icache.clear()
+            self._icache_pages.clear()
+            return
+        icache = self._icache
+        for page in range(addr >> PAGE_SHIFT, ((addr + nbytes - 1) >> PAGE_SHIFT) + 1):
+            for pc in self._icache_pages.pop(page, ()):
+                icache.pop(pc, None)
 
-        # -------- Size-suffixed Arithmetic Instructions (8 bytes) --------
-        if op == 0x0312:  # ADD8
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = self.alu.add(a, b, 8, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 8)
-            return
-        if op == 0x0313:  # SUB8
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = self.alu.sub(a, b, 8, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 8)
-            return
-        if op == 0x0314:  # MUL8
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = self.alu.mul(a, b, 8, signed=False)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 8)
-            return
-        if op == 0x0315:  # MULS8
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = self.alu.mul(a, b, 8, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 8)
-            return
-        if op == 0x0316:  # DIV8
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            try:
-                r = self.alu.div(a, b, 8, signed=True)
-                self.sync_flags_from_alu()
-                self.registers[ins.rd].write(r, 8)
-            except ZeroDivisionError:
-                self.flags["V"] = 1
-                self.registers[ins.rd].write(0, 8)
-            return
-        if op == 0x0319:  # MOD8
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            try:
-                r = self.alu.mod(a, b, 8, signed=True)
-                self.sync_flags_from_alu()
-                self.registers[ins.rd].write(r, 8)
-            except ZeroDivisionError:
-                self.flags["V"] = 1
-                self.registers[ins.rd].write(0, 8)
-            return
-        if op == 0x0317:  # ADDV8
-            a, b = self.registers[ins.rd].read(8), ins.imm & 0xFFFFFFFF
-            r = self.alu.add(a, b, 4, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 8)
-            return
-        if op == 0x0318:  # SUBV8
-            a, b = self.registers[ins.rd].read(8), ins.imm & 0xFFFFFFFF
-            r = self.alu.sub(a, b, 8, signed=True)
-            self.sync_flags_from_alu()
-            self.registers[ins.rd].write(r, 8)
-            return
+    def tick(self):
+        """ Emulates excecution of one instrucction
 
-        # -------- MOV Instructions --------
-        if op == 0x0400:  # MOV1
-            self.registers[ins.rd].write(self.registers[ins.rs].read(1), 1)
-            return
-        if op == 0x0401:  # MOV2
-            self.registers[ins.rd].write(self.registers[ins.rs].read(2), 2)
-            return
-        if op == 0x0402:  # MOV4
-            self.registers[ins.rd].write(self.registers[ins.rs].read(4), 4)
-            return
-        if op == 0x0403:  # MOV8
-            self.registers[ins.rd].write(self.registers[ins.rs].read(8), 8)
-            return
-        if op == 0x0410:  # MOVV1
-            self.registers[ins.rd].write(ins.imm & 0xFF, 1)
-            return
-        if op == 0x0411:  # MOVV2
-            self.registers[ins.rd].write(ins.imm & 0xFFFF, 2)
-            return
-        if op == 0x0412:  # MOVV4
-            self.registers[ins.rd].write(ins.imm & 0xFFFFFFFF, 4)
-            return
-        if op == 0x0413:  # MOVV8
-            self.registers[ins.rd].write(ins.imm, 8)
-            return
+        Usa la caché de instrucciones predecodificadas; a diferencia de
+        fetch()/decode()/execute() (usados por la GUI paso a paso), no
+        actualiza self.ir.
+        """
+        pc = self.pc
+        entry = self._icache.get(pc)
+        if entry is None:
+            entry = self.predecode(pc)
+        if self.profiler is not None:
+            return self._tick_profiled(pc, entry)
+        handler, rd, rs, imm, self.pc = entry
+        try:
+            handler(rd, rs, imm)
+        except MemoryFault as e:
+            if e.pc is None:
+                e.pc = pc
+            raise
 
-        # -------- LOAD Instructions --------
-        if op == 0x0500:  # LOAD1
-            self.registers[ins.rd].write(self.memory.read(ins.imm, 1), 1)
-            return
-        if op == 0x0501:  # LOAD2
-            self.registers[ins.rd].write(self.memory.read(ins.imm, 2), 2)
-            return
-        if op == 0x0502:  # LOAD4
-            self.registers[ins.rd].write(self.memory.read(ins.imm, 4), 4)
-            return
-        if op == 0x0503:  # LOAD8
-            self.registers[ins.rd].write(self.memory.read(ins.imm, 8), 8)
-            return
-        if op == 0x0510:  # LOADR1
-            addr = self.registers[ins.rs].read(8) & MASK64
-            self.registers[ins.rd].write(self.memory.read(addr, 1), 1)
-            return
-        if op == 0x0511:  # LOADR2
-            addr = self.registers[ins.rs].read(8) & MASK64
-            self.registers[ins.rd].write(self.memory.read(addr, 2), 2)
-            return
-        if op == 0x0512:  # LOADR4
-            addr = self.registers[ins.rs].read(8) & MASK64
-            self.registers[ins.rd].write(self.memory.read(addr, 4), 4)
-            return
-        if op == 0x0513:  # LOADR8
-            addr = self.registers[ins.rs].read(8) & MASK64
-            value = self.memory.read(addr, 8)
-            self.registers[ins.rd].write(value, 8)
-            return
+    def _tick_profiled(self, pc, entry):
+        opcode = self.memory.read_u64(pc) >> 48
+        handler, rd, rs, imm, self.pc = entry
+        handler(rd, rs, imm)
+        self.profiler.opcode_of[pc] = opcode
+        self.profiler.start(pc)
+        self.profiler.record(pc, opcode, self.pc)
 
-        # -------- STORE Instructions --------
-        if op == 0x0600:  # STORE1
-            val = self.registers[ins.rd].read(1)
-            self.memory.write(ins.imm, val, 1)
-            self._log_store(ins.imm, 1, val)
-            return
-        if op == 0x0601:  # STORE2
-            val = self.registers[ins.rd].read(2)
-            self.memory.write(ins.imm, val, 2)
-            self._log_store(ins.imm, 2, val)
-            return
-        if op == 0x0602:  # STORE4
-            val = self.registers[ins.rd].read(4)
-            self.memory.write(ins.imm, val, 4)
-            self._log_store(ins.imm, 4, val)
-            return
-        if op == 0x0603:  # STORE8
-            val = self.registers[ins.rd].read(8)
-            self.memory.write(ins.imm, val, 8)
-            self._log_store(ins.imm, 8, val)
-            return
-        if op == 0x0610:  # STORER1
-            addr = self.registers[ins.rs].read(8) & MASK64
-            val = self.registers[ins.rd].read(1)
-            self.memory.write(addr, val, 1)
-            self._log_store(addr, 1, val)
-            return
-        if op == 0x0611:  # STORER2
-            addr = self.registers[ins.rs].read(8) & MASK64
-            val = self.registers[ins.rd].read(2)
-            self.memory.write(addr, val, 2)
-            self._log_store(addr, 2, val)
-            return
-        if op == 0x0612:  # STORER4
-            addr = self.registers[ins.rs].read(8) & MASK64
-            val = self.registers[ins.rd].read(4)
-            self.memory.write(addr, val, 4)
-            self._log_store(addr, 4, val)
-            return
-        if op == 0x0613:  # STORER8
-            addr = self.registers[ins.rs].read(8) & MASK64
-            val = self.registers[ins.rd].read(8)
-            self.memory.write(addr, val, 8)
-            self._log_store(addr, 8, val)
-            return
 
-        # -------- FPU Instructions --------
-        if op == 0x0700:  # FADD4
-            a, b = self.registers[ins.rd].read(4), self.registers[ins.rs].read(4)
-            r = self.fpu.add(a, b, 4)
-            self.sync_flags_from_fpu()
-            self.registers[ins.rd].write(r, 4)
-            return
-        if op == 0x0701:  # FSUB4
-            a, b = self.registers[ins.rd].read(4), self.registers[ins.rs].read(4)
-            r = self.fpu.sub(a, b, 4)
-            self.sync_flags_from_fpu()
-            self.registers[ins.rd].write(r, 4)
-            return
-        if op == 0x0702:  # FMUL4
-            a, b = self.registers[ins.rd].read(4), self.registers[ins.rs].read(4)
-            r = self.fpu.mul(a, b, 4)
-            self.sync_flags_from_fpu()
-            self.registers[ins.rd].write(r, 4)
-            return
-        if op == 0x0703:  # FDIV4
-            a, b = self.registers[ins.rd].read(4), self.registers[ins.rs].read(4)
-            r = self.fpu.div(a, b, 4)
-            self.sync_flags_from_fpu()
-            self.registers[ins.rd].write(r, 4)
-            return
-        if op == 0x0710:  # FADD8
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = self.fpu.add(a, b, 8)
-            self.sync_flags_from_fpu()
-            self.registers[ins.rd].write(r, 8)
-            return
-        if op == 0x0711:  # FSUB8
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = self.fpu.sub(a, b, 8)
-            self.sync_flags_from_fpu()
-            self.registers[ins.rd].write(r, 8)
-            return
-        if op == 0x0712:  # FMUL8
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = self.fpu.mul(a, b, 8)
-            self.sync_flags_from_fpu()
-            self.registers[ins.rd].write(r, 8)
-            return
-        if op == 0x0713:  # FDIV8
-            a, b = self.registers[ins.rd].read(8), self.registers[ins.rs].read(8)
-            r = self.fpu.div(a, b, 8)
-            self.sync_flags_from_fpu()
-            self.registers[ins.rd].write(r, 8)
-            return
-        if op == 0x0720:  # FSQRT4
-            a = self.registers[ins.rd].read(4)
-            r = self.fpu.sqrt(a, 4)
-            self.sync_flags_from_fpu()
-            self.registers[ins.rd].write(r, 4)
-            return
-        if op == 0x0721:  # FSQRT8
-            a = self.registers[ins.rd].read(8)
-            r = self.fpu.sqrt(a, 8)
-            self.sync_flags_from_fpu()
-            self.registers[ins.rd].write(r, 8)
-            return
-        if op == 0x0722:  # FSIN4
-            a = self.registers[ins.rd].read(4)
-            r = self.fpu.sin(a, 4)
-            self.sync_flags_from_fpu()
-            self.registers[ins.rd].write(r, 4)
-            return
-        if op == 0x0723:  # FCOS4
-            a = self.registers[ins.rd].read(4)
-            r = self.fpu.cos(a, 4)
-            self.sync_flags_from_fpu()
-            self.registers[ins.rd].write(r, 4)
-            return
-        if op == 0x0724:  # FSIN8
-            a = self.registers[ins.rd].read(8)
-            r = self.fpu.sin(a, 8)
-            self.sync_flags_from_fpu()
-            self.registers[ins.rd].write(r, 8)
-            return
-        if op == 0x0725:  # FCOS8
-            a = self.registers[ins.rd].read(8)
-            r = self.fpu.cos(a, 8)
-            self.sync_flags_from_fpu()
-            self.registers[ins.rd].write(r, 8)
-            return
-        
-        # -------- Conversiones FPU --------
-        if op == 0x0730:  # CVTF2I8 (float64 -> int64)
-            float_bits = self.registers[ins.rs].read(8)
-            float_val = self.fpu._bits_to_float(float_bits, 8)
-            int_val = int(float_val)  # Truncar a entero
-            # Ajustar para complemento a 2 si es necesario
-            if int_val < 0:
-                int_val = (1 << 64) + int_val
-            self.registers[ins.rd].write(int_val, 8)
-            return
-        
-        if op == 0x0731:  # CVTI2F8 (int64 -> float64)
-            int_bits = self.registers[ins.rs].read(8)
-            # Convertir de complemento a 2 si es negativo
-            if int_bits & (1 << 63):
-                int_val = int_bits - (1 << 64)
-            else:
-                int_val = int_bits
-            float_val = float(int_val)
-            float_bits = self.fpu._float_to_bits(float_val, 8)
-            self.registers[ins.rd].write(float_bits, 8)
-            return
-        
-        if op == 0x0732:  # CVTF2I4 (float32 -> int32)
-            float_bits = self.registers[ins.rs].read(4)
-            float_val = self.fpu._bits_to_float(float_bits, 4)
-            int_val = int(float_val)
-            if int_val < 0:
-                int_val = (1 << 32) + int_val
-            self.registers[ins.rd].write(int_val, 4)
-            return
-        
-        if op == 0x0733:  # CVTI2F4 (int32 -> float32)
-            int_bits = self.registers[ins.rs].read(4)
-            if int_bits & (1 << 31):
-                int_val = int_bits - (1 << 32)
+    # ---------------- Main Loop ----------------
+    ENGINES = ("interp", "block", "trace")
+
+    def run(self, max_cycles=10_000_000_000, engine="interp", profiler=None):
+        """Ejecuta hasta PARAR o hasta max_cycles instrucciones.
+
+        engine="interp" interpreta instrucción a instrucción desde la caché;
+        engine="block" ejecuta bloques básicos traducidos a funciones Python
+        (ver Translator.py) y deja al intérprete lo que no sabe traducir.
+        engine="trace" además compila los bucles calientes en trazas con guardas.
+        Con un profiler (argumento o self.profiler, ver Profiler.py) se usa
+        siempre el intérprete y se anota cada instrucción.
+        Devuelve el número de instrucciones ejecutadas.
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine: {engine!r}")
+        self.running = 1
+        if profiler is None:
+            profiler = self.profiler
+        if profiler is not None:
+            run_chunk = lambda n: self._run_profiled(n, profiler)
+        elif engine == "block":
+            run_chunk = self._run_blocks
+        elif engine == "trace":
+            run_chunk = self._run_traces
+        else:
+            run_chunk = self._run_interp
+        irq = getattr(self.io, 'irq', None)
+        try:
+            if irq is None:
+                cycles = run_chunk(max_cycles)
             else:
-                int_val = int_bits
-            float_val = float(int_val)
-            float_bits = self.fpu._float_to_bits(float_val, 4)
-            self.registers[ins.rd].write(float_bits, 4)
-            return
-
-
-        # -------- Stack Instructions --------
-        if op == 0x0099:  # CALL (call subroutine)
-            # Push return address to stack (8 bytes)
-            if self.sp.value + 8 > len(self.memory):
-                raise IndexError("Stack overflow: cannot push return address")
-            self.memory.write(self.sp.value, self.pc, 8)
-            self.sp.value += 8
-            self.pc = ins.imm & MASK64
-            return
-
-        if op == 0x0800:  # RET (return from subroutine)
-            # Pop return address from stack (8 bytes)
-            if self.sp.value < 8:
-                raise IndexError("Stack underflow: cannot pop return address")
-            return_addr = self.memory.read(self.sp.value - 8, 8)
-            self.sp.value -= 8
-            self.pc = return_addr & MASK64
-            return
-
-        if op == 0x0810:  # POP1
-            if self.sp.value < 1:
-                raise IndexError("Stack underflow: cannot pop 1 byte")
-            value = self.memory.read(self.sp.value - 1, 1)
-            self.sp.value -= 1
-            self.registers[ins.rd].write(value, 1)
-            self.update_ZN(value)
-            return
-
-        if op == 0x0811:  # POP2
-            if self.sp.value < 2:
-                raise IndexError("Stack underflow: cannot pop 2 bytes")
-            value = self.memory.read(self.sp.value - 2, 2)
-            self.sp.value -= 2
-            self.registers[ins.rd].write(value, 2)
-            self.update_ZN(value)
-            return
-
-        if op == 0x0812:  # POP4
-            if self.sp.value < 4:
-                raise IndexError("Stack underflow: cannot pop 4 bytes")
-            value = self.memory.read(self.sp.value - 4, 4)
-            self.sp.value -= 4
-            self.registers[ins.rd].write(value, 4)
-            self.update_ZN(value)
-            return
-
-        if op == 0x0813:  # POP8
-            if self.sp.value < 8:
-                raise IndexError("Stack underflow: cannot pop 8 bytes")
-            value = self.memory.read(self.sp.value - 8, 8)
-            self.sp.value -= 8
-            self.registers[ins.rd].write(value, 8)
-            self.update_ZN(value)
-            return
-
-        if op == 0x0820:  # PUSH1
-            value = self.registers[ins.rd].read(1)
-            if self.sp.value + 1 > len(self.memory):
-                raise IndexError("Stack overflow: cannot push 1 byte")
-            self.memory.write(self.sp.value, value, 1)
-            self.sp.value += 1
-            return
-
-        if op == 0x0821:  # PUSH2
-            value = self.registers[ins.rd].read(2)
-            if self.sp.value + 2 > len(self.memory):
-                raise IndexError("Stack overflow: cannot push 2 bytes")
-            self.memory.write(self.sp.value, value, 2)
-            self.sp.value += 2
-            return
-
-        if op == 0x0822:  # PUSH4
-            value = self.registers[ins.rd].read(4)
-            if self.sp.value + 4 > len(self.memory):
-                raise IndexError("Stack overflow: cannot push 4 bytes")
-            self.memory.write(self.sp.value, value, 4)
-            self.sp.value += 4
-            return
+                cycles = self._run_with_interrupts(run_chunk, max_cycles, irq)
+        except MemoryFault as e:
+            if e.pc is None:
+                e.pc = self._faulting_pc(self.pc)
+            raise
+        if cycles >= max_cycles:
+            raise RuntimeError("Max cycles reached")
+        return cycles
 
-        if op == 0x0823:  # PUSH8
-            value = self.registers[ins.rd].read(8)
-            if self.sp.value + 8 > len(self.memory):
-                raise IndexError("Stack overflow: cannot push 8 bytes")
-            self.memory.write(self.sp.value, value, 8)
-            self.sp.value += 8
-            return
+    def _run_with_interrupts(self, run_chunk, max_cycles, irq):
+        """Ejecuta por tramos de como mucho IRQ_CHECK_CYCLES ciclos (o hasta el
+        siguiente vencimiento de un temporizador); entre tramos avanza el reloj
+        del controlador, atiende WAIT y entrega la interrupción pendiente. Los
+        motores no cambian: la comprobación no cuesta nada por instrucción."""
+        cycles = 0
+        self._deliver_interrupt(irq)
+        while self.running and cycles < max_cycles:
+            limit = min(max_cycles, cycles + IRQ_CHECK_CYCLES)
+            deadline = irq.next_deadline()
+            if deadline is not None:
+                limit = min(limit, cycles + max(deadline - irq.now, 1))
+            n = run_chunk(limit - cycles)
+            cycles += n
+            irq.advance(n)
+            if self.waiting:
+                # Los ciclos dormidos cuentan: los temporizadores miden ciclos
+                self.waiting = False
+                self.running = 1
+                cycles += irq.wait(max_cycles - cycles)
+            if self.running:
+                self._deliver_interrupt(irq)
+        return cycles
+
+    def _faulting_pc(self, next_pc):
+        """PC de la instrucción que provocó un MemoryFault. Los motores ya
+        avanzaron cpu.pc a la instrucción siguiente, así que se busca entre las
+        instrucciones decodificadas (icache y bloques traducidos) la que termina en next_pc."""
+        starts = [pc for pc, entry in self._icache.items() if entry[4] == next_pc]
+        if self._translator is not None:
+            starts += [ins[0] for instrs in self._translator._instrs.values()
+                       for ins in instrs if ins[5] == next_pc]
+        return max(starts) if starts else None
+
+    def _run_interp(self, max_cycles):
+        cycles = 0
+        icache = self._icache
+        predecode = self.predecode
 
-    def tick(self):
-        """ Emulates excecution of one instrucction
-        """
-        self.fetch()
-        ins = self.decode()
-        self.execute(ins)
+        # Igual que tick(), pero sin la llamada extra por instrucción
+        while self.running and cycles < max_cycles:
+            entry = icache.get(self.pc)
+            if entry is None:
+                entry = predecode(self.pc)
+            handler, rd, rs, imm, self.pc = entry
+            handler(rd, rs, imm)
+            cycles += 1
+        return cycles
 
+    def _run_profiled(self, max_cycles, profiler):
+        cycles = 0
+        icache = self._icache
+        predecode = self.predecode
+        opcode_of = profiler.opcode_of
+        record = profiler.record
+        profiler.start(self.pc)
+        while self.running and cycles < max_cycles:
+            pc = self.pc
+            entry = icache.get(pc)
+            if entry is None:
+                entry = predecode(pc)
+                opcode_of[pc] = self.memory.read_u64(pc) >> 48
+            elif pc not in opcode_of:
+                opcode_of[pc] = self.memory.read_u64(pc) >> 48
+            handler, rd, rs, imm, self.pc = entry
+            handler(rd, rs, imm)
+            cycles += 1
+            record(pc, opcode_of[pc], self.pc)
+        return cycles
+
+    def _run_blocks(self, max_cycles):
+        if self._translator is None:
+            self._translator = BlockTranslator(self)
+        translator = self._translator
+        blocks = translator.blocks
+        icache = self._icache
+        predecode = self.predecode
+        cycles = 0
 
-    # ---------------- Main Loop ----------------
-    def run(self, max_cycles=10_000_000_000):
-        self.running = 1
+        while self.running and cycles < max_cycles:
+            block, n = blocks.get(self.pc) or translator.translate(self.pc)
+            if block is not None and cycles + n <= max_cycles:
+                try:
+                    self.pc = block()
+                    cycles += n
+                except BlockExit as e:
+                    # el bloque escribió sobre su propio código; pc ya apunta
+                    # a la siguiente instrucción
+                    cycles += e.args[0]
+                continue
+            # Instrucción no traducible (o no caben más ciclos): una del intérprete
+            entry = icache.get(self.pc)
+            if entry is None:
+                entry = predecode(self.pc)
+            handler, rd, rs, imm, self.pc = entry
+            handler(rd, rs, imm)
+            cycles += 1
+        return cycles
+
+    def _run_traces(self, max_cycles):
+        if self._translator is None:
+            self._translator = BlockTranslator(self)
+        translator = self._translator
+        blocks = translator.blocks
+        traces = translator.traces
+        no_trace = translator.no_trace
+        icache = self._icache
+        predecode = self.predecode
+        hot = translator.hot
+        recording = None    # cabeza del bucle que se está grabando
+        path: list = []
         cycles = 0
-      
+
         while self.running and cycles < max_cycles:
-            self.tick()
+            pc = self.pc
+            trace = traces.get(pc)
+            if trace is not None and recording is None:
+                try:
+                    self.pc, n = trace(max_cycles - cycles)
+                except BlockExit as e:
+                    cycles += e.args[0]
+                    continue
+                if n:
+                    cycles += n
+                    continue
+                # no cabe una vuelta entera: se sigue bloque a bloque
+
+            block, n = blocks.get(pc) or translator.translate(pc)
+            if block is not None and cycles + n <= max_cycles:
+                try:
+                    self.pc = next_pc = block()
+                    cycles += n
+                except BlockExit as e:
+                    cycles += e.args[0]
+                    if recording is not None:
+                        no_trace.add(recording)
+                        recording = None
+                    continue
+                if recording is not None:
+                    path.append((pc, next_pc))
+                    if next_pc == recording:
+                        if translator.translate_trace(recording, path) is None:
+                            no_trace.add(recording)
+                        recording = None
+                    elif len(path) >= MAX_TRACE_BLOCKS:
+                        no_trace.add(recording)
+                        recording = None
+                elif next_pc <= pc and next_pc not in traces and next_pc not in no_trace:
+                    # salto hacia atrás: posible cabeza de bucle
+                    count = hot.get(next_pc, 0) + 1
+                    hot[next_pc] = count
+                    if count >= HOT_LOOP_THRESHOLD:
+                        hot[next_pc] = 0
+                        recording = next_pc
+                        path = []
+                continue
+
+            # Instrucción no traducible: el camino no se puede grabar
+            if recording is not None:
+                no_trace.add(recording)
+                recording = None
+            entry = icache.get(self.pc)
+            if entry is None:
+                entry = predecode(self.pc)
+            handler, rd, rs, imm, self.pc = entry
+            handler(rd, rs, imm)
             cycles += 1
-        if cycles >= max_cycles:
-            raise RuntimeError("Max cycles reached")
-        
+        return cycles
+
+    # ---------------- Snapshot / restore ----------------
+    def snapshot(self) -> MachineSnapshot:
+        """Captura la máquina (p.ej. con el programa ya cargado) para volver a
+        ella con restore() tantas veces como haga falta, sin pasar por el Loader."""
+        return MachineSnapshot(
+            tuple(self.regs), dict(self.flags), self.pc, self.ir, self.running,
+            self.memory.snapshot() if hasattr(self.memory, 'snapshot') else None,
+            self.io.snapshot() if hasattr(self.io, 'snapshot') else None,
+            self.interrupts_enabled, self.waiting,
+        )
+
+    def restore(self, snap: MachineSnapshot):
+        """Vuelve al estado de snap. La RAM solo copia las páginas escritas desde
+        entonces; las cachés de instrucciones se invalidan por los avisos de
+        escritura de Memory si alguna de esas páginas tenía código."""
+        self.regs[:] = snap.regs
+        self._pending_flags = None
+        self._flags.update(snap.flags)
+        self.pc = snap.pc
+        self.ir = snap.ir
+        self.running = snap.running
+        self.interrupts_enabled = snap.interrupts_enabled
+        self.waiting = snap.waiting
+        if snap.memory is not None:
+            self.memory.restore(snap.memory)
+        if snap.io is not None:
+            self.io.restore(snap.io)
+
     def set_pc(self,pc):
         self.pc = pc
 
     def set_sp(self, value):
-        self.sp.write(value,8)
+        self.regs[15] = value & MASK64
 
     def dump_state(self):
         print("=== ESTADO DEL CPU ===")
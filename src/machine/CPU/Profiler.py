@@ -0,0 +1,159 @@
+"""
+Perfilador de ejecución: cuenta instrucciones por opcode, por PC y por función.
+
+Las funciones se reconstruyen siguiendo CALL (0x0099) y RET (0x0800) contra las
+etiquetas del programa (CodigoRelo.labels, relativas a la dirección de carga):
+cada CALL abre un marco para la etiqueta destino y cada RET lo cierra.
+
+- exclusivo: instrucciones ejecutadas dentro de la función (el CALL cuenta para
+  quien llama, el RET para la función que retorna).
+- inclusivo: exclusivo más todo lo ejecutado por las funciones que llama. En
+  funciones recursivas solo se suma el marco más externo.
+
+Uso:
+    prof = Profiler(relo.labels, base=start)
+    cpu.run(profiler=prof)
+    print(prof.report())
+    prof.save_json("perfil.json")
+
+El perfilado usa siempre el intérprete; CPU.run sin profiler no cambia.
+"""
+import bisect
+import json
+
+from compiler.instructions import IS_INV
+
+OP_CALL = 0x0099
+OP_RET = 0x0800
+
+ROOT_FUNCTION = "<inicio>"
+
+
+class Profiler:
+    def __init__(self, labels: dict | None = None, base: int = 0):
+        # dirección absoluta -> etiqueta (si varias comparten dirección, gana la primera)
+        self.labels = {}
+        for name, addr in (labels or {}).items():
+            self.labels.setdefault(addr + base, name)
+        self._label_addrs = sorted(self.labels)
+        self.reset()
+
+    def reset(self):
+        self.cycles = 0
+        self.pc_hits = {}
+        self.opcode_of = {}     # pc -> opcode decodificado en ese pc
+        self.calls = {}
+        self.exclusive = {}
+        self.inclusive = {}
+        # marcos abiertos: [función, ciclo de entrada]
+        self._stack = []
+        self._active = {}       # función -> marcos abiertos (recursión)
+
+    # ---------------- Registro ----------------
+    def start(self, pc: int):
+        """Abre el marco raíz en el PC de inicio si no hay ninguno abierto."""
+        if not self._stack:
+            self._enter(self.function_name(pc))
+
+    def record(self, pc: int, opcode: int, next_pc: int):
+        """Anota una instrucción ya ejecutada (pc -> next_pc)."""
+        self.cycles += 1
+        hits = self.pc_hits
+        hits[pc] = hits.get(pc, 0) + 1
+        top = self._stack[-1][0]
+        self.exclusive[top] = self.exclusive.get(top, 0) + 1
+        if opcode == OP_CALL:
+            self._enter(self.function_name(next_pc))
+        elif opcode == OP_RET and len(self._stack) > 1:
+            self._leave()
+
+    def _enter(self, name):
+        self._stack.append([name, self.cycles])
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self._active[name] = self._active.get(name, 0) + 1
+
+    def _leave(self):
+        name, entered = self._stack.pop()
+        self._active[name] -= 1
+        if not self._active[name]:
+            self.inclusive[name] = self.inclusive.get(name, 0) + self.cycles - entered
+
+    def inclusive_counts(self) -> dict:
+        """Ciclos inclusivos contando también los marcos aún abiertos (PARAR dentro
+        de una función, max_cycles, ejecución paso a paso)."""
+        counts = dict(self.inclusive)
+        seen = set()
+        for name, entered in self._stack:
+            if name not in seen:
+                seen.add(name)
+                counts[name] = counts.get(name, 0) + self.cycles - entered
+        return counts
+
+    # ---------------- Consultas ----------------
+    def function_name(self, addr: int) -> str:
+        name = self.labels.get(addr)
+        if name is not None:
+            return name
+        return ROOT_FUNCTION if not self._stack else f"0x{addr:X}"
+
+    def location(self, pc: int) -> str:
+        """Etiqueta más cercana por debajo de pc, p.ej. 'BUCLE+0x10'."""
+        i = bisect.bisect_right(self._label_addrs, pc) - 1
+        if i < 0:
+            return ""
+        addr = self._label_addrs[i]
+        name = self.labels[addr]
+        return name if addr == pc else f"{name}+0x{pc - addr:X}"
+
+    def opcode_counts(self) -> dict:
+        counts = {}
+        for pc, hits in self.pc_hits.items():
+            op = self.opcode_of.get(pc)
+            counts[op] = counts.get(op, 0) + hits
+        return counts
+
+    def to_dict(self) -> dict:
+        def mnemonic(op):
+            return IS_INV.get(op, {}).get('mnemonic', f"0x{op:04X}" if op is not None else "?")
+
+        opcodes = sorted(self.opcode_counts().items(), key=lambda kv: -kv[1])
+        pcs = sorted(self.pc_hits.items(), key=lambda kv: (-kv[1], kv[0]))
+        inclusive = self.inclusive_counts()
+        functions = sorted(self.calls, key=lambda f: (-inclusive.get(f, 0), f))
+        return {
+            "cycles": self.cycles,
+            "opcodes": [{"opcode": op, "mnemonic": mnemonic(op), "count": n} for op, n in opcodes],
+            "pcs": [{"pc": pc, "location": self.location(pc), "mnemonic": mnemonic(self.opcode_of.get(pc)),
+                     "count": n} for pc, n in pcs],
+            "functions": [{"name": f, "calls": self.calls[f], "inclusive": inclusive.get(f, 0),
+                           "exclusive": self.exclusive.get(f, 0)} for f in functions],
+        }
+
+    # ---------------- Informes ----------------
+    def report(self, top: int = 20) -> str:
+        """Informe de texto ordenado de mayor a menor."""
+        data = self.to_dict()
+        total = data["cycles"] or 1
+        lines = [f"Instrucciones ejecutadas: {data['cycles']}", ""]
+
+        lines.append(f"{'Función':<24} {'Llamadas':>9} {'Inclusivo':>12} {'%':>6} {'Exclusivo':>12} {'%':>6}")
+        for f in data["functions"][:top]:
+            lines.append(f"{f['name']:<24} {f['calls']:>9} {f['inclusive']:>12} {100 * f['inclusive'] / total:>6.1f}"
+                         f" {f['exclusive']:>12} {100 * f['exclusive'] / total:>6.1f}")
+        lines.append("")
+
+        lines.append(f"{'Opcode':<8} {'Mnemónico':<12} {'Veces':>12} {'%':>6}")
+        for o in data["opcodes"][:top]:
+            op = f"{o['opcode']:04X}" if o["opcode"] is not None else "?"
+            lines.append(f"{op:<8} {o['mnemonic']:<12} {o['count']:>12} {100 * o['count'] / total:>6.1f}")
+        lines.append("")
+
+        lines.append(f"{'PC':<10} {'Ubicación':<24} {'Mnemónico':<12} {'Veces':>12} {'%':>6}")
+        for p in data["pcs"][:top]:
+            lines.append(f"{p['pc']:08X}   {p['location']:<24} {p['mnemonic']:<12} {p['count']:>12}"
+                         f" {100 * p['count'] / total:>6.1f}")
+        return "\n".join(lines)
+
+    def save_json(self, filename: str):
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
@@ -3,6 +3,9 @@ MASK32 = (1 << 32) - 1
 MASK16 = (1 << 16) - 1
 MASK8  = (1 << 8) - 1
 
+# Máscara por tamaño en bytes (precalculadas para el banco de registros)
+SIZE_MASKS = {1: MASK8, 2: MASK16, 4: MASK32, 8: MASK64}
+
 class Register:
     def __init__(self, name) -> None:
         self.name = name
@@ -23,6 +26,60 @@ class Register:
         binary_representation = "{0:0{1}b}".format(self.value,8)
         print(binary_representation)
 
+
+class RegisterView(Register):
+    """Vista de un registro del RegisterFile con la interfaz de Register
+    (.value, read, write) para la GUI, los tests y el código que aún la usa."""
+
+    def __init__(self, values, index, name) -> None:
+        self.name = name
+        self._values = values
+        self._index = index
+
+    @property
+    def value(self):
+        return self._values[self._index]
+
+    @value.setter
+    def value(self, value):
+        self._values[self._index] = value
+
+    def __repr__(self):
+        return f"<{self.name}={self._values[self._index]:#x}>"
+
+
+class RegisterFile:
+    """Banco de registros plano: los valores son enteros en una lista.
+
+    El CPU trabaja directamente sobre `values` (regs[i] & SIZE_MASKS[n]);
+    registers[i] devuelve una RegisterView compatible con Register.
+    Se usa una lista y no array('Q') porque .value, como en Register, admite
+    cualquier entero sin validar y una lista evita además reempaquetar cada lectura.
+    """
+
+    def __init__(self, count=16, prefix="R") -> None:
+        self.values = [0] * count
+        self._views = [RegisterView(self.values, i, f"{prefix}{i}") for i in range(count)]
+
+    def __getitem__(self, index):
+        return self._views[index]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self._views)
+
+    def read(self, index, size=8):
+        return self.values[index] & SIZE_MASKS[size]
+
+    def write(self, index, value, size=8):
+        mask = SIZE_MASKS.get(size)
+        if mask is None:
+            raise ValueError(f"Cannot write {size} bytes on register {self._views[index].name}\nSizes supported: [1,2,4,8]")
+        self.values[index] = value & mask
+
+
 if __name__ == "__main__":
     r = Register("R")
     r.write(-1,1)
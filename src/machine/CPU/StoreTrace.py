@@ -0,0 +1,116 @@
+"""
+Traza de escrituras a memoria (STORE, STORER, STOREV).
+
+Mientras no haya un StoreTracer conectado (CPU.set_store_tracer) los handlers
+de STORE no hacen nada extra. Conectado, cada escritura se guarda como un
+registro binario de tamaño fijo en un buffer circular; el formateo y la
+resolución de símbolos (Memory.find_symbol_at) se hacen solo al volcar la
+traza con flush()/lines(), no en cada STORE.
+
+Formato de archivo (save/load):
+    b"ATST" | versión (u16) | tamaño de registro (u16) | nº de registros (u64)
+    seguido de los registros, del más antiguo al más reciente.
+"""
+import logging
+import struct
+
+logger = logging.getLogger("machine.cpu")
+
+# pc de la instrucción, dirección, valor, BP (R14) en el momento del STORE, tamaño
+RECORD = struct.Struct("<QQQQB")
+HEADER = struct.Struct("<4sHHQ")
+MAGIC = b"ATST"
+VERSION = 1
+
+_FLOAT = {4: struct.Struct("<f"), 8: struct.Struct("<d")}
+
+
+class StoreTracer:
+    def __init__(self, capacity: int = 1 << 16):
+        self.capacity = capacity
+        self.buffer = bytearray(capacity * RECORD.size)
+        self.count = 0          # registros escritos desde el último clear()
+        self._flushed = 0
+        self._header_printed = False
+
+    def record(self, pc: int, addr: int, size: int, val: int, bp: int):
+        RECORD.pack_into(self.buffer, (self.count % self.capacity) * RECORD.size, pc, addr, val, bp, size)
+        self.count += 1
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    @property
+    def dropped(self) -> int:
+        """Registros sobrescritos por el buffer circular."""
+        return max(0, self.count - self.capacity)
+
+    def clear(self):
+        self.count = 0
+        self._flushed = 0
+
+    def records(self, start: int = 0):
+        """Tuplas (pc, addr, size, val, bp) desde el registro nº start que siga en el buffer."""
+        for i in range(max(start, self.dropped), self.count):
+            pc, addr, val, bp, size = RECORD.unpack_from(self.buffer, (i % self.capacity) * RECORD.size)
+            yield pc, addr, size, val, bp
+
+    # ---------------- Volcado legible ----------------
+    def lines(self, memory, start: int = 0):
+        """Filas de la tabla STORE para las escrituras a símbolos registrados o a la pila."""
+        find_symbol_at = getattr(memory, 'find_symbol_at', None)
+        stack_base = getattr(memory, 'stack_base', None)
+        stack_end = getattr(memory, 'stack_end', None)
+        for pc, addr, size, val, bp in self.records(start):
+            sym = find_symbol_at(addr, bp=bp) if find_symbol_at else None
+            if sym:
+                name = sym.get('name')[:12]
+                rel = addr - sym.get('addr')
+                offset = f"+{rel} (0x{rel:X})" if rel != 0 else "+0"
+            elif stack_base is not None and stack_end is not None and stack_base <= addr < stack_end:
+                name = 'stack'
+                offset = "+0"
+            else:
+                continue
+            if size in _FLOAT:
+                value = f"float={_FLOAT[size].unpack(val.to_bytes(size, 'little'))[0]:.6f}"
+            else:
+                value = f"value={val}"
+            yield (f"STORE  {name:<12} {addr:#010x}   {size:<6d} {offset:<16} {value:<20} "
+                   f"{'raw=0x' + format(val, f'0{size * 2}X'):<24} pc={pc:#010x}")
+
+    def flush(self, memory, log: logging.Logger = logger):
+        """Envía al logger (INFO) las escrituras registradas desde el último flush."""
+        if not log.isEnabledFor(logging.INFO):
+            self._flushed = self.count
+            return
+        start = self._flushed
+        self._flushed = self.count
+        if start < self.dropped:
+            log.info("STORE  ... %d escrituras descartadas (buffer de %d)", self.dropped - start, self.capacity)
+        for line in self.lines(memory, start):
+            if not self._header_printed:
+                log.info("STORE  %-12s %-12s %-6s %-16s %-20s %-24s %s",
+                         'Name', 'Addr', 'Size', 'Offset', 'Value/Float', 'Raw', 'PC')
+                self._header_printed = True
+            log.info("%s", line)
+
+    # ---------------- Archivo binario ----------------
+    def save(self, filename: str):
+        with open(filename, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, len(self)))
+            first = self.dropped % self.capacity if self.dropped else 0
+            end = len(self) * RECORD.size
+            f.write(self.buffer[first * RECORD.size:end])
+            f.write(self.buffer[:first * RECORD.size])
+
+    @classmethod
+    def load(cls, filename: str) -> "StoreTracer":
+        with open(filename, "rb") as f:
+            magic, version, rec_size, n = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION or rec_size != RECORD.size:
+                raise ValueError(f"{filename}: no es una traza de STORE v{VERSION}")
+            tracer = cls(max(n, 1))
+            f.readinto(memoryview(tracer.buffer)[:n * RECORD.size])
+        tracer.count = n
+        return tracer
@@ -0,0 +1,755 @@
+"""
+Traductor de bloques básicos a funciones Python.
+
+Un bloque básico empieza en un PC y termina en el primer salto (0x0090–0x0098),
+CALL (0x0099) o RET (0x0800), o justo antes de una instrucción que el traductor
+no soporta (PARAR, FPU, conversiones, ...), que se deja al intérprete.
+Cada bloque se genera como código fuente, se compila con compile()/exec y se
+guarda por PC. El código generado lee y escribe los registros, los flags y la
+memoria directamente, con la misma semántica que los handlers de CPU.
+
+Las banderas se calculan solo cuando alguien puede observarlas: si una
+instrucción posterior del mismo bloque las sobrescribe antes de un salto o de
+un acceso a memoria/IO, la escritura intermedia se omite.
+
+Sobre los bloques, el modo de trazas (engine="trace") cuenta los destinos de
+saltos hacia atrás; cuando la cabeza de un bucle se calienta, graba el camino
+de bloques ejecutado hasta volver a ella y lo compila en una sola función que
+itera el bucle completo. Cada salto condicional (y cada RET) del camino lleva
+una guarda que devuelve el control al ejecutor si se toma la otra rama.
+"""
+import re
+
+from machine.Memory.Memory import PAGE_SHIFT
+
+MASK64 = (1 << 64) - 1
+SIGN64 = 1 << 63
+ALL_FLAGS = frozenset("ZNCV")
+
+# Longitud máxima de un bloque (en instrucciones)
+MAX_BLOCK_LEN = 64
+
+# Veces que se debe saltar hacia atrás a un pc antes de grabar su traza
+HOT_LOOP_THRESHOLD = 50
+# Longitud máxima de una traza (en bloques)
+MAX_TRACE_BLOCKS = 32
+
+BRANCHES = range(0x0090, 0x0099)
+CALL = 0x0099
+RET = 0x0800
+
+# Condición de cada salto condicional, sobre el dict de flags F
+BRANCH_CONDITIONS = {
+    0x0091: 'F["Z"] == 1',
+    0x0092: 'F["Z"] == 0',
+    0x0093: 'F["N"] == 1',
+    0x0094: 'F["N"] == 0',
+    0x0095: 'F["C"] == 1',
+    0x0096: 'F["C"] == 0',
+    0x0097: '(F["V"] ^ F["N"]) == 1',
+    0x0098: '(F["V"] ^ F["N"]) == 0',
+}
+BRANCH_READS = {
+    0x0091: "Z", 0x0092: "Z", 0x0093: "N", 0x0094: "N",
+    0x0095: "C", 0x0096: "C", 0x0097: "VN", 0x0098: "VN",
+}
+
+# Aritmética con la ALU: opcode -> (operación, signed, tamaño de lectura,
+# máscara del inmediato (None = registro rs, 0 = inmediato sin máscara),
+# tamaño en la ALU, tamaño de escritura). Refleja exactamente los handlers
+# de CPU, incluidas sus rarezas (ADDV8 opera en 4 bytes).
+ALU_OPS = {
+    0x0010: ('add', True, 8, None, 8, 8), 0x0011: ('sub', True, 8, None, 8, 8),
+    0x0012: ('mul', True, 8, None, 8, 8), 0x0013: ('mul', False, 8, None, 8, 8),
+    0x0014: ('div', True, 8, None, 8, 8),
+    0x0020: ('add', True, 8, 0, 8, 8), 0x0021: ('sub', True, 8, 0, 8, 8),
+}
+for _base, _size in ((0x0100, 1), (0x0200, 2), (0x0300, 4)):
+    _m = (1 << (8 * _size)) - 1
+    ALU_OPS.update({
+        _base + 0x00: ('add', True, _size, None, _size, _size),
+        _base + 0x01: ('sub', True, _size, None, _size, _size),
+        _base + 0x02: ('mul', False, _size, None, _size, _size),
+        _base + 0x03: ('mul', True, _size, None, _size, _size),
+        _base + 0x04: ('div', True, _size, None, _size, _size),
+        _base + 0x05: ('mod', True, _size, None, _size, _size),
+        _base + 0x10: ('add', True, _size, _m, _size, _size),
+        _base + 0x11: ('sub', True, _size, _m, _size, _size),
+    })
+ALU_OPS.update({
+    0x0312: ('add', True, 8, None, 8, 8), 0x0313: ('sub', True, 8, None, 8, 8),
+    0x0314: ('mul', False, 8, None, 8, 8), 0x0315: ('mul', True, 8, None, 8, 8),
+    0x0316: ('div', True, 8, None, 8, 8), 0x0319: ('mod', True, 8, None, 8, 8),
+    0x0317: ('add', True, 8, 0xFFFFFFFF, 4, 8),
+    0x0318: ('sub', True, 8, 0xFFFFFFFF, 8, 8),
+})
+
+# Comparaciones: opcode -> (tamaño de lectura, máscara del inmediato o None)
+CMP_OPS = {
+    0x0070: (8, None), 0x0071: (8, 0),
+    0x0830: (1, None), 0x0831: (2, None), 0x0832: (4, None), 0x0833: (8, None),
+    0x0840: (1, 0xFF), 0x0841: (2, 0xFFFF), 0x0842: (4, 0xFFFFFFFF), 0x0843: (8, 0),
+}
+
+# Manipulación directa de flags: opcode -> (flag, valor)
+FLAG_OPS = {
+    0x0080: ("Z", 0), 0x0081: ("Z", 1), 0x0082: ("N", 0), 0x0083: ("N", 1),
+    0x0084: ("C", 0), 0x0085: ("C", 1), 0x0086: ("V", 0), 0x0087: ("V", 1),
+}
+
+# Opcodes con formato pero sin handler: el intérprete los trata como NOP
+NOP_OPS = {0x0001, 0x00A3, 0x00A4, 0x0726, 0x0727}
+
+# Generar y compilar el código es lo más caro de traducir. El código objeto no
+# depende del CPU (registros, memoria, etc. llegan por el namespace), así que se
+# reutiliza entre máquinas que ejecutan el mismo programa (GUI, benchmarks,
+# tests), indexado por las instrucciones decodificadas del bloque.
+_CODE_CACHE: dict = {}
+_CODE_CACHE_MAX = 4096
+
+
+def _mask(size):
+    return (1 << (8 * size)) - 1
+
+
+class BlockExit(Exception):
+    """Salida anticipada de un bloque cuya memoria de código se acaba de
+    sobrescribir; args[0] es el número de instrucciones ya ejecutadas."""
+
+
+class Emitted:
+    """Código de una instrucción: líneas (flag, indent, texto), donde flag es
+    None para efectos siempre necesarios o la bandera que la línea escribe."""
+    __slots__ = ("lines", "kills", "reads", "barrier", "writes_mem", "exit")
+
+    def __init__(self):
+        self.lines = []
+        self.kills = set()
+        self.reads = set()
+        # barrier: la instrucción puede lanzar o llamar fuera (memoria, IO);
+        # antes de ella todas las banderas deben estar materializadas.
+        self.barrier = False
+        self.writes_mem = False
+        # exit: expresión del siguiente PC si la instrucción termina el bloque
+        self.exit = None
+
+    def add(self, text, flag=None, indent=0):
+        self.lines.append((flag, indent, text))
+
+
+def _emit_zn(e, value, indent=0):
+    e.add(f'F["Z"] = 1 if ({value}) & {MASK64} == 0 else 0', "Z", indent)
+    e.add(f'F["N"] = ({value}) >> 63 & 1', "N", indent)
+    e.kills |= {"Z", "N"}
+
+
+def _emit_alu(e, i, spec, rd, rs, imm):
+    kind, signed, rsize, imm_mask, asize, wsize = spec
+    rmask = _mask(rsize)
+    amask = _mask(asize)
+    sign = 1 << (8 * asize - 1)
+    wmask = _mask(wsize)
+    a, b, r = f"a{i}", f"b{i}", f"r{i}"
+
+    e.add(f"{a} = regs[{rd}] & {rmask}")
+    if imm_mask is None:
+        e.add(f"{b} = regs[{rs}] & {rmask}")
+    elif imm_mask == 0:
+        e.add(f"{b} = {imm}")
+    else:
+        e.add(f"{b} = {imm & imm_mask}")
+
+    indent = 0
+    if kind in ('div', 'mod'):
+        # ZeroDivisionError en la ALU: el handler solo activa V y pone el registro a 0
+        e.add(f"if {b} == 0:")
+        e.add('F["V"] = 1', "V", 1)
+        e.add(f"regs[{rd}] = 0", None, 1)
+        e.add("else:")
+        indent = 1
+        e.kills |= {"V"}
+    else:
+        e.kills |= ALL_FLAGS
+
+    if signed:
+        e.add(f"if {a} & {sign}: {a} -= {amask + 1}", None, indent)
+        e.add(f"if {b} & {sign}: {b} -= {amask + 1}", None, indent)
+
+    if kind == 'add':
+        e.add(f"{r} = {a} + {b}", None, indent)
+        carry = f"{r} > {amask} or {r} < 0"
+        overflow = f"({a} ^ {r}) & ({b} ^ {r}) & {sign}"
+    elif kind == 'sub':
+        e.add(f"{r} = {a} - {b}", None, indent)
+        carry = f"{a} < {b}"
+        overflow = f"({a} ^ {b}) & ({a} ^ {r}) & {sign}"
+    elif kind == 'mul':
+        e.add(f"{r} = {a} * {b}", None, indent)
+        if signed:
+            carry = overflow = f"not ({-sign} <= {r} < {sign})"
+        else:
+            carry = overflow = f"{r} > {amask}"
+    elif kind == 'div':
+        e.add(f"{r} = int({a} / {b})" if signed else f"{r} = {a} // {b}", None, indent)
+        carry = None
+        overflow = f"not ({-sign} <= {r} < {sign})" if signed else f"{r} > {amask}"
+    else:  # mod
+        e.add(f"{r} = {a} % {b}", None, indent)
+        carry = None
+        overflow = f"not ({-sign} <= {r} < {sign})" if signed else f"{r} > {amask}"
+
+    e.add(f'F["C"] = 1 if {carry} else 0' if carry else 'F["C"] = 0', "C", indent)
+    e.add(f'F["V"] = 1 if {overflow} else 0', "V", indent)
+    e.add(f'F["Z"] = 1 if {r} & {amask} == 0 else 0', "Z", indent)
+    e.add(f'F["N"] = 1 if {r} & {sign} else 0', "N", indent)
+    e.add(f"regs[{rd}] = {r} & {amask & wmask}", None, indent)
+
+
+def emit_instruction(i, op, rd, rs, imm, next_pc):
+    """Genera el código de una instrucción. Devuelve None si no está soportada
+    (el bloque termina antes y la ejecuta el intérprete)."""
+    e = Emitted()
+
+    if op in NOP_OPS:
+        return e
+
+    if op in ALU_OPS:
+        _emit_alu(e, i, ALU_OPS[op], rd, rs, imm)
+        return e
+
+    if op == 0x0015:  # MOD (8 bytes, sin flags; b == 0 lanza ZeroDivisionError)
+        e.barrier = True
+        e.add(f"cpu.pc = {next_pc}")
+        e.add(f"regs[{rd}] = ((regs[{rd}] & {MASK64}) % (regs[{rs}] & {MASK64})) & {MASK64}")
+        return e
+
+    if op in (0x0030, 0x0031):  # INC / DEC
+        a = f"a{i}"
+        e.add(f"{a} = regs[{rd}] & {MASK64}")
+        if op == 0x0030:
+            e.add(f"regs[{rd}] = ({a} + 1) & {MASK64}")
+            e.add(f'F["C"] = 1 if {a} == {MASK64} else 0', "C")
+            e.add(f'F["V"] = 1 if {a} == {SIGN64 - 1} else 0', "V")
+        else:
+            e.add(f"regs[{rd}] = ({a} - 1) & {MASK64}")
+            e.add(f'F["C"] = 1 if {a} == 0 else 0', "C")
+            e.add(f'F["V"] = 1 if {a} == {SIGN64} else 0', "V")
+        e.kills |= {"C", "V"}
+        _emit_zn(e, f"regs[{rd}]")
+        return e
+
+    if op == 0x0064:  # CLR
+        e.add(f"regs[{rd}] = 0")
+        for f in "ZNCV":
+            e.add(f'F["{f}"] = {1 if f == "Z" else 0}', f)
+        e.kills |= ALL_FLAGS
+        return e
+
+    if 0x0040 <= op <= 0x0046:  # Lógicas
+        src = {
+            0x0040: f"~regs[{rd}]",
+            0x0041: f"regs[{rd}] & regs[{rs}]",
+            0x0042: f"regs[{rd}] & {imm}",
+            0x0043: f"regs[{rd}] | regs[{rs}]",
+            0x0044: f"regs[{rd}] | {imm}",
+            0x0045: f"regs[{rd}] ^ regs[{rs}]",
+            0x0046: f"regs[{rd}] ^ {imm}",
+        }[op]
+        e.add(f"regs[{rd}] = ({src}) & {MASK64}")
+        _emit_zn(e, f"regs[{rd}]")
+        return e
+
+    if 0x0050 <= op <= 0x0053:  # Shifts (la cantidad sale del propio registro)
+        a = f"a{i}"
+        e.add(f"{a} = regs[{rd}] & {MASK64}")
+        if op in (0x0050, 0x0052):
+            e.add(f"regs[{rd}] = ({a} << ({a} & 0x3F)) & {MASK64}")
+        elif op == 0x0051:
+            e.add(f"regs[{rd}] = (({a} - {1 << 64} if {a} >> 63 else {a}) >> ({a} & 0x3F)) & {MASK64}")
+        else:
+            e.add(f"regs[{rd}] = {a} >> ({a} & 0x3F)")
+        _emit_zn(e, f"regs[{rd}]")
+        return e
+
+    if op in (0x0060, 0x0061, 0x0062):  # LOAD / LOADV / LOADR
+        if op == 0x0061:
+            e.add(f"regs[{rd}] = {imm & MASK64}")
+        else:
+            e.barrier = True
+            e.add(f"cpu.pc = {next_pc}")
+            if op == 0x0060:
+                e.add(f"regs[{rd}] = read_u64({imm})")
+            else:
+                e.add(f"regs[{rd}] = read_u8(regs[{rs}] & {MASK64})")
+        _emit_zn(e, f"regs[{rd}]")
+        return e
+
+    if op in CMP_OPS:
+        size, imm_mask = CMP_OPS[op]
+        m = _mask(size)
+        a, b, r = f"a{i}", f"b{i}", f"r{i}"
+        e.add(f"{a} = regs[{rd}] & {m}")
+        if imm_mask is None:
+            e.add(f"{b} = regs[{rs}] & {m}")
+        elif imm_mask == 0:
+            e.add(f"{b} = {imm}")
+        else:
+            e.add(f"{b} = {imm & imm_mask}")
+        e.add(f"{r} = ({a} - {b}) & {MASK64}")
+        e.add(f'F["Z"] = 1 if {r} == 0 else 0', "Z")
+        e.add(f'F["N"] = {r} >> 63', "N")
+        e.add(f'F["C"] = 1 if {a} >= {b} else 0', "C")
+        e.add(f'F["V"] = (({a} ^ {b}) & ({a} ^ {r})) >> 63 & 1', "V")
+        e.kills |= ALL_FLAGS
+        return e
+
+    if op in FLAG_OPS:
+        flag, value = FLAG_OPS[op]
+        e.add(f'F["{flag}"] = {value}', flag)
+        e.kills.add(flag)
+        return e
+
+    if op == 0x0090:  # JMP
+        e.exit = f"{imm}"
+        return e
+
+    if op in BRANCH_CONDITIONS:
+        e.reads |= set(BRANCH_READS[op])
+        e.exit = f"{imm} if {BRANCH_CONDITIONS[op]} else {next_pc}"
+        return e
+
+    if op in (0x00A0, 0x00A1, 0x00A2):  # SVIO / LOADIO / SHOWIO
+        e.barrier = True
+        e.add(f"cpu.pc = {next_pc}")
+        if op == 0x00A0:
+            e.add(f"io.write({imm}, regs[{rd}] & {MASK64})")
+        elif op == 0x00A1:
+            e.add(f"regs[{rd}] = io.read({imm}) & {MASK64}")
+            _emit_zn(e, f"regs[{rd}]")
+        else:
+            e.add(f"io.show({imm})")
+        return e
+
+    if 0x0400 <= op <= 0x0403:  # MOV1/2/4/8
+        m = _mask((1, 2, 4, 8)[op - 0x0400])
+        e.add(f"regs[{rd}] = regs[{rs}] & {m}")
+        return e
+
+    if 0x0410 <= op <= 0x0413:  # MOVV1/2/4/8
+        m = _mask((1, 2, 4, 8)[op - 0x0410])
+        e.add(f"regs[{rd}] = {imm & m}")
+        return e
+
+    if 0x0500 <= op <= 0x0503 or 0x0510 <= op <= 0x0513:  # LOADn / LOADRn
+        size = (1, 2, 4, 8)[op & 0xF]
+        addr = f"{imm}" if op < 0x0510 else f"regs[{rs}] & {MASK64}"
+        e.barrier = True
+        e.add(f"cpu.pc = {next_pc}")
+        e.add(f"regs[{rd}] = read_u{8 * size}({addr})")
+        return e
+
+    if op == 0x0063 or 0x0600 <= op <= 0x0603 or 0x0610 <= op <= 0x0613:  # STORE
+        size = 8 if op == 0x0063 else (1, 2, 4, 8)[op & 0xF]
+        a, v = f"a{i}", f"v{i}"
+        e.barrier = True
+        e.writes_mem = True
+        e.add(f"cpu.pc = {next_pc}")
+        if 0x0610 <= op <= 0x0613:
+            e.add(f"{a} = regs[{rs}] & {MASK64}")
+        else:
+            e.add(f"{a} = {imm}")
+        e.add(f"{v} = regs[{rd}] & {_mask(size)}")
+        e.add(f"write_u{8 * size}({a}, {v})")
+        return e
+
+    if op == CALL:
+        e.barrier = True
+        e.writes_mem = True
+        e.add(f"cpu.pc = {next_pc}")
+        e.add(f"if regs[15] + 8 > MEMLEN: raise IndexError('Stack overflow: cannot push return address')")
+        e.add(f"write_u64(regs[15], {next_pc})")
+        e.add("regs[15] += 8")
+        e.exit = f"{imm & MASK64}"
+        return e
+
+    if op == RET:
+        a = f"a{i}"
+        e.barrier = True
+        e.add(f"cpu.pc = {next_pc}")
+        e.add("if regs[15] < 8: raise IndexError('Stack underflow: cannot pop return address')")
+        e.add(f"{a} = read_u64(regs[15] - 8)")
+        e.add("regs[15] -= 8")
+        e.exit = f"{a} & {MASK64}"
+        return e
+
+    if 0x0810 <= op <= 0x0813:  # POPn
+        size = (1, 2, 4, 8)[op - 0x0810]
+        unit = "byte" if size == 1 else "bytes"
+        v = f"v{i}"
+        e.barrier = True
+        e.add(f"cpu.pc = {next_pc}")
+        e.add(f"if regs[15] < {size}: raise IndexError('Stack underflow: cannot pop {size} {unit}')")
+        e.add(f"{v} = read_u{8 * size}(regs[15] - {size})")
+        e.add(f"regs[15] -= {size}")
+        e.add(f"regs[{rd}] = {v} & {_mask(size)}")
+        _emit_zn(e, v)
+        return e
+
+    if 0x0820 <= op <= 0x0823:  # PUSHn
+        size = (1, 2, 4, 8)[op - 0x0820]
+        unit = "byte" if size == 1 else "bytes"
+        v = f"v{i}"
+        e.barrier = True
+        e.writes_mem = True
+        e.add(f"cpu.pc = {next_pc}")
+        e.add(f"{v} = regs[{rd}] & {_mask(size)}")
+        e.add(f"if regs[15] + {size} > MEMLEN: raise IndexError('Stack overflow: cannot push {size} {unit}')")
+        e.add(f"write_u{8 * size}(regs[15], {v})")
+        e.add(f"regs[15] += {size}")
+        return e
+
+    return None
+
+
+def schedule_flags(emitted, live_out=ALL_FLAGS):
+    """Análisis de vida de banderas hacia atrás: devuelve, por instrucción, el
+    conjunto de banderas que sigue vivo tras ella (las que hay que escribir)."""
+    live = set(live_out)
+    result = [None] * len(emitted)
+    for k in range(len(emitted) - 1, -1, -1):
+        e = emitted[k]
+        result[k] = frozenset(live)
+        live = (live - e.kills) | e.reads
+        if e.barrier:
+            live = set(ALL_FLAGS)
+    return result
+
+
+def render(emitted, live_after, base_indent=1):
+    """Convierte las instrucciones emitidas en líneas de código Python."""
+    out = []
+    for e, live in zip(emitted, live_after):
+        for flag, indent, text in e.lines:
+            if flag is not None and flag not in live:
+                continue
+            out.append("    " * (base_indent + indent) + text)
+    return out
+
+
+_REG_REF = re.compile(r"\bregs\[(\d+)\]")
+_FLAG_REF = re.compile(r'F\["([ZNCV])"\]')
+_REG_ASSIGN = re.compile(r"^\s*g(\d+) [-+]?=", re.M)
+
+
+def _localize(line, flags=True):
+    """Cambia los accesos a registros (y a banderas si flags) por variables locales."""
+    line = _REG_REF.sub(r"g\1", line)
+    return _FLAG_REF.sub(lambda m: f"f{m.group(1)}", line) if flags else line
+
+
+def _render_local(emitted, live_after, indent, exits, flags):
+    """Renderiza las instrucciones con los registros (y las banderas si flags)
+    en variables locales.
+
+    exits(k, e) devuelve las líneas extra tras la instrucción k (1-based):
+    comprobación de código sobrescrito, guardas, etc.
+    """
+    pad = "    " * indent
+    body = []
+    for k, (e, live) in enumerate(zip(emitted, live_after), 1):
+        for line in render([e], [live], base_indent=indent):
+            body.append(_localize(line, flags))
+        body.extend(pad + line for line in exits(k, e))
+    return body
+
+
+def _frame(body):
+    """Líneas de carga y de volcado de los registros/banderas locales de body.
+
+    Si el código toca las banderas, antes hay que evaluar las que dejó
+    pendientes el intérprete (CPU.materialize_flags)."""
+    text = "\n".join(body)
+    written = sorted({int(r) for r in _REG_ASSIGN.findall(text)})
+    used = sorted({int(r) for r in re.findall(r"\bg(\d+)\b", text)})
+    load = [f"g{r} = regs[{r}]" for r in used]
+    store = [f"regs[{r}] = g{r}" for r in written]
+    if re.search(r'\bf[ZNCV]\b|F\["', text):
+        load.insert(0, "if cpu._pending_flags is not None: cpu.materialize_flags()")
+    if re.search(r"\bf[ZNCV]\b", text):
+        load += [f'f{f} = F["{f}"]' for f in "ZNCV"]
+        store += [f'F["{f}"] = f{f}' for f in "ZNCV" if re.search(rf"^\s*f{f} =", text, re.M)]
+    return load, store
+
+
+def generate_block(instrs):
+    """Código fuente de la función `block()` para las instrucciones dadas;
+    devuelve el pc siguiente.
+
+    Los registros que usa el bloque viven en variables locales y se vuelcan al
+    CPU al salir (también si una instrucción lanza una excepción).
+    """
+    emitted = [emit_instruction(k, op, rd, rs, imm, next_pc)
+               for k, (_, op, rd, rs, imm, next_pc) in enumerate(instrs)]
+    live_after = schedule_flags(emitted)
+
+    def exits(k, e):
+        if e.writes_mem and e.exit is None:
+            # el bloque pudo sobrescribir su propio código
+            return [f"if not alive[0]: raise BlockExit({k})"]
+        return []
+
+    body = _render_local(emitted, live_after, 2, exits, flags=False)
+    last = emitted[-1]
+    body.append("        ex = " + _localize(last.exit if last.exit is not None else str(instrs[-1][5]), False))
+    load, store = _frame(body)
+    if not store:
+        # nada que volcar: sin try
+        return "\n".join(["def block():"] + ["    " + line for line in load] +
+                         [line[4:] for line in body] + ["    return ex"]) + "\n"
+    return "\n".join(
+        ["def block():"] + ["    " + line for line in load] + ["    try:"] + body +
+        ["    except BaseException:"] + ["        " + line for line in store] + ["        raise"] +
+        ["    " + line for line in store] + ["    return ex"]) + "\n"
+
+
+def generate_trace(head, steps):
+    """Código fuente de la función `trace(budget)` para un bucle grabado.
+
+    steps: [(instrucciones del bloque, pc al que salió), ...] desde head hasta
+    volver a head. La función itera mientras quepa una vuelta entera en budget
+    y devuelve (pc siguiente, instrucciones ejecutadas). Como en los bloques,
+    registros y banderas viven en variables locales durante toda la traza.
+    """
+    emitted = []
+    guards = []
+    k = 0
+    for instrs, taken in steps:
+        for j, (_, op, rd, rs, imm, next_pc) in enumerate(instrs):
+            e = emit_instruction(k, op, rd, rs, imm, next_pc)
+            k += 1
+            guard = []
+            if j == len(instrs) - 1 and e.exit is not None:
+                if op in BRANCH_CONDITIONS and imm != next_pc:
+                    cond = _localize(BRANCH_CONDITIONS[op])
+                    if taken == imm:
+                        guard = [f"if not ({cond}):", f"    ex = {next_pc}; n += {k}; break"]
+                    else:
+                        guard = [f"if {cond}:", f"    ex = {imm}; n += {k}; break"]
+                    # al salir por la guarda las banderas deben estar al día
+                    e.barrier = True
+                elif op == RET:
+                    guard = [f"t = {_localize(e.exit)}", f"if t != {taken}:", f"    ex = t; n += {k}; break"]
+            emitted.append(e)
+            guards.append(guard)
+
+    total = k
+    live_after = schedule_flags(emitted)
+
+    def exits(k, e):
+        lines = []
+        if e.writes_mem:
+            lines.append(f"if not alive[0]: raise BlockExit(n + {k})")
+        return lines + guards[k - 1]
+
+    body = _render_local(emitted, live_after, 3, exits, flags=True)
+    load, store = _frame(body)
+    return "\n".join(
+        ["def trace(budget):"] + ["    " + line for line in load] + [
+            "    n = 0",
+            f"    ex = {head}",
+            "    try:",
+            f"        while n + {total} <= budget:",
+        ] + body + [
+            f"            n += {total}",
+            "    except BaseException:",
+        ] + ["        " + line for line in store] + [
+            "        raise",
+        ] + ["    " + line for line in store] + [
+            "    return (ex, n)",
+        ]) + "\n"
+
+
+# Opcodes que el traductor sabe generar y los que cierran un bloque
+SUPPORTED = frozenset(op for op in range(0x0900)
+                      if emit_instruction(0, op, 0, 0, 0, 8) is not None)
+TERMINATORS = frozenset(BRANCHES) | {CALL, RET}
+STORES = frozenset({0x0063, 0x0600, 0x0601, 0x0602, 0x0603, 0x0610, 0x0611, 0x0612, 0x0613})
+
+
+class BlockTranslator:
+    """Traduce y guarda bloques básicos de un CPU.
+
+    blocks: pc -> (función, nº de instrucciones). Una función None indica que
+    la primera instrucción no es traducible y debe ejecutarla el intérprete.
+    traces: pc de cabeza de bucle -> función trace(budget).
+    """
+
+    def __init__(self, cpu):
+        self.cpu = cpu
+        self.memory = cpu.memory
+        self.blocks: dict = {}
+        self.traces: dict = {}
+        # cabezas de bucle cuya grabación falló (camino no traducible o demasiado largo)
+        self.no_trace: set = set()
+        # saltos hacia atrás por cabeza de bucle; persiste entre llamadas a run()
+        self.hot: dict = {}
+        self._instrs: dict = {}
+        self._block_pages: dict = {}
+        self._trace_pages: dict = {}
+        self._alive: dict = {}
+        self._trace_alive: dict = {}
+        # Con la traza de STORE activa, los STORE los ejecuta el intérprete
+        # (handlers con traza) y el código generado no cambia
+        self.supported = SUPPORTED - STORES if cpu.store_tracer is not None else SUPPORTED
+        if hasattr(self.memory, 'add_write_listener'):
+            self.memory.add_write_listener(self.invalidate)
+
+    # ---------------- Decodificación ----------------
+    def _decode(self, pc):
+        """(opcode, rd, rs, imm, next_pc) sin efectos sobre el CPU, o None si pc
+        no contiene una instrucción decodificable."""
+        memory = self.memory
+        if pc < 0 or pc + 8 > len(memory):
+            return None
+        # Sin permiso de ejecución lo ejecuta el intérprete, que lanza MemoryFault
+        if getattr(memory, 'protection', False) and not memory.can_exec(pc):
+            return None
+        word = memory.read_u64(pc)
+        op = (word >> 48) & 0xFFFF
+        fmt = self.cpu.formats.get(op)
+        if fmt is None:
+            return None
+        if fmt == 2:  # RI: el inmediato ocupa la palabra siguiente
+            if pc + 16 > len(memory):
+                return None
+            return op, (word >> 44) & 0xF, None, memory.read_u64(pc + 8), pc + 16
+        if fmt == 1:  # RR
+            return op, (word >> 4) & 0xF, word & 0xF, None, pc + 8
+        if fmt == 3:  # R
+            return op, (word >> 44) & 0xF, None, None, pc + 8
+        return op, None, None, None, pc + 8
+
+    def scan(self, pc):
+        """Devuelve las instrucciones traducibles del bloque que empieza en pc
+        como tuplas (pc, opcode, rd, rs, imm, next_pc)."""
+        instrs = []
+        while len(instrs) < MAX_BLOCK_LEN:
+            dec = self._decode(pc)
+            if dec is None or dec[0] not in self.supported:
+                break
+            instrs.append((pc,) + dec)
+            if dec[0] in TERMINATORS:
+                break
+            pc = dec[4]
+        return instrs
+
+    # ---------------- Traducción ----------------
+    def translate(self, pc):
+        instrs = self.scan(pc)
+        if not instrs:
+            entry = (None, 0)
+            self.blocks[pc] = entry
+            self._watch(self._block_pages, pc, pc, pc + 8)
+            return entry
+
+        key = tuple(instrs)
+        code = _CODE_CACHE.get(key)
+        if code is None:
+            if len(_CODE_CACHE) >= _CODE_CACHE_MAX:
+                _CODE_CACHE.clear()
+            code = _CODE_CACHE[key] = compile(generate_block(instrs), f"<block {pc:#x}>", "exec")
+        alive = [True]
+        namespace = self._namespace(alive)
+        exec(code, namespace)
+
+        entry = (namespace["block"], len(instrs))
+        self.blocks[pc] = entry
+        self._instrs[pc] = instrs
+        self._alive[pc] = alive
+        self._watch(self._block_pages, pc, pc, instrs[-1][5])
+        return entry
+
+    def translate_trace(self, head, path):
+        """Compila el camino grabado [(pc de bloque, pc siguiente), ...] que
+        empieza y termina en head. Devuelve la función o None si algún bloque
+        se invalidó durante la grabación."""
+        steps = []
+        for pc, taken in path:
+            instrs = self._instrs.get(pc)
+            if instrs is None:
+                return None
+            steps.append((tuple(instrs), taken))
+
+        key = (head, tuple(steps))
+        code = _CODE_CACHE.get(key)
+        if code is None:
+            if len(_CODE_CACHE) >= _CODE_CACHE_MAX:
+                _CODE_CACHE.clear()
+            code = _CODE_CACHE[key] = compile(generate_trace(head, steps), f"<trace {head:#x}>", "exec")
+        alive = [True]
+        namespace = self._namespace(alive)
+        exec(code, namespace)
+
+        trace = namespace["trace"]
+        self.traces[head] = trace
+        self._trace_alive[head] = alive
+        for instrs, _ in steps:
+            self._watch(self._trace_pages, head, instrs[0][0], instrs[-1][5])
+        return trace
+
+    def _namespace(self, alive):
+        cpu = self.cpu
+        memory = self.memory
+        ns = {
+            "cpu": cpu,
+            "F": cpu._flags,
+            "regs": cpu.regs,
+            "read_u8": memory.read_u8,
+            "read_u16": memory.read_u16,
+            "read_u32": memory.read_u32,
+            "read_u64": memory.read_u64,
+            "write_u8": memory.write_u8,
+            "write_u16": memory.write_u16,
+            "write_u32": memory.write_u32,
+            "write_u64": memory.write_u64,
+            "io": cpu.io,
+            "MEMLEN": len(memory),
+            "alive": alive,
+            "BlockExit": BlockExit,
+        }
+        return ns
+
+    # ---------------- Invalidación ----------------
+    def _watch(self, pages, key, start, end):
+        for page in range(start >> PAGE_SHIFT, ((end - 1) >> PAGE_SHIFT) + 1):
+            pages.setdefault(page, []).append(key)
+        if hasattr(self.memory, 'watch_code'):
+            self.memory.watch_code(start, end - start)
+
+    def _drop(self, pc):
+        if self.blocks.pop(pc, None) is not None:
+            self._instrs.pop(pc, None)
+            alive = self._alive.pop(pc, None)
+            if alive is not None:
+                alive[0] = False
+
+    def _drop_trace(self, head):
+        if self.traces.pop(head, None) is not None:
+            self._trace_alive.pop(head)[0] = False
+
+    def invalidate(self, addr, nbytes):
+        """Descarta los bloques y trazas de las páginas que toca [addr, addr+nbytes)."""
+        if nbytes >= len(self.memory):
+            for pc in list(self.blocks):
+                self._drop(pc)
+            for head in list(self.traces):
+                self._drop_trace(head)
+            self._block_pages.clear()
+            self._trace_pages.clear()
+            self.no_trace.clear()
+            return
+        for page in range(addr >> PAGE_SHIFT, ((addr + nbytes - 1) >> PAGE_SHIFT) + 1):
+            for pc in self._block_pages.pop(page, ()):
+                self._drop(pc)
+            for head in self._trace_pages.pop(page, ()):
+                self._drop_trace(head)
@@ -2,6 +2,34 @@ import struct
 import math
 import warnings
 
+MASK64 = (1 << 64) - 1
+
+# Reinterpretación de bits IEEE 754 con structs precompilados (sin parsear el formato cada vez)
+_U32, _F32 = struct.Struct('<I'), struct.Struct('<f')
+_U64, _F64 = struct.Struct('<Q'), struct.Struct('<d')
+_u32_pack, _u32_unpack, _f32_pack, _f32_unpack = _U32.pack, _U32.unpack, _F32.pack, _F32.unpack
+_u64_pack, _u64_unpack, _f64_pack, _f64_unpack = _U64.pack, _U64.unpack, _F64.pack, _F64.unpack
+
+
+def f32_from_bits(bits: int) -> float:
+    return _f32_unpack(_u32_pack(bits & 0xFFFFFFFF))[0]
+
+
+def f32_to_bits(value: float) -> int:
+    return _u32_unpack(_f32_pack(value))[0]
+
+
+def f64_from_bits(bits: int) -> float:
+    return _f64_unpack(_u64_pack(bits & MASK64))[0]
+
+
+def f64_to_bits(value: float) -> int:
+    return _u64_unpack(_f64_pack(value))[0]
+
+
+# tamaño en bytes -> (bits -> float, float -> bits)
+FLOAT_CODECS = {4: (f32_from_bits, f32_to_bits), 8: (f64_from_bits, f64_to_bits)}
+
 class Flags:
     """Registra los estados de las banderas: Carry, Overflow, Zero, Negative."""
     def __init__(self):
@@ -17,10 +45,124 @@ class Flags:
         return {'C': self.C, 'V': self.O, 'Z': self.Z, 'N': self.N}
 
 
+# ======================================
+# Cálculo de banderas (evaluación perezosa)
+# ======================================
+# Cada función recibe los operandos tal como los vio la operación (ya con signo
+# si era signed), el resultado sin truncar y el tamaño, y devuelve (Z, N, C, V).
+
+def _zn(res, size):
+    bits = size * 8
+    res &= (1 << bits) - 1
+    return (1 if res == 0 else 0), (1 if res >> (bits - 1) else 0)
+
+
+def flags_add(a, b, res, size):
+    mask = (1 << (size * 8)) - 1
+    z, n = _zn(res, size)
+    overflow = ((a ^ res) & (b ^ res) & (1 << (size * 8 - 1))) != 0
+    return z, n, (1 if res > mask or res < 0 else 0), (1 if overflow else 0)
+
+
+def flags_sub(a, b, res, size):
+    z, n = _zn(res, size)
+    overflow = ((a ^ b) & (a ^ res) & (1 << (size * 8 - 1))) != 0
+    return z, n, (1 if a < b else 0), (1 if overflow else 0)
+
+
+def flags_mul_signed(a, b, res, size):
+    sign_bit = 1 << (size * 8 - 1)
+    z, n = _zn(res, size)
+    overflow = 0 if -sign_bit <= res < sign_bit else 1
+    return z, n, overflow, overflow
+
+
+def flags_mul_unsigned(a, b, res, size):
+    z, n = _zn(res, size)
+    overflow = 1 if res > (1 << (size * 8)) - 1 else 0
+    return z, n, overflow, overflow
+
+
+def flags_div_signed(a, b, res, size):
+    sign_bit = 1 << (size * 8 - 1)
+    z, n = _zn(res, size)
+    return z, n, 0, (0 if -sign_bit <= res < sign_bit else 1)
+
+
+def flags_div_unsigned(a, b, res, size):
+    z, n = _zn(res, size)
+    return z, n, 0, (1 if res > (1 << (size * 8)) - 1 else 0)
+
+
+def flags_cmp(a, b, res, size):
+    """CMP/CMPV del CPU: Z y N sobre la resta en 64 bits, C = a >= b."""
+    res &= MASK64
+    a_s = a - (1 << 64) if a >> 63 else a
+    b_s = b - (1 << 64) if b >> 63 else b
+    r_s = res - (1 << 64) if res >> 63 else res
+    overflow = (a_s >= 0 and b_s < 0 and r_s < 0) or (a_s < 0 and b_s >= 0 and r_s >= 0)
+    return (1 if res == 0 else 0), res >> 63, (1 if a >= b else 0), (1 if overflow else 0)
+
+
+def flags_inc(a, b, res, size):
+    """INC del CPU (64 bits): a es el valor previo y res = (a + 1) & MASK64."""
+    return (1 if res == 0 else 0), res >> 63, (1 if a == MASK64 else 0), (1 if a == MASK64 >> 1 else 0)
+
+
+def flags_dec(a, b, res, size):
+    """DEC del CPU (64 bits): a es el valor previo y res = (a - 1) & MASK64."""
+    return (1 if res == 0 else 0), res >> 63, (1 if a == 0 else 0), (1 if a == 1 << 63 else 0)
+
+
+# (operación, signed) -> función de banderas que usa ALU para ese caso
+ALU_FLAG_FUNCS = {
+    ('add', True): flags_add, ('add', False): flags_add,
+    ('sub', True): flags_sub, ('sub', False): flags_sub,
+    ('mul', True): flags_mul_signed, ('mul', False): flags_mul_unsigned,
+    ('div', True): flags_div_signed, ('div', False): flags_div_unsigned,
+    ('mod', True): flags_div_signed, ('mod', False): flags_div_unsigned,
+}
+
+_ALU_EXPR = {'add': 'a + b', 'sub': 'a - b', 'mul': 'a * b', 'mod': 'a % b'}
+
+
+def alu_source(op, signed, size, flags_target):
+    """Líneas de Python de ALU.<op>(a, b, size, signed) para un tamaño fijo:
+    la máscara y el bit de signo van como constantes. Dejan en `res` el
+    resultado sin truncar y asignan a flags_target el mismo registro que
+    ALU.last. La comprobación de b == 0 (div/mod) queda para quien las use."""
+    bits = size * 8
+    lines = []
+    if signed:
+        # Igual que _to_signed: solo mira el bit de signo, no trunca
+        lines.append(f"if a & {1 << (bits - 1)}: a -= {1 << bits}")
+        lines.append(f"if b & {1 << (bits - 1)}: b -= {1 << bits}")
+    if op == 'div':
+        lines.append("res = int(a / b)" if signed else "res = a // b")
+    else:
+        lines.append(f"res = {_ALU_EXPR[op]}")
+    lines.append(f"{flags_target} = ({ALU_FLAG_FUNCS[op, signed].__name__}, a, b, res, {size})")
+    return lines
+
+
 class ALU:
-    """Unidad Aritmético-Lógica con operaciones signed/unsigned y tamaños 1,2,4,8 bytes."""
+    """Unidad Aritmético-Lógica con operaciones signed/unsigned y tamaños 1,2,4,8 bytes.
+
+    Las banderas no se calculan en cada operación: `last` guarda el registro
+    (función, a, b, resultado, tamaño) y `flags` las evalúa al consultarlas.
+    """
     def __init__(self):
-        self.flags = Flags()
+        self._flags = Flags()
+        self.last = None
+
+    @property
+    def flags(self):
+        record = self.last
+        if record is not None:
+            self.last = None
+            f = self._flags
+            f.Z, f.N, f.C, f.O = record[0](*record[1:])
+        return self._flags
 
     def _mask(self, size):
         bits = size * 8
@@ -40,55 +182,36 @@ class ALU:
         mask, _ = self._mask(size)
         return val & mask
 
-    def _update_flags(self, result, size, carry=False, overflow=False):
-        mask, sign_bit = self._mask(size)
-        result &= mask
-        self.flags.C = 1 if carry else 0
-        self.flags.O = 1 if overflow else 0
-        self.flags.Z = 1 if result == 0 else 0
-        self.flags.N = 1 if result & sign_bit else 0
-
     # ======================================
     # Operaciones básicas
     # ======================================
 
     def add(self, a, b, size=4, signed=False):
-        mask, sign_bit = self._mask(size)
         if signed:
             a, b = self._to_signed(a, size), self._to_signed(b, size)
         res = a + b
-        carry = res > mask or res < 0
-        overflow = ((a ^ res) & (b ^ res) & sign_bit) != 0
-        self._update_flags(res, size, carry, overflow)
+        self.last = (flags_add, a, b, res, size)
         return self._to_unsigned(res, size)
 
     def sub(self, a, b, size=4, signed=False):
-        mask, sign_bit = self._mask(size)
         if signed:
             a, b = self._to_signed(a, size), self._to_signed(b, size)
         res = a - b
-        carry = a < b
-        overflow = ((a ^ b) & (a ^ res) & sign_bit) != 0
-        self._update_flags(res, size, carry, overflow)
+        self.last = (flags_sub, a, b, res, size)
         return self._to_unsigned(res, size)
 
     # ======================================
     # Multiplicación
     # ======================================
     def mul(self, a, b, size=4, signed=False):
-        mask, sign_bit = self._mask(size)
-
         if signed:
             a = self._to_signed(a, size)
             b = self._to_signed(b, size)
             res = a * b
-            overflow = not (-sign_bit <= res < sign_bit)
+            self.last = (flags_mul_signed, a, b, res, size)
         else:
             res = a * b
-            overflow = res > mask
-
-        carry = overflow
-        self._update_flags(res, size, carry, overflow)
+            self.last = (flags_mul_unsigned, a, b, res, size)
         return self._to_unsigned(res, size)
 
     # ======================================
@@ -98,19 +221,14 @@ class ALU:
         if b == 0:
             raise ZeroDivisionError("División por cero en ALU")
 
-        mask, sign_bit = self._mask(size)
-
         if signed:
             a = self._to_signed(a, size)
             b = self._to_signed(b, size)
             res = int(a / b)
-            overflow = not (-sign_bit <= res < sign_bit)
+            self.last = (flags_div_signed, a, b, res, size)
         else:
             res = a // b
-            overflow = res > mask
-
-        carry = 0
-        self._update_flags(res, size, carry, overflow)
+            self.last = (flags_div_unsigned, a, b, res, size)
         return self._to_unsigned(res, size)
 
     # ======================================
@@ -120,19 +238,14 @@ class ALU:
         if b == 0:
             raise ZeroDivisionError("División por cero en operación módulo")
 
-        mask, sign_bit = self._mask(size)
-
         if signed:
             a = self._to_signed(a, size)
             b = self._to_signed(b, size)
             res = a % b
-            overflow = not (-sign_bit <= res < sign_bit)
+            self.last = (flags_div_signed, a, b, res, size)
         else:
             res = a % b
-            overflow = res > mask
-
-        carry = 0
-        self._update_flags(res, size, carry, overflow)
+            self.last = (flags_div_unsigned, a, b, res, size)
         return self._to_unsigned(res, size)
 
 
@@ -146,18 +259,18 @@ class FPU:
     def _bits_to_float(self, bits: int, size: int):
         """Convierte entero -> float/double IEEE 754."""
         if size == 4:
-            return struct.unpack('!f', struct.pack('!I', bits & 0xFFFFFFFF))[0]
+            return f32_from_bits(bits)
         elif size == 8:
-            return struct.unpack('!d', struct.pack('!Q', bits & 0xFFFFFFFFFFFFFFFF))[0]
+            return f64_from_bits(bits)
         else:
             raise ValueError("Solo tamaños 4 o 8 bytes soportados")
 
     def _float_to_bits(self, value: float, size: int):
         """Convierte float/double -> entero con bits IEEE 754."""
         if size == 4:
-            return struct.unpack('!I', struct.pack('!f', value))[0]
+            return f32_to_bits(value)
         elif size == 8:
-            return struct.unpack('!Q', struct.pack('!d', value))[0]
+            return f64_to_bits(value)
         else:
             raise ValueError("Solo tamaños 4 o 8 bytes soportados")
 
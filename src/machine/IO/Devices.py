@@ -1,55 +1,364 @@
+import os
+import threading
 import time
 
 class Device:
+    # Controlador de interrupciones y línea (IOSystem.route_irq); None = sin interrupciones
+    irq = None
+    irq_line = None
+
+    def raise_irq(self):
+        if self.irq is not None:
+            self.irq.raise_irq(self.irq_line)
+
+    def can_wake(self) -> bool:
+        """Si todavía puede generar interrupciones por sí solo (WAIT no espera en vano)."""
+        return False
+
     def read(self):
         raise NotImplementedError("read() no implementado")
 
     def write(self, value):
         raise NotImplementedError("write() no implementado")
 
+    # Transferencias en bloque (IOSystem.read_block/write_block); por defecto byte a byte
+    def read_block(self, n):
+        return bytes(self.read() & 0xFF for _ in range(n))
+
+    def write_block(self, data):
+        for b in data:
+            self.write(b)
+        return len(data)
+
+    # Estado para IOSystem.snapshot/restore; los dispositivos sin estado no hacen nada
+    def snapshot(self):
+        return None
+
+    def restore(self, state):
+        pass
+
 class Screen(Device):
-    def __init__(self):
-        self.buffer = ""  # guarda lo que se imprimió
-        # Optional callback that GUI can set to receive characters as they're shown.
-        # Signature: callable(char: str) -> None
+    """Pantalla con buffer de bytes y scrollback acotado.
+
+    write() añade un byte (O(1) amortizado) y `buffer` devuelve como str los
+    últimos `scrollback` caracteres. show() no llama a on_show por carácter:
+    acumula y entrega trozos al ver un salto de línea, al juntar `chunk_size`
+    caracteres o cuando pasan `flush_interval` segundos; flush() entrega lo pendiente.
+    """
+
+    def __init__(self, scrollback: int = 1 << 20, chunk_size: int = 4096, flush_interval: float = 0.05):
+        self.scrollback = scrollback
+        self.chunk_size = chunk_size
+        self.flush_interval = flush_interval
+        self._data = bytearray()  # guarda lo que se imprimió
+        self.version = 0          # cambia con cada escritura o asignación de buffer
+        self._pending = []
+        self._last_flush = time.monotonic()
+        # Optional callback that GUI can set to receive text as it's shown.
+        # Signature: callable(chunk: str) -> None
         self.on_show = None
 
+    @property
+    def buffer(self) -> str:
+        return self._data[-self.scrollback:].decode('latin-1')
+
+    @buffer.setter
+    def buffer(self, text: str):
+        self._data = bytearray(text[-self.scrollback:].encode('latin-1'))
+        self._pending.clear()
+        self.version += 1
+
     def write(self, value):
-        char = chr(value & 0xFF)
-        self.buffer += char
+        data = self._data
+        data.append(value & 0xFF)
+        self.version += 1
+        # Recorta por bloques para que el coste quede amortizado
+        if len(data) > 2 * self.scrollback:
+            del data[:-self.scrollback]
+
+    def write_block(self, data):
+        self._data.extend(data)
+        self.version += 1
+        if len(self._data) > 2 * self.scrollback:
+            del self._data[:-self.scrollback]
+        return len(data)
+
+    def snapshot(self):
+        return self.buffer
+
+    def restore(self, state):
+        self.buffer = state
     
     def show(self):
-        """Imprime el último carácter escrito en el buffer"""
-        if self.buffer:
-            # Prefer callback to update GUI. If not set, fall back to logging (no console prints).
-            ch = self.buffer[-1]
-            if callable(self.on_show):
-                try:
-                    # send the last character to the GUI callback
-                    self.on_show(ch)
-                except Exception:
-                    # swallow callbacks errors to avoid breaking VM
-                    pass
-            else:
-                # Do not print to console; use a logger so CLI remains clean.
-                import logging
-                logging.getLogger("machine.io").debug("Screen output: %s", ch)
+        """Muestra el último carácter escrito en el buffer"""
+        if self._data:
+            ch = chr(self._data[-1])
+            pending = self._pending
+            pending.append(ch)
+            if (ch == "\n" or len(pending) >= self.chunk_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+
+    def flush(self):
+        """Entrega a on_show lo mostrado desde el último flush."""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        chunk = "".join(self._pending)
+        self._pending.clear()
+        # Prefer callback to update GUI. If not set, fall back to logging (no console prints).
+        if callable(self.on_show):
+            try:
+                self.on_show(chunk)
+            except Exception:
+                # swallow callbacks errors to avoid breaking VM
+                pass
+        else:
+            # Do not print to console; use a logger so CLI remains clean.
+            import logging
+            logging.getLogger("machine.io").debug("Screen output: %s", chunk)
     
 class Keyboard(Device):
+    """Teclado con buffer circular de `capacity` bytes, seguro entre hilos.
 
-    def __init__(self):
-        self.buffer = []
+    read() devuelve 0xFF si no hay datos. Con blocking=True la lectura espera
+    (sin consumir CPU) a que llegue un byte, hasta `timeout` segundos si se da,
+    en lugar de obligar al programa a hacer polling; close() despierta a quien
+    espere y marca el fin de la entrada.
+    """
+    EMPTY = 0xFF
+    POLL_WAIT = 0.00001  # espera en modo no bloqueante, para no girar en vacío
+
+    def __init__(self, capacity: int = 4096, blocking: bool = False, timeout: float = None):
+        self.capacity = capacity
+        self.blocking = blocking
+        self.timeout = timeout
+        self._ring = bytearray(capacity)
+        self._head = 0
+        self._count = 0
+        self.dropped = 0      # bytes descartados con el buffer lleno
+        self.closed = False
+        self._cond = threading.Condition()
+        # Se llama al leer con el buffer vacío, antes de esperar (p. ej. Screen.flush
+        # para que se vea el prompt). Signature: callable() -> None
+        self.on_empty = None
+
+    @property
+    def buffer(self):
+        """Copia de los bytes pendientes, del más antiguo al más reciente."""
+        with self._cond:
+            return self._pending()
+
+    def _pending(self):
+        end = self._head + self._count
+        if end <= self.capacity:
+            return list(self._ring[self._head:end])
+        return list(self._ring[self._head:]) + list(self._ring[:end - self.capacity])
 
     def read(self):
-        if len(self.buffer) == 0 :
-            time.sleep(0.00001) ## Para evitar consumo de CPU
-            return 0xFF
-        ch = self.buffer[0]
-        self.buffer.remove(ch)
-        return ch
+        if not self._count and self.on_empty is not None:
+            self.on_empty()
+        with self._cond:
+            if not self._count:
+                if self.closed:
+                    return self.EMPTY
+                if self.blocking:
+                    self._cond.wait_for(lambda: self._count or self.closed, self.timeout)
+                else:
+                    # Se despierta en cuanto llega un byte, no al acabar el sleep
+                    self._cond.wait(self.POLL_WAIT)
+                if not self._count:
+                    return self.EMPTY
+            ch = self._ring[self._head]
+            self._head = (self._head + 1) % self.capacity
+            self._count -= 1
+            return ch
 
     def write(self, value:int):
-        self.buffer.append(value & 0xFF) # solo un byte (0–255)
+        with self._cond:
+            if self._count == self.capacity:
+                self.dropped += 1
+                return
+            self._ring[(self._head + self._count) % self.capacity] = value & 0xFF # solo un byte (0–255)
+            self._count += 1
+            self._cond.notify()
+        self.raise_irq()
+
+    def read_block(self, n):
+        """Hasta n bytes ya disponibles, sin esperar (puede devolver menos)."""
+        with self._cond:
+            n = min(n, self._count)
+            end = self._head + n
+            if end <= self.capacity:
+                data = bytes(self._ring[self._head:end])
+            else:
+                data = bytes(self._ring[self._head:]) + bytes(self._ring[:end - self.capacity])
+            self._head = end % self.capacity
+            self._count -= n
+            return data
+
+    def write_block(self, data):
+        """Encola los bytes que quepan; devuelve cuántos aceptó."""
+        with self._cond:
+            n = min(len(data), self.capacity - self._count)
+            self.dropped += len(data) - n
+            tail = (self._head + self._count) % self.capacity
+            first = min(n, self.capacity - tail)
+            self._ring[tail:tail + first] = data[:first]
+            self._ring[:n - first] = data[first:n]
+            self._count += n
+            if n:
+                self._cond.notify_all()
+        if n:
+            self.raise_irq()
+        return n
+
+    def clear(self):
+        with self._cond:
+            self._head = 0
+            self._count = 0
+            self.closed = False
+
+    def close(self):
+        """Fin de la entrada: las lecturas dejan de esperar y devuelven 0xFF al vaciarse."""
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+        if self.irq is not None:
+            self.irq.wake()
+
+    def can_wake(self):
+        return not self.closed
+
+    def snapshot(self):
+        return self.buffer
+
+    def restore(self, state):
+        with self._cond:
+            state = bytes(state)[-self.capacity:]
+            self._ring[:len(state)] = state
+            self._head = 0
+            self._count = len(state)
+            self._cond.notify_all()
+
+class BlockDevice(Device):
+    """Disco sobre un archivo del host, en sectores de sector_size bytes.
+
+    Ocupa PORTS puertos consecutivos (IOSystem.register_range):
+
+        +0 SECTOR   sector actual (escribirlo reinicia la posición de DATA)
+        +1 ADDR     dirección de RAM para DMA
+        +2 COUNT    sectores por orden DMA
+        +3 CMD      escribir CMD_READ / CMD_WRITE / CMD_FLUSH (fsync); leer da el estado
+        +4 DATA     E/S programada: un byte por LOADIO/SVIO desde SECTOR
+        +5 SECTORS  tamaño del disco en sectores (solo lectura)
+        +6 BYTES    tamaño del disco en bytes (solo lectura)
+
+    CMD_READ/CMD_WRITE copian COUNT sectores entre el archivo y la RAM en una
+    sola llamada (Memory.dma_from_file/dma_to_file) y avanzan SECTOR, así que
+    un recorrido secuencial solo necesita repetir el comando. Los sectores tras
+    el final del archivo se leen como ceros; escribir ahí lo alarga.
+    """
+    SECTOR, ADDR, COUNT, CMD, DATA, SECTORS, BYTES = range(7)
+    PORTS = 7
+    CMD_READ, CMD_WRITE, CMD_FLUSH = 1, 2, 3
+    ST_OK, ST_ERROR = 0, 1
+
+    def __init__(self, path: str, memory, sector_size: int = 512):
+        self.path = path
+        self.memory = memory
+        self.sector_size = sector_size
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        # Sin buffer de Python: el DMA lee/escribe directamente sobre la RAM
+        self.file = os.fdopen(fd, "r+b", buffering=0)
+        self.sector = 0
+        self.addr = 0
+        self.count = 1
+        self.status = self.ST_OK
+        self._pos = 0
+
+    def size(self) -> int:
+        return os.fstat(self.file.fileno()).st_size
+
+    def read_port(self, offset):
+        if offset == self.DATA:
+            data = self.read_block_port(offset, 1)
+            return data[0] if data else 0
+        if offset == self.SECTOR:
+            return self.sector
+        if offset == self.ADDR:
+            return self.addr
+        if offset == self.COUNT:
+            return self.count
+        if offset == self.CMD:
+            return self.status
+        if offset == self.SECTORS:
+            return -(-self.size() // self.sector_size)
+        return self.size()
+
+    def write_port(self, offset, value):
+        if offset == self.DATA:
+            self.write_block_port(offset, bytes((value & 0xFF,)))
+        elif offset == self.SECTOR:
+            self.sector = value
+            self._pos = 0
+        elif offset == self.ADDR:
+            self.addr = value
+        elif offset == self.COUNT:
+            self.count = value
+        elif offset == self.CMD:
+            self.command(value)
+
+    def read_block_port(self, offset, n):
+        if offset != self.DATA:
+            return bytes(self.read_port(offset) & 0xFF for _ in range(n))
+        self.file.seek(self.sector * self.sector_size + self._pos)
+        data = self.file.read(n)
+        self._pos += len(data)
+        return data
+
+    def write_block_port(self, offset, data):
+        if offset != self.DATA:
+            for b in data:
+                self.write_port(offset, b)
+            return len(data)
+        self.file.seek(self.sector * self.sector_size + self._pos)
+        n = self.file.write(data)
+        self._pos += n
+        return n
+
+    def command(self, cmd):
+        """Ejecuta una orden DMA; un MemoryFault de la RAM se propaga a la CPU."""
+        nbytes = self.count * self.sector_size
+        self.status = self.ST_OK
+        try:
+            if cmd == self.CMD_READ:
+                self.file.seek(self.sector * self.sector_size)
+                self.memory.dma_from_file(self.file, self.addr, nbytes)
+            elif cmd == self.CMD_WRITE:
+                self.file.seek(self.sector * self.sector_size)
+                self.memory.dma_to_file(self.file, self.addr, nbytes)
+            elif cmd == self.CMD_FLUSH:
+                os.fsync(self.file.fileno())
+                return
+            else:
+                self.status = self.ST_ERROR
+                return
+        except (IndexError, OSError, OverflowError, ValueError):
+            self.status = self.ST_ERROR
+            return
+        self.sector += self.count
+        self._pos = 0
+
+    def close(self):
+        self.file.close()
+
+    def snapshot(self):
+        # Solo los registros: el contenido del archivo no forma parte de la instantánea
+        return (self.sector, self.addr, self.count, self.status, self._pos)
+
+    def restore(self, state):
+        self.sector, self.addr, self.count, self.status, self._pos = state
 
 
 if __name__ == "__main__":
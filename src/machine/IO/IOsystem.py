@@ -1,35 +1,172 @@
+import logging
+from functools import partial
+
 from machine.IO.Devices import Device
 
+logger = logging.getLogger("machine.io")
+
+# Puertos direccionables con la tabla de despacho (LOADIO/SVIO/SHOWIO usan el inmediato)
+PORT_SPACE = 1 << 16
+
+
+class _Port:
+    """Entrada de la tabla de despacho: callables ya resueltos para un puerto."""
+    __slots__ = ('device', 'start', 'read', 'write', 'show', 'read_block', 'write_block')
+
+    def __init__(self, device, start, read, write, show, read_block, write_block):
+        self.device = device
+        self.start = start
+        self.read = read
+        self.write = write
+        self.show = show
+        self.read_block = read_block
+        self.write_block = write_block
+
+
+def _no_show():
+    pass
+
+
+def _loop_read_block(read, n):
+    return bytes(read() & 0xFF for _ in range(n))
+
+
+def _loop_write_block(write, data):
+    for b in data:
+        write(b)
+    return len(data)
+
+
 class IOSystem:
     def __init__(self):
-        self.devices: dict[int,Device] = {}
+        self.devices: dict[int,Device] = {}   # puerto inicial -> dispositivo
+        self.spans: dict[int,int] = {}        # puerto inicial -> nº de puertos
+        self._ports: list = [None] * PORT_SPACE
+        self._warned = set()
+        # Controlador de interrupciones (attach_interrupts); CPU.run lo consulta entre tramos
+        self.irq = None
 
     def register(self, addr, device):
         """Registra un dispositivo en una dirección de IO"""
-        self.devices[addr] = device
+        self._claim(addr, 1, device)
+        read_block = getattr(device, 'read_block', None) or partial(_loop_read_block, device.read)
+        write_block = getattr(device, 'write_block', None) or partial(_loop_write_block, device.write)
+        self._ports[addr] = _Port(device, addr, device.read, device.write,
+                                  getattr(device, 'show', _no_show), read_block, write_block)
+
+    def register_range(self, start, count, device):
+        """Registra un dispositivo que ocupa los puertos [start, start + count).
+
+        Cada puerto llama a device.read_port(offset) / write_port(offset, value)
+        y, si existen, show_port(offset), read_block_port(offset, n) y
+        write_block_port(offset, data), con offset relativo a start."""
+        self._claim(start, count, device)
+        show_port = getattr(device, 'show_port', None)
+        read_block_port = getattr(device, 'read_block_port', None)
+        write_block_port = getattr(device, 'write_block_port', None)
+        for offset in range(count):
+            read = partial(device.read_port, offset)
+            write = partial(device.write_port, offset)
+            self._ports[start + offset] = _Port(
+                device, start, read, write,
+                partial(show_port, offset) if show_port else _no_show,
+                partial(read_block_port, offset) if read_block_port else partial(_loop_read_block, read),
+                partial(write_block_port, offset) if write_block_port else partial(_loop_write_block, write))
+
+    def unregister(self, addr):
+        """Quita el dispositivo registrado en addr (con todo su rango)."""
+        port = self._port(addr)
+        if port is None:
+            return None
+        count = self.spans.pop(port.start)
+        self._ports[port.start:port.start + count] = [None] * count
+        return self.devices.pop(port.start)
+
+    def attach_interrupts(self, controller, base):
+        """Conecta el controlador de interrupciones y registra sus puertos desde base."""
+        self.register_range(base, controller.PORTS, controller)
+        self.irq = controller
+
+    def route_irq(self, addr, line):
+        """Conecta el dispositivo del puerto addr a la línea `line` del controlador."""
+        device = self.get_device(addr)
+        if device is None or self.irq is None:
+            raise ValueError(f"No hay dispositivo en {addr:#x} o controlador de interrupciones")
+        self.irq.connect(device, line)
+
+    def _claim(self, start, count, device):
+        if count < 1 or start < 0 or start + count > PORT_SPACE:
+            raise ValueError(f"Rango de IO [{start:#x}, {start + count:#x}) fuera de 0..{PORT_SPACE:#x}")
+        # Volver a registrar en el mismo puerto inicial reemplaza al anterior (como el dict de antes)
+        if start in self.devices:
+            self.unregister(start)
+        for addr in range(start, start + count):
+            port = self._ports[addr]
+            if port is not None:
+                raise ValueError(f"El puerto {addr:#x} ya lo usa {port.device!r} (desde {port.start:#x})")
+        self.devices[start] = device
+        self.spans[start] = count
+        self._warned.difference_update(range(start, start + count))
+
+    def _port(self, addr):
+        try:
+            return self._ports[addr] if addr >= 0 else None
+        except IndexError:
+            return None
+
+    def _unmapped(self, addr):
+        # Solo un aviso por puerto: los bucles de polling no inundan el log
+        if addr not in self._warned:
+            self._warned.add(addr)
+            logger.warning("Dispositivo en %s no existe", hex(addr))
 
     def get_device(self, addr):
-        return self.devices.get(addr)
+        port = self._port(addr)
+        return port.device if port is not None else None
 
     def write(self, addr, value):
-        device = self.devices.get(addr)
-        if device:
-            device.write(value)
+        port = self._port(addr)
+        if port is not None:
+            port.write(value)
         else:
-            import logging
-            logging.getLogger("machine.io").warning("Dispositivo en %s no existe", hex(addr))
+            self._unmapped(addr)
 
     def read(self, addr):
-        device = self.devices.get(addr)
-        if device:
-            return device.read()
-        import logging
-        logging.getLogger("machine.io").warning("Dispositivo en %s no existe", hex(addr))
+        port = self._port(addr)
+        if port is not None:
+            return port.read()
+        self._unmapped(addr)
         return 0
-    
+
+    def read_block(self, addr, n) -> bytes:
+        """Lee hasta n bytes del puerto en una sola llamada (el dispositivo puede devolver menos)."""
+        port = self._port(addr)
+        if port is not None:
+            return port.read_block(n)
+        self._unmapped(addr)
+        return bytes(n)
+
+    def write_block(self, addr, data) -> int:
+        """Escribe los bytes de data en el puerto; devuelve cuántos aceptó el dispositivo."""
+        port = self._port(addr)
+        if port is not None:
+            return port.write_block(data)
+        self._unmapped(addr)
+        return 0
+
+    def snapshot(self) -> dict:
+        """Estado de cada dispositivo registrado (buffers de pantalla, teclado...)."""
+        return {addr: device.snapshot() for addr, device in self.devices.items()
+                if hasattr(device, 'snapshot')}
+
+    def restore(self, state: dict):
+        for addr, device_state in state.items():
+            device = self.devices.get(addr)
+            if device is not None and hasattr(device, 'restore'):
+                device.restore(device_state)
+
     def show(self, addr):
         """Muestra el contenido del dispositivo (para SHOWIO)"""
-        device = self.devices.get(addr)
-        if device and hasattr(device, 'show'):
-            device.show()
-
+        port = self._port(addr)
+        if port is not None:
+            port.show()
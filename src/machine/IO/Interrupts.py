@@ -0,0 +1,176 @@
+"""
+Controlador de interrupciones y temporizador programable.
+
+El controlador se conecta con IOSystem.attach_interrupts(ctl, base) y los
+dispositivos con IOSystem.route_irq(puerto, línea). La CPU no lo consulta en
+cada instrucción: CPU.run ejecuta por tramos de como mucho IRQ_CHECK_CYCLES
+ciclos (o hasta el siguiente vencimiento del temporizador) y entre tramo y
+tramo entrega la interrupción pendiente de menor línea, si las interrupciones
+están habilitadas (EI/DI) y la línea no está enmascarada.
+
+Entregar una interrupción apila el pc y las banderas (8 + 8 bytes) y salta al
+vector de la línea (SETIV); RTI los recupera y rehabilita las interrupciones.
+WAIT duerme la CPU hasta que haya una línea pendiente y sin máscara: el tiempo
+de los temporizadores avanza de golpe y, si solo queda esperar a un teclado,
+el hilo se bloquea hasta que llegue una tecla.
+
+Puertos del controlador (desde base):
+    +0 PENDING  líneas pendientes; escribir una máscara las descarta (ack)
+    +1 MASK     líneas habilitadas (bit i = línea i)
+
+Puertos del temporizador (IOSystem.register_range(base, Timer.PORTS, timer)):
+    +0 PERIOD   ciclos hasta vencer; escribirlo lo arma (0 lo para)
+    +1 MODE     0 = una vez, 1 = periódico (por defecto)
+    +2 COUNT    ciclos que faltan (solo lectura)
+    +3 TICKS    vencimientos desde que se creó (solo lectura)
+"""
+import threading
+
+from machine.IO.Devices import Device
+
+# Ciclos máximos entre dos comprobaciones de interrupciones en CPU.run
+IRQ_CHECK_CYCLES = 1024
+
+
+class InterruptController(Device):
+    LINES = 8
+    PENDING, MASK = range(2)
+    PORTS = 2
+
+    def __init__(self):
+        self.pending = 0
+        self.mask = 0
+        self.vectors = [None] * self.LINES
+        self.now = 0                # ciclos de CPU contados por advance()
+        self.delivered = [0] * self.LINES
+        self.timers = []
+        self.sources = []
+        self._cond = threading.Condition()
+
+    # ---------- Puertos ----------
+    def read_port(self, offset):
+        return self.pending if offset == self.PENDING else self.mask
+
+    def write_port(self, offset, value):
+        with self._cond:
+            if offset == self.PENDING:
+                self.pending &= ~value
+            else:
+                self.mask = value & ((1 << self.LINES) - 1)
+                self._cond.notify_all()
+
+    # ---------- Dispositivos ----------
+    def connect(self, device, line):
+        if not 0 <= line < self.LINES:
+            raise ValueError(f"Línea de interrupción fuera de rango: {line}")
+        device.irq = self
+        device.irq_line = line
+        self.sources.append(device)
+        if hasattr(device, 'expire'):
+            self.timers.append(device)
+
+    def raise_irq(self, line):
+        """Marca la línea como pendiente; se puede llamar desde otro hilo."""
+        with self._cond:
+            self.pending |= 1 << line
+            self._cond.notify_all()
+
+    def wake(self):
+        """Despierta un WAIT para que vuelva a mirar sus fuentes (p. ej. teclado cerrado)."""
+        with self._cond:
+            self._cond.notify_all()
+
+    # ---------- Lado de la CPU ----------
+    def next_deadline(self):
+        """Ciclo (en la escala de now) del próximo vencimiento de un temporizador, o None."""
+        deadlines = [t.deadline for t in self.timers if t.deadline is not None]
+        return min(deadlines) if deadlines else None
+
+    def advance(self, cycles):
+        """Avanza el reloj y vence los temporizadores cuyo plazo ya pasó."""
+        self.now += cycles
+        for timer in self.timers:
+            if timer.deadline is not None and timer.deadline <= self.now:
+                timer.expire(self.now)
+
+    def take(self):
+        """Quita y devuelve la línea pendiente sin máscara de menor número (o None)."""
+        with self._cond:
+            ready = self.pending & self.mask
+            if not ready:
+                return None
+            line = (ready & -ready).bit_length() - 1
+            self.pending &= ~(1 << line)
+            self.delivered[line] += 1
+            return line
+
+    def wait(self, budget):
+        """WAIT: espera a una línea pendiente sin máscara. Devuelve los ciclos
+        que se dejaron pasar (como mucho budget). Si nada puede despertar a la
+        CPU (sin temporizador armado ni fuente abierta) vuelve enseguida."""
+        idle = 0
+        with self._cond:
+            while not self.pending & self.mask and idle < budget:
+                deadline = self.next_deadline()
+                if deadline is not None:
+                    step = min(max(deadline - self.now, 0), budget - idle)
+                    idle += step
+                    self.advance(step)
+                    continue
+                if not any(s.can_wake() for s in self.sources):
+                    break
+                self._cond.wait()
+        return idle
+
+    def snapshot(self):
+        return (self.pending, self.mask, list(self.vectors), self.now)
+
+    def restore(self, state):
+        self.pending, self.mask, vectors, self.now = state
+        self.vectors[:] = vectors
+
+
+class Timer(Device):
+    PERIOD, MODE, COUNT, TICKS = range(4)
+    PORTS = 4
+    ONE_SHOT, PERIODIC = 0, 1
+
+    def __init__(self):
+        self.period = 0
+        self.mode = self.PERIODIC
+        self.deadline = None
+        self.ticks = 0
+
+    def _now(self):
+        return self.irq.now if self.irq is not None else 0
+
+    def read_port(self, offset):
+        if offset == self.PERIOD:
+            return self.period
+        if offset == self.MODE:
+            return self.mode
+        if offset == self.COUNT:
+            return max(self.deadline - self._now(), 0) if self.deadline is not None else 0
+        return self.ticks
+
+    def write_port(self, offset, value):
+        if offset == self.PERIOD:
+            self.period = value
+            self.deadline = self._now() + value if value else None
+        elif offset == self.MODE:
+            self.mode = value & 1
+
+    def expire(self, now):
+        self.ticks += 1
+        if self.mode == self.PERIODIC and self.period:
+            # Los vencimientos perdidos (tramos largos) se agrupan en uno
+            self.deadline += ((now - self.deadline) // self.period + 1) * self.period
+        else:
+            self.deadline = None
+        self.raise_irq()
+
+    def snapshot(self):
+        return (self.period, self.mode, self.deadline, self.ticks)
+
+    def restore(self, state):
+        self.period, self.mode, self.deadline, self.ticks = state
@@ -1,8 +1,14 @@
 import os
 import re
+import mmap
 import atexit
+import bisect
+import hashlib
+import heapq
 import logging
 import struct
+import weakref
+import zlib
 
 logger = logging.getLogger("machine.memory")
 
@@ -11,6 +17,78 @@ MASK32 = (1 << 32) - 1
 MASK16 = (1 << 16) - 1
 MASK8  = (1 << 8) - 1
 
+# Granularidad (en bytes) con la que se vigilan escrituras sobre código
+PAGE_SHIFT = 8
+PAGE_SIZE = 1 << PAGE_SHIFT
+
+# Instantánea binaria de la RAM (save_snapshot/load_snapshot):
+#   cabecera | mapa de bits de páginas no nulas | páginas no nulas (opcionalmente zlib)
+SNAPSHOT_MAGIC = b"ATRM"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<4sHHQII")  # magic, versión, flags, tamaño RAM, tamaño de página, nº páginas
+SNAPSHOT_ZLIB = 0x1
+
+# Accesos tipados (little endian) precompilados: unpack_from/pack_into leen y
+# escriben directamente sobre el buffer de la RAM, sin copias intermedias
+_U8, _U16, _U32, _U64 = (struct.Struct(f) for f in ("<B", "<H", "<I", "<Q"))
+_F32, _F64 = struct.Struct("<f"), struct.Struct("<d")
+_UNSIGNED = {1: _U8, 2: _U16, 4: _U32, 8: _U64}
+_SIGNED = {n: struct.Struct(f) for n, f in ((1, "<b"), (2, "<h"), (4, "<i"), (8, "<q"))}
+
+# Bloque para poner a cero / comparar la RAM por tramos sin reservar `size` bytes
+_ZERO_CHUNK = bytes(1 << 20)
+
+# Permisos de las regiones de protección (combinables con |)
+PROT_R = 0x1
+PROT_W = 0x2
+PROT_X = 0x4
+PROT_RW = PROT_R | PROT_W
+PROT_RX = PROT_R | PROT_X
+PROT_RWX = PROT_R | PROT_W | PROT_X
+
+# Accesos del programa (CPU y código traducido) que se comprueban con la
+# protección activa: nombre -> (struct, máscara del valor o None si es float)
+_GUEST_READS = {"read_u8": _U8, "read_u16": _U16, "read_u32": _U32, "read_u64": _U64,
+                "read_f32": _F32, "read_f64": _F64}
+_GUEST_WRITES = {"write_u8": (_U8, MASK8), "write_u16": (_U16, MASK16), "write_u32": (_U32, MASK32),
+                 "write_u64": (_U64, MASK64), "write_f32": (_F32, None), "write_f64": (_F64, None)}
+
+
+class MemoryFault(Exception):
+    """Acceso que viola los permisos de una región de memoria.
+
+    access: "read", "write" o "exec"; addr/size: el acceso; region: nombre de la
+    región (None si cae fuera de todas); pc: instrucción que lo provocó (la CPU
+    lo completa al propagar la excepción).
+    """
+    def __init__(self, access: str, addr: int, size: int, region: str | None = None, pc: int | None = None):
+        super().__init__(access, addr, size, region, pc)
+        self.access = access
+        self.addr = addr
+        self.size = size
+        self.region = region
+        self.pc = pc
+
+    def __str__(self):
+        where = f" ({self.region})" if self.region else ""
+        pc = f", PC={self.pc:#x}" if self.pc is not None else ""
+        return f"Violación de protección: {self.access} de {self.size} bytes en {self.addr:#x}{where}{pc}"
+
+
+class Region:
+    """Rango [start, end) con permisos PROT_*; ver Memory.set_region."""
+    __slots__ = ("name", "start", "end", "perms")
+
+    def __init__(self, name: str, start: int, end: int, perms: int):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.perms = perms
+
+    def __repr__(self):
+        flags = "".join(c if self.perms & bit else "-" for c, bit in (("r", PROT_R), ("w", PROT_W), ("x", PROT_X)))
+        return f"<Region {self.name} {self.start:#x}-{self.end:#x} {flags}>"
+
 def to_uint64(x: int) -> int:
     return x & MASK64
 
@@ -20,6 +98,61 @@ def to_int_from_bytes(b: bytes, signed: bool = False) -> int:
 def to_bytes_from_int(x: int, size: int) -> bytes:
     return int(x).to_bytes(size, byteorder='little', signed=False)
 
+class MemorySnapshot:
+    """Contenido de la RAM en Memory.snapshot(); restore() solo copia de vuelta
+    las páginas escritas después del token."""
+    __slots__ = ("data", "token")
+
+    def __init__(self, data: bytes, token: int):
+        self.data = data
+        self.token = token
+
+
+class _IntervalIndex:
+    """Intervalos [inicio, fin) con prioridad (orden de registro) para
+    find_symbol_at. add() solo inserta en orden; la primera búsqueda después
+    reconstruye una lista ordenada de tramos disjuntos, cada uno con el
+    intervalo de mayor prioridad que lo cubre, y find() es un bisect."""
+
+    def __init__(self):
+        self._items: list[tuple] = []     # (inicio, fin, prioridad, valor) por inicio
+        self._bounds: list[int] = []
+        self._winners: list = []
+        self._stale = False
+
+    def add(self, start: int, end: int, priority: int, value):
+        if end <= start:
+            return
+        bisect.insort(self._items, (start, end, priority, value), key=lambda item: item[:3])
+        self._stale = True
+
+    def _rebuild(self):
+        points = sorted({p for start, end, _, _ in self._items for p in (start, end)})
+        bounds, winners = [], []
+        active = []                       # montículo de (-prioridad, fin, valor)
+        i, items = 0, self._items
+        for point in points:
+            while i < len(items) and items[i][0] == point:
+                _, end, priority, value = items[i]
+                heapq.heappush(active, (-priority, end, value))
+                i += 1
+            while active and active[0][1] <= point:
+                heapq.heappop(active)
+            winner = active[0][2] if active else None
+            # Tramos contiguos con el mismo ganador se funden
+            if not winners or winners[-1] is not winner:
+                bounds.append(point)
+                winners.append(winner)
+        self._bounds, self._winners = bounds, winners
+        self._stale = False
+
+    def find(self, x: int):
+        if self._stale:
+            self._rebuild()
+        i = bisect.bisect_right(self._bounds, x) - 1
+        return self._winners[i] if i >= 0 else None
+
+
 class Memory:
     """
     Memoria lineal de bytes con utilidades para leer/escribir
@@ -30,30 +163,62 @@ class Memory:
                  stack_base: int = 0x1C000, stack_end: int | None = None):
         """
         size: tamaño de la RAM en bytes.
-        memory_file: ruta del archivo .txt para persistencia. Si None, usa 'memory_ram.txt' en el cwd.
+        memory_file: ruta de la instantánea binaria de persistencia. Si None, usa 'memory_ram.bin' en el cwd.
+            También se aceptan archivos .txt del formato antiguo (ver load_from_file).
         auto_load: si True, intenta cargar la RAM desde memory_file al construir.
-        auto_save_at_exit: si True, guarda automáticamente la RAM en memory_file al terminar el proceso.
+        auto_save_at_exit: si True, guarda la RAM en memory_file al terminar el proceso si cambió.
         """
         self.size = size
-        # array de bytes, inicializado a 0
-        self.mem = bytearray(size)
+        # array de bytes, inicializado a 0 (MappedMemory lo reemplaza por un mmap)
+        self.mem = self._allocate(size)
+
+        # Páginas que contienen código ya decodificado por algún consumidor
+        # (p.ej. la caché de instrucciones del CPU). Solo las escrituras que
+        # tocan estas páginas notifican a los listeners.
+        self._watched_pages: set[int] = set()
+        self._write_listeners: list = []
+
+        # Páginas escritas: generación de la última escritura por página. Cada
+        # consumidor incremental (visor de RAM, instantáneas...) guarda el token
+        # de fetch_dirty/dirty_token y luego solo procesa lo escrito después.
+        self._write_gen = 1
+        self._page_gen = [0] * ((size + PAGE_SIZE - 1) >> PAGE_SHIFT)
+        # Páginas no nulas en la última instantánea y token de esa instantánea
+        self._snapshot_pages: set[int] = set()
+        self._snapshot_token = 0
+
+        # Regiones de protección (las registra el Loader). Solo se hacen cumplir
+        # tras enable_protection(); mientras tanto los accesos no comprueban nada.
+        self.regions: list[Region] = []
+        self.protection = False
+        self._default_perms = PROT_RW
+        self._page_perms: bytearray | None = None
+
+        # Huella del contenido tras la última carga/guardado; None = RAM en cero
+        self._saved_digest = None
 
         # Configuración de archivo de memoria por defecto
-        self.memory_file = memory_file or os.path.join(os.getcwd(), "memory_ram.txt")
-
-        # Cargar contenido previo si existe y está habilitado
-        if auto_load and os.path.exists(self.memory_file):
-            try:
-                self.load_from_txt(self.memory_file)
-            except Exception:
-                # En caso de error al cargar, continuar con RAM en cero
-                pass
+        self.memory_file = memory_file or os.path.join(os.getcwd(), "memory_ram.bin")
+
+        # Cargar contenido previo si existe y está habilitado; si aún no hay
+        # instantánea pero sí un memory_ram.txt antiguo al lado, se importa ese
+        if auto_load:
+            legacy_txt = os.path.splitext(self.memory_file)[0] + ".txt"
+            path = self.memory_file if os.path.exists(self.memory_file) else legacy_txt
+            if os.path.exists(path):
+                try:
+                    self.load_from_file(path)
+                except Exception:
+                    # En caso de error al cargar, continuar con RAM en cero
+                    self._zero_fill()
+                    self._saved_digest = None
 
-        # Registrar guardado automático al salir
+        # Registrar guardado automático al salir (solo si la RAM cambió)
         if auto_save_at_exit:
             def _save_on_exit():
                 try:
-                    self.save_to_txt(self.memory_file)
+                    if self.is_dirty():
+                        self.persist()
                 except Exception:
                     pass
             atexit.register(_save_on_exit)
@@ -75,6 +240,15 @@ class Memory:
         # self.symbol_table_by_addr: Dict mapping addresses (int) to their symbol dicts.
         #   Allows fast lookup of symbol information by address.
         self.symbol_table_by_addr: dict = {}
+        # Índices de intervalos para find_symbol_at sin recorrer self.symbols
+        # (gana el símbolo registrado más tarde): absolutos por dirección y
+        # relativos a BP por desplazamiento (addr - BP)
+        self._abs_index = _IntervalIndex()
+        self._rel_index = _IntervalIndex()
+        self._symbol_keys: set = set()
+
+    def _allocate(self, size: int):
+        return bytearray(size)
 
     def _check_range(self, addr: int, nbytes: int):
         if addr < 0 or addr + nbytes > self.size:
@@ -83,38 +257,124 @@ class Memory:
     # ---------- Lecturas ----------
     def read(self, addr: int, size: int, signed: bool = False) -> int:
         """Leer un valor de size bytes (1, 2, 4, 8) desde memoria en little endian"""
-        if size not in (1, 2, 4, 8):
+        st = (_SIGNED if signed else _UNSIGNED).get(size)
+        if st is None:
             raise ValueError("El tamaño debe ser 1, 2, 4 u 8 bytes")
 
         self._check_range(addr, size)
-        data = self.mem[addr:addr+size]
-        return int.from_bytes(data, byteorder="little", signed=signed)
+        return st.unpack_from(self.mem, addr)[0]
+
+    def read_u8(self, addr: int) -> int:
+        if addr < 0 or addr + 1 > self.size:
+            self._check_range(addr, 1)
+        return self.mem[addr]
+
+    def read_u16(self, addr: int) -> int:
+        if addr < 0 or addr + 2 > self.size:
+            self._check_range(addr, 2)
+        return _U16.unpack_from(self.mem, addr)[0]
+
+    def read_u32(self, addr: int) -> int:
+        if addr < 0 or addr + 4 > self.size:
+            self._check_range(addr, 4)
+        return _U32.unpack_from(self.mem, addr)[0]
+
+    def read_u64(self, addr: int) -> int:
+        if addr < 0 or addr + 8 > self.size:
+            self._check_range(addr, 8)
+        return _U64.unpack_from(self.mem, addr)[0]
+
+    def read_f32(self, addr: int) -> float:
+        if addr < 0 or addr + 4 > self.size:
+            self._check_range(addr, 4)
+        return _F32.unpack_from(self.mem, addr)[0]
+
+    def read_f64(self, addr: int) -> float:
+        if addr < 0 or addr + 8 > self.size:
+            self._check_range(addr, 8)
+        return _F64.unpack_from(self.mem, addr)[0]
 
     # ---------- Escrituras ----------
     def write(self, addr: int, val: int, size: int):
         """Escribir un valor de size bytes (1, 2, 4, 8) en memoria en little endian"""
-        if size not in (1, 2, 4, 8):
+        st = _UNSIGNED.get(size)
+        if st is None:
             raise ValueError("El tamaño debe ser 1, 2, 4 u 8 bytes")
 
         self._check_range(addr, size)
-        # Convertir a bytes en little endian, siempre unsigned si es necesario
         intval = int(val)
-
-        # Rango signed para size bytes
-        signed_min = -(1 << (size*8 - 1))
-        signed_max = (1 << (size*8 - 1)) - 1
-
-        # Si cabe en signed → signed=True
-        if signed_min <= intval <= signed_max:
-            b = intval.to_bytes(size, "little", signed=True)
-        else:
-            # Caso (por ejemplo floats empaquetados) usar unsigned
-            b = intval.to_bytes(size, "little", signed=False)
-
-        self.mem[addr:addr+size] = b
+        # Negativos en complemento a dos; positivos (p.ej. floats empaquetados) sin signo
+        (_SIGNED[size] if intval < 0 else st).pack_into(self.mem, addr, intval)
+        self._mark_dirty(addr, size)
+        self._after_write(addr, size)
 
         # Intentionally no logging here; loader now logs .DATA moves.
 
+    # write_uN truncan el valor a N bits (como los registros de la CPU)
+    def write_u8(self, addr: int, val: int):
+        if addr < 0 or addr + 1 > self.size:
+            self._check_range(addr, 1)
+        self.mem[addr] = val & MASK8
+        self._page_gen[addr >> PAGE_SHIFT] = self._write_gen
+        if self._watched_pages:
+            self._after_write(addr, 1)
+
+    def write_u16(self, addr: int, val: int):
+        if addr < 0 or addr + 2 > self.size:
+            self._check_range(addr, 2)
+        _U16.pack_into(self.mem, addr, val & MASK16)
+        pg, gen = self._page_gen, self._write_gen
+        pg[addr >> PAGE_SHIFT] = pg[(addr + 1) >> PAGE_SHIFT] = gen
+        if self._watched_pages:
+            self._after_write(addr, 2)
+
+    def write_u32(self, addr: int, val: int):
+        if addr < 0 or addr + 4 > self.size:
+            self._check_range(addr, 4)
+        _U32.pack_into(self.mem, addr, val & MASK32)
+        pg, gen = self._page_gen, self._write_gen
+        pg[addr >> PAGE_SHIFT] = pg[(addr + 3) >> PAGE_SHIFT] = gen
+        if self._watched_pages:
+            self._after_write(addr, 4)
+
+    def write_u64(self, addr: int, val: int):
+        if addr < 0 or addr + 8 > self.size:
+            self._check_range(addr, 8)
+        _U64.pack_into(self.mem, addr, val & MASK64)
+        pg, gen = self._page_gen, self._write_gen
+        pg[addr >> PAGE_SHIFT] = pg[(addr + 7) >> PAGE_SHIFT] = gen
+        if self._watched_pages:
+            self._after_write(addr, 8)
+
+    def write_f32(self, addr: int, val: float):
+        if addr < 0 or addr + 4 > self.size:
+            self._check_range(addr, 4)
+        _F32.pack_into(self.mem, addr, val)
+        self._mark_dirty(addr, 4)
+        if self._watched_pages:
+            self._after_write(addr, 4)
+
+    def write_f64(self, addr: int, val: float):
+        if addr < 0 or addr + 8 > self.size:
+            self._check_range(addr, 8)
+        _F64.pack_into(self.mem, addr, val)
+        self._mark_dirty(addr, 8)
+        if self._watched_pages:
+            self._after_write(addr, 8)
+
+    def _mark_dirty(self, addr: int, nbytes: int):
+        if nbytes > 0:
+            first, last = addr >> PAGE_SHIFT, (addr + nbytes - 1) >> PAGE_SHIFT
+            if first == last:
+                self._page_gen[first] = self._write_gen
+            else:
+                self._page_gen[first:last + 1] = [self._write_gen] * (last - first + 1)
+
+    def _after_write(self, addr: int, size: int):
+        wp = self._watched_pages
+        if wp and ((addr >> PAGE_SHIFT) in wp or ((addr + size - 1) >> PAGE_SHIFT) in wp):
+            self._notify_write(addr, size)
+
     # ---------- Utilidades ----------
     def dump(self, start: int = 0, end: int = 64):
         """Volcar memoria en hex desde start a end"""
@@ -128,6 +388,191 @@ class Memory:
         """Cargar bytes crudos en memoria"""
         self._check_range(addr, len(data))
         self.mem[addr:addr+len(data)] = data
+        self._mark_dirty(addr, len(data))
+        if self._watched_pages and data:
+            self._notify_if_watched(addr, len(data))
+
+    # ---------- DMA con archivos ----------
+    def dma_from_file(self, f, addr: int, nbytes: int) -> int:
+        """Copia nbytes del archivo (posición actual) a [addr, addr+nbytes) con un solo
+        readinto sobre la RAM; lo que falte tras EOF queda a cero. Devuelve los bytes leídos."""
+        self._check_range(addr, nbytes)
+        self._check_perms("write", addr, nbytes, PROT_W)
+        with memoryview(self.mem)[addr:addr + nbytes] as view:
+            n = f.readinto(view) or 0
+            if n < nbytes:
+                view[n:] = bytes(nbytes - n)
+        self._mark_dirty(addr, nbytes)
+        if self._watched_pages and nbytes:
+            self._notify_if_watched(addr, nbytes)
+        return n
+
+    def dma_to_file(self, f, addr: int, nbytes: int) -> int:
+        """Escribe [addr, addr+nbytes) en el archivo (posición actual) sin copias intermedias."""
+        self._check_range(addr, nbytes)
+        self._check_perms("read", addr, nbytes, PROT_R)
+        with memoryview(self.mem)[addr:addr + nbytes] as view:
+            return f.write(view)
+
+    # ---------- Regiones y protección ----------
+    def set_region(self, name: str, start: int, end: int, perms: int):
+        """Define (o redefine, si ya existe ese nombre) la región [start, end).
+        A nivel de página los permisos de regiones solapadas se suman."""
+        self._check_range(start, end - start)
+        old = [r for r in self.regions if r.name == name]
+        self.regions = [r for r in self.regions if r.name != name]
+        self.regions.append(Region(name, start, end, perms))
+        if self.protection:
+            self._rebuild_perms()
+            # El código cacheado de esas páginas debe volver a comprobar PROT_X
+            for r in old + [self.regions[-1]]:
+                if r.end > r.start:
+                    self._notify_write(r.start, r.end - r.start)
+
+    def remove_region(self, name: str):
+        removed = [r for r in self.regions if r.name == name]
+        self.regions = [r for r in self.regions if r.name != name]
+        if self.protection and removed:
+            self._rebuild_perms()
+            for r in removed:
+                if r.end > r.start:
+                    self._notify_write(r.start, r.end - r.start)
+
+    def region_at(self, addr: int) -> Region | None:
+        """Región más reciente que contiene addr."""
+        for region in reversed(self.regions):
+            if region.start <= addr < region.end:
+                return region
+        return None
+
+    def enable_protection(self, enabled: bool = True, default: int = PROT_RW):
+        """Activa la comprobación de permisos por página en los accesos del
+        programa (read_uN/write_uN/..._fN y la ejecución). Las páginas fuera de
+        toda región usan `default` (por defecto datos: lectura/escritura, sin
+        ejecución). Desactivada, los accesos vuelven a ser los de la clase, sin
+        ninguna comprobación. read/write/load_bytes genéricos (Loader, GUI) no
+        se comprueban nunca.
+        """
+        self.protection = enabled
+        self._default_perms = default
+        if enabled:
+            self._rebuild_perms()
+            for name, st in _GUEST_READS.items():
+                setattr(self, name, self._checked_read(st))
+            for name, (st, mask) in _GUEST_WRITES.items():
+                setattr(self, name, self._checked_write(st, mask))
+        else:
+            self._page_perms = None
+            for name in (*_GUEST_READS, *_GUEST_WRITES):
+                self.__dict__.pop(name, None)
+        # Los consumidores que guardaron referencias a los accesos (bloques
+        # traducidos) o código ya validado deben reconstruirse
+        self._notify_write(0, self.size)
+
+    def _rebuild_perms(self):
+        npages = (self.size + PAGE_SIZE - 1) >> PAGE_SHIFT
+        by_page = {}
+        for region in self.regions:
+            if region.end <= region.start:
+                continue
+            for page in range(region.start >> PAGE_SHIFT, ((region.end - 1) >> PAGE_SHIFT) + 1):
+                by_page[page] = by_page.get(page, 0) | region.perms
+        perms = self._page_perms
+        if perms is None or len(perms) != npages:
+            perms = self._page_perms = bytearray(npages)
+        perms[:] = bytes([self._default_perms]) * npages
+        for page, p in by_page.items():
+            perms[page] = p
+
+    # Versiones comprobadas de read_uN/write_uN: mismo trabajo que las de la
+    # clase más la consulta de permisos de la página inicial y la final
+    def _checked_read(self, st):
+        unpack, size, mem, perms = st.unpack_from, st.size, self.mem, self._page_perms
+        last = self.size - size
+
+        def checked(addr):
+            if 0 <= addr <= last:
+                if perms[addr >> PAGE_SHIFT] & perms[(addr + size - 1) >> PAGE_SHIFT] & PROT_R:
+                    return unpack(mem, addr)[0]
+                self._fault("read", addr, size)
+            self._check_range(addr, size)
+        return checked
+
+    def _checked_write(self, st, mask):
+        pack, size, mem, perms = st.pack_into, st.size, self.mem, self._page_perms
+        pg = self._page_gen
+        last = self.size - size
+
+        def checked(addr, val):
+            if 0 <= addr <= last:
+                if perms[addr >> PAGE_SHIFT] & perms[(addr + size - 1) >> PAGE_SHIFT] & PROT_W:
+                    pack(mem, addr, val & mask if mask is not None else val)
+                    pg[addr >> PAGE_SHIFT] = pg[(addr + size - 1) >> PAGE_SHIFT] = self._write_gen
+                    if self._watched_pages:
+                        self._after_write(addr, size)
+                    return
+                self._fault("write", addr, size)
+            self._check_range(addr, size)
+        return checked
+
+    def _fault(self, access: str, addr: int, size: int):
+        region = self.region_at(addr)
+        raise MemoryFault(access, addr, size, region.name if region else None)
+
+    def _check_perms(self, access: str, addr: int, nbytes: int, bit: int):
+        perms = self._page_perms
+        if perms is None or nbytes <= 0:
+            return
+        for page in range(addr >> PAGE_SHIFT, ((addr + nbytes - 1) >> PAGE_SHIFT) + 1):
+            if not perms[page] & bit:
+                self._fault(access, max(addr, page << PAGE_SHIFT), nbytes)
+
+    def check_exec(self, addr: int, nbytes: int = 8):
+        """Lanza MemoryFault("exec") si la protección está activa y [addr, addr+nbytes)
+        no es ejecutable."""
+        perms = self._page_perms
+        if perms is None or not 0 <= addr <= self.size - nbytes:
+            return
+        if not perms[addr >> PAGE_SHIFT] & perms[(addr + nbytes - 1) >> PAGE_SHIFT] & PROT_X:
+            self._fault("exec", addr, nbytes)
+
+    def can_exec(self, addr: int, nbytes: int = 8) -> bool:
+        perms = self._page_perms
+        if perms is None or not 0 <= addr <= self.size - nbytes:
+            return True
+        return bool(perms[addr >> PAGE_SHIFT] & perms[(addr + nbytes - 1) >> PAGE_SHIFT] & PROT_X)
+
+    # ---------- Vigilancia de escrituras sobre código ----------
+    def watch_code(self, addr: int, nbytes: int):
+        """Marca las páginas de [addr, addr+nbytes) como código: las escrituras
+        posteriores sobre ellas se notifican a los listeners registrados."""
+        for page in range(addr >> PAGE_SHIFT, ((addr + nbytes - 1) >> PAGE_SHIFT) + 1):
+            self._watched_pages.add(page)
+
+    def add_write_listener(self, callback):
+        """Registra callback(addr, nbytes), invocado cuando una escritura toca una
+        página vigilada. Los métodos ligados se guardan con referencia débil para
+        que un CPU descartado (p.ej. tras reset_cpu en la GUI) no quede vivo."""
+        try:
+            ref = weakref.WeakMethod(callback)
+        except TypeError:
+            ref = lambda cb=callback: cb
+        self._write_listeners.append(ref)
+
+    def _notify_if_watched(self, addr: int, nbytes: int):
+        wp = self._watched_pages
+        for page in range(addr >> PAGE_SHIFT, ((addr + nbytes - 1) >> PAGE_SHIFT) + 1):
+            if page in wp:
+                self._notify_write(addr, nbytes)
+                return
+
+    def _notify_write(self, addr: int, nbytes: int):
+        for ref in list(self._write_listeners):
+            callback = ref()
+            if callback is None:
+                self._write_listeners.remove(ref)
+                continue
+            callback(addr, nbytes)
 
     def register_symbol(self, name: str, addr: int | None, size: int, meta: dict | None = None):
         """Register a symbol name with its address and size for runtime lookup.
@@ -141,11 +586,13 @@ class Memory:
             return
         meta = meta or {}
         # avoid exact duplicate registrations (same name, addr, size, meta)
-        for s in self.symbols:
-            if s['name'] == name and s.get('addr') == addr and s['size'] == size and s.get('meta', {}) == meta:
-                return False
+        key = (name, addr, size, repr(sorted(meta.items())))
+        if key in self._symbol_keys:
+            return False
+        self._symbol_keys.add(key)
 
         entry = {'name': name, 'addr': addr, 'size': size, 'meta': meta}
+        seq = len(self.symbols)
         self.symbols.append(entry)
 
         # maintain name index as a list of (addr,size) entries to allow
@@ -155,6 +602,11 @@ class Memory:
         # only index by absolute address when addr is provided
         if addr is not None:
             self.symbol_table_by_addr[addr] = name
+            self._abs_index.add(addr, addr + size, seq, entry)
+
+        if 'local_rel' in meta:
+            rel = meta['local_rel']
+            self._rel_index.add(rel, rel + size, seq, entry)
 
         return True
 
@@ -164,24 +616,19 @@ class Memory:
         registered with meta['local_rel'].
         Returns None if no symbol matches.
         """
-        # Prefer most-recently registered symbols: iterate in reverse order
-        for s in reversed(self.symbols):
-            a = s.get('addr')
-            if a is not None and a <= addr < a + s['size']:
-                return s
+        # Prefer most-recently registered symbols: highest registration order wins
+        best = self._abs_index.find(addr)
+        if best is not None:
+            return best
 
         # If caller provided BP, try resolving relative symbols (also prefer recent registrations)
         if bp is not None:
-            for s in reversed(self.symbols):
-                meta = s.get('meta') or {}
-                if 'local_rel' in meta:
-                    rel = meta['local_rel']
-                    base = bp + rel
-                    if base <= addr < base + s['size']:
-                        # return a copy with resolved addr for convenience
-                        resolved = s.copy()
-                        resolved['addr'] = base
-                        return resolved
+            s = self._rel_index.find(addr - bp)
+            if s is not None:
+                # return a copy with resolved addr for convenience
+                resolved = s.copy()
+                resolved['addr'] = bp + s['meta']['local_rel']
+                return resolved
 
         return None
 
@@ -198,12 +645,202 @@ class Memory:
 
     def __setitem__(self, key, value):
         self.mem[key] = value
+        if isinstance(key, slice):
+            start, stop, _ = key.indices(self.size)
+            nbytes = stop - start
+        else:
+            start, nbytes = key % self.size, 1
+        self._mark_dirty(start, nbytes)
+        if self._watched_pages and nbytes > 0:
+            self._notify_if_watched(start, nbytes)
 
     def clear(self):
         """Limpia toda la RAM poniéndola en cero."""
-        self.mem[:] = b"\x00" * self.size
+        self._zero_fill()
+        self._mark_dirty(0, self.size)
+        if self._watched_pages:
+            self._notify_write(0, self.size)
+
+    def _zero_fill(self):
+        """Pone la RAM en cero por tramos, sin construir un bytes del tamaño total."""
+        step = len(_ZERO_CHUNK)
+        with memoryview(self.mem) as view:
+            for start in range(0, self.size, step):
+                end = min(start + step, self.size)
+                view[start:end] = _ZERO_CHUNK[:end - start]
+
+    def _is_zero(self) -> bool:
+        step = len(_ZERO_CHUNK)
+        with memoryview(self.mem) as view:
+            for start in range(0, self.size, step):
+                end = min(start + step, self.size)
+                if view[start:end] != _ZERO_CHUNK[:end - start]:
+                    return False
+        return True
 
-    # ---------- Persistencia en .txt ----------
+    # ---------- Páginas escritas ----------
+    def dirty_token(self) -> int:
+        """Token para dirty_ranges/fetch_dirty: lo escrito a partir de ahora cuenta como sucio."""
+        token = self._write_gen
+        self._write_gen += 1
+        return token
+
+    def _dirty_pages(self, since: int) -> list[int]:
+        return [page for page, gen in enumerate(self._page_gen) if gen > since]
+
+    def dirty_ranges(self, since: int = 0) -> list[tuple[int, int]]:
+        """Rangos [inicio, fin) escritos después del token since, a granularidad de
+        página (PAGE_SIZE) y con las páginas contiguas fusionadas. since=0: todo lo escrito."""
+        ranges = []
+        for page in self._dirty_pages(since):
+            start = page << PAGE_SHIFT
+            end = min(start + PAGE_SIZE, self.size)
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], end)
+            else:
+                ranges.append((start, end))
+        return ranges
+
+    def fetch_dirty(self, since: int = 0) -> tuple[list[tuple[int, int]], int]:
+        """(dirty_ranges(since), token nuevo): el consumidor guarda el token para la próxima vez.
+
+            ranges, self.token = memory.fetch_dirty(self.token)
+        """
+        return self.dirty_ranges(since), self.dirty_token()
+
+    # ---------- Instantáneas en memoria (snapshot/restore) ----------
+    def snapshot(self) -> MemorySnapshot:
+        """Copia inmutable de la RAM. La copia es un único memcpy; lo que
+        escala con el uso es restore(), que repone solo las páginas tocadas."""
+        token = self.dirty_token()
+        return MemorySnapshot(bytes(self.mem), token)
+
+    def restore(self, snap: MemorySnapshot):
+        """Devuelve la RAM al contenido de snap copiando solo las páginas escritas
+        desde el snapshot (o desde el último restore de ese snapshot).
+        Devuelve los bytes copiados."""
+        if len(snap.data) != self.size:
+            raise ValueError(f"Instantánea de {len(snap.data)} bytes para una RAM de {self.size}")
+        data = memoryview(snap.data)
+        restored = 0
+        for start, end in self.dirty_ranges(snap.token):
+            self.mem[start:end] = data[start:end]
+            # Otros consumidores (visor de RAM, instantáneas en disco) deben verlo
+            self._mark_dirty(start, end - start)
+            if self._watched_pages:
+                self._notify_if_watched(start, end - start)
+            restored += end - start
+        snap.token = self.dirty_token()
+        return restored
+
+    # ---------- Persistencia binaria ----------
+    def _digest(self) -> bytes:
+        return hashlib.blake2b(self.mem, digest_size=16).digest()
+
+    def is_dirty(self) -> bool:
+        """True si la RAM cambió desde la última carga o guardado de archivo."""
+        if not any(gen > self._snapshot_token for gen in self._page_gen):
+            return False
+        if self._saved_digest is None:
+            return not self._is_zero()
+        return self._digest() != self._saved_digest
+
+    def persist(self):
+        """Guarda la RAM en memory_file (instantánea binaria)."""
+        self.save_snapshot(self.memory_file)
+
+    def save_snapshot(self, path: str, compress: bool = True):
+        """Guarda la RAM como instantánea binaria: solo las páginas no nulas,
+        comprimidas con zlib si compress. Escribe a un temporal y lo renombra."""
+        npages = (self.size + PAGE_SIZE - 1) >> PAGE_SHIFT
+        view = memoryview(self.mem)
+        zero = bytes(PAGE_SIZE)
+        # Solo se revisan las páginas escritas desde la instantánea anterior. En la
+        # primera se revisa todo: puede haber contenido que no pasó por una
+        # escritura registrada (p.ej. un archivo mapeado que ya existía)
+        nonzero = self._snapshot_pages
+        if self._snapshot_token:
+            candidates = self._dirty_pages(self._snapshot_token)
+        else:
+            candidates = range(npages)
+        for page in candidates:
+            chunk = view[page << PAGE_SHIFT:(page + 1) << PAGE_SHIFT]
+            if chunk != zero[:len(chunk)]:
+                nonzero.add(page)
+            else:
+                nonzero.discard(page)
+        bitmap = bytearray((npages + 7) // 8)
+        pages = []
+        for page in sorted(nonzero):
+            bitmap[page >> 3] |= 1 << (page & 7)
+            pages.append(view[page << PAGE_SHIFT:(page + 1) << PAGE_SHIFT])
+        payload = b"".join(pages)
+        flags = 0
+        if compress:
+            payload = zlib.compress(payload, 1)
+            flags |= SNAPSHOT_ZLIB
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, 'wb') as f:
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags, self.size, PAGE_SIZE, len(pages)))
+            f.write(bitmap)
+            f.write(payload)
+        os.replace(tmp, path)
+        self._saved_digest = self._digest()
+        self._snapshot_token = self.dirty_token()
+
+    def load_snapshot(self, path: str):
+        """Carga una instantánea de save_snapshot. Como load_from_txt, si la
+        instantánea es más pequeña el resto queda en 0 y si es mayor se ignora el excedente."""
+        with open(path, 'rb') as f:
+            header = f.read(SNAPSHOT_HEADER.size)
+            if len(header) < SNAPSHOT_HEADER.size:
+                raise ValueError(f"{path}: instantánea de RAM truncada")
+            magic, version, flags, size, page_size, nstored = SNAPSHOT_HEADER.unpack(header)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION or page_size != PAGE_SIZE:
+                raise ValueError(f"{path}: no es una instantánea de RAM v{SNAPSHOT_VERSION}")
+            npages = (size + PAGE_SIZE - 1) >> PAGE_SHIFT
+            bitmap = f.read((npages + 7) // 8)
+            pages = [p for p in range(npages) if bitmap[p >> 3] >> (p & 7) & 1]
+            if len(pages) != nstored:
+                raise ValueError(f"{path}: mapa de páginas inconsistente")
+            lengths = [min(PAGE_SIZE, size - (p << PAGE_SHIFT)) for p in pages]
+            if flags & SNAPSHOT_ZLIB:
+                payload = zlib.decompress(f.read())
+            else:
+                payload = bytearray(sum(lengths))
+                f.readinto(payload)
+
+        self._zero_fill()
+        self._mark_dirty(0, self.size)
+        view = memoryview(payload)
+        offset = 0
+        loaded = set()
+        for page, length in zip(pages, lengths):
+            start = page << PAGE_SHIFT
+            n = min(length, self.size - start)
+            if n > 0:
+                self.mem[start:start + n] = view[offset:offset + n]
+                loaded.add(page)
+            offset += length
+        if self._watched_pages:
+            self._notify_write(0, self.size)
+        self._saved_digest = self._digest()
+        self._snapshot_pages = loaded
+        self._snapshot_token = self.dirty_token()
+
+    def load_from_file(self, path: str):
+        """Carga la RAM desde una instantánea binaria o, si no lo es, desde el formato .txt."""
+        with open(path, 'rb') as f:
+            is_snapshot = f.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+        if is_snapshot:
+            self.load_snapshot(path)
+        else:
+            self.load_from_txt(path)
+            self._saved_digest = self._digest()
+
+    # ---------- Exportación/importación en .txt ----------
     def save_to_txt(self, path: str):
         """
         Guarda la RAM completa en un archivo .txt en formato legible:
@@ -229,7 +866,10 @@ class Memory:
         Si el archivo contiene menos bytes que la RAM, el resto quedará en 0. Si contiene más, se ignora el excedente.
         """
         # Resetear RAM a cero antes de cargar
-        self.mem[:] = b"\x00" * self.size
+        self._zero_fill()
+        self._mark_dirty(0, self.size)
+        if self._watched_pages:
+            self._notify_write(0, self.size)
 
         hex_byte_re = re.compile(r'\b([0-9A-Fa-f]{2})\b')
         write_ptr = 0
@@ -245,4 +885,91 @@ class Memory:
                     byte_val = int(m.group(1), 16)
                     self.mem[write_ptr] = byte_val
                     write_ptr += 1
-        # Si el archivo tiene menos bytes, el resto ya está en 0
\ No newline at end of file
+        # Si el archivo tiene menos bytes, el resto ya está en 0
+
+class MappedMemory(Memory):
+    """
+    Memory respaldada por un archivo mapeado con mmap: la RAM *es* el archivo.
+
+    read/write/get_bytes operan directamente sobre el mapeo, así que crear la
+    máquina y salir no cuestan O(tamaño): el archivo se extiende de forma
+    dispersa (las páginas nunca escritas no ocupan disco) y el sistema operativo
+    vuelca solo las páginas modificadas (también al terminar el proceso, sin
+    atexit). Otro proceso (o instancia) que mapee el mismo archivo ve las
+    mismas escrituras sin copias.
+
+        mem = MappedMemory(64 * 2**20, "ram.map")
+    """
+    def __init__(self, size: int, path: str, **kwargs):
+        self.path = os.path.abspath(path)
+        kwargs.setdefault('memory_file', self.path)
+        # El contenido persistente es el propio archivo: no hay carga ni guardado de instantánea
+        kwargs['auto_load'] = False
+        kwargs['auto_save_at_exit'] = False
+        super().__init__(size, **kwargs)
+        self._persist_token = 0
+
+    def _allocate(self, size: int):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            existing = os.fstat(fd).st_size
+            # Un archivo que ya existía trae contenido que no pasó por write():
+            # _dirty_pages lo marca la primera vez que alguien pregunta
+            self._unseeded = existing > 0
+            if existing < size:
+                os.ftruncate(fd, size)
+            return mmap.mmap(fd, size, access=mmap.ACCESS_WRITE)
+        finally:
+            # mmap duplica el descriptor; el mapeo sigue válido
+            os.close(fd)
+
+    def _dirty_pages(self, since: int) -> list[int]:
+        if self._unseeded:
+            self._seed_existing_pages()
+        return super()._dirty_pages(since)
+
+    def _seed_existing_pages(self):
+        """Marca las páginas no nulas del archivo con la generación 1 (anterior a
+        cualquier token), sin pisar las escritas desde que se abrió."""
+        self._unseeded = False
+        view = memoryview(self.mem)
+        zero = bytes(PAGE_SIZE)
+        pg = self._page_gen
+        step = len(_ZERO_CHUNK)
+        for base in range(0, self.size, step):
+            end = min(base + step, self.size)
+            # Los tramos nulos (lo habitual en un archivo disperso) se saltan enteros
+            if view[base:end] == _ZERO_CHUNK[:end - base]:
+                continue
+            for page in range(base >> PAGE_SHIFT, (end + PAGE_SIZE - 1) >> PAGE_SHIFT):
+                if pg[page] == 0:
+                    chunk = view[page << PAGE_SHIFT:(page + 1) << PAGE_SHIFT]
+                    if chunk != zero[:len(chunk)]:
+                        pg[page] = 1
+
+    def is_dirty(self) -> bool:
+        """Un mapeo nunca está pendiente de guardar: cada escritura ya es el archivo."""
+        return False
+
+    def persist(self):
+        """Fuerza el volcado a disco de lo escrito desde el persist() anterior."""
+        if self.mem.closed:
+            return
+        ranges, self._persist_token = self.fetch_dirty(self._persist_token)
+        for start, end in ranges:
+            # msync exige desplazamientos alineados a la página del sistema
+            start -= start % mmap.PAGESIZE
+            self.mem.flush(start, end - start)
+
+    def save_snapshot(self, path: str, compress: bool = True):
+        # os.replace sobre el archivo mapeado dejaría el mapeo apuntando a un inodo huérfano
+        if os.path.abspath(path) == self.path:
+            raise ValueError(f"{path}: es el archivo mapeado de esta RAM; use persist()")
+        super().save_snapshot(path, compress)
+
+    def close(self):
+        """Vuelca y libera el mapeo. La memoria no puede usarse después."""
+        if not self.mem.closed:
+            self.mem.flush()
+            self.mem.close()
@@ -1,6 +1,7 @@
 from GUI.GUI import SimuladorGUI
-from machine.Memory.Memory import Memory
+from machine.Memory.Memory import Memory, MappedMemory
 from machine.CPU.CPU import CPU
+from machine.CPU.StoreTrace import StoreTracer
 from machine.IO.Devices import Screen,Keyboard
 from machine.IO.IOsystem import IOSystem
 import os
@@ -8,16 +9,25 @@ import logging
 
 # Usar una ruta explícita para evitar archivos duplicados de RAM
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-RAM_FILE = os.path.join(BASE_DIR, "memory_ram.txt")
+# Instantánea binaria; si aún no existe se importa memory_ram.txt (formato anterior)
+RAM_FILE = os.path.join(BASE_DIR, "memory_ram.bin")
 
 logging.basicConfig(level=logging.WARNING)
 # Keep loader .DATA init messages visible
 logging.getLogger("compiler.loader").setLevel(logging.INFO)
-# Keep CPU variable-store messages visible
+# Keep CPU variable-store messages visible (the GUI flushes the STORE trace after each run/step)
 logging.getLogger("machine.cpu").setLevel(logging.INFO)
 # By default keep debug logging hidden. To see detailed memory/CPU traces set logging to DEBUG.
 # Memory size increased from 2**16 (64KB) to 2**17 (128KB) to support larger programs and additional features that require more RAM.
-mem = Memory(2**17, memory_file=RAM_FILE, debug_writes=False, debug_stack_writes=False)
+MEM_SIZE = 2**17
+# Para espacios de direcciones de varios MB, mapear la RAM sobre un archivo
+# (p.ej. os.path.join(BASE_DIR, "memory_ram.map")): arrancar y salir no dependen del tamaño.
+RAM_MAP_FILE = None
+
+if RAM_MAP_FILE:
+    mem = MappedMemory(MEM_SIZE, RAM_MAP_FILE, debug_writes=False, debug_stack_writes=False)
+else:
+    mem = Memory(MEM_SIZE, memory_file=RAM_FILE, debug_writes=False, debug_stack_writes=False)
 
 io = IOSystem()
 
@@ -34,6 +44,8 @@ io.register(0x200,keyboard)
 # keyboard.write(0)
 
 cpu = CPU(mem,io)
+# STORE tracing is only paid for in the GUI; headless runs leave it off
+cpu.set_store_tracer(StoreTracer())
 app = SimuladorGUI(cpu,screen,keyboard)
 
 app.mainloop()
\ No newline at end of file
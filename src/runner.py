@@ -0,0 +1,292 @@
+"""
+Ejecución sin interfaz gráfica (no importa tkinter).
+
+Uso:
+    python src/runner.py programa.txt             # alto nivel: preprocesa, compila, ensambla...
+    python src/runner.py programa.asm             # ensamblador Atlas
+    python src/runner.py prog.txt --link lib/relocatables/basic_math.relo
+    echo "hola" | python src/runner.py eco.asm    # el teclado se alimenta desde stdin
+    python src/runner.py prog.txt --profile-json perfil.json   # perfil de ejecución
+    python src/runner.py prog.asm --link lib/disk.asm --disk datos.img   # disco de bloques
+
+La pantalla (puerto 0x100) escribe en stdout y el teclado (puerto 0x200) lee
+de stdin: cada línea se entrega carácter a carácter seguida de un 0, igual
+que la caja de entrada de la GUI. Con --disk se conecta un disco de bloques
+sobre un archivo en los puertos 0x400-0x406 (ver lib/disk.asm). Con
+--interrupts se conectan el controlador de interrupciones (0x500-0x501) y un
+temporizador (0x510-0x513, línea 0); el teclado usa la línea 1 (ver
+machine/IO/Interrupts.py, EI/DI/SETIV/WAIT/RTI). Los ciclos
+ejecutados y el tiempo de pared se informan por stderr para no mezclarse con
+la salida del programa.
+"""
+import argparse
+import contextlib
+import io
+import logging
+import sys
+import threading
+import time
+
+from machine.Memory.Memory import Memory, MappedMemory, MemoryFault
+from machine.CPU.CPU import CPU
+from machine.IO.Devices import Screen, Keyboard, BlockDevice
+from machine.IO.IOsystem import IOSystem
+from machine.IO.Interrupts import InterruptController, Timer
+from machine.CPU.Profiler import Profiler
+from machine.CPU.StoreTrace import StoreTracer
+
+from compiler.ensamblador import Ensamblador, CodigoRelo
+from compiler.Linker import Linker
+from compiler.Loader import Loader
+
+logger = logging.getLogger("machine.runner")
+
+SCREEN_PORT = 0x100
+KEYBOARD_PORT = 0x200
+DISK_PORT = 0x400
+IRQ_PORT = 0x500
+TIMER_PORT = 0x510
+TIMER_IRQ = 0
+KEYBOARD_IRQ = 1
+
+
+class BuildError(Exception):
+    """El programa no pudo compilarse, ensamblarse o enlazarse."""
+
+
+def compile_source(text, base_path=".", log=None):
+    """Preprocesa y compila código de alto nivel; devuelve el ensamblador generado."""
+    from compiler.Preprocessor import preprocess
+    from compiler.syntax_analizer import parse
+    from compiler.semantic_analyzer import SemanticAnalyzer
+    from compiler.code_generator import generate_code
+
+    # El compilador imprime trazas en stdout, que aquí es la pantalla de la máquina
+    with contextlib.redirect_stdout(log or io.StringIO()):
+        ast = parse(preprocess(text, base_path=base_path))
+        if not ast:
+            raise BuildError("Error de Sintaxis: No se pudo parsear el código")
+        analyzer = SemanticAnalyzer()
+        analyzer.analyze(ast)
+        for error in analyzer.errors:
+            logger.warning("%s", error)
+        assembly_code = generate_code(ast, analyzer.symbol_table)
+    if not assembly_code:
+        raise BuildError("No se pudo generar código Assembly")
+    return assembly_code
+
+
+def build_program(path, libs=(), base_path=".", log=None):
+    """Devuelve el CodigoRelo enlazado de un programa (.txt, .asm o .relo) y sus librerías."""
+    relos = [load_relocatable(p, base_path, log) for p in [path, *libs]]
+    programa = relos[0]
+    if len(relos) > 1:
+        linker = Linker()
+        linker.relocatables = relos
+        with contextlib.redirect_stdout(log or io.StringIO()):
+            programa = linker.get_liked_code()
+    if programa.extern_labels:
+        raise BuildError(f"Hay referencias sin resolver: {programa.extern_labels}")
+    return programa
+
+
+def load_relocatable(path, base_path=".", log=None):
+    """Ensambla (y compila si es de alto nivel) un archivo; los .relo se leen tal cual."""
+    if path.endswith(".relo"):
+        return CodigoRelo.load_relo(path)
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    if not path.endswith(".asm"):
+        text = compile_source(text, base_path, log)
+    with contextlib.redirect_stdout(log or io.StringIO()):
+        return Ensamblador().assemble(text)
+
+
+def new_machine(mem_size=2**17, out=None, mem_file=None, disk_file=None, interrupts=False):
+    """CPU con pantalla y teclado en los puertos de main.py; la pantalla escribe en `out`.
+    Con mem_file la RAM se mapea sobre ese archivo (MappedMemory) y persiste entre ejecuciones.
+    Con disk_file se conecta un BlockDevice en DISK_PORT (cpu.io.get_device(DISK_PORT)) y
+    con interrupts el controlador en IRQ_PORT, un Timer en TIMER_PORT y el teclado como IRQ."""
+    if mem_file:
+        mem = MappedMemory(mem_size, mem_file)
+    else:
+        mem = Memory(mem_size, auto_load=False, auto_save_at_exit=False)
+    io_system = IOSystem()
+    screen = Screen()
+    keyboard = Keyboard()
+    io_system.register(SCREEN_PORT, screen)
+    io_system.register(KEYBOARD_PORT, keyboard)
+    if disk_file:
+        try:
+            disk = BlockDevice(disk_file, mem)
+        except OSError:
+            # No dejar abierto el mapeo de --mem-file si el disco no se puede abrir
+            if hasattr(mem, 'close'):
+                mem.close()
+            raise
+        io_system.register_range(DISK_PORT, BlockDevice.PORTS, disk)
+    if interrupts:
+        io_system.attach_interrupts(InterruptController(), IRQ_PORT)
+        io_system.register_range(TIMER_PORT, Timer.PORTS, Timer())
+        io_system.route_irq(TIMER_PORT, TIMER_IRQ)
+        io_system.route_irq(KEYBOARD_PORT, KEYBOARD_IRQ)
+    if out is not None:
+        def _on_show(chunk):
+            out.write(chunk)
+            out.flush()
+        screen.on_show = _on_show
+    # Lo pendiente en pantalla se entrega antes de esperar por el teclado
+    keyboard.on_empty = screen.flush
+    return CPU(mem, io_system), screen, keyboard
+
+
+def feed_keyboard(keyboard, lines):
+    """Entrega cada línea al teclado terminada en 0 (NULL), como la GUI."""
+    for line in lines:
+        for ch in line.rstrip("\r\n"):
+            keyboard.write(ord(ch))
+        keyboard.write(0)
+
+
+def _feed_until_eof(keyboard, stdin):
+    try:
+        feed_keyboard(keyboard, stdin)
+    finally:
+        keyboard.close()
+
+
+def attach_stdin(keyboard, stdin):
+    """Con una terminal lee en segundo plano; con tubería o archivo lo carga todo antes de ejecutar.
+
+    En la terminal el teclado pasa a modo bloqueante: LOADIO espera a la
+    siguiente tecla en lugar de girar; con EOF (Ctrl-D) deja de esperar."""
+    if stdin is None or stdin.closed:
+        return
+    if stdin.isatty():
+        keyboard.blocking = True
+        thread = threading.Thread(target=_feed_until_eof, args=(keyboard, stdin), daemon=True)
+        thread.start()
+    else:
+        feed_keyboard(keyboard, stdin.readlines())
+        keyboard.close()
+
+
+def run(cpu, max_cycles, engine, profiler=None):
+    """Ejecuta la CPU; devuelve (ciclos, segundos, terminó_por_PARAR)."""
+    t0 = time.perf_counter()
+    try:
+        cycles = cpu.run(max_cycles=max_cycles, engine=engine, profiler=profiler)
+        halted = True
+    except RuntimeError as e:
+        # Solo el límite de ciclos; SETIV sin controlador, RecursionError... son errores de ejecución
+        if str(e) != "Max cycles reached":
+            raise
+        cycles = max_cycles
+        halted = False
+    return cycles, time.perf_counter() - t0, halted
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ejecuta un programa Atlas sin interfaz gráfica")
+    parser.add_argument("program", help="programa de alto nivel (.txt), ensamblador (.asm) o .relo")
+    parser.add_argument("--link", action="append", default=[], metavar="ARCHIVO",
+                        help="relocalizable (.relo/.asm) a enlazar tras el programa; repetible")
+    parser.add_argument("--base-path", default=".",
+                        help="directorio desde el que se resuelven los #include con comillas")
+    parser.add_argument("--start", type=lambda s: int(s, 0), default=0, help="dirección de carga")
+    parser.add_argument("--mem-size", type=lambda s: int(s, 0), default=2**17)
+    parser.add_argument("--mem-file", default=None, metavar="ARCHIVO",
+                        help="mapea la RAM sobre este archivo (mmap) en lugar de reservarla en el proceso")
+    parser.add_argument("--disk", default=None, metavar="ARCHIVO",
+                        help="disco de bloques sobre este archivo en los puertos 0x400-0x406 (lib/disk.asm)")
+    parser.add_argument("--interrupts", action="store_true",
+                        help="conecta el controlador de interrupciones, un temporizador y la IRQ del teclado")
+    parser.add_argument("--max-cycles", type=int, default=10_000_000_000)
+    parser.add_argument("--protect", action="store_true",
+                        help="hace cumplir las regiones del cargador: código sin escritura, datos sin ejecución")
+    parser.add_argument("--engine", default="trace", choices=CPU.ENGINES)
+    parser.add_argument("--input", default=None,
+                        help="texto para el teclado en lugar de stdin (una línea por '\\n')")
+    parser.add_argument("--profile", action="store_true",
+                        help="perfila la ejecución (opcodes, PCs y funciones) e imprime el informe en stderr")
+    parser.add_argument("--profile-json", default=None, metavar="ARCHIVO",
+                        help="además guarda el perfil en JSON (implica --profile)")
+    parser.add_argument("--store-trace", default=None, metavar="ARCHIVO",
+                        help="guarda la traza binaria de STORE (ver machine/CPU/StoreTrace.py)")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="muestra las trazas del compilador, del cargador y la tabla de STORE")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+    if args.verbose:
+        logging.getLogger("compiler.loader").setLevel(logging.INFO)
+        logging.getLogger("machine.cpu").setLevel(logging.INFO)
+    log = sys.stderr if args.verbose else None
+
+    try:
+        programa = build_program(args.program, args.link, args.base_path, log)
+    except BuildError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        # El ensamblador no tiene excepciones propias: KeyError en mnemónicos desconocidos, etc.
+        print(f"error: {type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        cpu, screen, keyboard = new_machine(args.mem_size, out=sys.stdout, mem_file=args.mem_file,
+                                           disk_file=args.disk, interrupts=args.interrupts)
+        Loader(cpu.memory).load_in_memory(programa.codigo, args.start)
+        cpu.set_pc(args.start)
+        cpu.set_sp(cpu.memory.size // 2)
+        if args.protect:
+            cpu.memory.enable_protection()
+    except Exception as e:
+        # --mem-file/--disk que no se pueden abrir, un programa que no cabe en --mem-size...
+        print(f"error: {type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+
+    if args.input is not None:
+        feed_keyboard(keyboard, args.input.split("\n"))
+        keyboard.close()
+    else:
+        attach_stdin(keyboard, sys.stdin)
+
+    if args.verbose or args.store_trace:
+        cpu.set_store_tracer(StoreTracer())
+
+    profiler = None
+    if args.profile or args.profile_json:
+        profiler = Profiler(programa.labels, base=args.start)
+
+    try:
+        cycles, secs, halted = run(cpu, args.max_cycles, args.engine, profiler)
+    except MemoryFault as e:
+        screen.flush()
+        sys.stdout.flush()
+        print(f"\nerror de ejecución: {e}", file=sys.stderr)
+        return 3
+    except Exception as e:
+        screen.flush()
+        sys.stdout.flush()
+        print(f"\nerror de ejecución (PC={cpu.pc:#x}): {type(e).__name__}: {e}", file=sys.stderr)
+        return 3
+    screen.flush()
+    sys.stdout.flush()
+    if cpu.store_tracer is not None:
+        cpu.store_tracer.flush(cpu.memory)
+        if args.store_trace:
+            cpu.store_tracer.save(args.store_trace)
+    rate = cycles / secs if secs else 0.0
+    print(f"\n{'PARAR' if halted else 'max_cycles alcanzado'}: {cycles} ciclos en {secs:.3f} s "
+          f"({rate:,.0f} instr/s, engine={'interp (perfilado)' if profiler else args.engine})",
+          file=sys.stderr)
+    if profiler is not None:
+        print(profiler.report(), file=sys.stderr)
+        if args.profile_json:
+            profiler.save_json(args.profile_json)
+    return 0 if halted else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+""" Pruebas del motor por lotes (BatchCPU) frente a ejecuciones secuenciales
+"""
+
+from machine.Memory.Memory import Memory
+from machine.CPU.CPU import CPU
+from machine.IO.IOsystem import IOSystem
+from machine.IO.Devices import Screen
+
+from compiler.ensamblador import Ensamblador
+from compiler.Loader import Loader
+
+
+def make_cpu(size=0x20000):
+    mem = Memory(size, auto_load=False, auto_save_at_exit=False)
+    io = IOSystem()
+    screen = Screen()
+    io.register(0x100, screen)
+    cpu = CPU(mem, io)
+    return cpu, screen
+
+
+def load_asm(cpu, source, start=0):
+    relo = Ensamblador().assemble(source)
+    Loader(cpu.memory).load_in_memory(relo.codigo, start)
+    cpu.set_pc(start)
+    cpu.set_sp(cpu.memory.size // 2)
+
+
+COLLATZ = """
+    LOADV R2, 0
+BUCLE:
+    CMPV R1, 1
+    JEQ FIN
+    PUSH8 R1
+    CALL PASO
+    POP8 R3
+    INC R2
+    JMP BUCLE
+PASO:
+    MOV8 R4, R1
+    ANDV R4, 1
+    JEQ PAR
+    MOVV8 R5, 3
+    MUL R1, R5
+    INC R1
+    RET
+PAR:
+    MOVV8 R7, 2
+    DIV R1, R7
+    RET
+FIN:
+    MOVV8 R6, 0x10000
+    STORER8 R2, R6
+    SVIO R2, 0x100
+    PARAR
+"""
+
+
+def test_batch_cpu_matches_sequential_runs_with_divergent_lanes():
+    import pytest
+    pytest.importorskip("numpy")
+    from machine.CPU.Batch import BatchCPU
+
+    def prepare(value):
+        cpu, screen = make_cpu()
+        load_asm(cpu, COLLATZ)
+        cpu.regs[1] = value
+        if value == 5:
+            cpu.regs[15] = cpu.memory.size - 4   # PUSH8 se sale de la memoria
+        return cpu, screen
+
+    def outcome(cpu, screen, error):
+        return (list(cpu.regs), dict(cpu.flags), cpu.pc, bool(cpu.running), type(error),
+                cpu.memory.read_u64(0x10000), screen.buffer)
+
+    # 0 no llega nunca a 1 (Max cycles reached) y 5 desborda la pila
+    inputs = [6, 27, 1, 7, 0, 5, 97, 6]
+    expected = []
+    for value in inputs:
+        cpu, screen = prepare(value)
+        cycles, error = None, None
+        try:
+            cycles = cpu.run(max_cycles=2000)
+        except RuntimeError as exc:
+            cycles, error = 2000, exc
+        except IndexError as exc:
+            error = exc
+        expected.append((outcome(cpu, screen, error), cycles))
+
+    lanes = [prepare(value) for value in inputs]
+    batch = BatchCPU([cpu for cpu, _ in lanes])
+    cycles = batch.run(max_cycles=2000)
+    for (cpu, screen), n, error, (state, ref_cycles) in zip(lanes, cycles, batch.errors, expected):
+        assert outcome(cpu, screen, error) == state
+        assert ref_cycles is None or n == ref_cycles
+    assert [type(e) for e in batch.errors].count(type(None)) == 6
@@ -0,0 +1,84 @@
+""" Pruebas del ejecutor por lotes (src/batch_runner.py)
+"""
+import json
+import os
+
+import batch_runner
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ECO = """
+    MOVV8 R02, 0x18000
+    CALL INPUT_STRING
+BUCLE:
+    LOADR1 R01, R02
+    CMPV R01, 0
+    JEQ FIN
+    SVIO R01, 0x100
+    SHOWIO 0x100
+    ADDV8 R02, 1
+    JMP BUCLE
+FIN:
+    PARAR
+"""
+
+
+def test_run_batch_pool_keeps_order_limits_and_captured_output(tmp_path):
+    eco = tmp_path / "eco.asm"
+    eco.write_text(ECO, encoding="utf-8")
+    bucle = tmp_path / "bucle.asm"
+    bucle.write_text("BUCLE:\n    JMP BUCLE\n", encoding="utf-8")
+    roto = tmp_path / "roto.asm"
+    roto.write_text("NOEXISTE R01\n", encoding="utf-8")
+    stdio = os.path.join(ROOT, "lib", "stdio.asm")
+    euclides = os.path.join(ROOT, "Algoritmos", "Ejemplos_alto_nivel", "euclides_resta.txt")
+
+    jobs = [
+        batch_runner.make_job(str(eco), link=[stdio], input="hola", name="eco-hola"),
+        batch_runner.make_job(str(bucle), max_cycles=500),
+        batch_runner.make_job(str(bucle), max_cycles=10**12, run_timeout=0.2, engine="interp"),
+        batch_runner.make_job(str(roto)),
+        batch_runner.make_job(euclides, engine="block"),
+        batch_runner.make_job(str(eco), link=[stdio], input="adios"),
+    ]
+    seen = []
+    report = batch_runner.run_batch(jobs, workers=2, on_result=seen.append)
+    results = report["jobs"]
+    assert [r["status"] for r in results] == ["ok", "max_cycles", "timeout", "build_error", "ok", "ok"]
+    assert len(seen) == len(jobs)
+    assert results[0]["name"] == "eco-hola" and results[0]["output"] == "hola"
+    assert results[5]["output"] == "adios"
+    assert results[1]["cycles"] == 500 and results[1]["exit_code"] == 2
+    assert 0 < results[2]["cycles"] < 10**12
+    assert "NOEXISTE" in results[3]["error"]
+    assert "MCD" in results[4]["output"] and "21" in results[4]["output"]
+    assert report["summary"]["statuses"] == {"ok": 3, "max_cycles": 1, "timeout": 1, "build_error": 1}
+    json.dumps(report)
+
+
+def test_run_job_reports_programs_that_do_not_fit_in_memory(tmp_path):
+    bucle = tmp_path / "bucle.asm"
+    bucle.write_text("BUCLE:\n    JMP BUCLE\n", encoding="utf-8")
+    for options in ({"mem_size": 8}, {"start": 2**17}):
+        result = batch_runner.run_job(batch_runner.make_job(str(bucle), **options))
+        assert result["status"] == "build_error" and result["exit_code"] == 1
+        assert "fuera de rango" in result["error"]
+
+
+def test_batch_runner_cli_writes_json_report(tmp_path, capsys):
+    eco = tmp_path / "eco.asm"
+    eco.write_text(ECO, encoding="utf-8")
+    trabajos = tmp_path / "trabajos.json"
+    trabajos.write_text(json.dumps([{"program": str(eco), "input": "uno"},
+                                    {"program": str(eco), "input": "dos", "name": "segundo"}]),
+                        encoding="utf-8")
+    informe = tmp_path / "informe.json"
+    rc = batch_runner.main(["--jobs", str(trabajos), "--link", os.path.join(ROOT, "lib", "stdio.asm"),
+                            "--workers", "1", "--json", str(informe)])
+    assert rc == 0
+    report = json.loads(informe.read_text(encoding="utf-8"))
+    assert [(r["name"], r["output"]) for r in report["jobs"]] == [(str(eco), "uno"), ("segundo", "dos")]
+    assert "2 trabajos" in capsys.readouterr().out
+
+    rc = batch_runner.main([str(tmp_path / "no_existe.asm"), "--workers", "1", "-q"])
+    assert rc == 1
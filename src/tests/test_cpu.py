@@ -0,0 +1,632 @@
+""" Pruebas del CPU: despacho por opcode y ejecución de programas pequeños
+"""
+
+from machine.Memory.Memory import Memory
+from machine.CPU.CPU import CPU
+from machine.IO.IOsystem import IOSystem
+from machine.IO.Devices import Screen
+
+from compiler.ensamblador import Ensamblador
+from compiler.Loader import Loader
+
+
+def make_cpu(size=0x20000):
+    mem = Memory(size, auto_load=False, auto_save_at_exit=False)
+    io = IOSystem()
+    screen = Screen()
+    io.register(0x100, screen)
+    cpu = CPU(mem, io)
+    return cpu, screen
+
+
+def load_asm(cpu, source, start=0):
+    relo = Ensamblador().assemble(source)
+    Loader(cpu.memory).load_in_memory(relo.codigo, start)
+    cpu.set_pc(start)
+    cpu.set_sp(cpu.memory.size // 2)
+
+
+FACTORIAL = """
+    LOADV R1, 5
+    LOADV R2, 1
+LOOP:
+    CMPV R1, 0
+    JEQ FIN
+    MUL R2, R1
+    DEC R1
+    JMP LOOP
+FIN:
+    STOREV R2, 0x10000
+    PARAR
+"""
+
+
+def test_every_decodable_opcode_has_a_handler():
+    cpu, _ = make_cpu(64)
+    # CLRIO/RESETIO e INTFLOAT tienen formato pero nunca tuvieron implementación
+    unimplemented = {0x00A3, 0x00A4, 0x0726, 0x0727}
+    assert set(cpu.formats) - set(cpu._handlers) == unimplemented
+    assert set(cpu._handlers) <= set(cpu.formats)
+
+
+def test_factorial_program():
+    cpu, _ = make_cpu()
+    load_asm(cpu, FACTORIAL)
+    cpu.run()
+    assert cpu.registers[2].value == 120
+    assert cpu.memory.read(0x10000, 8) == 120
+    assert cpu.flags["Z"] == 1
+
+
+def test_push_pop_roundtrip_all_sizes():
+    cpu, _ = make_cpu()
+    load_asm(cpu, """
+    MOVV8 R1, 0x123456789ABCDEF0
+    PUSH8 R1
+    POP8 R2
+    MOVV4 R3, 0x12345678
+    PUSH4 R3
+    POP4 R4
+    MOVV2 R5, 0x1234
+    PUSH2 R5
+    POP2 R6
+    MOVV1 R7, 0xAB
+    PUSH1 R7
+    POP1 R8
+    PARAR
+    """)
+    sp0 = cpu.sp.value
+    cpu.run()
+    assert cpu.registers[2].value == 0x123456789ABCDEF0
+    assert cpu.registers[4].value == 0x12345678
+    assert cpu.registers[6].value == 0x1234
+    assert cpu.registers[8].value == 0xAB
+    assert cpu.sp.value == sp0
+
+
+def test_conditional_jumps_follow_flags():
+    cpu, _ = make_cpu()
+    load_asm(cpu, """
+    LOADV R1, 3
+    LOADV R2, 0
+BUCLE:
+    INC R2
+    DEC R1
+    CMPV R1, 0
+    JNE BUCLE
+    PARAR
+    """)
+    cpu.run()
+    assert cpu.registers[2].value == 3
+    assert cpu.registers[1].value == 0
+
+
+def test_call_ret_and_showio():
+    cpu, screen = make_cpu()
+    load_asm(cpu, """
+    LOADV R1, 72
+    CALL IMPRIME
+    LOADV R1, 105
+    CALL IMPRIME
+    PARAR
+IMPRIME:
+    SVIO R1, 0x100
+    SHOWIO 0x100
+    RET
+    """)
+    cpu.run()
+    assert screen.buffer == "Hi"
+    assert not cpu.running
+
+
+def test_icache_replays_loop_and_decodes_once():
+    cpu, _ = make_cpu()
+    load_asm(cpu, FACTORIAL)
+    decoded = []
+    predecode = cpu.predecode
+    cpu.predecode = lambda pc: decoded.append(pc) or predecode(pc)
+    cpu.run()
+    # cada instrucción del programa se decodificó una sola vez
+    assert len(decoded) == len(set(decoded)) == len(cpu._icache)
+
+
+def test_icache_invalidated_by_self_modifying_store():
+    cpu, _ = make_cpu()
+    # Programa: la primera pasada ejecuta "LOADV R1, 1"; luego se sobreescribe
+    # el inmediato de esa instrucción (palabra en 0x08) con 42 y se vuelve a ejecutar.
+    load_asm(cpu, """
+INICIO:
+    LOADV R1, 1
+    ADD R2, R1
+    CMPV R2, 1
+    JNE FIN
+    LOADV R3, 42
+    STOREV R3, 8
+    JMP INICIO
+FIN:
+    PARAR
+    """)
+    cpu.run()
+    assert cpu.registers[1].value == 42
+    assert cpu.registers[2].value == 43
+
+
+def test_icache_invalidated_when_loader_replaces_program():
+    cpu, _ = make_cpu()
+    load_asm(cpu, "LOADV R1, 1\nPARAR\n")
+    cpu.run()
+    assert cpu.registers[1].value == 1
+
+    load_asm(cpu, "LOADV R1, 2\nPARAR\n")
+    cpu.running = True
+    cpu.run()
+    assert cpu.registers[1].value == 2
+
+
+# ---------------- Traductor de bloques (engine="block") ----------------
+
+def test_block_engine_matches_interpreter():
+    states = []
+    for engine in ("interp", "block"):
+        cpu, _ = make_cpu()
+        load_asm(cpu, FACTORIAL)
+        cpu.run(engine=engine)
+        states.append(([r.value for r in cpu.registers], dict(cpu.flags),
+                       cpu.memory.read(0x10000, 8), cpu.pc))
+    assert states[0] == states[1]
+
+
+def test_block_engine_falls_back_for_unsupported_opcodes():
+    cpu, screen = make_cpu()
+    # FADD8 no se traduce: lo ejecuta el intérprete entre dos bloques
+    load_asm(cpu, """
+    MOVV8 R1, 0x3FF0000000000000
+    MOVV8 R2, 0x4000000000000000
+    FADD8 R1, R2
+    LOADV R3, 79
+    CALL IMPRIME
+    LOADV R3, 75
+    CALL IMPRIME
+    PARAR
+IMPRIME:
+    SVIO R3, 0x100
+    SHOWIO 0x100
+    RET
+    """)
+    cpu.run(engine="block")
+    assert cpu.registers[1].value == 0x4008000000000000  # 1.0 + 2.0
+    assert screen.buffer == "OK"
+    assert not cpu.running
+
+
+def test_block_engine_self_modifying_store_and_loader():
+    cpu, _ = make_cpu()
+    load_asm(cpu, """
+INICIO:
+    LOADV R1, 1
+    ADD R2, R1
+    CMPV R2, 1
+    JNE FIN
+    LOADV R3, 42
+    STOREV R3, 8
+    JMP INICIO
+FIN:
+    PARAR
+    """)
+    cpu.run(engine="block")
+    assert cpu.registers[1].value == 42
+    assert cpu.registers[2].value == 43
+
+    load_asm(cpu, "LOADV R1, 2\nPARAR\n")
+    cpu.run(engine="block")
+    assert cpu.registers[1].value == 2
+
+
+def test_block_engine_respects_max_cycles():
+    cpu, _ = make_cpu()
+    load_asm(cpu, "BUCLE:\n    INC R1\n    JMP BUCLE\n")
+    try:
+        cpu.run(max_cycles=101, engine="block")
+    except RuntimeError:
+        pass
+    assert cpu.registers[1].value == 51
+
+
+def test_unknown_engine_is_rejected():
+    cpu, _ = make_cpu()
+    try:
+        cpu.run(engine="turbo")
+    except ValueError:
+        return
+    assert False, "engine desconocido aceptado"
+
+
+# ---------------- Trazas de bucles calientes (engine="trace") ----------------
+
+PARES_IMPARES = """
+    LOADV R1, 1000
+    LOADV R2, 0
+    LOADV R3, 0
+BUCLE:
+    MOV8 R4, R1
+    ANDV R4, 1
+    JEQ PAR
+    INC R3
+    JMP SIGUE
+PAR:
+    ADD R2, R1
+SIGUE:
+    STORE8 R2, 0x10000
+    DEC R1
+    CMPV R1, 0
+    JNE BUCLE
+    PARAR
+"""
+
+
+def run_engine(source, engine, **kwargs):
+    cpu, _ = make_cpu()
+    load_asm(cpu, source)
+    cpu.run(engine=engine, **kwargs)
+    return cpu
+
+
+def test_trace_engine_compiles_hot_loop():
+    cpu = run_engine(FACTORIAL.replace("LOADV R1, 5", "LOADV R1, 500"), "trace")
+    ref = run_engine(FACTORIAL.replace("LOADV R1, 5", "LOADV R1, 500"), "interp")
+    assert cpu._translator.traces
+    assert [r.value for r in cpu.registers] == [r.value for r in ref.registers]
+    assert cpu.flags == ref.flags
+
+
+def test_trace_guards_exit_when_branch_changes():
+    cpu = run_engine(PARES_IMPARES, "trace")
+    ref = run_engine(PARES_IMPARES, "interp")
+    assert cpu._translator.traces
+    assert cpu.registers[2].value == sum(range(2, 1001, 2))
+    assert cpu.registers[3].value == 500
+    assert [r.value for r in cpu.registers] == [r.value for r in ref.registers]
+    assert cpu.flags == ref.flags
+    assert cpu.memory.read(0x10000, 8) == ref.memory.read(0x10000, 8)
+
+
+def test_trace_engine_respects_max_cycles():
+    cpu, _ = make_cpu()
+    load_asm(cpu, "BUCLE:\n    INC R1\n    JMP BUCLE\n")
+    try:
+        cpu.run(max_cycles=1001, engine="trace")
+    except RuntimeError:
+        pass
+    assert cpu._translator.traces
+    assert cpu.registers[1].value == 501
+
+
+# ---------------- Banco de registros ----------------
+
+def test_register_views_share_the_flat_register_file():
+    cpu, _ = make_cpu()
+    cpu.registers[3].value = 0x1234
+    assert cpu.regs[3] == 0x1234
+    cpu.regs[4] = 0xFFFF_FFFF_FFFF_FFFF
+    assert cpu.registers[4].value == 0xFFFF_FFFF_FFFF_FFFF
+    assert cpu.registers[4].read(2) == 0xFFFF
+    cpu.registers[4].write(0x1FF, 1)
+    assert cpu.regs[4] == 0xFF
+    assert cpu.sp is cpu.registers[15]
+    cpu.set_sp(0x800)
+    assert cpu.sp.value == 0x800
+    assert [r.value for r in cpu.registers][3:5] == [0x1234, 0xFF]
+    try:
+        cpu.registers[0].write(1, 3)
+    except ValueError:
+        return
+    assert False, "tamaño de escritura inválido aceptado"
+
+
+# ---------------- Banderas perezosas ----------------
+
+def test_lazy_flags_materialize_on_read():
+    cpu, _ = make_cpu()
+    load_asm(cpu, """
+    MOVV8 R1, 0x7FFFFFFFFFFFFFFF
+    LOADV R2, 1
+    ADD R1, R2
+    PARAR
+    """)
+    cpu.run()
+    assert cpu._pending_flags is not None
+    assert cpu.flags == {"Z": 0, "N": 1, "C": 0, "V": 1}
+    assert cpu._pending_flags is None
+
+
+def test_lazy_flags_keep_untouched_flags_on_partial_writes():
+    cpu, _ = make_cpu()
+    # CMP 1, 2 deja C=0 y V=0 pendientes; SETV y AND (Z/N) escriben solo parte
+    load_asm(cpu, """
+    LOADV R1, 1
+    LOADV R2, 2
+    CMP R1, R2
+    SETV
+    CMPV R1, 0
+    AND R1, R2
+    PARAR
+    """)
+    cpu.run()
+    assert cpu.flags == {"Z": 1, "N": 0, "C": 1, "V": 0}
+
+
+def test_alu_flags_still_available_on_the_unit():
+    cpu, _ = make_cpu()
+    assert cpu.alu.add(0xFF, 1, 1) == 0
+    assert (cpu.alu.flags.Z, cpu.alu.flags.C, cpu.alu.flags.O) == (1, 1, 0)
+    assert cpu.alu.flags.as_dict() == {"C": 1, "V": 0, "Z": 1, "N": 0}
+
+
+# ---------------- Perfilador ----------------
+
+PERFIL = """
+    LOADV R1, 3
+BUCLE:
+    CALL DOBLE
+    DEC R1
+    CMPV R1, 0
+    JNE BUCLE
+    PARAR
+DOBLE:
+    ADD R2, R2
+    CALL UNO
+    RET
+UNO:
+    INC R2
+    RET
+"""
+
+
+def test_profiler_counts_opcodes_pcs_and_functions(tmp_path):
+    from machine.CPU.Profiler import Profiler
+    import json
+
+    cpu, _ = make_cpu()
+    relo = Ensamblador().assemble(PERFIL)
+    Loader(cpu.memory).load_in_memory(relo.codigo, 0)
+    cpu.set_pc(0)
+    cpu.set_sp(cpu.memory.size // 2)
+    prof = Profiler(relo.labels)
+    cycles = cpu.run(engine="trace", profiler=prof)
+
+    assert cycles == prof.cycles == 1 + 3 * 9 + 1
+    ops = prof.opcode_counts()
+    assert ops[0x0099] == 6 and ops[0x0800] == 6
+    assert prof.pc_hits[relo.labels["UNO"]] == 3
+
+    data = prof.to_dict()
+    funcs = {f["name"]: f for f in data["functions"]}
+    assert funcs["UNO"] == {"name": "UNO", "calls": 3, "inclusive": 6, "exclusive": 6}
+    assert funcs["DOBLE"]["inclusive"] == 3 * 3 + 6 and funcs["DOBLE"]["exclusive"] == 9
+    assert funcs["<inicio>"]["inclusive"] == cycles
+    assert sum(f["exclusive"] for f in funcs.values()) == cycles
+    assert "DOBLE" in prof.report()
+
+    prof.save_json(tmp_path / "perfil.json")
+    assert json.loads((tmp_path / "perfil.json").read_text())["cycles"] == cycles
+
+
+def test_profiler_attribute_hooks_tick():
+    from machine.CPU.Profiler import Profiler
+
+    cpu, _ = make_cpu()
+    load_asm(cpu, FACTORIAL)
+    cpu.profiler = Profiler()
+    for _ in range(4):
+        cpu.tick()
+    assert cpu.profiler.cycles == 4
+    assert cpu.profiler.opcode_counts()[0x0071] == 1  # CMPV
+
+
+# ---------------- Traza de STORE ----------------
+
+def test_store_handlers_untouched_without_tracer():
+    cpu, _ = make_cpu()
+    assert cpu.store_tracer is None
+    assert cpu._handlers[0x0603] == cpu._op_store8
+    assert cpu._handlers[0x0612] == cpu._op_storer4
+
+
+def test_store_tracer_records_every_engine(tmp_path):
+    from machine.CPU.StoreTrace import StoreTracer
+
+    source = """
+    LOADV R1, 0x10000
+    LOADV R2, 5
+BUCLE:
+    STORER4 R2, R1
+    ADDV R1, 4
+    DEC R2
+    CMPV R2, 0
+    JNE BUCLE
+    STOREV R1, 0x10100
+    PARAR
+    """
+    for engine in ("interp", "block", "trace"):
+        cpu, _ = make_cpu()
+        tracer = StoreTracer(capacity=4)
+        cpu.set_store_tracer(tracer)
+        load_asm(cpu, source)
+        cpu.run(engine=engine)
+        assert tracer.count == 6 and len(tracer) == 4 and tracer.dropped == 2
+        assert list(tracer.records()) == [
+            (0x20, 0x10008, 4, 3, 0), (0x20, 0x1000C, 4, 2, 0), (0x20, 0x10010, 4, 1, 0),
+            (0x60, 0x10100, 8, 0x10014, 0)]
+
+    tracer.save(tmp_path / "stores.bin")
+    loaded = StoreTracer.load(tmp_path / "stores.bin")
+    assert list(loaded.records()) == list(tracer.records())
+
+    cpu.set_store_tracer(None)
+    assert cpu._handlers[0x0612] == cpu._op_storer4
+
+
+def test_snapshot_restore_reruns_loaded_program_on_every_engine():
+    source = """
+    LOADV R1, 1
+    LOADV R2, 2
+    STOREV R2, 8
+    ADD R3, R1
+    STOREV R3, 0x18000
+    SVIO R3, 0x100
+    SHOWIO 0x100
+    LOADV R1, 1
+    PUSH8 R1
+    PARAR
+    """
+    for engine in ("interp", "block", "trace"):
+        cpu, screen = make_cpu()
+        load_asm(cpu, source)
+        snap = cpu.snapshot()
+        for _ in range(3):
+            cpu.run(engine=engine)
+            # LOADV R1, 1 se ejecuta antes de que STOREV reescriba su inmediato
+            assert cpu.regs[3] == 1 and cpu.memory.read_u64(8) == 2
+            assert cpu.memory.read_u64(0x18000) == 1 and screen.buffer == "\x01"
+            # solo se copian las páginas tocadas: código, 0x18000 y la pila
+            assert cpu.memory.restore(snap.memory) == 3 * 256
+            cpu.restore(snap)
+            assert cpu.regs[3] == 0 and cpu.pc == 0 and cpu.running
+            assert cpu.memory.read_u64(8) == 1 and cpu.memory.read_u64(0x18000) == 0
+            assert screen.buffer == ""
+        assert cpu.memory.restore(snap.memory) == 0
+
+
+def test_memory_protection_faults_carry_pc_and_address_on_every_engine():
+    from machine.Memory.Memory import MemoryFault
+
+    runaway = """
+    LOADV R1, 0x40
+    LOADV R2, 7
+BUCLE:
+    STORER8 R2, R1
+    SUBV R1, 8
+    JMP BUCLE
+    """
+    for engine in ("interp", "block", "trace"):
+        cpu, _ = make_cpu()
+        load_asm(cpu, runaway)
+        # sin protección el bucle reescribe su propio código sin avisar
+        cpu.memory.enable_protection()
+        try:
+            cpu.run(engine=engine, max_cycles=1000)
+        except MemoryFault as e:
+            assert (e.access, e.addr, e.size, e.pc) == ("write", 0x40, 8, 0x20)
+            assert e.region == "codigo@0x0"
+        else:
+            raise AssertionError("STORER8 sobre el código no falló")
+
+        cpu, _ = make_cpu()
+        load_asm(cpu, "JMP 0x10000\nPARAR")
+        cpu.memory.enable_protection()
+        try:
+            cpu.run(engine=engine)
+        except MemoryFault as e:
+            assert (e.access, e.addr, e.pc, e.region) == ("exec", 0x10000, 0x10000, None)
+        else:
+            raise AssertionError("ejecutar datos no falló")
+
+
+def test_memory_protection_off_keeps_unchecked_accessors():
+    cpu, _ = make_cpu()
+    load_asm(cpu, FACTORIAL)
+    mem = cpu.memory
+    assert [r.name for r in mem.regions] == ["codigo@0x0"]
+    mem.enable_protection()
+    assert "write_u64" in vars(mem)
+    mem.enable_protection(False)
+    assert "write_u64" not in vars(mem) and mem._page_perms is None
+    cpu.run(engine="trace")
+    assert mem.read_u64(0x10000) == 120
+
+
+def test_restore_returns_interrupt_enable_and_wait_state():
+    from machine.IO.Interrupts import InterruptController
+    cpu, _ = make_cpu()
+    cpu.io.attach_interrupts(InterruptController(), 0x500)
+    load_asm(cpu, """
+    EI
+    WAIT
+    PARAR
+    """)
+    snap = cpu.snapshot()
+    cpu.tick()
+    cpu.tick()
+    assert cpu.interrupts_enabled and cpu.waiting
+    cpu.restore(snap)
+    assert not cpu.interrupts_enabled and not cpu.waiting and cpu.pc == 0
+
+
+def test_fused_fpu_handlers_match_fpu_unit_and_warn_only_off_the_fast_path():
+    import math
+    import warnings
+    from machine.CPU.Units import FPU, FLOAT_CODECS
+    values = [0.0, -0.0, 1.5, -2.25, 3.0e38, 1e-45, 1e300, -1e-300, float('inf'), float('-inf'), float('nan')]
+    ops = {0x0700: ('add', 4), 0x0701: ('sub', 4), 0x0702: ('mul', 4), 0x0703: ('div', 4),
+           0x0710: ('add', 8), 0x0711: ('sub', 8), 0x0712: ('mul', 8), 0x0713: ('div', 8),
+           0x0720: ('sqrt', 4), 0x0721: ('sqrt', 8), 0x0722: ('sin', 4), 0x0723: ('cos', 4),
+           0x0724: ('sin', 8), 0x0725: ('cos', 8)}
+    cpu, _ = make_cpu()
+    for opcode, (name, size) in ops.items():
+        to_float, to_bits = FLOAT_CODECS[size]
+        bits = [to_bits(v) if size == 8 or abs(v) < 1e39 or not math.isfinite(v) else to_bits(3.0e38)
+                for v in values]
+        unary = name in ('sqrt', 'sin', 'cos')
+        for a in bits:
+            for b in ([0] if unary else bits):
+                fpu = FPU()
+                with warnings.catch_warnings(record=True) as expected_warnings:
+                    warnings.simplefilter('always')
+                    try:
+                        expected = getattr(fpu, name)(*((a,) if unary else (a, b)), size)
+                    except (OverflowError, ValueError) as exc:
+                        expected = type(exc)
+                cpu.regs[1], cpu.regs[2] = a, b
+                cpu.flags = {'C': 1, 'V': 1, 'Z': 1, 'N': 1}
+                with warnings.catch_warnings(record=True) as got_warnings:
+                    warnings.simplefilter('always')
+                    try:
+                        cpu._handlers[opcode](1, 2, 0)
+                    except (OverflowError, ValueError) as exc:
+                        assert expected is type(exc) and cpu.regs[1] == a
+                        continue
+                got = cpu.regs[1]
+                if math.isnan(to_float(expected)):
+                    assert math.isnan(to_float(got))
+                else:
+                    assert got == expected, (name, size, to_float(a), to_float(b))
+                assert dict(cpu.flags) == fpu.flags, (name, size, to_float(a), to_float(b))
+                assert len(got_warnings) == len(expected_warnings)
+
+
+def test_width_specialized_alu_handlers_match_generic_alu():
+    from machine.CPU.Units import ALU
+    from machine.CPU.Translator import ALU_OPS
+    cpu, _ = make_cpu()
+    edges = [0, 1, 2, 0x7F, 0x80, 0xFF, 0x7FFF, 0x8000, 0xFFFF, 0x7FFFFFFF, 0x80000000,
+             0xFFFFFFFF, (1 << 63) - 1, 1 << 63, (1 << 64) - 1, 0x123456789ABCDEF0]
+    for opcode, (op, signed, rsize, imm_mask, asize, wsize) in ALU_OPS.items():
+        rmask = (1 << (8 * rsize)) - 1
+        for x in edges:
+            for y in edges:
+                a = x & rmask
+                b = y & rmask if imm_mask is None else (y & imm_mask if imm_mask else y)
+                alu = ALU()
+                if b == 0 and op in ('div', 'mod'):
+                    expected, expected_flags = 0, None
+                else:
+                    expected = getattr(alu, op)(a, b, asize, signed=signed) & ((1 << (8 * wsize)) - 1)
+                    expected_flags = alu.flags.as_dict()
+                cpu.regs[1], cpu.regs[2] = x, y
+                cpu.flags = {"Z": 0, "N": 0, "C": 0, "V": 0}
+                cpu._handlers[opcode](1, 2, y)
+                assert cpu.regs[1] == expected, (hex(opcode), x, y)
+                if expected_flags is None:
+                    assert cpu.flags["V"] == 1
+                else:
+                    assert cpu.flags == expected_flags, (hex(opcode), x, y)
@@ -0,0 +1,85 @@
+""" Pruebas de los dispositivos de E/S: teclado y pantalla
+"""
+
+from machine.Memory.Memory import Memory
+from machine.CPU.CPU import CPU
+from machine.IO.IOsystem import IOSystem
+from machine.IO.Devices import Screen
+
+from compiler.ensamblador import Ensamblador
+from compiler.Loader import Loader
+
+
+def make_cpu(size=0x20000):
+    mem = Memory(size, auto_load=False, auto_save_at_exit=False)
+    io = IOSystem()
+    screen = Screen()
+    io.register(0x100, screen)
+    cpu = CPU(mem, io)
+    return cpu, screen
+
+
+def load_asm(cpu, source, start=0):
+    relo = Ensamblador().assemble(source)
+    Loader(cpu.memory).load_in_memory(relo.codigo, start)
+    cpu.set_pc(start)
+    cpu.set_sp(cpu.memory.size // 2)
+
+
+def test_keyboard_ring_buffer_is_fifo_with_repeated_bytes():
+    from machine.IO.Devices import Keyboard
+    kb = Keyboard(capacity=4)
+    for b in (7, 3, 7, 9, 1):  # el quinto no cabe
+        kb.write(b)
+    assert kb.dropped == 1 and kb.buffer == [7, 3, 7, 9]
+    assert [kb.read(), kb.read()] == [7, 3]
+    kb.write(0x1FF)
+    assert kb.buffer == [7, 9, 0xFF] and kb.snapshot() == [7, 9, 0xFF]
+    assert [kb.read() for _ in range(4)] == [7, 9, 0xFF, Keyboard.EMPTY]
+
+
+def test_blocking_keyboard_loadio_waits_for_input_on_every_engine():
+    import threading
+    import time
+    from machine.IO.Devices import Keyboard
+    for engine in CPU.ENGINES:
+        cpu, screen = make_cpu()
+        kb = Keyboard(blocking=True, timeout=5)
+        cpu.io.register(0x200, kb)
+        load_asm(cpu, """
+ECO:
+    LOADIO R3, 0x200
+    CMPV R3, 0
+    JEQ FIN
+    SVIO R3, 0x100
+    JMP ECO
+FIN:
+    PARAR
+        """)
+
+        def teclear():
+            for ch in "ok\0":
+                time.sleep(0.02)
+                kb.write(ord(ch))
+        threading.Thread(target=teclear, daemon=True).start()
+        cycles = cpu.run(max_cycles=1000, engine=engine)
+        # Sin polling: una lectura por carácter
+        assert screen.buffer == "ok" and cycles == 14, engine
+
+
+def test_screen_batches_callbacks_and_bounds_scrollback():
+    chunks = []
+    screen = Screen(scrollback=8, chunk_size=4, flush_interval=3600)
+    screen.on_show = chunks.append
+    for ch in "ab\ncdefgh":
+        screen.write(ord(ch))
+        screen.show()
+    assert chunks == ["ab\n", "cdef"]  # salto de línea y tamaño
+    screen.flush()
+    assert chunks[-1] == "gh" and "".join(chunks) == "ab\ncdefgh"
+    for ch in "0123456789" * 3:
+        screen.write(ord(ch))
+    assert screen.buffer == "23456789" and len(screen._data) <= 16
+    version = screen.version
+    screen.buffer = ""
+    assert screen.buffer == "" and screen.version != version
@@ -0,0 +1,131 @@
+""" Pruebas de las interrupciones: controlador, temporizador, WAIT y RTI
+"""
+
+from machine.Memory.Memory import Memory
+from machine.CPU.CPU import CPU
+from machine.IO.IOsystem import IOSystem
+from machine.IO.Devices import Screen
+
+from compiler.ensamblador import Ensamblador
+from compiler.Loader import Loader
+
+
+def make_cpu(size=0x20000):
+    mem = Memory(size, auto_load=False, auto_save_at_exit=False)
+    io = IOSystem()
+    screen = Screen()
+    io.register(0x100, screen)
+    cpu = CPU(mem, io)
+    return cpu, screen
+
+
+def load_asm(cpu, source, start=0):
+    relo = Ensamblador().assemble(source)
+    Loader(cpu.memory).load_in_memory(relo.codigo, start)
+    cpu.set_pc(start)
+    cpu.set_sp(cpu.memory.size // 2)
+
+
+INTERRUPCIONES = """
+    MOVV8 R01, 0
+    SETIV R01, TIMER_ISR
+    MOVV8 R01, 1
+    SETIV R01, TECLADO_ISR
+    MOVV8 R01, 3
+    SVIO R01, 0x501          ; MASK: temporizador (0) y teclado (1)
+    MOVV8 R01, 5000
+    SVIO R01, 0x510          ; PERIOD: vence cada 5000 ciclos
+    EI
+ESPERA:
+    WAIT
+    CMPV R06, 1              ; ¿llegó el NULL del teclado?
+    JNE ESPERA
+    PARAR
+TIMER_ISR:
+    ADDV8 R05, 1
+    RTI
+TECLADO_ISR:
+    PUSH8 R01
+LEE:
+    LOADIO R01, 0x200
+    CMPV R01, 0xFF
+    JEQ FIN_ISR
+    CMPV R01, 0
+    JEQ FIN_LINEA
+    SVIO R01, 0x100
+    SHOWIO 0x100
+    JMP LEE
+FIN_LINEA:
+    MOVV8 R06, 1
+    JMP LEE
+FIN_ISR:
+    POP8 R01
+    RTI
+"""
+
+
+def test_timer_and_keyboard_interrupts_wake_wait_on_every_engine():
+    import threading
+    import time
+    from machine.IO.Devices import Keyboard
+    from machine.IO.Interrupts import InterruptController, Timer
+    for engine in CPU.ENGINES:
+        cpu, screen = make_cpu()
+        kb, timer = Keyboard(), Timer()
+        cpu.io.register(0x200, kb)
+        cpu.io.attach_interrupts(InterruptController(), 0x500)
+        cpu.io.register_range(0x510, Timer.PORTS, timer)
+        cpu.io.route_irq(0x510, 0)
+        cpu.io.route_irq(0x200, 1)
+        load_asm(cpu, INTERRUPCIONES)
+        sp = cpu.regs[15]
+
+        def teclear():
+            time.sleep(0.05)
+            for ch in "hola\0":
+                kb.write(ord(ch))
+        threading.Thread(target=teclear, daemon=True).start()
+        cycles = cpu.run(max_cycles=10**9, engine=engine)
+        assert screen.buffer == "hola", engine
+        # WAIT adelanta el reloj hasta cada vencimiento en vez de girar en un bucle
+        assert cpu.regs[5] == timer.ticks and timer.ticks * 5000 <= cycles < 10**9
+        assert cpu.regs[15] == sp and cpu.io.irq.delivered[1] >= 1
+
+
+def test_interrupt_frame_restores_flags_and_pc():
+    from machine.IO.Interrupts import InterruptController, Timer
+    cpu, _ = make_cpu()
+    timer = Timer()
+    cpu.io.attach_interrupts(InterruptController(), 0x500)
+    cpu.io.register_range(0x510, Timer.PORTS, timer)
+    cpu.io.route_irq(0x510, 0)
+    load_asm(cpu, """
+    MOVV8 R01, 0
+    SETIV R01, ISR
+    MOVV8 R01, 1
+    SVIO R01, 0x501          ; MASK: solo el temporizador
+    MOVV8 R01, 0
+    SVIO R01, 0x511          ; MODE: una sola vez
+    MOVV8 R01, 100
+    SVIO R01, 0x510
+    CMPV R01, 100            ; Z = 1 antes de la interrupción
+    EI
+BUCLE:
+    JNE MAL                  ; si RTI no devolviera Z = 1 saldría por aquí
+    JMP BUCLE
+MAL:
+    MOVV8 R03, 1
+    PARAR
+ISR:
+    CMPV R01, 0              ; Z = 0 dentro del manejador
+    ADDV8 R02, 1
+    CMPV R02, 3
+    JNE SIGUE
+    PARAR
+SIGUE:
+    SVIO R01, 0x510          ; rearma el temporizador
+    RTI
+    """)
+    cpu.run(max_cycles=100_000, engine="trace")
+    assert cpu.regs[2] == 3 and cpu.regs[3] == 0 and timer.ticks == 3 and not cpu.running
+    assert cpu.regs[15] == cpu.memory.size // 2 + 16  # el tercer marco no se desapiló
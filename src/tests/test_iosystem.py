@@ -0,0 +1,68 @@
+""" Pruebas del sistema de E/S: puertos, rangos y transferencias por bloques
+"""
+
+from machine.Memory.Memory import Memory
+from machine.CPU.CPU import CPU
+from machine.IO.IOsystem import IOSystem
+from machine.IO.Devices import Screen
+
+from compiler.ensamblador import Ensamblador
+from compiler.Loader import Loader
+
+
+def make_cpu(size=0x20000):
+    mem = Memory(size, auto_load=False, auto_save_at_exit=False)
+    io = IOSystem()
+    screen = Screen()
+    io.register(0x100, screen)
+    cpu = CPU(mem, io)
+    return cpu, screen
+
+
+def load_asm(cpu, source, start=0):
+    relo = Ensamblador().assemble(source)
+    Loader(cpu.memory).load_in_memory(relo.codigo, start)
+    cpu.set_pc(start)
+    cpu.set_sp(cpu.memory.size // 2)
+
+
+def test_iosystem_port_ranges_block_transfers_and_single_warning(caplog):
+    from machine.IO.Devices import Keyboard
+
+    class Regs:
+        def __init__(self):
+            self.values = [0] * 4
+
+        def read_port(self, offset):
+            return self.values[offset]
+
+        def write_port(self, offset, value):
+            self.values[offset] = value
+
+    cpu, screen = make_cpu()
+    regs, kb = Regs(), Keyboard()
+    cpu.io.register_range(0x300, 4, regs)
+    cpu.io.register(0x200, kb)
+    load_asm(cpu, """
+    LOADV R1, 9
+    SVIO R1, 0x302
+    LOADIO R2, 0x302
+    LOADIO R3, 0x304
+    LOADIO R3, 0x304
+    PARAR
+    """)
+    cpu.run()
+    assert regs.values == [0, 0, 9, 0] and cpu.regs[2] == 9 and cpu.regs[3] == 0
+    assert cpu.io.get_device(0x303) is regs and cpu.io.get_device(0x304) is None
+    assert sum("0x304" in r.getMessage() for r in caplog.records) == 1
+    try:
+        cpu.io.register(0x301, Screen())
+        assert False, "el puerto 0x301 ya está ocupado"
+    except ValueError:
+        pass
+
+    assert cpu.io.write_block(0x100, b"hola") == 4 and screen.buffer == "hola"
+    assert cpu.io.write_block(0x200, b"abc") == 3
+    assert cpu.io.read_block(0x200, 2) == b"ab" and cpu.io.read_block(0x200, 8) == b"c"
+    assert cpu.io.read_block(0x302, 3) == bytes([9, 9, 9])  # lecturas repetidas del puerto
+    assert cpu.io.unregister(0x300) is regs and cpu.io.get_device(0x302) is None
@@ -1,6 +1,6 @@
 import logging
 import struct
-from machine.Memory.Memory import Memory
+from machine.Memory.Memory import Memory, MappedMemory
 from compiler.Loader import Loader
 from compiler.instructions import IS_INV
 
@@ -15,6 +15,30 @@ def test_memory_write_little_endian():
     assert stored == bytes([0x04, 0x03, 0x02, 0x01])
 
 
+
+def test_typed_accessors_match_generic_read_write():
+    mem = Memory(0x100, auto_load=False, auto_save_at_exit=False)
+    mem.write_u64(0x10, -2)         # se trunca a 64 bits
+    assert mem.read(0x10, 8) == 0xFFFFFFFFFFFFFFFE
+    assert mem.read(0x10, 8, signed=True) == -2
+    mem.write(0x20, -1, 2)
+    assert (mem.read_u8(0x20), mem.read_u16(0x20), mem.read_u32(0x20)) == (0xFF, 0xFFFF, 0xFFFF)
+    mem.write_u32(0x30, 0x1_0000_0001)
+    assert mem.get_bytes(0x30, 5) == b"\x01\x00\x00\x00\x00"
+    mem.write_f64(0x40, 2.5)
+    mem.write_f32(0x48, -0.75)
+    assert mem.read_f64(0x40) == 2.5 and mem.read_f32(0x48) == -0.75
+    assert mem.read_u64(0x40) == struct.unpack("<Q", struct.pack("<d", 2.5))[0]
+
+    for bad in (-1, 0xF9):
+        try:
+            mem.read_u64(bad)
+        except IndexError:
+            pass
+        else:
+            raise AssertionError(f"read_u64({bad:#x}) no falló")
+
+
 def test_loader_consumes_data_directive(tmp_path):
     # Create memory and loader
     mem = Memory(0x20000)
@@ -34,3 +58,159 @@ def test_loader_consumes_data_directive(tmp_path):
     # verify memory was written
     stored = bytes(mem.mem[addr:addr+size])
     assert stored == b
+
+
+def test_find_symbol_at_index_prefers_recent_and_resolves_bp_relative():
+    mem = Memory(0x2000, auto_load=False, auto_save_at_exit=False)
+    assert mem.register_symbol('arr', 0x100, 32) is True
+    assert mem.register_symbol('x', 0x108, 4) is True
+    assert mem.register_symbol('x', 0x108, 4) is False  # duplicado exacto
+    assert mem.register_symbol('loc', None, 8, meta={'local_rel': -16}) is True
+
+    assert mem.find_symbol_at(0x10A)['name'] == 'x'      # solapado: gana el más reciente
+    assert mem.find_symbol_at(0x10C)['name'] == 'arr'
+    assert mem.find_symbol_at(0x11F)['name'] == 'arr'
+    assert mem.find_symbol_at(0x120) is None
+    assert mem.find_symbol_at(0x7F0) is None
+    local = mem.find_symbol_at(0x7F4, bp=0x800)
+    assert local['name'] == 'loc' and local['addr'] == 0x7F0
+    assert len(mem.symbols) == 3
+
+
+def test_find_symbol_at_interval_index_with_large_symbols():
+    mem = Memory(0x20000, auto_load=False, auto_save_at_exit=False)
+    for i in range(100):
+        mem.register_symbol(f'g{i}', 0x1000 + 8 * i, 8)
+    mem.register_symbol('heap', 0x1000, 0x10000)     # cubre todos los g*: gana por ser más reciente
+    assert mem.find_symbol_at(0x1008)['name'] == 'heap'
+    mem.register_symbol('tarde', 0x1010, 8)
+    assert mem.find_symbol_at(0x1017)['name'] == 'tarde'
+    assert mem.find_symbol_at(0x1018)['name'] == 'heap'
+    assert mem.find_symbol_at(0x10FFF)['name'] == 'heap'
+    assert mem.find_symbol_at(0x11000) is None
+    assert mem.find_symbol_at(0xFFF) is None
+    mem.register_symbol('vacio', 0x11000, 0)
+    assert mem.find_symbol_at(0x11000) is None
+
+
+def test_bp_relative_symbols_are_indexed_by_interval():
+    mem = Memory(0x1000, auto_load=False, auto_save_at_exit=False)
+    mem.register_symbol('buf', None, 1 << 20, meta={'local_rel': -(1 << 20)})
+    mem.register_symbol('i', None, 8, meta={'local_rel': -8})
+    assert mem.find_symbol_at(0x7F8, bp=0x800)['name'] == 'i'
+    hit = mem.find_symbol_at(0x7F0, bp=0x800)
+    assert hit['name'] == 'buf' and hit['addr'] == 0x800 - (1 << 20)
+    assert mem.find_symbol_at(0x800, bp=0x800) is None
+
+
+def test_binary_snapshot_roundtrip_stores_only_nonzero_pages(tmp_path):
+    mem = Memory(0x20000, auto_load=False, auto_save_at_exit=False)
+    assert not mem.is_dirty()
+    mem.write(0x10, 0x1122334455667788, 8)
+    mem.load_bytes(0x1FFF0, bytes(range(1, 17)))
+    assert mem.is_dirty()
+
+    for compress in (True, False):
+        path = tmp_path / f"ram_{compress}.bin"
+        mem.save_snapshot(str(path), compress=compress)
+        assert not mem.is_dirty()
+        # cabecera + mapa de 512 páginas + como mucho 2 páginas de 256 bytes
+        assert path.stat().st_size <= 24 + 64 + 2 * 256
+
+        other = Memory(0x20000, memory_file=str(path), auto_save_at_exit=False)
+        assert other.mem == mem.mem
+        assert not other.is_dirty()
+        other.write(0x10, 0, 8)
+        assert other.is_dirty()
+
+
+def test_dirty_ranges_per_consumer_and_incremental_snapshot(tmp_path):
+    mem = Memory(0x1000, auto_load=False, auto_save_at_exit=False)
+    assert mem.dirty_ranges() == []
+    mem.write_u64(0x1FC, 1 << 40 | 1) # cruza de la página 1 a la 2
+    mem.load_bytes(0x800, b"xy")
+    ranges, gui = mem.fetch_dirty()
+    assert ranges == [(0x100, 0x300), (0x800, 0x900)]
+
+    other = mem.dirty_token()
+    mem[0xFFF] = 7
+    assert mem.fetch_dirty(gui)[0] == [(0xF00, 0x1000)]
+    assert mem.dirty_ranges(other) == [(0xF00, 0x1000)]
+
+    path = str(tmp_path / "ram.bin")
+    mem.save_snapshot(path)
+    assert not mem.is_dirty()
+    mem.write(0x800, 0, 2)           # la página 8 vuelve a cero
+    mem.write_u8(0x300, 5)
+    assert mem.is_dirty()
+    mem.save_snapshot(path)
+    again = Memory(0x1000, memory_file=path, auto_save_at_exit=False)
+    assert again.mem == mem.mem
+    assert sorted(again._snapshot_pages) == [1, 2, 3, 15]
+
+
+def test_legacy_txt_is_imported_and_text_export_kept(tmp_path):
+    mem = Memory(0x100, auto_load=False, auto_save_at_exit=False)
+    mem.write(0x8, 0xCAFE, 2)
+    mem.save_to_txt(str(tmp_path / "memory_ram.txt"))
+
+    # sin memory_ram.bin se importa el .txt antiguo que está al lado
+    other = Memory(0x100, memory_file=str(tmp_path / "memory_ram.bin"), auto_save_at_exit=False)
+    assert other.read(0x8, 2) == 0xCAFE
+    assert not other.is_dirty()
+
+
+def test_mapped_memory_is_shared_and_persists_in_file(tmp_path):
+    path = tmp_path / "ram.map"
+    size = 64 * 2**20
+    mem = MappedMemory(size, str(path))
+    # archivo disperso: el tamaño lógico es la RAM completa
+    assert path.stat().st_size == size
+    mem.write(size - 8, 0x1122334455667788, 8)
+    mem.load_bytes(0x100, b"hola")
+
+    # otra instancia sobre el mismo archivo ve las escrituras sin copiar nada
+    other = MappedMemory(size, str(path))
+    assert other.read(size - 8, 8) == 0x1122334455667788
+    other.write(0x104, 0x21, 1)
+    assert mem.get_bytes(0x100, 5) == b"hola!"
+    assert not mem.is_dirty()
+
+    mem.save_snapshot(str(tmp_path / "copia.bin"))
+    assert Memory(size, memory_file=str(tmp_path / "copia.bin"), auto_save_at_exit=False).get_bytes(0x100, 5) == b"hola!"
+
+    mem.clear()
+    assert other.read(size - 8, 8) == 0
+    other.close()
+    mem.close()
+    assert path.read_bytes()[0x100:0x105] == bytes(5)
+
+
+def test_first_snapshot_of_reopened_mapping_keeps_existing_content(tmp_path):
+    path = tmp_path / "ram.map"
+    mem = MappedMemory(1 << 16, str(path))
+    mem.write(0x1000, 0xDEADBEEF, 8)
+    mem.close()
+
+    reopened = MappedMemory(1 << 16, str(path))
+    copia = str(tmp_path / "copia.bin")
+    reopened.save_snapshot(copia)
+    restored = Memory(1 << 16, memory_file=copia, auto_save_at_exit=False)
+    assert restored.read(0x1000, 8) == 0xDEADBEEF
+    reopened.close()
+
+
+def test_reopened_mapping_reports_existing_content_as_written(tmp_path):
+    path = tmp_path / "ram.map"
+    mem = MappedMemory(1 << 16, str(path))
+    mem.write(0x1000, 0xDEADBEEF, 8)
+    mem.load_bytes(0xFFFC, b"fin!")
+    mem.close()
+
+    reopened = MappedMemory(1 << 16, str(path))
+    token = reopened.dirty_token()   # el contenido del archivo es anterior a cualquier token
+    reopened.write_u8(0x2000, 1)
+    ranges, viewer = reopened.fetch_dirty()
+    assert ranges == [(0x1000, 0x1100), (0x2000, 0x2100), (0xFF00, 0x10000)]
+    assert reopened.dirty_ranges(token) == [(0x2000, 0x2100)]
+    reopened.close()
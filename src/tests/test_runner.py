@@ -0,0 +1,127 @@
+""" Pruebas del ejecutor sin interfaz gráfica (src/runner.py)
+"""
+import io
+import os
+import subprocess
+import sys
+
+import runner
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ECO = """
+    MOVV8 R02, 0x18000
+    CALL INPUT_STRING
+BUCLE:
+    LOADR1 R01, R02
+    CMPV R01, 0
+    JEQ FIN
+    SVIO R01, 0x100
+    SHOWIO 0x100
+    ADDV8 R02, 1
+    JMP BUCLE
+FIN:
+    PARAR
+"""
+
+
+def run_main(args, stdin_text, capsys, monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.StringIO(stdin_text))
+    rc = runner.main(args)
+    return rc, capsys.readouterr()
+
+
+def test_runner_does_not_import_tkinter():
+    src = os.path.dirname(os.path.abspath(runner.__file__))
+    code = "import sys, runner; sys.exit('tkinter' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], cwd=src).returncode == 0
+
+
+def test_runner_links_library_and_echoes_stdin(tmp_path, capsys, monkeypatch):
+    prog = tmp_path / "eco.asm"
+    prog.write_text(ECO, encoding="utf-8")
+    rc, out = run_main([str(prog), "--link", os.path.join(ROOT, "lib", "stdio.asm")],
+                       "hola\n", capsys, monkeypatch)
+    assert rc == 0
+    assert out.out == "hola"
+    assert "PARAR" in out.err and "ciclos" in out.err
+
+
+def test_runner_compiles_high_level_program(capsys, monkeypatch):
+    prog = os.path.join(ROOT, "Algoritmos", "Ejemplos_alto_nivel", "euclides_resta.txt")
+    rc, out = run_main([prog, "--engine", "block"], "", capsys, monkeypatch)
+    assert rc == 0
+    assert "MCD" in out.out and "21" in out.out
+
+
+def test_runner_reports_max_cycles_and_unresolved_labels(tmp_path, capsys, monkeypatch):
+    prog = tmp_path / "eco.asm"
+    prog.write_text(ECO, encoding="utf-8")
+    rc, out = run_main([str(prog)], "", capsys, monkeypatch)
+    assert rc == 1 and "INPUT_STRING" in out.err
+
+    prog.write_text("BUCLE:\n    JMP BUCLE\n", encoding="utf-8")
+    rc, out = run_main([str(prog), "--max-cycles", "500"], "", capsys, monkeypatch)
+    assert rc == 2 and "500 ciclos" in out.err
+
+    # Otros RuntimeError de la CPU no son "max_cycles alcanzado"
+    prog.write_text("MOVV8 R01, 0\nSETIV R01, 0\nPARAR\n", encoding="utf-8")
+    rc, out = run_main([str(prog)], "", capsys, monkeypatch)
+    assert rc == 3 and "SETIV" in out.err and "max_cycles" not in out.err
+
+
+def test_runner_reports_machine_setup_and_load_errors(tmp_path, capsys, monkeypatch):
+    prog = tmp_path / "bucle.asm"
+    prog.write_text("BUCLE:\n    JMP BUCLE\n", encoding="utf-8")
+    rc, out = run_main([str(prog), "--mem-size", "8"], "", capsys, monkeypatch)
+    assert rc == 1 and out.err.startswith("error: IndexError") and "Traceback" not in out.err
+
+    rc, out = run_main([str(prog), "--start", "0x20000"], "", capsys, monkeypatch)
+    assert rc == 1 and "fuera de rango" in out.err
+
+
+def test_runner_reports_unopenable_disk_image(tmp_path, capsys, monkeypatch):
+    prog = tmp_path / "fin.asm"
+    prog.write_text("PARAR\n", encoding="utf-8")
+    for disk in (tmp_path / "no_existe" / "disco.img", tmp_path):
+        rc, out = run_main([str(prog), "--disk", str(disk), "--mem-file", str(tmp_path / "ram.map")],
+                           "", capsys, monkeypatch)
+        assert rc == 1 and out.err.startswith("error: ") and str(disk) in out.err
+
+
+COPIA_DISCO = """
+    ; Copia los sectores 0-1 del disco a los sectores 2-3 pasando por la RAM
+    MOVV8 R01, 0
+    MOVV8 R02, 0x18000
+    MOVV8 R03, 2
+    CALL DISK_READ
+    CMPV R01, 0
+    JNE FALLO
+    MOVV8 R01, 2
+    CALL DISK_WRITE
+    CMPV R01, 0
+    JNE FALLO
+    CALL DISK_SECTORS
+    ADDV8 R01, 48
+    SVIO R01, 0x100
+    SHOWIO 0x100
+    PARAR
+FALLO:
+    MOVV8 R01, 69
+    SVIO R01, 0x100
+    SHOWIO 0x100
+    PARAR
+"""
+
+
+def test_runner_disk_dma_copies_sectors(tmp_path, capsys, monkeypatch):
+    prog = tmp_path / "copia.asm"
+    prog.write_text(COPIA_DISCO, encoding="utf-8")
+    disk = tmp_path / "disco.img"
+    data = bytes(range(256)) * 3 + b"fin"
+    disk.write_bytes(data)
+    rc, out = run_main([str(prog), "--link", os.path.join(ROOT, "lib", "disk.asm"), "--disk", str(disk)],
+                       "", capsys, monkeypatch)
+    assert rc == 0 and out.out == "4"
+    # El sector 1 estaba incompleto: se lee con ceros y se copia completo
+    assert disk.read_bytes() == data + bytes(1024 - len(data)) + data + bytes(1024 - len(data))